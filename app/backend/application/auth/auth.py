@@ -5,7 +5,7 @@ from flask_jwt_extended import (
     get_jwt, set_access_cookies, set_refresh_cookies, unset_jwt_cookies
 )
 from datetime import timedelta
-from werkzeug.security import generate_password_hash, check_password_hash
+from application.auth.credentials import hash_password, verify_and_update
 from application.data.database import db
 from application.data.models import *
 import re
@@ -46,7 +46,7 @@ def register():
             name=name,
             email=email,
             phone=phone,
-            password_hashed=generate_password_hash(password)
+            password_hashed=hash_password(password)
         )
 
         role_from_db = Role.query.filter_by(name=role).first()
@@ -132,7 +132,11 @@ def login():
         password = auth_data['password']
 
         user = User.query.filter_by(email=email).first()
-        if user and check_password_hash(user.password_hashed, password):
+        if user and verify_and_update(user, password):
+            if db.session.is_modified(user):
+                # password was rehashed with the configured method
+                db.session.commit()
+
             role_name = None
             try:
                 role_name = getattr(user, 'primary_role', None)
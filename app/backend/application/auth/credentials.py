@@ -0,0 +1,108 @@
+"""
+Password hashing off the eventlet hub.
+
+The app runs under `eventlet.monkey_patch()`, so a pbkdf2 hash computed
+inline blocks the only OS thread for hundreds of milliseconds and stalls
+every Socket.IO heartbeat. Here hashing runs in eventlet's native thread pool
+(`tpool`, hashlib releases the GIL) behind a semaphore that bounds how many
+hashes run at once; without eventlet it simply runs inline.
+
+Config (read per call, all optional):
+    PASSWORD_HASH_METHOD       werkzeug method string, e.g. "pbkdf2:sha256:600000"
+    PASSWORD_HASH_CONCURRENCY  max hashes in flight (default: CPU count)
+
+`verify_and_update` rehashes a stored hash made with an older method the next
+time its owner logs in.
+"""
+import logging
+import os
+import threading
+
+from flask import current_app, has_app_context
+from werkzeug.security import generate_password_hash, check_password_hash
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PASSWORD_HASH_METHOD = "pbkdf2:sha256:600000"
+
+_slots = None
+_slots_size = None
+_slots_lock = threading.Lock()
+
+
+def _config(key, default):
+    if has_app_context():
+        return current_app.config.get(key, default)
+    return default
+
+
+def hash_method():
+    return _config("PASSWORD_HASH_METHOD", DEFAULT_PASSWORD_HASH_METHOD)
+
+
+def _semaphore():
+    """Bounded slots, created on first use so they are green once eventlet has patched threading."""
+    global _slots, _slots_size
+    size = max(1, int(_config("PASSWORD_HASH_CONCURRENCY", os.cpu_count() or 2)))
+    if _slots is None or _slots_size != size:
+        with _slots_lock:
+            if _slots is None or _slots_size != size:
+                _slots = threading.BoundedSemaphore(size)
+                _slots_size = size
+    return _slots
+
+
+def _eventlet_patched():
+    try:
+        from eventlet import patcher
+        return patcher.is_monkey_patched("thread")
+    except ImportError:
+        return False
+
+
+def _offload(fn, *args):
+    """Run a CPU-bound call without blocking the eventlet hub."""
+    with _semaphore():
+        if _eventlet_patched():
+            from eventlet import tpool
+            return tpool.execute(fn, *args)
+        return fn(*args)
+
+
+def hash_password(password):
+    method = hash_method()
+    return _offload(generate_password_hash, password, method)
+
+
+def verify_password(stored_hash, password):
+    if not stored_hash or password is None:
+        return False
+    try:
+        return _offload(check_password_hash, stored_hash, password)
+    except (TypeError, ValueError) as e:
+        # Malformed or unsupported hash in the database
+        logger.warning(f"⚠️ Could not verify password hash: {e}")
+        return False
+
+
+def needs_rehash(stored_hash):
+    """True when `stored_hash` was made with a different method or cost than configured."""
+    if not stored_hash or "$" not in stored_hash:
+        return True
+    return stored_hash.split("$", 1)[0] != hash_method()
+
+
+def verify_and_update(user, password):
+    """
+    Check `password` against `user.password_hashed`. On success, replace an
+    outdated hash in place (the caller commits). Returns whether it matched.
+    """
+    if not verify_password(user.password_hashed, password):
+        return False
+    if needs_rehash(user.password_hashed):
+        try:
+            user.password_hashed = hash_password(password)
+            logger.info(f"🔐 Rehashed password for user {user.id} with {hash_method().split(':')[0]}")
+        except Exception as e:
+            logger.warning(f"⚠️ Password rehash failed for user {user.id}: {e}")
+    return True
@@ -7,6 +7,9 @@ from werkzeug.utils import secure_filename
 from flask import current_app, request
 from datetime import datetime
 import os, uuid
+import logging
+
+logger = logging.getLogger(__name__)
 
 output_fields = {
     "applicant_id": fields.Integer,
@@ -83,6 +86,15 @@ MUTABLE = [
 
 def missing(v): return v is None or (isinstance(v,str) and not v.strip())
 
+def _process_resume(cand):
+    """Extract + hash the new resume and queue its pre-parse; never fails the upload."""
+    from application.controller.applicant.resume_processing import process_resume_upload
+    try:
+        process_resume_upload(cand)
+    except Exception as e:
+        db.session.rollback()
+        logger.warning(f"⚠️ Resume processing failed for applicant {cand.applicant_id}: {e}")
+
 class ApplicantAPI(Resource):
 
     @marshal_with(output_fields)
@@ -139,6 +151,7 @@ class ApplicantAPI(Resource):
                 existing.cover_letter_uploaded_at = datetime.utcnow()
 
             db.session.commit()
+            if resume: _process_resume(existing)
             return marshal(existing, output_fields),200
 
         if not args.get('name'): return {'message':'name required'},400
@@ -196,6 +209,7 @@ class ApplicantAPI(Resource):
         try:
             db.session.add(cand)
             db.session.commit()
+            _process_resume(cand)
             return marshal(cand, output_fields),201
         except SQLAlchemyError as e:
             _del(rp)
@@ -265,12 +279,15 @@ class ApplicantAPI(Resource):
             # This can be extended when model fields are added
 
         db.session.commit()
+        if resume: _process_resume(cand)
         return marshal(cand, output_fields),200
 
     def delete(self, applicant_id):
         cand = ApplicantProfile.query.get_or_404(applicant_id)
         _del(cand.resume_file_path)
         _del(cand.cover_letter_file_path)
+        from application.controller.applicant.models import ResumeDocument
+        ResumeDocument.query.filter_by(applicant_id=applicant_id).delete()
         db.session.delete(cand)
         db.session.commit()
         return '',200
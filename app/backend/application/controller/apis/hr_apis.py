@@ -3,7 +3,7 @@ from werkzeug.exceptions import NotFound, BadRequest, Conflict
 from application.data.database import db
 from application.data.models import *
 from application.utils.validation import *
-from werkzeug.security import generate_password_hash
+from application.auth.credentials import hash_password
 from werkzeug.datastructures import FileStorage
 from werkzeug.utils import secure_filename
 from flask import current_app, request
@@ -95,7 +95,7 @@ class HRApi(Resource):
                 if not password:
                     raise BadRequest("password is required when creating a new user.")
 
-                hashed = generate_password_hash(password)
+                hashed = hash_password(password)
                 user = User(name=name, email=email, phone=args.get('phone'), password_hashed=hashed)
                 try:
                     user.role = 'hr'
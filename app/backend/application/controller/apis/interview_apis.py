@@ -8,6 +8,7 @@ from sqlalchemy.exc import SQLAlchemyError
 from datetime import date, time, datetime, timedelta  # ✅ UPDATED: Added datetime, timedelta
 import os
 import json
+from application.controller.interview.models import InterviewEvaluationSummary
 
 # ============= EXISTING CRUD API (UNCHANGED) =============
 
@@ -359,43 +360,64 @@ def get_recordings_path():
     return os.path.join(current_app.root_path, '..', 'recordings')
 
 class HRInterviewList(Resource):
-    """GET /api/hr/interviews/<company_id> - List completed interviews for HR dashboard"""
-    
+    """GET /api/hr/interviews/<company_id> - List completed interviews for HR dashboard
+
+    Optional query params:
+      - min_rating / max_rating: filter on overall_rating
+      - recommendation: filter on the recommendation decision (e.g. "Hire")
+      - sort: date (default) | rating | duration
+      - order: desc (default) | asc
+    """
+
+    SORT_COLUMNS = {
+        'date': Interview.interview_date,
+        'rating': InterviewEvaluationSummary.overall_rating,
+        'duration': InterviewEvaluationSummary.duration_minutes,
+    }
+
     def get(self, company_id):
         try:
-            interviews = db.session.query(
+            # Single query: evaluation numbers come from the indexed summary table
+            query = db.session.query(
                 Interview,
                 Application,
                 JobPosting,
-                ApplicantProfile
+                ApplicantProfile,
+                InterviewEvaluationSummary
             ).join(
                 Application, Interview.application_id == Application.id
             ).join(
                 JobPosting, Application.job_id == JobPosting.id
             ).join(
                 ApplicantProfile, Application.applicant_id == ApplicantProfile.applicant_id
+            ).outerjoin(
+                InterviewEvaluationSummary, InterviewEvaluationSummary.interview_id == Interview.id
             ).filter(
                 JobPosting.company_id == company_id,
                 Interview.status == 'completed',
                 Interview.interview_recording_url.isnot(None)
-            ).order_by(
-                Interview.interview_date.desc()
-            ).all()
-            
+            )
+
+            min_rating = request.args.get('min_rating', type=float)
+            max_rating = request.args.get('max_rating', type=float)
+            recommendation = request.args.get('recommendation')
+            if min_rating is not None:
+                query = query.filter(InterviewEvaluationSummary.overall_rating >= min_rating)
+            if max_rating is not None:
+                query = query.filter(InterviewEvaluationSummary.overall_rating <= max_rating)
+            if recommendation:
+                query = query.filter(InterviewEvaluationSummary.recommendation == recommendation)
+
+            sort_col = self.SORT_COLUMNS.get(request.args.get('sort', 'date'), Interview.interview_date)
+            if request.args.get('order', 'desc').lower() == 'asc':
+                query = query.order_by(sort_col.asc(), Interview.id.asc())
+            else:
+                query = query.order_by(sort_col.desc(), Interview.id.desc())
+
             result = []
-            recordings_base = get_recordings_path()
-            
-            for interview, application, job, applicant in interviews:
+            for interview, application, job, applicant, summary in query.all():
                 session_id = extract_session_id(interview.interview_recording_url)
-                
-                metadata = {}
-                evaluation = {}
-                
-                if session_id:
-                    session_path = os.path.join(recordings_base, session_id)
-                    metadata = load_json_file(os.path.join(session_path, 'metadata.json'))
-                    evaluation = load_json_file(os.path.join(session_path, 'evaluation.json'))
-                
+
                 result.append({
                     'interview_id': interview.id,
                     'session_id': session_id,
@@ -403,10 +425,10 @@ class HRInterviewList(Resource):
                     'job_title': job.job_title,
                     'interview_date': interview.interview_date.isoformat() if interview.interview_date else None,
                     'stage': interview.stage,
-                    'duration_minutes': metadata.get('duration_minutes', 0),
-                    'questions_asked': metadata.get('questions_asked', 0),
-                    'overall_rating': evaluation.get('overall_rating', 0),
-                    'recommendation': evaluation.get('recommendation', 'N/A'),
+                    'duration_minutes': summary.duration_minutes or 0 if summary else 0,
+                    'questions_asked': summary.questions_asked or 0 if summary else 0,
+                    'overall_rating': summary.overall_rating or 0 if summary else 0,
+                    'recommendation': summary.recommendation_payload() if summary else 'N/A',
                     'video_url': interview.interview_recording_url,
                     'application_id': application.id,
                     'application_status': application.status
@@ -5,6 +5,8 @@ from application.data.models import (
     Project, Certification
 )
 from application.data.database import db
+from application.utils.events import publish, ProfileUpdated
+from application.controller.applicant.resume_processing import resume_processing_status
 from flask import send_file
 import os
 
@@ -93,6 +95,17 @@ def get_candidate_profile(application_id):
     }, 200
 
 
+# RESUME PROCESSING
+
+@applicant_bp.route('/<int:applicant_id>/resume/processing', methods=['GET'])
+def get_resume_processing(applicant_id):
+    """Upload-time extraction and background pre-parse status of the current resume"""
+    status = resume_processing_status(applicant_id)
+    if not status:
+        return {"error": "No processed resume for this applicant"}, 404
+    return jsonify(status), 200
+
+
 # EXPERIENCE
 
 @applicant_bp.route('/<int:applicant_id>/experiences', methods=['GET'])
@@ -129,6 +142,8 @@ def add_experience(applicant_id):
 @applicant_bp.route('/<int:applicant_id>/experiences', methods=['DELETE'])
 def delete_all_experiences(applicant_id):
     PreviousExperience.query.filter_by(applicant_id=applicant_id).delete()
+    # bulk deletes skip the flush-time detectors
+    publish(ProfileUpdated(applicant_id, ("experiences",)))
     db.session.commit()
     return {"message": "All experiences deleted"}, 200
 
@@ -173,6 +188,7 @@ def add_education(applicant_id):
 @applicant_bp.route('/<int:applicant_id>/education', methods=['DELETE'])
 def delete_all_education(applicant_id):
     PreviousEducation.query.filter_by(applicant_id=applicant_id).delete()
+    publish(ProfileUpdated(applicant_id, ("educations",)))
     db.session.commit()
     return {"message": "All education deleted"}, 200
 
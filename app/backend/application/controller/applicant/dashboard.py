@@ -1,15 +1,23 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint, jsonify, abort
 from application.data.models import *
 from application.data.database import db
 from sqlalchemy import func
+from sqlalchemy.orm import joinedload
+from application.controller.applicant.summary import (
+    grouped_status_counts,
+    dashboard_status_counts,
+    profile_completeness,
+)
 
 applicant_dashboard_bp = Blueprint("applicant_dashboard", __name__)
 
 @applicant_dashboard_bp.route("/<int:applicant_id>", methods=["GET"])
 def get_applicant_dashboard(applicant_id):
 
-    # Get applicant profile
-    profile = ApplicantProfile.query.get_or_404(applicant_id)
+    # Profile row and GROUP BY status counts in one statement
+    profile, counts = grouped_status_counts(applicant_id, with_profile=True)
+    if profile is None:
+        abort(404)
 
     # Applicant name
     applicant_name = profile.name
@@ -17,6 +25,7 @@ def get_applicant_dashboard(applicant_id):
     # ---- Recent Applications ----
     recent_apps = (
         Application.query
+        .options(joinedload(Application.job).joinedload(JobPosting.company))
         .filter_by(applicant_id=applicant_id)
         .order_by(Application.applied_date.desc())
         .limit(5)
@@ -35,43 +44,19 @@ def get_applicant_dashboard(applicant_id):
     ]
 
     # ---- Applications by Status ----
-    status_counts = {
-        "Applied": Application.query.filter_by(applicant_id=applicant_id, status="submitted").count(),
-        "Shortlisted": Application.query.filter_by(applicant_id=applicant_id, status="shortlisted").count(),
-        "Interview": Application.query.filter_by(applicant_id=applicant_id, status="interview").count(),
-        "Offer": Application.query.filter_by(applicant_id=applicant_id, status="offered").count(),
-        "Rejected": Application.query.filter_by(applicant_id=applicant_id, status="rejected").count(),
-    }
+    status_counts = dashboard_status_counts(counts)
 
     # ---- Profile Completeness ----
-    profile_fields = [
-        profile.name,
-        profile.address,
-        profile.gender,
-        profile.highest_qualification,
-        profile.institution_name,
-        profile.graduation_year,
-        profile.skills,
-        profile.preferred_location,
-        profile.years_of_experience,
-        profile.current_job_title,
-        profile.linkedin_url,
-        profile.github_url,
-        profile.portfolio_url,
-        profile.current_company,
-        profile.notice_period,
-        profile.resume_filename,
-        profile.cover_letter_filename
-    ]
-
-    filled_fields = sum(1 for f in profile_fields if f not in (None, "", "null"))
-    total_fields = len(profile_fields)
-
-    profile_completion_percentage = int((filled_fields / total_fields) * 100)
+    profile_completion_percentage = profile_completeness(profile)
 
     # ---- Upcoming Interviews ----
     upcoming = (
         Interview.query
+        .options(
+            joinedload(Interview.application)
+            .joinedload(Application.job)
+            .joinedload(JobPosting.company)
+        )
         .filter(Interview.interviewee_id == applicant_id)
         .filter(Interview.interview_date >= func.current_date())
         .order_by(Interview.interview_date.asc())
@@ -0,0 +1,92 @@
+"""
+Applicant-side derived tables.
+
+ResumeDocument holds what upload-time processing got out of an applicant's
+current resume: the extracted text with the file's content hash, and the
+state and result of the background pre-parse (see resume_processing.py).
+Apply and interview start read the text from here instead of opening the
+PDF again.
+
+ResumeSignature and ResumeLshBucket hold the MinHash signature of that text
+and its LSH band buckets (see resume_dedup.py), so near-duplicate resumes
+are found with an indexed lookup instead of comparing against every profile.
+"""
+from datetime import datetime
+
+from application.data.database import db
+
+
+class ResumeDocument(db.Model):
+    __tablename__ = "resume_document"
+
+    PENDING = "pending"
+    PARSED = "parsed"
+    FAILED = "failed"
+    # nothing to parse (text extraction failed)
+    SKIPPED = "skipped"
+
+    id = db.Column(db.Integer, primary_key=True)
+    applicant_id = db.Column(db.Integer, nullable=False, unique=True, index=True)
+    # resume_file_path the text was extracted from; a new upload gets a new path
+    file_path = db.Column(db.String(512))
+    # sha256 of the file bytes
+    content_hash = db.Column(db.String(64), index=True)
+    text = db.Column(db.Text)
+    char_count = db.Column(db.Integer)
+    extract_error = db.Column(db.Text)
+    extracted_at = db.Column(db.DateTime)
+    parse_status = db.Column(db.String(16), index=True)
+    parse_error = db.Column(db.Text)
+    parsed_at = db.Column(db.DateTime)
+    # Structured profile from the pre-parse (JSON text)
+    profile_json = db.Column(db.Text)
+    # Ids of the experience/education/certification rows the pre-parse inserted (JSON text)
+    imported_json = db.Column(db.Text)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def to_dict(self):
+        import json
+        return {
+            "applicant_id": self.applicant_id,
+            "content_hash": self.content_hash,
+            "has_text": bool(self.text),
+            "char_count": self.char_count,
+            "extract_error": self.extract_error,
+            "extracted_at": self.extracted_at.isoformat() if self.extracted_at else None,
+            "parse_status": self.parse_status,
+            "parse_error": self.parse_error,
+            "parsed_at": self.parsed_at.isoformat() if self.parsed_at else None,
+            "profile": json.loads(self.profile_json) if self.profile_json else None,
+        }
+
+    def __repr__(self):
+        return f"<ResumeDocument applicant={self.applicant_id} parse={self.parse_status}>"
+
+
+class ResumeSignature(db.Model):
+    __tablename__ = "resume_signature"
+
+    id = db.Column(db.Integer, primary_key=True)
+    applicant_id = db.Column(db.Integer, nullable=False, unique=True, index=True)
+    # ResumeDocument.content_hash the signature was computed for
+    content_hash = db.Column(db.String(64))
+    # NUM_PERM little-endian uint32 minimums
+    minhash = db.Column(db.LargeBinary, nullable=False)
+    shingle_count = db.Column(db.Integer)
+    computed_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<ResumeSignature applicant={self.applicant_id} shingles={self.shingle_count}>"
+
+
+class ResumeLshBucket(db.Model):
+    __tablename__ = "resume_lsh_bucket"
+    __table_args__ = (
+        db.Index("ix_resume_lsh_bucket_band_bucket", "band", "bucket"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    applicant_id = db.Column(db.Integer, nullable=False, index=True)
+    band = db.Column(db.SmallInteger, nullable=False)
+    # 64-bit hash of the band's rows of the signature
+    bucket = db.Column(db.BigInteger, nullable=False)
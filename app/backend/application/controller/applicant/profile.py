@@ -1,10 +1,12 @@
 from flask import Blueprint, jsonify
 from application.data.models import *
 from application.data.database import db
+from application.utils.cache import response_cache
 
 applicant_profile_bp = Blueprint("applicant_profile", __name__)
 
 @applicant_profile_bp.route("/<int:applicant_id>", methods=["GET"])
+@response_cache.cached_view(tags=("applicant:{applicant_id}",))
 def get_full_profile(applicant_id):
 
     applicant = ApplicantProfile.query.get_or_404(applicant_id)
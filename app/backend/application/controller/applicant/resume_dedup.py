@@ -0,0 +1,267 @@
+"""
+Near-duplicate resume detection.
+
+The same resume often comes back under another account or file name, with a
+changed phone number or a reordered skills line. An exact content hash (as
+used at upload) misses those; a MinHash signature does not. Each resume's
+text is reduced to its set of word 3-shingles, and the signature keeps the
+minimum of NUM_PERM hash functions over that set. The share of positions two
+signatures agree on estimates the Jaccard similarity of the two resumes.
+
+Signatures are split into BANDS bands of ROWS rows. Every band is hashed into
+a ResumeLshBucket row, and resumes sharing any bucket are candidates. With
+16 bands of 8 rows, a pair at similarity 0.85 becomes a candidate 99% of the
+time and a pair at 0.5 only 6% of the time, so a lookup costs one indexed
+query plus verifying a handful of signatures, whatever the number of
+profiles.
+
+Signatures are written at upload (resume_processing.py). `python backfill.py
+resume-signatures` computes them for resumes stored before that.
+
+Config (read per call, all optional):
+    RESUME_DUPLICATE_THRESHOLD      similarity for the HR duplicates view (default 0.85)
+    RESUME_SCORE_REUSE              reuse a near-duplicate's LLM score for the same JD (default True)
+    RESUME_SCORE_REUSE_THRESHOLD    similarity required for that reuse (default 0.95)
+"""
+import hashlib
+import logging
+import re
+import zlib
+from datetime import datetime
+
+import numpy as np
+from flask import current_app
+from sqlalchemy import and_, or_
+
+from application.data.database import db
+from application.data.models import Application, JobPosting
+from application.controller.applicant.models import ResumeDocument, ResumeSignature, ResumeLshBucket
+
+logger = logging.getLogger(__name__)
+
+SHINGLE_WORDS = 3
+BANDS = 16
+ROWS = 8
+NUM_PERM = BANDS * ROWS
+LOOKUP_BATCH = 500
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+# Multiply-shift hash family: h(x) = (a * x + b) mod 2^64 >> 32, a odd.
+# The seed is fixed: stored signatures must stay comparable across restarts.
+_rng = np.random.default_rng(0x5EED)
+_A = _rng.integers(1, 2 ** 63, size=NUM_PERM, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+_B = _rng.integers(0, 2 ** 63, size=NUM_PERM, dtype=np.uint64)
+del _rng
+
+
+def shingles(text, k=SHINGLE_WORDS):
+    words = _WORD_RE.findall((text or "").lower())
+    if len(words) < k:
+        return set(words)
+    return {" ".join(words[i:i + k]) for i in range(len(words) - k + 1)}
+
+
+def minhash(text):
+    """MinHash signature (NUM_PERM uint32) of the text, or None when it has no words."""
+    grams = shingles(text)
+    if not grams:
+        return None
+    x = np.fromiter((zlib.crc32(g.encode("utf-8")) for g in grams), dtype=np.uint64, count=len(grams))
+    hashed = (_A[:, None] * x[None, :] + _B[:, None]) >> np.uint64(32)
+    return hashed.min(axis=1).astype(np.uint32)
+
+
+def similarity(a, b):
+    """Estimated Jaccard similarity of two signatures."""
+    return float(np.count_nonzero(a == b)) / NUM_PERM
+
+
+def band_buckets(signature):
+    """(band, bucket) pairs of a signature; bucket is a signed 64-bit hash."""
+    rows = signature.astype("<u4").reshape(BANDS, ROWS)
+    return [
+        (band, int.from_bytes(hashlib.blake2b(rows[band].tobytes(), digest_size=8).digest(), "big", signed=True))
+        for band in range(BANDS)
+    ]
+
+
+def _decode(blob):
+    return np.frombuffer(blob, dtype="<u4").astype(np.uint32)
+
+
+# ---------------------------------------------------------------------------
+# Storage
+# ---------------------------------------------------------------------------
+
+def update_resume_signature(doc):
+    """Write (or clear) the signature and LSH buckets for a ResumeDocument. Does not commit."""
+    applicant_id = doc.applicant_id
+    ResumeLshBucket.query.filter_by(applicant_id=applicant_id).delete(synchronize_session=False)
+    row = ResumeSignature.query.filter_by(applicant_id=applicant_id).first()
+
+    signature = minhash(doc.text) if doc.text else None
+    if signature is None:
+        if row is not None:
+            db.session.delete(row)
+        return None
+
+    if row is None:
+        row = ResumeSignature(applicant_id=applicant_id)
+        db.session.add(row)
+    row.content_hash = doc.content_hash
+    row.minhash = signature.astype("<u4").tobytes()
+    row.shingle_count = len(shingles(doc.text))
+    row.computed_at = datetime.utcnow()
+    db.session.add_all(
+        ResumeLshBucket(applicant_id=applicant_id, band=band, bucket=bucket)
+        for band, bucket in band_buckets(signature)
+    )
+    return signature
+
+
+def backfill_signatures(batch_size=200):
+    """Compute signatures for stored resume text that has none (or an outdated one). Commits per batch."""
+    written = 0
+    last_id = 0
+    while True:
+        docs = (
+            ResumeDocument.query
+            .outerjoin(ResumeSignature, ResumeSignature.applicant_id == ResumeDocument.applicant_id)
+            .filter(ResumeDocument.id > last_id, ResumeDocument.text.isnot(None))
+            .filter(or_(ResumeSignature.id.is_(None), ResumeSignature.content_hash != ResumeDocument.content_hash))
+            .order_by(ResumeDocument.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not docs:
+            return written
+        for doc in docs:
+            if update_resume_signature(doc) is not None:
+                written += 1
+        last_id = docs[-1].id
+        db.session.commit()
+
+
+# ---------------------------------------------------------------------------
+# Lookup
+# ---------------------------------------------------------------------------
+
+def _signatures(applicant_ids):
+    found = {}
+    ids = list(applicant_ids)
+    for start in range(0, len(ids), LOOKUP_BATCH):
+        rows = (
+            db.session.query(ResumeSignature.applicant_id, ResumeSignature.minhash)
+            .filter(ResumeSignature.applicant_id.in_(ids[start:start + LOOKUP_BATCH]))
+        )
+        found.update((applicant_id, _decode(blob)) for applicant_id, blob in rows)
+    return found
+
+
+def near_duplicates(signature, threshold, exclude_applicant=None):
+    """[(applicant_id, similarity)] of stored resumes at or above `threshold`, most similar first."""
+    if signature is None:
+        return []
+    buckets = or_(*[
+        and_(ResumeLshBucket.band == band, ResumeLshBucket.bucket == bucket)
+        for band, bucket in band_buckets(signature)
+    ])
+    query = db.session.query(ResumeLshBucket.applicant_id).filter(buckets).distinct()
+    if exclude_applicant is not None:
+        query = query.filter(ResumeLshBucket.applicant_id != exclude_applicant)
+    candidates = [applicant_id for (applicant_id,) in query]
+
+    matches = [
+        (applicant_id, similarity(signature, other))
+        for applicant_id, other in _signatures(candidates).items()
+    ]
+    return sorted((m for m in matches if m[1] >= threshold), key=lambda m: (-m[1], m[0]))
+
+
+def duplicate_groups(applicant_ids, threshold):
+    """
+    Group the given applicants whose resumes are near-duplicates of each other.
+    Returns [(sorted applicant ids, lowest verified pair similarity)], largest groups first.
+    """
+    ids = list(set(applicant_ids))
+    by_bucket = {}
+    for start in range(0, len(ids), LOOKUP_BATCH):
+        rows = (
+            db.session.query(ResumeLshBucket.band, ResumeLshBucket.bucket, ResumeLshBucket.applicant_id)
+            .filter(ResumeLshBucket.applicant_id.in_(ids[start:start + LOOKUP_BATCH]))
+        )
+        for band, bucket, applicant_id in rows:
+            by_bucket.setdefault((band, bucket), []).append(applicant_id)
+
+    # Each bucket is checked against its first member rather than pairwise, so a
+    # widely shared resume costs linear work; other bands link the rest
+    pairs = set()
+    for members in by_bucket.values():
+        if len(members) > 1:
+            members.sort()
+            pairs.update((members[0], other) for other in members[1:])
+    if not pairs:
+        return []
+
+    signatures = _signatures({a for pair in pairs for a in pair})
+    parent = {}
+
+    def find(a):
+        parent.setdefault(a, a)
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        return a
+
+    weakest = {}
+    verified = []
+    for a, b in pairs:
+        if a in signatures and b in signatures:
+            score = similarity(signatures[a], signatures[b])
+            if score >= threshold:
+                verified.append((a, b, score))
+                parent[find(a)] = find(b)
+    for a, b, score in verified:
+        root = find(a)
+        weakest[root] = min(weakest.get(root, 1.0), score)
+
+    groups = {}
+    for a in parent:
+        groups.setdefault(find(a), []).append(a)
+    result = [(sorted(members), weakest[root]) for root, members in groups.items() if len(members) > 1]
+    return sorted(result, key=lambda g: (-len(g[0]), g[0][0]))
+
+
+def reusable_scoring(application, resume_text):
+    """
+    A scored Application of a near-identical resume against the same job
+    description, as (application, similarity), or None. Same JD means the
+    same job, or another job with an identical inline description.
+    """
+    config = current_app.config
+    if not config.get("RESUME_SCORE_REUSE", True):
+        return None
+    duplicates = near_duplicates(minhash(resume_text), float(config.get("RESUME_SCORE_REUSE_THRESHOLD", 0.95)),
+                                 exclude_applicant=application.applicant_id)
+    if not duplicates:
+        return None
+    similar = dict(duplicates)
+
+    job = db.session.get(JobPosting, application.job_id)
+    same_jd = Application.job_id == application.job_id
+    description = (job.job_description or "").strip() if job is not None else ""
+    if description:
+        same_jd = or_(same_jd, JobPosting.job_description == job.job_description)
+    prior = (
+        Application.query
+        .join(JobPosting, JobPosting.id == Application.job_id)
+        .filter(Application.applicant_id.in_(list(similar)), Application.id != application.id)
+        .filter(Application.resume_score.isnot(None), Application.ai_feedback.isnot(None))
+        .filter(same_jd)
+        .all()
+    )
+    if not prior:
+        return None
+    best = max(prior, key=lambda a: (similar[a.applicant_id], a.job_id == application.job_id, -a.id))
+    return best, similar[best.applicant_id]
@@ -0,0 +1,341 @@
+"""
+Upload-time resume processing.
+
+`process_resume_upload` runs right after a resume is saved: it hashes the
+file, extracts its text once (or reuses the text of an identical file already
+on record) and stores both in ResumeDocument, along with the text's MinHash
+signature for near-duplicate lookups (resume_dedup.py). The structured
+pre-parse (skills, experience, education, certifications) is an LLM call, so
+it runs in a background thread pool; `preparse_resume` does the work and can
+also be called directly.
+
+Pre-parsed rows go into the existing PreviousExperience / PreviousEducation /
+Certification tables. A section the applicant already filled in by hand is
+left alone, and rows from an earlier pre-parse are replaced when a new resume
+is parsed. Profile skills and years of experience are only filled when empty.
+
+Config (read per call, all optional):
+    RESUME_PREPARSE_BACKGROUND  run the pre-parse after upload (default True; off under TESTING)
+    RESUME_PREPARSE_WORKERS     background threads (default 2)
+"""
+import hashlib
+import json
+import logging
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+
+from flask import current_app
+
+from application.data.database import db
+from application.data.models import ApplicantProfile, PreviousExperience, PreviousEducation, Certification
+from application.controller.applicant.models import ResumeDocument
+from application.controller.applicant.resume_dedup import update_resume_signature
+from application.controller.resume_parser.parser_service import (
+    extract_text_from_file, call_gemini_once, clean_json_response,
+)
+from application.controller.resume_parser.packing import pack_resume
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+PREPARSE_PROMPT = (
+    "You are an expert HR AI. Extract the candidate's profile from the resume below.\n"
+    "Return ONLY a JSON object with exactly these keys:\n"
+    "{\n"
+    '  "skills": ["skill", ...],\n'
+    '  "total_experience_years": number,\n'
+    '  "experience": [{"position": "", "company": "", "start_date": "YYYY-MM", "end_date": "YYYY-MM or null", "description": ""}],\n'
+    '  "education": [{"university": "", "degree": "", "field": "", "grade": "", "start_date": "YYYY-MM", "end_date": "YYYY-MM"}],\n'
+    '  "certifications": [{"certificate_name": "", "issuing_organization": "", "issue_date": "YYYY-MM", "credential_id": ""}]\n'
+    "}\n"
+    "Use only information present in the resume; use null for unknown values and [] for missing sections.\n\n"
+    "Resume Text:\n"
+)
+
+
+def file_sha256(path, chunk_size=1 << 16):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Read side
+# ---------------------------------------------------------------------------
+
+def stored_resume_text(profile):
+    """Precomputed text of the profile's current resume, or None."""
+    if profile is None or not profile.resume_file_path:
+        return None
+    doc = ResumeDocument.query.filter_by(applicant_id=profile.applicant_id).first()
+    if doc and doc.text and doc.file_path == profile.resume_file_path:
+        return doc.text
+    return None
+
+
+def resume_processing_status(applicant_id):
+    doc = ResumeDocument.query.filter_by(applicant_id=applicant_id).first()
+    return doc.to_dict() if doc else None
+
+
+# ---------------------------------------------------------------------------
+# Upload stage
+# ---------------------------------------------------------------------------
+
+def process_resume_upload(profile):
+    """
+    Hash and extract the profile's just-saved resume, then queue the pre-parse.
+    Commits. Extraction errors are recorded, not raised.
+    """
+    path = profile.resume_file_path
+    digest = file_sha256(path)
+    now = datetime.utcnow()
+
+    doc = ResumeDocument.query.filter_by(applicant_id=profile.applicant_id).first()
+    if doc is None:
+        doc = ResumeDocument(applicant_id=profile.applicant_id)
+        db.session.add(doc)
+    elif doc.content_hash == digest and doc.text:
+        # Same file uploaded again: keep the text, and the parse if there is one
+        doc.file_path = path
+        retry = doc.parse_status != ResumeDocument.PARSED
+        if retry:
+            doc.parse_status = ResumeDocument.PENDING
+        db.session.commit()
+        if retry:
+            schedule_preparse(profile.applicant_id)
+        return doc
+
+    doc.file_path = path
+    doc.content_hash = digest
+    doc.extract_error = None
+    doc.parse_error = None
+    doc.parsed_at = None
+    doc.profile_json = None
+    doc.extracted_at = now
+
+    # Another applicant (or an earlier upload) may already have this exact file
+    twin = (
+        ResumeDocument.query
+        .filter(ResumeDocument.content_hash == digest, ResumeDocument.text.isnot(None))
+        .filter(ResumeDocument.applicant_id != profile.applicant_id)
+        .first()
+    )
+    if twin is not None:
+        doc.text = twin.text
+    else:
+        try:
+            doc.text = extract_text_from_file(path)
+        except Exception as e:
+            doc.text = None
+            doc.extract_error = str(e)[:1000]
+            logger.warning(f"⚠️ Resume text extraction failed for applicant {profile.applicant_id}: {e}")
+
+    doc.char_count = len(doc.text) if doc.text else 0
+    doc.parse_status = ResumeDocument.PENDING if doc.text else ResumeDocument.SKIPPED
+    update_resume_signature(doc)
+    db.session.commit()
+
+    if doc.parse_status == ResumeDocument.PENDING:
+        schedule_preparse(profile.applicant_id)
+    return doc
+
+
+def _get_executor(workers):
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="resume-preparse")
+    return _executor
+
+
+def schedule_preparse(applicant_id):
+    """Run preparse_resume in the background; returns whether it was scheduled."""
+    app = current_app._get_current_object()
+    if app.config.get("TESTING") or not app.config.get("RESUME_PREPARSE_BACKGROUND", True):
+        return False
+
+    def run():
+        with app.app_context():
+            try:
+                preparse_resume(applicant_id)
+            except Exception as e:
+                logger.exception(f"❌ Resume pre-parse crashed for applicant {applicant_id}: {e}")
+            finally:
+                db.session.remove()
+
+    _get_executor(max(1, int(app.config.get("RESUME_PREPARSE_WORKERS", 2)))).submit(run)
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Pre-parse
+# ---------------------------------------------------------------------------
+
+def _parse_resume_date(value):
+    """'2021-03', '2021-03-15', '2021', 'Mar 2021' -> date; 'present'/None -> None."""
+    if not value or not isinstance(value, str):
+        return None
+    value = value.strip()
+    for fmt in ("%Y-%m-%d", "%Y-%m", "%Y/%m", "%b %Y", "%B %Y", "%Y"):
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    match = re.search(r"\b(19|20)\d{2}\b", value)
+    return date(int(match.group(0)), 1, 1) if match else None
+
+
+def _text(value, limit=255):
+    if value is None:
+        return None
+    value = str(value).strip()
+    return value[:limit] if value and value.lower() not in ("null", "none", "n/a") else None
+
+
+def normalize_profile(data):
+    """Coerce the model's JSON into the shape stored in profile_json."""
+    if not isinstance(data, dict):
+        raise ValueError("Pre-parse response is not a JSON object")
+
+    def items(key):
+        value = data.get(key) or []
+        return [item for item in value if isinstance(item, dict)] if isinstance(value, list) else []
+
+    skills = []
+    for skill in data.get("skills") or []:
+        skill = _text(skill, 100)
+        if skill and skill.lower() not in {s.lower() for s in skills}:
+            skills.append(skill)
+    try:
+        years = max(0.0, float(data.get("total_experience_years") or 0))
+    except (TypeError, ValueError):
+        years = 0.0
+
+    return {
+        "skills": skills,
+        "total_experience_years": years,
+        "experience": [
+            {
+                "position": _text(e.get("position")),
+                "company": _text(e.get("company")),
+                "start_date": _text(e.get("start_date"), 20),
+                "end_date": _text(e.get("end_date"), 20),
+                "description": _text(e.get("description"), 2000),
+            }
+            for e in items("experience") if _text(e.get("position")) or _text(e.get("company"))
+        ],
+        "education": [
+            {
+                "university": _text(e.get("university")),
+                "degree": _text(e.get("degree")),
+                "field": _text(e.get("field")),
+                "grade": _text(e.get("grade"), 20),
+                "start_date": _text(e.get("start_date"), 20),
+                "end_date": _text(e.get("end_date"), 20),
+            }
+            for e in items("education") if _text(e.get("university")) or _text(e.get("degree"))
+        ],
+        "certifications": [
+            {
+                "certificate_name": _text(c.get("certificate_name")),
+                "issuing_organization": _text(c.get("issuing_organization")),
+                "issue_date": _text(c.get("issue_date"), 20),
+                "credential_id": _text(c.get("credential_id")),
+            }
+            for c in items("certifications") if _text(c.get("certificate_name"))
+        ],
+    }
+
+
+SECTIONS = (
+    ("experience", PreviousExperience, lambda aid, e: PreviousExperience(
+        applicant_id=aid, position=e["position"], company=e["company"],
+        start_date=_parse_resume_date(e["start_date"]), end_date=_parse_resume_date(e["end_date"]),
+        description=e["description"],
+    )),
+    ("education", PreviousEducation, lambda aid, e: PreviousEducation(
+        applicant_id=aid, university=e["university"], degree=e["degree"], field=e["field"], grade=e["grade"],
+        start_date=_parse_resume_date(e["start_date"]), end_date=_parse_resume_date(e["end_date"]),
+    )),
+    ("certifications", Certification, lambda aid, c: Certification(
+        applicant_id=aid, certificate_name=c["certificate_name"], issuing_organization=c["issuing_organization"],
+        issue_date=_parse_resume_date(c["issue_date"]), credential_id=c["credential_id"],
+    )),
+)
+
+
+def _import_sections(doc, profile_data):
+    """Replace earlier pre-parsed rows; skip sections the applicant maintains by hand."""
+    applicant_id = doc.applicant_id
+    imported = json.loads(doc.imported_json) if doc.imported_json else {}
+
+    for key, model, build in SECTIONS:
+        previous_ids = imported.get(key) or []
+        if previous_ids:
+            for row in model.query.filter(model.applicant_id == applicant_id, model.id.in_(previous_ids)).all():
+                db.session.delete(row)
+            db.session.flush()
+
+        if model.query.filter_by(applicant_id=applicant_id).first() is not None:
+            imported[key] = []
+            continue
+
+        rows = [build(applicant_id, item) for item in profile_data[key]]
+        db.session.add_all(rows)
+        db.session.flush()
+        imported[key] = [row.id for row in rows]
+
+    doc.imported_json = json.dumps(imported)
+
+    profile = db.session.get(ApplicantProfile, applicant_id)
+    if profile is not None:
+        if not (profile.skills or "").strip() and profile_data["skills"]:
+            profile.skills = ", ".join(profile_data["skills"])
+        if profile.years_of_experience in (None, "") and profile_data["total_experience_years"]:
+            profile.years_of_experience = int(round(profile_data["total_experience_years"]))
+
+
+def preparse_resume(applicant_id):
+    """Structured pre-parse of the stored resume text. Returns the ResumeDocument (or None)."""
+    doc = ResumeDocument.query.filter_by(applicant_id=applicant_id).first()
+    if doc is None or not doc.text:
+        return None
+    content_hash = doc.content_hash
+
+    try:
+        resume = pack_resume(doc.text, current_app.config.get("PROMPT_RESUME_TOKENS", 2000))
+        raw = call_gemini_once(PREPARSE_PROMPT + resume.text)
+        profile_data = normalize_profile(json.loads(clean_json_response(raw)))
+    except Exception as e:
+        db.session.rollback()
+        doc = ResumeDocument.query.filter_by(applicant_id=applicant_id).first()
+        if doc is not None and doc.content_hash == content_hash:
+            doc.parse_status = ResumeDocument.FAILED
+            doc.parse_error = str(e)[:1000]
+            db.session.commit()
+        logger.warning(f"⚠️ Resume pre-parse failed for applicant {applicant_id}: {e}")
+        return doc
+
+    # A newer upload may have replaced the resume while the model was thinking
+    db.session.refresh(doc)
+    if doc.content_hash != content_hash:
+        logger.info(f"⏭️ Resume changed during pre-parse for applicant {applicant_id}; discarding result")
+        return doc
+
+    _import_sections(doc, profile_data)
+    doc.profile_json = json.dumps(profile_data)
+    doc.parse_status = ResumeDocument.PARSED
+    doc.parse_error = None
+    doc.parsed_at = datetime.utcnow()
+    db.session.commit()
+    logger.info(f"🧾 Pre-parsed resume for applicant {applicant_id}: "
+                f"{len(profile_data['skills'])} skills, {len(profile_data['experience'])} roles")
+    return doc
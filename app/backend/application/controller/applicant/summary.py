@@ -0,0 +1,92 @@
+"""
+Applicant-level aggregates shared by the applicant dashboard and the
+"my applications" listing.
+
+Application status counts come from a single GROUP BY status query. Profile
+completeness is cached under the applicant's profile tag and is only
+recomputed after the ApplicantProfile row itself changes.
+"""
+from sqlalchemy import func
+
+from application.data.database import db
+from application.data.models import Application, ApplicantProfile
+from application.utils.cache import response_cache
+
+# Dashboard bucket label -> Application.status
+STATUS_BUCKETS = {
+    "Applied": "submitted",
+    "Shortlisted": "shortlisted",
+    "Interview": "interview",
+    "Offer": "offered",
+    "Rejected": "rejected",
+}
+
+PROFILE_COMPLETENESS_FIELDS = (
+    "name",
+    "address",
+    "gender",
+    "highest_qualification",
+    "institution_name",
+    "graduation_year",
+    "skills",
+    "preferred_location",
+    "years_of_experience",
+    "current_job_title",
+    "linkedin_url",
+    "github_url",
+    "portfolio_url",
+    "current_company",
+    "notice_period",
+    "resume_filename",
+    "cover_letter_filename",
+)
+
+
+def grouped_status_counts(applicant_id, with_profile=False):
+    """
+    Count the applicant's applications per status in one GROUP BY query.
+
+    Returns {status: count}. With `with_profile` the ApplicantProfile row is
+    selected in the same statement and (profile, counts) is returned; profile
+    is None when the applicant does not exist.
+    """
+    if not with_profile:
+        rows = (
+            db.session.query(Application.status, func.count(Application.id))
+            .filter(Application.applicant_id == applicant_id)
+            .group_by(Application.status)
+            .all()
+        )
+        return {status: count for status, count in rows}
+
+    rows = (
+        db.session.query(ApplicantProfile, Application.status, func.count(Application.id))
+        .outerjoin(Application, Application.applicant_id == ApplicantProfile.applicant_id)
+        .filter(ApplicantProfile.applicant_id == applicant_id)
+        .group_by(ApplicantProfile.applicant_id, Application.status)
+        .all()
+    )
+    profile = rows[0][0] if rows else None
+    counts = {status: count for _, status, count in rows if status is not None and count}
+    return profile, counts
+
+
+def dashboard_status_counts(counts):
+    return {label: counts.get(status, 0) for label, status in STATUS_BUCKETS.items()}
+
+
+def compute_profile_completeness(profile):
+    values = [getattr(profile, field, None) for field in PROFILE_COMPLETENESS_FIELDS]
+    filled = sum(1 for v in values if v not in (None, "", "null"))
+    return int((filled / len(values)) * 100)
+
+
+def profile_completeness(profile):
+    """Cached completeness percentage; invalidated when the profile row changes."""
+    return response_cache.get_or_set(
+        "applicant.profile_completeness",
+        {"applicant_id": profile.applicant_id},
+        lambda: compute_profile_completeness(profile),
+        tags=[f"profile:{profile.applicant_id}"],
+        timeout=0,
+    )
@@ -1,19 +1,32 @@
 from flask import Blueprint, request, jsonify, current_app
 from application.data.models import Application, ApplicantProfile, JobPosting, Company
 from application.data.database import db
+from application.utils.pagination import SortKey, CursorError, keyset_paginate, parse_limit, requested_limit
+from application.controller.applicant.summary import grouped_status_counts
 from datetime import datetime, date
-import requests
+from application.utils.events import publish, ApplicationSubmitted
+from application.controller.resume_parser.models import ApplicationPrefilter
+from application.controller.resume_parser.metadata_store import applications_with_skills
 
 applications_bp = Blueprint('applications', __name__)
 
+# Serve an applicant's "recent" and "status" listings: the ORDER BY and the cursor seek
+db.Index("ix_application_applicant_applied", Application.applicant_id, Application.applied_date, Application.id)
+db.Index("ix_application_applicant_status", Application.applicant_id, Application.status, Application.id)
+
 # hr side -> all candidates page
 @applications_bp.route('/<int:company_id>/candidates', methods=['GET'])
 def get_candidates(company_id):
 
     role = request.args.get('role')
     search = request.args.get('search')
+    sort_by = request.args.get('sort')
+    job_id = request.args.get('job_id', type=int)
+    # comma-separated; candidates must list all of them
+    skills = [s for s in (request.args.get('skill') or '').split(',') if s.strip()]
     page = int(request.args.get('page', 1))
-    per_page = int(request.args.get('per_page', 12))
+    per_page = parse_limit(request.args.get('per_page'), default=12)
+    with_total = request.args.get('include_total', 'true').lower() != 'false'
 
     # Base query (with company restriction)
     query = (
@@ -22,10 +35,12 @@ def get_candidates(company_id):
             ApplicantProfile.name.label("full_name"),
             ApplicantProfile.gender,
             JobPosting.job_title,
-            Application.resume_score
+            Application.resume_score,
+            ApplicationPrefilter.score.label("prefilter_score"),
         )
         .join(ApplicantProfile, ApplicantProfile.applicant_id == Application.applicant_id)
         .join(JobPosting, JobPosting.id == Application.job_id)
+        .outerjoin(ApplicationPrefilter, ApplicationPrefilter.application_id == Application.id)
         .filter(JobPosting.company_id == company_id)    
     )
 
@@ -36,11 +51,36 @@ def get_candidates(company_id):
         search_pattern = f"%{search}%"
         query = query.filter(ApplicantProfile.name.ilike(search_pattern))
 
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+    if job_id is not None:
+        query = query.filter(Application.job_id == job_id)
+
+    if skills:
+        query = query.filter(Application.id.in_(applications_with_skills(skills, job_id=job_id)))
+
+    if sort_by == "prefilter":
+        # best lexical match first; applications not pre-ranked yet go last
+        keys = [
+            SortKey(ApplicationPrefilter.score, descending=True, value="prefilter_score", nullable=True),
+            SortKey(Application.id, value="application_id"),
+        ]
+    else:
+        keys = [SortKey(Application.id, value="application_id")]
+
+    try:
+        pagination = keyset_paginate(
+            query,
+            keys,
+            cursor=request.args.get('cursor'),
+            limit=per_page,
+            page=page,
+            with_total=with_total,
+        )
+    except CursorError as e:
+        return jsonify({"message": str(e)}), 400
     rows = pagination.items
 
     result = []
-    sn = (page - 1) * per_page + 1
+    sn = pagination.position + 1
 
     for row in rows:
         first_name, last_name = split_name(row.full_name)
@@ -52,15 +92,18 @@ def get_candidates(company_id):
             "gender": row.gender,
             "role": row.job_title,
             "ai_match_score": row.resume_score,
+            "prefilter_score": row.prefilter_score,
             "action_url": f"/candidate/{row.application_id}"
         })
         sn += 1
 
     return jsonify({
         "total": pagination.total,
-        "page": page,
+        "total_is_exact": pagination.total_is_exact,
+        "page": pagination.position // per_page + 1,
         "per_page": per_page,
-        "candidates": result
+        "candidates": result,
+        "next_cursor": pagination.next_cursor
     }), 200
 
 
@@ -70,6 +113,56 @@ def split_name(full_name):
         return parts[0], ""
     return parts[0], " ".join(parts[1:])
 
+# near-duplicate resumes among a company's candidates
+@applications_bp.route('/<int:company_id>/duplicates', methods=['GET'])
+def get_duplicate_candidates(company_id):
+    from application.controller.applicant.resume_dedup import duplicate_groups
+
+    try:
+        threshold = float(request.args.get('threshold', current_app.config.get("RESUME_DUPLICATE_THRESHOLD", 0.85)))
+    except ValueError:
+        return jsonify({"message": "threshold must be a number"}), 400
+    if not 0 < threshold <= 1:
+        return jsonify({"message": "threshold must be within (0, 1]"}), 400
+
+    rows = (
+        db.session.query(
+            Application.id,
+            Application.applicant_id,
+            Application.resume_score,
+            ApplicantProfile.name,
+            JobPosting.job_title,
+        )
+        .join(ApplicantProfile, ApplicantProfile.applicant_id == Application.applicant_id)
+        .join(JobPosting, JobPosting.id == Application.job_id)
+        .filter(JobPosting.company_id == company_id)
+        .order_by(Application.id)
+        .all()
+    )
+    by_applicant = {}
+    for row in rows:
+        by_applicant.setdefault(row.applicant_id, []).append(row)
+
+    groups = []
+    for applicant_ids, similarity in duplicate_groups(by_applicant, threshold):
+        groups.append({
+            "similarity": round(similarity, 3),
+            "candidates": [
+                {
+                    "application_id": row.id,
+                    "applicant_id": row.applicant_id,
+                    "name": row.name,
+                    "role": row.job_title,
+                    "ai_match_score": row.resume_score,
+                    "action_url": f"/candidate/{row.id}",
+                }
+                for applicant_id in applicant_ids
+                for row in by_applicant[applicant_id]
+            ],
+        })
+
+    return jsonify({"threshold": threshold, "groups": groups}), 200
+
 # get candidate count for a company
 @applications_bp.route('/<int:company_id>/count', methods=['GET'])
 def get_candidate_count(company_id):
@@ -134,36 +227,11 @@ def apply_for_job():
     )
 
     db.session.add(application)
+    db.session.flush()
+    # Resume scoring subscribes to this; it runs after the commit, off the request
+    publish(ApplicationSubmitted(application.id, application.applicant_id, application.job_id))
     db.session.commit()
 
-    # 🔹 Trigger resume parsing synchronously for this applicant+job
-    try:
-        # Build local URL to existing /resumeparser/parse-resume endpoint
-        base_url = request.host_url.rstrip("/")  # e.g. http://127.0.0.1:8086
-        parse_url = f"{base_url}/resumeparser/parse-resume"
-
-        resp = requests.post(
-            parse_url,
-            data={
-                "applicantid": str(applicant_id),
-                "jobid": str(job_id),
-                # no 'force' -> parser will skip if already processed
-            },
-            timeout=15,
-        )
-        current_app.logger.info(
-            "Triggered resume parsing on apply: %s %s",
-            resp.status_code,
-            resp.text[:200],
-        )
-    except Exception as e:
-        # Do NOT fail the application just because AI parsing failed
-        current_app.logger.error(
-            "Failed to trigger resume parsing on apply: %s",
-            e,
-            exc_info=True,
-        )
-
     return jsonify({
         "message": "Application submitted successfully",
         "application_id": application.id
@@ -198,17 +266,35 @@ def get_applications_for_applicant(applicant_id):
     if filter_status and filter_status != "all":
         query = query.filter(Application.status == filter_status)
 
-    # sorting
+    # sorting (keyset keys always end in Application.id for a total order)
     if sort_by == "company":
-        query = query.order_by(Company.company_name.asc())
+        keys = [
+            SortKey(Company.company_name, value=lambda r: r[2].company_name, nullable=True),
+            SortKey(Application.id, value=lambda r: r[0].id),
+        ]
 
     elif sort_by == "status":
-        query = query.order_by(Application.status.asc())
+        keys = [
+            SortKey(Application.status, value=lambda r: r[0].status, nullable=True),
+            SortKey(Application.id, value=lambda r: r[0].id),
+        ]
 
     else:  # default: most recent
-        query = query.order_by(Application.applied_date.desc())
+        keys = [
+            SortKey(Application.applied_date, descending=True, value=lambda r: r[0].applied_date, nullable=True),
+            SortKey(Application.id, descending=True, value=lambda r: r[0].id),
+        ]
 
-    rows = query.all()
+    try:
+        page = keyset_paginate(
+            query,
+            keys,
+            cursor=request.args.get("cursor"),
+            limit=requested_limit(request.args, default=50),
+        )
+    except CursorError as e:
+        return jsonify({"message": str(e)}), 400
+    rows = page.items
 
     # Build list response
     result = []
@@ -224,16 +310,11 @@ def get_applications_for_applicant(applicant_id):
             "status": app.status
         })
 
-    # summary counts
-    total = (
-        Application.query.filter_by(applicant_id=applicant_id).count()
-    )
-    shortlisted = (
-        Application.query.filter_by(applicant_id=applicant_id, status="shortlisted").count()
-    )
-    rejected = (
-        Application.query.filter_by(applicant_id=applicant_id, status="rejected").count()
-    )
+    # summary counts (single GROUP BY status)
+    counts = grouped_status_counts(applicant_id)
+    total = sum(counts.values())
+    shortlisted = counts.get("shortlisted", 0)
+    rejected = counts.get("rejected", 0)
 
     return jsonify({
         "summary": {
@@ -241,7 +322,8 @@ def get_applications_for_applicant(applicant_id):
             "shortlisted": shortlisted,
             "rejected": rejected
         },
-        "applications": result
+        "applications": result,
+        "next_cursor": page.next_cursor
     }), 200
 
 
@@ -1,12 +1,12 @@
 from flask import Blueprint, jsonify, request
-from datetime import datetime, timedelta
-from sqlalchemy import func, extract
+from datetime import datetime
 from werkzeug.datastructures import FileStorage
 from werkzeug.utils import secure_filename
 from flask import current_app
 import os, uuid
 
 from application.data.database import db
+from application.utils.cache import response_cache
 from application.data.models import (
     Company,
     HRProfile,
@@ -15,6 +15,13 @@ from application.data.models import (
     Interview,
     Application,
 )
+from application.controller.company.rollups import (
+    ONBOARDED,
+    get_hiring_summary,
+    get_monthly_count,
+    month_start,
+    shift_months,
+)
 
 company_bp = Blueprint("company", __name__)
 
@@ -28,6 +35,7 @@ def ok(fn):
 
 
 @company_bp.route("/dashboard/<int:company_id>", methods=["GET"])
+@response_cache.cached_view(tags=("company:{company_id}",))
 def get_company_dashboard(company_id):
     """
     Returns:
@@ -46,69 +54,15 @@ def get_company_dashboard(company_id):
     )
 
     now = datetime.utcnow()
+    first_of_last_month = shift_months(month_start(now), -1)
 
-    first_of_this_month = datetime(now.year, now.month, 1)
-    first_of_last_month = first_of_this_month - timedelta(days=1)
-    first_of_last_month = datetime(first_of_last_month.year, first_of_last_month.month, 1)
-    last_of_last_month = first_of_this_month - timedelta(seconds=1)
-
-    onboarded_last_month = (
-        Onboarding.query.filter(
-            Onboarding.offer_accepted == True,
-            Onboarding.joining_date >= first_of_last_month,
-            Onboarding.joining_date <= last_of_last_month,
-        ).count()
-    )
+    # Scoped to this company through the rollup (joining month bucket)
+    onboarded_last_month = get_monthly_count(company_id, ONBOARDED, first_of_last_month)
 
     open_jobs = JobPosting.query.filter_by(company_id=company_id, status="open").count()
 
-    openings_data = (
-        db.session.query(
-            extract("month", JobPosting.created_date).label("month"),
-            extract("year", JobPosting.created_date).label("year"),
-            func.count(JobPosting.id),
-        )
-        .filter(JobPosting.company_id == company_id)
-        .group_by("year", "month")
-        .all()
-    )
-
-    onboarded_data = (
-        db.session.query(
-            extract("month", Onboarding.joining_date).label("month"),
-            extract("year", Onboarding.joining_date).label("year"),
-            func.count(Onboarding.id),
-        )
-        .filter(Onboarding.offer_accepted == True)
-        .group_by("year", "month")
-        .all()
-    )
-
-    interviewing_data = (
-        db.session.query(
-            extract("month", Interview.interview_date).label("month"),
-            extract("year", Interview.interview_date).label("year"),
-            func.count(Interview.id),
-        )
-        .join(Interview.application)
-        .join(Application.job)
-        .filter(JobPosting.company_id == company_id)
-        .group_by("year", "month")
-        .all()
-    )
-
-    def build_monthly_dict(rows):
-        result = {}
-        for m, y, count in rows:
-            key = f"{int(y)}-{int(m):02d}"
-            result[key] = count
-        return result
-
-    hiring_summary = {
-        "openings": build_monthly_dict(openings_data),
-        "onboarded": build_monthly_dict(onboarded_data),
-        "interviewing": build_monthly_dict(interviewing_data),
-    }
+    # Pre-aggregated (company, month, metric) buckets; see company/rollups.py
+    hiring_summary = get_hiring_summary(company_id, months=12, today=now)
 
     # Get company name
     company = Company.query.get(company_id)
@@ -0,0 +1,29 @@
+"""
+Company-side aggregate tables.
+
+HiringSummaryRollup stores one counter per (company, month, metric) so the
+company dashboard can read its 12-month hiring summary as an indexed range
+scan instead of grouping the raw JobPosting / Onboarding / Interview tables.
+"""
+from datetime import datetime
+
+from application.data.database import db
+
+
+class HiringSummaryRollup(db.Model):
+    __tablename__ = "hiring_summary_rollup"
+    __table_args__ = (
+        db.UniqueConstraint("company_id", "metric", "month", name="uq_hiring_rollup_bucket"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    company_id = db.Column(db.Integer, nullable=False)
+    # First day of the calendar month the bucket covers
+    month = db.Column(db.Date, nullable=False)
+    # One of: openings, onboarded, interviewing
+    metric = db.Column(db.String(32), nullable=False)
+    count = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<HiringSummaryRollup {self.company_id} {self.metric} {self.month}={self.count}>"
@@ -0,0 +1,283 @@
+"""
+Hiring-summary rollup maintenance.
+
+Mapper listeners on JobPosting, Onboarding and Interview keep
+HiringSummaryRollup counters in step with every insert, update and delete,
+inside the same transaction as the row that changed. The company dashboard
+then reads the last N months with a single range query.
+
+`rebuild_hiring_rollups` recomputes the buckets from the raw tables and is
+used by the backfill script for history written before the listeners existed.
+"""
+import logging
+from collections import Counter
+from datetime import date, datetime
+
+from sqlalchemy import event, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.attributes import get_history
+
+from application.data.database import db
+from application.data.models import JobPosting, Onboarding, Interview, Application
+from application.controller.company.models import HiringSummaryRollup
+
+logger = logging.getLogger(__name__)
+
+OPENINGS = "openings"
+ONBOARDED = "onboarded"
+INTERVIEWING = "interviewing"
+METRICS = (OPENINGS, ONBOARDED, INTERVIEWING)
+
+
+def month_start(value):
+    """Return the first day of the month for a date/datetime (None passes through)."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        value = value.date()
+    if isinstance(value, str):
+        try:
+            value = date.fromisoformat(value[:10])
+        except ValueError:
+            return None
+    return date(value.year, value.month, 1)
+
+
+def shift_months(value, months):
+    """Move a first-of-month date by a whole number of months."""
+    index = value.year * 12 + (value.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+# ---------------------------------------------------------------------------
+# Counter updates
+# ---------------------------------------------------------------------------
+
+def _dialect_insert(dialect_name):
+    """The dialect's insert() with ON CONFLICT DO UPDATE, or None."""
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        return None
+    return insert
+
+
+def _bump(connection, company_id, month, metric, delta):
+    """
+    Add delta to one bucket. Increments upsert in a single statement, so two
+    transactions creating the same bucket cannot collide on
+    uq_hiring_rollup_bucket; decrements only touch an existing bucket.
+    """
+    if not company_id or month is None or not delta:
+        return
+    table = HiringSummaryRollup.__table__
+    now = datetime.utcnow()
+    update = (
+        table.update()
+        .where(
+            table.c.company_id == company_id,
+            table.c.metric == metric,
+            table.c.month == month,
+        )
+        .values(count=table.c.count + delta, updated_at=now)
+    )
+    if delta < 0:
+        connection.execute(update)
+        return
+
+    row = dict(company_id=company_id, metric=metric, month=month, count=delta, updated_at=now)
+    insert = _dialect_insert(connection.dialect.name)
+    if insert is not None:
+        connection.execute(
+            insert(table).values(**row).on_conflict_do_update(
+                index_elements=[table.c.company_id, table.c.metric, table.c.month],
+                set_={"count": table.c.count + delta, "updated_at": now},
+            )
+        )
+        return
+
+    # other databases: UPDATE, else INSERT inside a savepoint; losing an insert race means the row now exists
+    if connection.execute(update).rowcount:
+        return
+    try:
+        with connection.begin_nested():
+            connection.execute(table.insert().values(**row))
+    except IntegrityError:
+        connection.execute(update)
+
+
+def _company_for_application(connection, application_id):
+    if not application_id:
+        return None
+    return connection.execute(
+        select(JobPosting.company_id)
+        .join(Application, Application.job_id == JobPosting.id)
+        .where(Application.id == application_id)
+    ).scalar()
+
+
+def _values(target, attrs, previous):
+    """Attribute values before (previous=True) or after the pending change."""
+    values = {}
+    for attr in attrs:
+        if previous:
+            hist = get_history(target, attr)
+            if hist.deleted:
+                values[attr] = hist.deleted[0]
+                continue
+        values[attr] = getattr(target, attr, None)
+    return values
+
+
+def _changed(target, attrs):
+    return any(get_history(target, attr).has_changes() for attr in attrs)
+
+
+# Per-model bucket resolvers: (connection, attribute values) -> (company_id, month) or None
+
+def _opening_bucket(connection, values):
+    return values["company_id"], month_start(values["created_date"])
+
+
+def _onboarded_bucket(connection, values):
+    if not values["offer_accepted"]:
+        return None
+    return (
+        _company_for_application(connection, values["application_id"]),
+        month_start(values["joining_date"]),
+    )
+
+
+def _interviewing_bucket(connection, values):
+    return (
+        _company_for_application(connection, values["application_id"]),
+        month_start(values["interview_date"]),
+    )
+
+
+TRACKED = {
+    JobPosting: (OPENINGS, ("company_id", "created_date"), _opening_bucket),
+    Onboarding: (ONBOARDED, ("application_id", "offer_accepted", "joining_date"), _onboarded_bucket),
+    Interview: (INTERVIEWING, ("application_id", "interview_date"), _interviewing_bucket),
+}
+
+
+def _apply(connection, metric, resolver, values, delta):
+    bucket = resolver(connection, values)
+    if bucket:
+        _bump(connection, bucket[0], bucket[1], metric, delta)
+
+
+def _register(model, metric, attrs, resolver):
+    @event.listens_for(model, "after_insert")
+    def _after_insert(mapper, connection, target):
+        _apply(connection, metric, resolver, _values(target, attrs, False), 1)
+
+    @event.listens_for(model, "after_update")
+    def _after_update(mapper, connection, target):
+        if not _changed(target, attrs):
+            return
+        _apply(connection, metric, resolver, _values(target, attrs, True), -1)
+        _apply(connection, metric, resolver, _values(target, attrs, False), 1)
+
+    @event.listens_for(model, "after_delete")
+    def _after_delete(mapper, connection, target):
+        _apply(connection, metric, resolver, _values(target, attrs, True), -1)
+
+
+for _model, (_metric, _attrs, _resolver) in TRACKED.items():
+    _register(_model, _metric, _attrs, _resolver)
+
+
+# ---------------------------------------------------------------------------
+# Reads
+# ---------------------------------------------------------------------------
+
+def get_hiring_summary(company_id, months=12, today=None):
+    """Monthly counters for the last `months` months, keyed "YYYY-MM" per metric."""
+    current = month_start(today or datetime.utcnow())
+    start = shift_months(current, -(months - 1))
+
+    rows = (
+        db.session.query(HiringSummaryRollup.metric, HiringSummaryRollup.month, HiringSummaryRollup.count)
+        .filter(
+            HiringSummaryRollup.company_id == company_id,
+            HiringSummaryRollup.month >= start,
+            HiringSummaryRollup.month <= current,
+        )
+        .all()
+    )
+
+    summary = {metric: {} for metric in METRICS}
+    for metric, month, count in rows:
+        if count and metric in summary:
+            summary[metric][f"{month.year}-{month.month:02d}"] = count
+    return summary
+
+
+def get_monthly_count(company_id, metric, month):
+    row = (
+        db.session.query(HiringSummaryRollup.count)
+        .filter_by(company_id=company_id, metric=metric, month=month_start(month))
+        .first()
+    )
+    return row[0] if row else 0
+
+
+# ---------------------------------------------------------------------------
+# Backfill
+# ---------------------------------------------------------------------------
+
+def _source_queries(company_id=None):
+    openings = db.session.query(JobPosting.company_id, JobPosting.created_date)
+    onboarded = (
+        db.session.query(JobPosting.company_id, Onboarding.joining_date)
+        .join(Application, Application.id == Onboarding.application_id)
+        .join(JobPosting, JobPosting.id == Application.job_id)
+        .filter(Onboarding.offer_accepted == True)
+    )
+    interviewing = (
+        db.session.query(JobPosting.company_id, Interview.interview_date)
+        .join(Application, Application.id == Interview.application_id)
+        .join(JobPosting, JobPosting.id == Application.job_id)
+    )
+    if company_id is not None:
+        openings = openings.filter(JobPosting.company_id == company_id)
+        onboarded = onboarded.filter(JobPosting.company_id == company_id)
+        interviewing = interviewing.filter(JobPosting.company_id == company_id)
+    return {OPENINGS: openings, ONBOARDED: onboarded, INTERVIEWING: interviewing}
+
+
+def rebuild_hiring_rollups(company_id=None, batch_size=5000):
+    """
+    Recompute rollup buckets from the raw tables.
+
+    Rows are streamed and bucketed in Python so the same code runs on SQLite
+    and Postgres (month truncation is dialect specific). Returns the number of
+    buckets written.
+    """
+    buckets = Counter()
+    for metric, query in _source_queries(company_id).items():
+        for cid, value in query.yield_per(batch_size):
+            month = month_start(value)
+            if cid and month:
+                buckets[(cid, metric, month)] += 1
+
+    delete = db.session.query(HiringSummaryRollup)
+    if company_id is not None:
+        delete = delete.filter(HiringSummaryRollup.company_id == company_id)
+    delete.delete(synchronize_session=False)
+
+    now = datetime.utcnow()
+    rows = [
+        {"company_id": cid, "metric": metric, "month": month, "count": count, "updated_at": now}
+        for (cid, metric, month), count in buckets.items()
+    ]
+    for i in range(0, len(rows), batch_size):
+        db.session.execute(HiringSummaryRollup.__table__.insert(), rows[i:i + batch_size])
+    db.session.commit()
+
+    logger.info(f"📊 Rebuilt {len(rows)} hiring rollup buckets")
+    return len(rows)
@@ -78,6 +78,42 @@ def get_roles_users():
         
         return error_response
 
+@main_bp.route('/health/ready', methods=['GET'])
+def readiness_check():
+    """
+    Readiness for load balancers. The database is required; Redis (interview
+    sessions) is reported but only degrades the status, since it is connected
+    lazily and retried on use.
+    """
+    checks = {}
+    try:
+        from application.data.database import db
+        from sqlalchemy import text
+        db.session.execute(text("SELECT 1"))
+        checks['database'] = 'ok'
+    except Exception as e:
+        checks['database'] = f'error: {e}'
+
+    try:
+        from application.controller.videointerview.models.session_store import session_store_ready
+        checks['redis'] = 'ok' if session_store_ready() else 'unavailable'
+    except Exception as e:
+        checks['redis'] = f'error: {e}'
+
+    if checks['database'] != 'ok':
+        status, code = 'unavailable', 503
+    elif checks['redis'] != 'ok':
+        status, code = 'degraded', 200
+    else:
+        status, code = 'ready', 200
+    return jsonify({'status': status, 'checks': checks, 'timestamp': datetime.now().isoformat()}), code
+
+@main_bp.route('/cache/stats', methods=["GET"])
+def get_cache_stats():
+    """Hit/miss counters of the response cache for this worker process"""
+    from application.utils.cache import response_cache
+    return jsonify(response_cache.stats()), 200
+
 def count_users_by_role(role_name):
     try:
         from application.data.models import User, Role, roles_users
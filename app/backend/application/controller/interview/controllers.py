@@ -3,9 +3,19 @@ from application.data.models import Interview, ApplicantProfile, Application, Jo
 from application.data.database import db
 from datetime import date, datetime, timedelta
 from sqlalchemy import extract
+from application.utils.pagination import SortKey, CursorError, keyset_paginate, requested_limit
+from application.utils.loader import get_loader
 
 interview_bp = Blueprint('interview', __name__)
 
+# Newest interview first, undated ones last; id breaks ties so cursors are stable
+INTERVIEW_DATE_KEYS = [
+    SortKey(Interview.interview_date, descending=True, nullable=True),
+    SortKey(Interview.id, descending=True),
+]
+# Serves INTERVIEW_DATE_KEYS for one interviewer: the ORDER BY and the cursor seek
+db.Index("ix_interview_interviewer_date", Interview.interviewer_id, Interview.interview_date, Interview.id)
+
 # hr dashboard -> KPIs -> get count of pending feedback interviews for a company
 @interview_bp.route('/feedback_pending/<int:company_id>', methods=['GET'])
 def get_interview_feedback_pending_count(company_id):
@@ -25,31 +35,47 @@ def get_interview_feedback_pending_count(company_id):
 def get_interviews_for_hr_sorted(hr_id):
     from application.data.models import Application, JobPosting, ApplicantProfile
     
-    interviews = (
+    query = (
         Interview.query
         .join(Application, Interview.application_id == Application.id)
         .join(JobPosting, Application.job_id == JobPosting.id)
         .join(ApplicantProfile, Application.applicant_id == ApplicantProfile.applicant_id)
         .filter(Interview.interviewer_id == hr_id)
-        .order_by(Interview.interview_date.desc())
-        .all()
     )
+    try:
+        page = keyset_paginate(
+            query,
+            INTERVIEW_DATE_KEYS,
+            cursor=request.args.get("cursor"),
+            limit=requested_limit(request.args, default=50),
+        )
+    except CursorError as e:
+        return jsonify({"message": str(e)}), 400
+    interviews = page.items
 
     from application.data.models import User
-    
+
+    # One IN query per entity type instead of lookups per interview
+    loader = get_loader()
+    applications = loader.get_many(Application, [i.application_id for i in interviews])
+    loader.want(JobPosting, [a.job_id for a in applications.values() if a])
+    loader.want(User, [a.applicant_id for a in applications.values() if a])
+
     result = []
     for i in interviews:
         # Get candidate name and job title from related objects
         candidate_name = 'Candidate'
         job_title = 'Position'
         
-        if i.application:
+        application = applications.get(i.application_id)
+        if application:
             # Get job title
-            if i.application.job:
-                job_title = i.application.job.job_title
+            job = loader.get(JobPosting, application.job_id)
+            if job:
+                job_title = job.job_title
             
             # Get candidate name from User
-            applicant_user = User.query.get(i.application.applicant_id)
+            applicant_user = loader.get(User, application.applicant_id)
             if applicant_user:
                 candidate_name = applicant_user.name
         
@@ -71,7 +97,7 @@ def get_interviews_for_hr_sorted(hr_id):
             "job_title": job_title
         })
 
-    return jsonify({"interviews": result}), 200
+    return jsonify({"interviews": result, "next_cursor": page.next_cursor}), 200
 
 # schedule interview
 @interview_bp.route('/schedule/<int:application_id>/<int:hr_id>', methods=['POST'])
@@ -199,19 +225,29 @@ def pending_feedback(company_id):
 @interview_bp.route('/cards/<int:company_id>', methods=['GET'])
 def get_interview_cards(company_id):
 
-    interviews = (
+    query = (
         Interview.query
         .join(Interview.application)
         .join(Application.job)
         .filter(JobPosting.company_id == company_id)
-        .order_by(Interview.interview_date.desc())
-        .all()
     )
+    try:
+        page = keyset_paginate(
+            query,
+            INTERVIEW_DATE_KEYS,
+            cursor=request.args.get("cursor"),
+            limit=requested_limit(request.args, default=50),
+        )
+    except CursorError as e:
+        return jsonify({"message": str(e)}), 400
+    interviews = page.items
+
+    loader = get_loader().want(ApplicantProfile, [i.interviewee_id for i in interviews])
 
     result = []
 
     for i in interviews:
-        interviewee = ApplicantProfile.query.get(i.interviewee_id)
+        interviewee = loader.get(ApplicantProfile, i.interviewee_id)
 
         result.append({
             "id": i.id,
@@ -225,7 +261,11 @@ def get_interview_cards(company_id):
             "application_id": i.application_id,
         })
 
-    return jsonify(result), 200
+    # Body stays a bare list for existing clients; the cursor travels in a header
+    response = jsonify(result)
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    return response, 200
 
 # get interview evaluation details
 @interview_bp.route('/evaluation/<int:interview_id>', methods=['GET'])
@@ -0,0 +1,144 @@
+"""
+Evaluation summary persistence.
+
+RecordingService writes evaluation.json and metadata.json at the end of a
+video interview; the same numbers are upserted here into
+InterviewEvaluationSummary, keyed by interview_id. `backfill_from_recordings`
+rebuilds the table from the recording folders written before this existed.
+"""
+import json
+import logging
+import os
+from datetime import datetime
+
+from application.data.database import db
+from application.data.models import Interview
+from application.controller.interview.models import InterviewEvaluationSummary
+
+logger = logging.getLogger(__name__)
+
+
+def _as_float(value):
+    try:
+        return float(value) if value not in (None, "") else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _as_int(value):
+    try:
+        return int(value) if value not in (None, "") else None
+    except (TypeError, ValueError):
+        return None
+
+
+def fields_from_evaluation(evaluation):
+    """Summary columns carried by an evaluation dict (evaluation.json)."""
+    if not isinstance(evaluation, dict):
+        return {}
+    fields = {"overall_rating": _as_float(evaluation.get("overall_rating"))}
+
+    rec = evaluation.get("recommendation")
+    if isinstance(rec, dict):
+        fields["recommendation"] = rec.get("decision") or "Unknown"
+        fields["recommendation_detail"] = json.dumps(rec, ensure_ascii=False)
+    elif isinstance(rec, str) and rec:
+        fields["recommendation"] = rec
+
+    meta = evaluation.get("interview_metadata") or {}
+    if isinstance(meta, dict):
+        if meta.get("duration_minutes") is not None:
+            fields["duration_minutes"] = _as_float(meta.get("duration_minutes"))
+        if meta.get("questions_asked") is not None:
+            fields["questions_asked"] = _as_int(meta.get("questions_asked"))
+    fields["evaluated_at"] = datetime.utcnow()
+    return fields
+
+
+def fields_from_metadata(metadata):
+    """Summary columns carried by metadata.json (duration and question count win here)."""
+    if not isinstance(metadata, dict):
+        return {}
+    fields = {
+        "duration_minutes": _as_float(metadata.get("duration_minutes")),
+        "questions_asked": _as_int(metadata.get("questions_asked")),
+    }
+    if metadata.get("overall_rating") is not None:
+        fields["overall_rating"] = _as_float(metadata.get("overall_rating"))
+    if metadata.get("recommendation") not in (None, "", "Unknown"):
+        fields["recommendation"] = str(metadata.get("recommendation"))
+    return fields
+
+
+def upsert_evaluation_summary(interview_id, session_id=None, commit=True, **fields):
+    """Create or update the summary row for an interview; None values are ignored."""
+    if not interview_id:
+        return None
+    summary = InterviewEvaluationSummary.query.filter_by(interview_id=interview_id).first()
+    if summary is None:
+        summary = InterviewEvaluationSummary(interview_id=interview_id)
+        db.session.add(summary)
+    if session_id:
+        summary.session_id = session_id
+    for name, value in fields.items():
+        if value is not None and hasattr(InterviewEvaluationSummary, name):
+            setattr(summary, name, value)
+    if commit:
+        db.session.commit()
+    return summary
+
+
+def _load_json(path):
+    try:
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+    except Exception as e:
+        logger.warning(f"⚠️ Could not read {path}: {e}")
+    return {}
+
+
+def _interview_for_session(session_id):
+    return (
+        db.session.query(Interview.id)
+        .filter(Interview.interview_recording_url.like(f"%/recordings/{session_id}/%"))
+        .scalar()
+    )
+
+
+def backfill_from_recordings(recordings_dir, batch_size=200):
+    """
+    Scan recordings/<session_id>/ folders and upsert a summary per interview.
+    Returns (written, skipped).
+    """
+    written = skipped = 0
+    if not os.path.isdir(recordings_dir):
+        logger.warning(f"⚠️ Recordings directory not found: {recordings_dir}")
+        return written, skipped
+
+    for session_id in sorted(os.listdir(recordings_dir)):
+        session_path = os.path.join(recordings_dir, session_id)
+        if not os.path.isdir(session_path):
+            continue
+
+        metadata = _load_json(os.path.join(session_path, "metadata.json"))
+        evaluation = _load_json(os.path.join(session_path, "evaluation.json"))
+        if not metadata and not evaluation:
+            skipped += 1
+            continue
+
+        interview_id = _as_int(metadata.get("interview_id")) or _interview_for_session(session_id)
+        if not interview_id:
+            skipped += 1
+            continue
+
+        fields = fields_from_evaluation(evaluation)
+        fields.update({k: v for k, v in fields_from_metadata(metadata).items() if v is not None})
+        upsert_evaluation_summary(interview_id, session_id=session_id, commit=False, **fields)
+        written += 1
+        if written % batch_size == 0:
+            db.session.commit()
+
+    db.session.commit()
+    logger.info(f"📊 Evaluation summaries backfilled: {written} written, {skipped} skipped")
+    return written, skipped
@@ -0,0 +1,68 @@
+"""
+Interview-side derived tables.
+
+InterviewEvaluationSummary mirrors the headline numbers of a video
+interview's evaluation.json / metadata.json so HR listings can filter and sort
+on them with an indexed query instead of opening two files per interview.
+
+InterviewWarmup holds what the video interview needs to start, prepared
+when the interview is scheduled (videointerview/services/warmup_service.py):
+the candidate context bundle, the opening question and a pool of
+job-specific follow-ups.
+"""
+from datetime import datetime
+
+from application.data.database import db
+
+
+class InterviewEvaluationSummary(db.Model):
+    __tablename__ = "interview_evaluation_summary"
+
+    id = db.Column(db.Integer, primary_key=True)
+    interview_id = db.Column(db.Integer, nullable=False, unique=True, index=True)
+    session_id = db.Column(db.String(128), index=True)
+    overall_rating = db.Column(db.Float, index=True)
+    # Decision string ("Hire", "Maybe", ...) for filtering
+    recommendation = db.Column(db.String(64), index=True)
+    # Full recommendation object from evaluation.json (JSON text)
+    recommendation_detail = db.Column(db.Text)
+    duration_minutes = db.Column(db.Float)
+    questions_asked = db.Column(db.Integer)
+    evaluated_at = db.Column(db.DateTime)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def recommendation_payload(self):
+        """The recommendation as it appears in evaluation.json when known."""
+        if self.recommendation_detail:
+            try:
+                import json
+                return json.loads(self.recommendation_detail)
+            except ValueError:
+                pass
+        return self.recommendation or "N/A"
+
+    def __repr__(self):
+        return f"<InterviewEvaluationSummary interview={self.interview_id} rating={self.overall_rating}>"
+
+
+class InterviewWarmup(db.Model):
+    __tablename__ = "interview_warmup"
+
+    id = db.Column(db.Integer, primary_key=True)
+    interview_id = db.Column(db.Integer, nullable=False, unique=True, index=True)
+    applicant_id = db.Column(db.Integer, index=True)
+    job_id = db.Column(db.Integer, index=True)
+    job_title = db.Column(db.String(255))
+    job_description = db.Column(db.Text)
+    # candidate_background of the InterviewSession (JSON text)
+    context = db.Column(db.Text)
+    first_question = db.Column(db.Text)
+    # JSON list of follow-up questions
+    follow_ups = db.Column(db.Text)
+    # set when the profile or job changed after it was built
+    stale = db.Column(db.Boolean, default=False, nullable=False)
+    build_ms = db.Column(db.Integer)
+    built_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<InterviewWarmup interview={self.interview_id} stale={self.stale}>"
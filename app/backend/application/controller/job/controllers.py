@@ -4,6 +4,9 @@ from application.data.models import Company, ApplicantProfile
 from application.data.models import JobPosting, Application, Interview, OfferLetter
 from datetime import datetime, date
 from application.data.database import db
+from application.utils.cache import response_cache
+from application.utils.pagination import SortKey, CursorError, keyset_paginate, parse_limit
+from application.controller.job.recommendations import recommend_jobs, FALLBACK_ENGINE
 
 job_bp = Blueprint('job', __name__)
 
@@ -72,6 +75,7 @@ def get_job_stats(company_id):
 
 
 @job_bp.route("/opportunities/<int:applicant_id>", methods=["GET"])
+@response_cache.cached_view(tags=("jobs", "applicant:{applicant_id}"), per_user=True)
 def get_job_opportunities(applicant_id):
     """
     Returns:
@@ -108,9 +112,20 @@ def get_job_opportunities(applicant_id):
         )
 
     page = int(request.args.get("page", 1))
-    per_page = int(request.args.get("per_page", 10))
-
-    paginated = query.paginate(page=page, per_page=per_page, error_out=False)
+    per_page = parse_limit(request.args.get("per_page"), default=10)
+    with_total = request.args.get("include_total", "true").lower() != "false"
+
+    try:
+        paginated = keyset_paginate(
+            query,
+            [SortKey(JobPosting.id)],
+            cursor=request.args.get("cursor"),
+            limit=per_page,
+            page=page,
+            with_total=with_total,
+        )
+    except CursorError as e:
+        return jsonify({"message": str(e)}), 400
     jobs = paginated.items
 
     results = []
@@ -138,16 +153,43 @@ def get_job_opportunities(applicant_id):
             "skills_matched": f"{match_count}/{total_required}",
         })
 
+    total_pages = None
+    if paginated.total is not None:
+        total_pages = (paginated.total + per_page - 1) // per_page
+
     return jsonify({
         "jobs": results,
         "total_jobs": paginated.total,
-        "page": paginated.page,
-        "total_pages": paginated.pages,
-        "per_page": per_page
+        "total_is_exact": paginated.total_is_exact,
+        "page": paginated.position // per_page + 1,
+        "total_pages": total_pages,
+        "per_page": per_page,
+        "next_cursor": paginated.next_cursor
     }), 200
     
 
+@job_bp.route("/recommendations/<int:applicant_id>", methods=["GET"])
+@response_cache.cached_view(tags=("jobs", "applicant:{applicant_id}"), per_user=True)
+def get_job_recommendations(applicant_id):
+    """
+    Top-N jobs ranked by similarity to the applicant's profile.
+    Query params: limit (default 10), include_applied (default false).
+    """
+    limit = parse_limit(request.args.get("limit"), default=10)
+    include_applied = request.args.get("include_applied", "false").lower() == "true"
+    try:
+        body = recommend_jobs(applicant_id, limit=limit, include_applied=include_applied)
+    except LookupError as e:
+        return jsonify({"message": str(e)}), 404
+    response = jsonify(body)
+    if body["engine"] == FALLBACK_ENGINE:
+        # stand-in ranking while the index builds: keep it out of the response cache
+        response.cache_control.no_store = True
+    return response, 200
+
+
 @job_bp.route("/detail/<int:job_id>/<int:applicant_id>", methods=["GET"])
+@response_cache.cached_view(tags=("job:{job_id}", "applicant:{applicant_id}"), per_user=True)
 def get_job_details(job_id, applicant_id):
     job = JobPosting.query.get_or_404(job_id)
     company = job.company
@@ -0,0 +1,627 @@
+"""
+Job recommendations for applicants.
+
+Job postings (title, required skills, description) and applicant profiles are
+embedded into one vector space and jobs are ranked by cosine similarity
+against an in-memory NumPy matrix, so a top-N query is a single
+matrix-vector product.
+
+Embedders:
+    HashedTfidfSvd   default. Word tokens plus character 3/4-grams hashed into a
+                     fixed feature space, TF-IDF weighted, then projected with a
+                     truncated (randomized) SVD fitted on the job corpus.
+                     Shared n-grams make "postgres" and "postgresql" close.
+    SentenceEmbedder a CPU sentence-transformers model, used when
+                     RECOMMEND_EMBEDDING_MODEL names one and the package is
+                     installed.
+
+The index is built on first use and kept current without rebuilding: a
+JobPostingChanged subscriber marks the job stale and the next query
+re-embeds just those rows. Jobs edited by another process are picked up by
+comparing the response cache's "jobs" tag version, at most every
+RECOMMEND_RECONCILE_SECONDS; versions this process bumped itself are skipped,
+since their jobs were already marked stale. A reconcile re-reads the table and
+re-embeds only rows whose text changed. The TF-IDF space is refitted once
+enough of the corpus has changed.
+
+Builds, refits and reconciles run on a background thread, one at a time. Until
+the new index is swapped in, queries use the old one; before the first build
+finishes they are ranked by skill overlap against recent postings (engine
+"skills-overlap"), and those responses are not cached.
+
+Config (read per call, all optional):
+    RECOMMEND_EMBEDDING_MODEL    sentence-transformers model name (default: TF-IDF/SVD)
+    RECOMMEND_SVD_DIMENSIONS     SVD dimensions (default 128)
+    RECOMMEND_RECONCILE_SECONDS  cross-process reconcile interval (default 60)
+    RECOMMEND_BACKGROUND_BUILD   build on a background thread (default True)
+"""
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+import zlib
+from collections import Counter
+from functools import lru_cache
+
+import numpy as np
+from flask import current_app
+
+from application.data.database import db
+from application.data.models import JobPosting, ApplicantProfile, Application
+from application.utils.cache import response_cache
+from application.utils.events import subscribe, INLINE, JobPostingChanged
+from application.utils.lazy import lazy_import
+from application.utils.loader import get_loader
+
+logger = logging.getLogger(__name__)
+
+HASH_FEATURES = 1 << 12
+SVD_SAMPLE = 5000
+EMBED_BATCH = 1000
+# Refit the TF-IDF space after this share of the corpus changed
+REFIT_RATIO = 0.2
+REFIT_MIN_CHANGES = 50
+
+# Jobs (newest first) scored by skill overlap while the first index builds
+FALLBACK_ENGINE = "skills-overlap"
+FALLBACK_SCAN = 2000
+
+# Field weights: skills say the most about a posting, the description the least
+TITLE_WEIGHT = 2
+SKILLS_WEIGHT = 3
+
+_WORD_RE = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+sentence_transformers = lazy_import("sentence_transformers")
+
+
+# ---------------------------------------------------------------------------
+# Text
+# ---------------------------------------------------------------------------
+
+def split_skills(value):
+    if not value:
+        return []
+    return [s.strip() for s in re.split(r"[,;\n|]", value) if s.strip()]
+
+
+def job_text(title, required_skills, description):
+    """Weighted text for one posting; repeated fields count more."""
+    parts = [title or ""] * TITLE_WEIGHT + [required_skills or ""] * SKILLS_WEIGHT + [description or ""]
+    return "\n".join(p for p in parts if p)
+
+
+def applicant_text(profile, resume_profile=None):
+    skills = split_skills(profile.skills) + split_skills(getattr(profile, "technical_skills", None))
+    if not skills and resume_profile:
+        skills = list(resume_profile.get("skills") or [])
+    positions = [e.position for e in (getattr(profile, "experiences", None) or []) if e.position]
+    parts = [", ".join(skills)] * SKILLS_WEIGHT + [", ".join(positions)] * TITLE_WEIGHT
+    parts.append(getattr(profile, "summary", None) or "")
+    return "\n".join(p for p in parts if p)
+
+
+def _normalize_skill(skill):
+    return re.sub(r"[^a-z0-9+#]", "", skill.lower())
+
+
+def _trigrams(value):
+    padded = f"^{value}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def skills_similar(a, b):
+    """'postgres' ~ 'postgresql', 'node.js' ~ 'nodejs'; exact match for very short names."""
+    a, b = _normalize_skill(a), _normalize_skill(b)
+    if not a or not b:
+        return False
+    if a == b:
+        return True
+    if min(len(a), len(b)) < 4:
+        return False
+    if (a.startswith(b) or b.startswith(a)) and abs(len(a) - len(b)) <= 3:
+        return True
+    ta, tb = _trigrams(a), _trigrams(b)
+    return len(ta & tb) / len(ta | tb) >= 0.6
+
+
+def matched_skills(applicant_skills, job_skills):
+    return [js for js in job_skills if any(skills_similar(js, s) for s in applicant_skills)]
+
+
+# ---------------------------------------------------------------------------
+# Embedders
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=1 << 16)
+def _word_buckets(word):
+    """Hashed buckets of a word and its character 3/4-grams (crc32: stable across processes)."""
+    features = [f"w:{word}"]
+    padded = f"<{word}>"
+    for n in (3, 4):
+        features.extend(f"c:{padded[i:i + n]}" for i in range(len(padded) - n + 1))
+    return np.array([zlib.crc32(f.encode("utf-8")) % HASH_FEATURES for f in features], dtype=np.int64)
+
+
+_NO_FEATURES = (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32))
+
+
+def _features(text):
+    """(unique buckets, counts) of the text's hashed features."""
+    words = Counter(_WORD_RE.findall((text or "").lower()))
+    if not words:
+        return _NO_FEATURES
+    parts = [_word_buckets(word) for word in words]
+    buckets = np.concatenate(parts)
+    counts = np.repeat(np.fromiter(words.values(), dtype=np.float32, count=len(words)), [len(p) for p in parts])
+    unique, inverse = np.unique(buckets, return_inverse=True)
+    return unique, np.bincount(inverse, weights=counts).astype(np.float32)
+
+
+def _normalize_rows(matrix):
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class HashedTfidfSvd:
+    name = "tfidf-svd"
+
+    def __init__(self, dimensions=128, seed=0):
+        self.dimensions = dimensions
+        self.seed = seed
+        self.idf = np.ones(HASH_FEATURES, dtype=np.float32)
+        self.components = None
+        self.fitted_on = 0
+
+    @property
+    def dim(self):
+        return self.components.shape[0] if self.components is not None else HASH_FEATURES
+
+    def _tfidf(self, features):
+        matrix = np.zeros((len(features), HASH_FEATURES), dtype=np.float32)
+        for row, (buckets, counts) in enumerate(features):
+            matrix[row, buckets] = 1.0 + np.log(counts)
+        return _normalize_rows(matrix * self.idf)
+
+    def fit(self, texts):
+        self._fit([_features(text) for text in texts])
+
+    def _fit(self, features):
+        df = np.zeros(HASH_FEATURES, dtype=np.float64)
+        for buckets, _ in features:
+            df[buckets] += 1
+        n = len(features)
+        self.idf = (np.log((1.0 + n) / (1.0 + df)) + 1.0).astype(np.float32)
+        self.fitted_on = n
+
+        if self.dimensions <= 0 or n <= self.dimensions:
+            # Small corpus: the raw TF-IDF space is already cheap
+            self.components = None
+            return
+        rng = np.random.default_rng(self.seed)
+        sample = features if n <= SVD_SAMPLE else [features[i] for i in rng.choice(n, SVD_SAMPLE, replace=False)]
+        x = self._tfidf(sample)
+        # Randomized range finder with two power iterations
+        y = x @ rng.standard_normal((HASH_FEATURES, self.dimensions + 10)).astype(np.float32)
+        for _ in range(2):
+            y = x @ (x.T @ y)
+        q, _ = np.linalg.qr(y)
+        _, _, vt = np.linalg.svd(q.T @ x, full_matrices=False)
+        self.components = vt[:self.dimensions].astype(np.float32)
+
+    def transform(self, texts):
+        return self._project(self._tfidf([_features(text) for text in texts]))
+
+    def fit_transform(self, texts):
+        features = [_features(text) for text in texts]
+        self._fit(features)
+        return np.concatenate([
+            self._project(self._tfidf(features[start:start + EMBED_BATCH]))
+            for start in range(0, len(features), EMBED_BATCH)
+        ]) if features else np.zeros((0, self.dim), dtype=np.float32)
+
+    def _project(self, x):
+        if self.components is not None:
+            x = _normalize_rows(x @ self.components.T)
+        return x.astype(np.float32)
+
+    def refit_due(self, changes):
+        return changes >= max(REFIT_MIN_CHANGES, REFIT_RATIO * self.fitted_on)
+
+
+class SentenceEmbedder:
+    name = "sentence-model"
+
+    def __init__(self, model_name):
+        self.model = sentence_transformers.SentenceTransformer(model_name, device="cpu")
+        self.dim = self.model.get_sentence_embedding_dimension()
+
+    def fit(self, texts):
+        pass
+
+    def transform(self, texts):
+        return np.asarray(self.model.encode(list(texts), normalize_embeddings=True), dtype=np.float32)
+
+    def fit_transform(self, texts):
+        return self.transform(texts) if texts else np.zeros((0, self.dim), dtype=np.float32)
+
+    def refit_due(self, changes):
+        return False
+
+
+# ---------------------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------------------
+
+def _digest(text):
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class JobVectorIndex:
+    """Row-per-job embedding matrix with incremental upsert/remove."""
+
+    def __init__(self, embedder):
+        self.embedder = embedder
+        self._lock = threading.RLock()
+        self._matrix = np.zeros((0, embedder.dim), dtype=np.float32)
+        self._ids = np.zeros(0, dtype=np.int64)
+        self._size = 0
+        self._rows = {}
+        self._digests = {}
+        self._stale = set()
+        self._changes = 0
+
+    def __len__(self):
+        return self._size
+
+    def build(self, items, vectors=None):
+        """
+        Fit the embedder on `(job_id, text)` pairs and index all of them.
+        `vectors`, if given, is the embedder's fit_transform of the texts, already done.
+        """
+        items = list(items)
+        with self._lock:
+            if vectors is None:
+                vectors = self.embedder.fit_transform([text for _, text in items])
+            self._matrix = np.zeros((max(16, len(items)), self.embedder.dim), dtype=np.float32)
+            self._matrix[:len(items)] = vectors
+            self._ids = np.zeros(self._matrix.shape[0], dtype=np.int64)
+            self._ids[:len(items)] = [job_id for job_id, _ in items]
+            self._size = len(items)
+            self._rows = {job_id: row for row, (job_id, _) in enumerate(items)}
+            self._digests = {job_id: _digest(text) for job_id, text in items}
+            self._stale = set()
+            self._changes = 0
+
+    def upsert(self, items):
+        """Re-embed the rows whose text changed; searches keep running while a batch is embedded."""
+        with self._lock:
+            items = [(job_id, text) for job_id, text in items if self._digests.get(job_id) != _digest(text)]
+        for start in range(0, len(items), EMBED_BATCH):
+            batch = items[start:start + EMBED_BATCH]
+            vectors = _off_hub(self.embedder.transform, [text for _, text in batch])
+            with self._lock:
+                for (job_id, text), vector in zip(batch, vectors):
+                    row = self._rows.get(job_id)
+                    if row is None:
+                        row = self._append_row(job_id)
+                    self._matrix[row] = vector
+                    self._digests[job_id] = _digest(text)
+                    self._changes += 1
+
+    def _append_row(self, job_id):
+        if self._size == self._matrix.shape[0]:
+            grown = max(16, self._size * 2)
+            self._matrix = np.resize(self._matrix, (grown, self._matrix.shape[1]))
+            self._ids = np.resize(self._ids, grown)
+        row = self._size
+        self._ids[row] = job_id
+        self._rows[job_id] = row
+        self._size += 1
+        return row
+
+    def remove(self, job_ids):
+        with self._lock:
+            for job_id in job_ids:
+                row = self._rows.pop(job_id, None)
+                self._digests.pop(job_id, None)
+                if row is None:
+                    continue
+                last = self._size - 1
+                if row != last:
+                    moved = int(self._ids[last])
+                    self._matrix[row] = self._matrix[last]
+                    self._ids[row] = moved
+                    self._rows[moved] = row
+                self._size -= 1
+                self._changes += 1
+
+    def mark_stale(self, job_id):
+        with self._lock:
+            self._stale.add(job_id)
+
+    def take_stale(self):
+        with self._lock:
+            stale, self._stale = self._stale, set()
+            return stale
+
+    def job_ids(self):
+        with self._lock:
+            return set(self._rows)
+
+    @property
+    def refit_due(self):
+        return self.embedder.refit_due(self._changes)
+
+    def embed(self, text):
+        return self.embedder.transform([text])[0]
+
+    def search(self, vector, limit=10, exclude=()):
+        """Top `limit` (job_id, score) by cosine similarity, skipping ids in `exclude`."""
+        with self._lock:
+            # upsert/remove write rows in place: score and copy the ids before letting go
+            size = self._size
+            if size == 0 or limit <= 0:
+                return []
+            scores = self._matrix[:size] @ vector
+            ids = self._ids[:size].copy()
+        want = min(size, limit + len(exclude))
+        top = np.argpartition(-scores, want - 1)[:want] if want < size else np.arange(size)
+        top = top[np.argsort(-scores[top], kind="stable")]
+        results = []
+        for row in top:
+            job_id = int(ids[row])
+            if job_id in exclude:
+                continue
+            results.append((job_id, float(scores[row])))
+            if len(results) == limit:
+                break
+        return results
+
+
+# ---------------------------------------------------------------------------
+# Service
+# ---------------------------------------------------------------------------
+
+_index = None
+_index_lock = threading.Lock()
+_sync_state = {"tag_version": None, "reconciled_at": 0.0}
+# The running build or reconcile's thread, and jobs changed since it read the table
+_build_state = {"thread": None, "changed": set()}
+
+response_cache.track_local_bumps("jobs")
+
+
+def _make_embedder():
+    config = current_app.config
+    model_name = config.get("RECOMMEND_EMBEDDING_MODEL")
+    if model_name:
+        try:
+            return SentenceEmbedder(model_name)
+        except Exception as e:
+            logger.warning(f"⚠️ Embedding model {model_name} unavailable, using TF-IDF/SVD: {e}")
+    return HashedTfidfSvd(dimensions=int(config.get("RECOMMEND_SVD_DIMENSIONS", 128)))
+
+
+def _job_rows(job_ids=None):
+    query = db.session.query(JobPosting.id, JobPosting.job_title, JobPosting.required_skills, JobPosting.job_description)
+    if job_ids is not None:
+        query = query.filter(JobPosting.id.in_(list(job_ids)))
+    return [(row.id, job_text(row.job_title, row.required_skills, row.job_description)) for row in query.yield_per(EMBED_BATCH)]
+
+
+def _off_hub(fn, *args):
+    """Run CPU-bound work in eventlet's native thread pool when the hub is patched in, else inline."""
+    try:
+        from eventlet import patcher, tpool
+        if patcher.is_monkey_patched("thread"):
+            return tpool.execute(fn, *args)
+    except ImportError:
+        pass
+    return fn(*args)
+
+
+def _build_index():
+    """A freshly built index and the "jobs" tag version it reflects."""
+    started = time.perf_counter()
+    version = response_cache.tag_version("jobs")
+    items = _job_rows()
+    embedder = _make_embedder()
+    index = JobVectorIndex(embedder)
+    # the fit is the slow part; on a green thread alone it would still stall the hub
+    index.build(items, _off_hub(embedder.fit_transform, [text for _, text in items]))
+    logger.info(f"🧭 Job recommendation index built: {len(index)} jobs, {index.embedder.name}, "
+                f"{(time.perf_counter() - started) * 1000:.0f} ms")
+    return index, version
+
+
+def _install(index, version):
+    """Swap in a built index (lock held); jobs changed during the build are re-embedded on the next query."""
+    global _index
+    for job_id in _build_state["changed"]:
+        index.mark_stale(job_id)
+    _index = index
+    _sync_state["tag_version"] = version
+    _sync_state["reconciled_at"] = time.monotonic()
+
+
+def _reconcile(index):
+    """Bring `index` in line with the whole table; returns the "jobs" tag version it reflects."""
+    version = response_cache.tag_version("jobs")
+    rows = _job_rows()
+    index.upsert(rows)
+    index.remove(index.job_ids() - {job_id for job_id, _ in rows})
+    return version
+
+
+def _reconciled(index, version):
+    """Record a finished reconcile (lock held); jobs changed meanwhile may hold older text, re-embed them."""
+    if index is not _index:
+        return
+    for job_id in _build_state["changed"]:
+        index.mark_stale(job_id)
+    _sync_state["tag_version"] = version
+    _sync_state["reconciled_at"] = time.monotonic()
+
+
+def _run_background(app, name, work, finish):
+    try:
+        with app.app_context():
+            result = work()
+        with _index_lock:
+            finish(result)
+    except Exception:
+        logger.exception(f"❌ Job recommendation index {name} failed")
+    finally:
+        with _index_lock:
+            _build_state["thread"] = None
+            _build_state["changed"] = set()
+
+
+def _start_background(name, work, finish):
+    """Run `work()`, then `finish(result)` under the lock, unless a build or reconcile is running (lock held)."""
+    if _build_state["thread"] is not None:
+        return
+    _build_state["changed"] = set()
+    if not current_app.config.get("RECOMMEND_BACKGROUND_BUILD", True):
+        finish(work())
+        return
+    thread = threading.Thread(target=_run_background, args=(current_app._get_current_object(), name, work, finish),
+                              name=f"job-index-{name}", daemon=True)
+    _build_state["thread"] = thread
+    thread.start()
+
+
+def _start_build():
+    _start_background("build", _build_index, lambda built: _install(*built))
+
+
+def _reconcile_due(version):
+    """Whether another process may have changed jobs since the last build or reconcile (lock held)."""
+    known = _sync_state["tag_version"]
+    if version == known:
+        return False
+    if response_cache.bumped_here("jobs", known, version):
+        # every change behind this version was ours and is already marked stale
+        _sync_state["tag_version"] = version
+        return False
+    interval = float(current_app.config.get("RECOMMEND_RECONCILE_SECONDS", 60))
+    return time.monotonic() - _sync_state["reconciled_at"] >= interval
+
+
+def _sync_stale(index):
+    stale = index.take_stale()
+    if stale:
+        rows = _job_rows(stale)
+        index.upsert(rows)
+        index.remove(stale - {job_id for job_id, _ in rows})
+
+
+def get_index():
+    """
+    The process-wide job index with this process's job changes applied; None
+    until the first build finishes. A missing or refit-due index starts a
+    build, a "jobs" version bumped elsewhere starts a reconcile.
+    """
+    version = response_cache.tag_version("jobs")
+    with _index_lock:
+        if _index is None or _index.refit_due:
+            _start_build()
+        index = _index
+        if index is not None and _reconcile_due(version):
+            _start_background("reconcile", lambda: _reconcile(index), lambda result: _reconciled(index, result))
+    if index is not None:
+        _sync_stale(index)
+    return index
+
+
+def wait_for_build(timeout=None):
+    """Block until the running build (if any) has been swapped in."""
+    thread = _build_state["thread"]
+    if thread is not None:
+        thread.join(timeout)
+
+
+def reset_index():
+    global _index
+    wait_for_build()
+    with _index_lock:
+        _index = None
+
+
+@subscribe(JobPostingChanged, mode=INLINE)
+def _mark_job_stale(evt):
+    with _index_lock:
+        if _index is not None:
+            _index.mark_stale(evt.job_id)
+        if _build_state["thread"] is not None:
+            _build_state["changed"].add(evt.job_id)
+
+
+def _skill_overlap_hits(skills, limit, exclude):
+    """(job_id, share of the job's skills matched) over the newest FALLBACK_SCAN postings."""
+    rows = (db.session.query(JobPosting.id, JobPosting.required_skills)
+            .order_by(JobPosting.id.desc()).limit(FALLBACK_SCAN))
+    scored = []
+    for job_id, required_skills in rows:
+        job_skills = split_skills(required_skills)
+        if job_id in exclude or not job_skills:
+            continue
+        matched = matched_skills(skills, job_skills)
+        if matched:
+            scored.append((job_id, len(matched) / len(job_skills)))
+    scored.sort(key=lambda hit: -hit[1])
+    return scored[:limit]
+
+
+def recommend_jobs(applicant_id, limit=10, include_applied=False):
+    """Top-N jobs for an applicant. Raises LookupError for an unknown applicant."""
+    started = time.perf_counter()
+    profile = db.session.get(ApplicantProfile, applicant_id)
+    if profile is None:
+        raise LookupError("Applicant not found")
+
+    from application.controller.applicant.models import ResumeDocument
+    doc = ResumeDocument.query.filter_by(applicant_id=applicant_id).first()
+    resume_profile = json.loads(doc.profile_json) if doc is not None and doc.profile_json else None
+    text = applicant_text(profile, resume_profile)
+
+    index = get_index()
+    exclude = set()
+    if not include_applied:
+        exclude = {job_id for (job_id,) in db.session.query(Application.job_id).filter(Application.applicant_id == applicant_id)}
+    skills = split_skills(profile.skills) or list((resume_profile or {}).get("skills") or [])
+    if index is None:
+        hits = _skill_overlap_hits(skills, limit, exclude)
+    else:
+        hits = index.search(index.embed(text), limit=limit, exclude=exclude) if text.strip() else []
+
+    jobs = get_loader().get_many(JobPosting, [job_id for job_id, _ in hits])
+    results = []
+    for job_id, score in hits:
+        job = jobs.get(job_id)
+        if job is None:
+            continue
+        job_skills = split_skills(job.required_skills)
+        matched = matched_skills(skills, job_skills)
+        results.append({
+            "job_id": job.id,
+            "position": job.job_title,
+            "company": job.company.company_name if job.company else None,
+            "location": job.location,
+            "work_mode": job.employment_type,
+            "score": round(max(score, 0.0) * 100, 1),
+            "skills_matched": f"{len(matched)}/{len(job_skills)}",
+            "matched_skills": matched,
+        })
+
+    return {
+        "applicant_id": applicant_id,
+        "engine": index.embedder.name if index is not None else FALLBACK_ENGINE,
+        "indexed_jobs": len(index) if index is not None else 0,
+        "recommendations": results,
+        "took_ms": round((time.perf_counter() - started) * 1000, 2),
+    }
@@ -0,0 +1,241 @@
+"""
+Bulk offer dispatch.
+
+`send_bulk_offers` issues offer letters to many candidates of one company in
+a single request. Validation is set-based: the applications, eligible
+interviews, candidates, users and existing offers of the whole list are each
+loaded with one IN query. Every OfferLetter and its outbox delivery are
+written in one transaction, and then exactly those deliveries are dispatched
+as one outbox batch: PDFs rendered across the render pool, emails over one
+SMTP connection. Anything that fails to send stays in the outbox for the
+background worker to retry.
+
+The report has one entry per requested application:
+    sent       email went out
+    retrying   send failed; the outbox retries it
+    queued     another worker picked it up; poll /offer/delivery/<offer_id>
+    failed     gave up (retry budget exhausted)
+    skipped    did not pass validation (see "reason")
+"""
+import logging
+from datetime import datetime
+
+from sqlalchemy import select
+
+from application.data.database import db
+from application.data.models import OfferLetter, Application, Interview, JobPosting, ApplicantProfile, User, Company
+from application.controller.offer_letter.models import OfferDelivery
+from application.controller.offer_letter.outbox import delivery_payload, stage_delivery, dispatch_pending
+from application.utils.email_utils import validate_email_address
+from application.utils.pdf_utils import offer_template_values
+from application.utils.loader import get_loader
+
+logger = logging.getLogger(__name__)
+
+ELIGIBLE_RESULTS = ("selected", "approved")
+
+
+class BulkOfferError(ValueError):
+    """The request as a whole is invalid (maps to 400)."""
+
+
+def eligible_application_ids(company_id):
+    """Applications of the company whose interview is completed and selected/approved."""
+    return [
+        row[0] for row in db.session.execute(
+            select(Interview.application_id)
+            .join(Application, Application.id == Interview.application_id)
+            .join(JobPosting, JobPosting.id == Application.job_id)
+            .where(JobPosting.company_id == company_id)
+            .where(Interview.status == "completed")
+            .where(Interview.result.in_(ELIGIBLE_RESULTS))
+            .distinct()
+            .order_by(Interview.application_id)
+        )
+    ]
+
+
+def _parse_salary(value):
+    if not value:
+        return None
+    try:
+        return int(float(str(value).replace(',', '')))
+    except (ValueError, TypeError):
+        return None
+
+
+def _parse_start_date(value):
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, '%Y-%m-%d')
+    except (ValueError, TypeError):
+        raise BulkOfferError(f"Invalid start_date format. Expected YYYY-MM-DD, got: {value}")
+
+
+def _requested_ids(company_id, data):
+    if data.get("all_eligible"):
+        return eligible_application_ids(company_id), []
+
+    raw = data.get("application_ids")
+    if not isinstance(raw, list) or not raw:
+        raise BulkOfferError("Provide a non-empty 'application_ids' list or 'all_eligible': true")
+
+    # request order, each id once; bad values may be unhashable, so they are keyed as reported
+    ids, invalid = [], []
+    seen, seen_invalid = set(), set()
+    for value in raw:
+        try:
+            app_id = int(value)
+        except (ValueError, TypeError):
+            if str(value) not in seen_invalid:
+                seen_invalid.add(str(value))
+                invalid.append(value)
+            continue
+        if app_id not in seen:
+            seen.add(app_id)
+            ids.append(app_id)
+    return ids, invalid
+
+
+def send_bulk_offers(company_id, data, sender=None):
+    """
+    Issue and send offer letters for the applications in `data`
+    ({"application_ids": [...]} or {"all_eligible": true}, plus the shared
+    offer fields salary/start_date/department/work_mode/benefits). Returns
+    the report dict; raises BulkOfferError for a malformed request.
+    """
+    company = db.session.get(Company, company_id)
+    if not company:
+        raise LookupError("Company not found")
+
+    joining_date = _parse_start_date(data.get("start_date"))
+    salary_override = _parse_salary(data.get("salary"))
+    offer_details = {
+        'department': data.get('department', 'Engineering'),
+        'work_mode': data.get('work_mode', 'Remote'),
+        'benefits': data.get('benefits', 'Standard benefits package')
+    }
+    ids, invalid = _requested_ids(company_id, data)
+
+    results = {}
+    order = []
+    for value in invalid:
+        key = str(value)
+        order.append(key)
+        results[key] = {"application_id": value, "status": "skipped", "reason": "Invalid application id"}
+
+    # ---- set-based validation ----
+    loader = get_loader()
+    applications = loader.get_many(Application, ids)
+    jobs = loader.get_many(JobPosting, [a.job_id for a in applications.values() if a])
+    eligible = set(db.session.scalars(
+        select(Interview.application_id)
+        .where(Interview.application_id.in_(ids))
+        .where(Interview.status == "completed")
+        .where(Interview.result.in_(ELIGIBLE_RESULTS))
+    )) if ids else set()
+    applicants = loader.get_many(ApplicantProfile, [a.applicant_id for a in applications.values() if a])
+    users = loader.get_many(User, [a.applicant_id for a in applications.values() if a])
+    existing_offers = loader.get_many(OfferLetter, ids, key="application_id")
+
+    valid = []
+    for app_id in ids:
+        order.append(app_id)
+        entry = {"application_id": app_id, "status": "skipped"}
+        results[app_id] = entry
+        application = applications.get(app_id)
+        job = jobs.get(application.job_id) if application else None
+        if not application or not job:
+            entry["reason"] = "Application not found"
+            continue
+        if job.company_id != company_id:
+            entry["reason"] = "Application belongs to another company"
+            continue
+        applicant = applicants.get(application.applicant_id)
+        user = users.get(application.applicant_id)
+        entry["candidate_name"] = applicant.name if applicant else None
+        entry["email"] = user.email if user else None
+        if app_id not in eligible:
+            entry["reason"] = "Candidate is not eligible: interview must be completed with result 'selected'"
+            continue
+        if not applicant or not user or not validate_email_address(user.email):
+            entry["reason"] = "Candidate has no valid email address"
+            continue
+        ctc = salary_override or job.basic_salary
+        if not ctc:
+            entry["reason"] = "Salary is required. Provide salary or set the job's basic salary."
+            continue
+        valid.append((application, job, applicant, user, ctc))
+
+    # ---- one transaction: offers + outbox rows ----
+    offer_ids = []
+    if valid:
+        now = datetime.utcnow()
+        offers = []
+        for application, job, applicant, user, ctc in valid:
+            offer = existing_offers.get(application.id)
+            if not offer:
+                offer = OfferLetter(
+                    application_id=application.id,
+                    candidate_id=application.applicant_id,
+                    company_id=job.company_id,
+                    ctc=ctc,
+                    joining_date=joining_date,
+                    status="issued"
+                )
+                db.session.add(offer)
+            else:
+                offer.ctc = ctc
+                if joining_date:
+                    offer.joining_date = joining_date
+            offers.append(offer)
+        db.session.flush()
+
+        deliveries = loader.get_many(OfferDelivery, [o.id for o in offers], key="offer_id")
+        for offer, (application, job, applicant, user, ctc) in zip(offers, valid):
+            payload = delivery_payload(
+                offer_template_values(offer.id, applicant.name, job.job_title,
+                                      joining_date=offer.joining_date, ctc=offer.ctc,
+                                      offer_details=offer_details),
+                candidate_name=applicant.name,
+                company_name=company.company_name,
+                job_title=job.job_title,
+                application_id=application.id,
+            )
+            stage_delivery(offer.id, application.id, user.email, payload,
+                           sender=sender, delivery=deliveries.get(offer.id), now=now)
+            results[application.id]["offer_id"] = offer.id
+            offer_ids.append(offer.id)
+        db.session.commit()
+
+    # ---- one outbox batch for exactly these deliveries ----
+    stats = {"connections": 0, "outcomes": {}}
+    if offer_ids:
+        stats = dispatch_pending(batch_size=len(offer_ids), offer_ids=offer_ids)
+
+    for key in order:
+        entry = results[key]
+        offer_id = entry.get("offer_id")
+        if offer_id is None:
+            continue
+        outcome = stats["outcomes"].get(offer_id)
+        if outcome is None:
+            entry["status"] = "queued"
+        else:
+            entry["status"] = outcome["status"]
+            if outcome["error"]:
+                entry["reason"] = outcome["error"]
+
+    report = [results[key] for key in order]
+    summary = {}
+    for entry in report:
+        summary[entry["status"]] = summary.get(entry["status"], 0) + 1
+    logger.info(f"📨 Bulk offers for company {company_id}: {summary}")
+    return {
+        "company_id": company_id,
+        "requested": len(report),
+        "summary": summary,
+        "smtp_connections": stats["connections"],
+        "results": report,
+    }
@@ -1,20 +1,15 @@
 from application.auth.auth import roles_required
-from application.data.models import OfferLetter, Application, Interview, JobPosting, ApplicantProfile
+from application.data.models import OfferLetter, Application, Interview, JobPosting, ApplicantProfile, HRProfile, User, Company
 from application.data.database import db
 from flask import Blueprint, jsonify, request
-from application.utils.pdf_utils import generate_offer_letter_pdf
-from application.utils.email_utils import send_offer_email
+from application.utils.email_utils import get_current_hr_email
+from application.controller.offer_letter.outbox import enqueue_offer, delivery_status
+from application.controller.offer_letter.bulk import send_bulk_offers, BulkOfferError
+from application.utils.loader import get_loader
 from datetime import date
 
 offer_bp = Blueprint('offer', __name__)
 
-import os
-
-def ensure_offer_letter_dir():
-    folder = os.path.join(os.getcwd(), "offer_letters")
-    os.makedirs(folder, exist_ok=True)
-    return folder
-
 # hr page -> KPIs -> offer acceptance rate
 @offer_bp.route('/acceptance_rate/<int:company_id>', methods=['GET'])
 def get_acceptance_rate(company_id):
@@ -46,24 +41,35 @@ def get_eligible_candidates(company_id):
         .all()
     )
 
+    # Resolve related rows level by level, one IN query per entity type
+    loader = get_loader()
+    applications = loader.get_many(Application, [i.application_id for i in selected_interviews])
+    loader.want(HRProfile, [i.interviewer_id for i in selected_interviews])
+    applicants = loader.get_many(ApplicantProfile, [a.applicant_id for a in applications.values() if a])
+    jobs = loader.get_many(JobPosting, [a.job_id for a in applications.values() if a])
+    loader.want(User, list(applicants))
+    loader.want(Company, [j.company_id for j in jobs.values() if j])
+
     result = []
     for interview in selected_interviews:
-        app = interview.application
-        applicant = app.applicant
-        job = app.job
-        interviewer = interview.interviewer
+        app = applications[interview.application_id]
+        applicant = applicants[app.applicant_id]
+        job = jobs[app.job_id]
+        interviewer = loader.get(HRProfile, interview.interviewer_id)
+        user = loader.get(User, applicant.applicant_id)
+        company = loader.get(Company, job.company_id)
 
         result.append({
             # Candidate Info
             "application_id": app.id,
             "candidate_id": applicant.applicant_id,
             "candidate_name": applicant.name,
-            "email": applicant.user.email,
+            "email": user.email if user else None,
             "job_title": job.job_title,
             "basic_salary": str(job.basic_salary) if job.basic_salary else None,
             "employment_type": job.employment_type,
             "location": job.location,
-            "company_name": job.company.company_name if job.company else "Company",
+            "company_name": company.company_name if company else "Company",
 
             # Interview Info
             "interview_id": interview.id,
@@ -83,7 +89,8 @@ def get_eligible_candidates(company_id):
 @offer_bp.route("/send_offer/<int:application_id>", methods=["POST"])
 def send_offer(application_id):
     """
-    Send offer letter to a candidate
+    Queue the offer letter for a candidate (PDF + email are sent by the outbox;
+    poll /offer/delivery/<offer_id> for the outcome)
     Accepts optional JSON body with offer details:
     - salary: Annual CTC
     - position: Job position/title
@@ -174,29 +181,38 @@ def send_offer(application_id):
         'benefits': data.get('benefits', 'Standard benefits package')
     }
 
-    # Generate PDF with offer details
-    pdf_path = generate_offer_letter_pdf(offer, offer_details)
-
-    # Candidate email and details
-    candidate_email = offer.candidate.user.email
-    candidate_name = offer.candidate.name
-    company_name = job.company.company_name if job.company else "Company"
-    job_title = job.job_title
-
-    # Send email with all required details
-    send_offer_email(
-        to_email=candidate_email,
-        pdf_path=pdf_path,
-        candidate_name=candidate_name,
-        company_name=company_name,
-        job_title=job_title,
-        application_id=application_id
-    )
+    # Rendering and email happen in the outbox worker; the offer, application
+    # and interview statuses move on once the email has actually gone out
+    enqueue_offer(offer, offer_details, sender=get_current_hr_email())
 
-    # Update status
-    offer.status = "sent"
-    application.status = "offered"  # Update application status
-    interview.result = "offer letter sent"
-    db.session.commit()
+    return {"message": "Offer letter queued", "offer_id": offer.id, "delivery_status": "queued"}, 202
 
-    return {"message": "Offer letter sent", "offer_id": offer.id}, 200
+
+@offer_bp.route("/send_bulk/<int:company_id>", methods=["POST"])
+def send_bulk_offer(company_id):
+    """
+    Send offer letters to many candidates at once
+    JSON body:
+    - application_ids: list of application ids, or
+    - all_eligible: true to use every eligible candidate of the company
+    - salary, start_date, department, work_mode, benefits: shared offer details
+      (salary falls back to each job's basic salary)
+    Returns a per-candidate report (see offer_letter/bulk.py)
+    """
+    data = request.get_json() or {}
+    try:
+        report = send_bulk_offers(company_id, data, sender=get_current_hr_email())
+    except LookupError as e:
+        return {"error": str(e)}, 404
+    except BulkOfferError as e:
+        return {"error": str(e)}, 400
+    return report, 200
+
+
+@offer_bp.route("/delivery/<int:offer_id>", methods=["GET"])
+def get_offer_delivery(offer_id):
+    """Delivery status of an offer letter email (queued/sending/sent/retrying/failed)"""
+    status = delivery_status(offer_id)
+    if not status:
+        return {"error": "No delivery found for this offer"}, 404
+    return status, 200
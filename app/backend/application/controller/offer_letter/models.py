@@ -0,0 +1,51 @@
+"""
+Offer letter delivery outbox.
+
+One OfferDelivery row per offer letter tracks getting its PDF rendered and
+emailed: send_offer only writes the row, the outbox worker
+(offer_letter/outbox.py) does the slow part and records the outcome here.
+"""
+from datetime import datetime
+
+from application.data.database import db
+
+
+class OfferDelivery(db.Model):
+    __tablename__ = "offer_delivery"
+
+    QUEUED = "queued"
+    SENDING = "sending"
+    SENT = "sent"
+    RETRYING = "retrying"
+    FAILED = "failed"
+
+    id = db.Column(db.Integer, primary_key=True)
+    offer_id = db.Column(db.Integer, nullable=False, unique=True, index=True)
+    application_id = db.Column(db.Integer, index=True)
+    status = db.Column(db.String(16), nullable=False, default=QUEUED, index=True)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    next_attempt_at = db.Column(db.DateTime, index=True)
+    last_error = db.Column(db.Text)
+    to_email = db.Column(db.String(255))
+    sender = db.Column(db.String(255))
+    # Template values and email fields captured at enqueue time (JSON text)
+    payload = db.Column(db.Text)
+    pdf_path = db.Column(db.String(512))
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
+    sent_at = db.Column(db.DateTime)
+
+    def to_dict(self):
+        return {
+            "offer_id": self.offer_id,
+            "application_id": self.application_id,
+            "status": self.status,
+            "attempts": self.attempts,
+            "last_error": self.last_error,
+            "next_attempt_at": self.next_attempt_at.isoformat() if self.next_attempt_at else None,
+            "sent_at": self.sent_at.isoformat() if self.sent_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
+
+    def __repr__(self):
+        return f"<OfferDelivery offer={self.offer_id} status={self.status} attempts={self.attempts}>"
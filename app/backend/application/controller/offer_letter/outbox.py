@@ -0,0 +1,354 @@
+"""
+Offer letter outbox.
+
+`enqueue_offer` records what to send and returns immediately; `dispatch_pending`
+claims due deliveries, renders each PDF from the cached template into
+OFFER_LETTER_DIR and sends the whole batch over one SMTP connection. Failures
+are retried with exponential backoff until OFFER_OUTBOX_MAX_ATTEMPTS, then the
+delivery is marked failed. A background worker thread runs the dispatcher; it
+is woken right away by new offers and otherwise polls.
+
+Config (read per call, all optional):
+    OFFER_OUTBOX_BATCH_SIZE             deliveries per batch / SMTP connection (25)
+    OFFER_OUTBOX_MAX_ATTEMPTS           attempts before a delivery fails (5)
+    OFFER_OUTBOX_RETRY_BASE_SECONDS     first retry delay, doubled each attempt (30)
+    OFFER_OUTBOX_RETRY_MAX_SECONDS      cap on the retry delay (3600)
+    OFFER_OUTBOX_CLAIM_TIMEOUT_SECONDS  reclaim "sending" rows a dead worker left behind (300)
+    OFFER_OUTBOX_POLL_SECONDS           worker idle poll interval (5)
+    OFFER_RENDER_PROCESSES              processes rendering a batch's PDFs (0 = inline)
+"""
+import json
+import logging
+import smtplib
+import threading
+from datetime import datetime, timedelta
+
+from flask import current_app
+from sqlalchemy import and_, or_, select, update
+
+from application.data.database import db
+from application.data.models import OfferLetter, Application, Interview
+from application.controller.offer_letter.models import OfferDelivery
+from application.utils.pdf_utils import offer_pdf_data, offer_letter_dir, render_offer_letter_pdfs
+from application.utils.email_utils import build_offer_message
+
+logger = logging.getLogger(__name__)
+
+DUE_STATUSES = (OfferDelivery.QUEUED, OfferDelivery.RETRYING)
+
+_worker = None
+
+
+def _config(key, default):
+    return current_app.config.get(key, default)
+
+
+# ---------------------------------------------------------------------------
+# Enqueue
+# ---------------------------------------------------------------------------
+
+def delivery_payload(pdf_values, candidate_name, company_name, job_title, application_id):
+    """What the worker needs to render and address one letter (stored as JSON)."""
+    return {
+        "pdf": pdf_values,
+        "candidate_name": candidate_name,
+        "company_name": company_name,
+        "job_title": job_title,
+        "application_id": application_id,
+    }
+
+
+def stage_delivery(offer_id, application_id, to_email, payload, sender=None, delivery=None, now=None):
+    """
+    Add or reset the delivery row for an offer in the current transaction
+    (no commit). Pass `delivery` when the caller already loaded it.
+    """
+    now = now or datetime.utcnow()
+    if delivery is None:
+        delivery = OfferDelivery.query.filter_by(offer_id=offer_id).first()
+    if delivery is None:
+        delivery = OfferDelivery(offer_id=offer_id, created_at=now)
+        db.session.add(delivery)
+
+    delivery.application_id = application_id
+    delivery.status = OfferDelivery.QUEUED
+    delivery.attempts = 0
+    delivery.next_attempt_at = now
+    delivery.last_error = None
+    delivery.sent_at = None
+    delivery.to_email = to_email
+    delivery.sender = sender
+    delivery.payload = json.dumps(payload)
+    delivery.updated_at = now
+    return delivery
+
+
+def enqueue_offer(offer, offer_details=None, sender=None):
+    """
+    Queue (or re-queue) the offer letter email for `offer`. Everything the
+    worker needs is captured now, so it never walks ORM relationships. The
+    caller's transaction is committed.
+    """
+    job = offer.application.job
+    payload = delivery_payload(
+        offer_pdf_data(offer, offer_details),
+        candidate_name=offer.candidate.name,
+        company_name=job.company.company_name if job.company else "Company",
+        job_title=job.job_title,
+        application_id=offer.application_id,
+    )
+    delivery = stage_delivery(offer.id, offer.application_id, offer.candidate.user.email, payload, sender=sender)
+    db.session.commit()
+
+    kick()
+    return delivery
+
+
+def delivery_status(offer_id):
+    delivery = OfferDelivery.query.filter_by(offer_id=offer_id).first()
+    return delivery.to_dict() if delivery else None
+
+
+# ---------------------------------------------------------------------------
+# Dispatch
+# ---------------------------------------------------------------------------
+
+def _claim(batch_size, now, offer_ids=None):
+    """
+    Move up to batch_size due rows (optionally only those of `offer_ids`) to
+    "sending"; a row another worker got first is skipped.
+    """
+    table = OfferDelivery.__table__
+    stale_before = now - timedelta(seconds=_config("OFFER_OUTBOX_CLAIM_TIMEOUT_SECONDS", 300))
+    query = (
+        select(table.c.id, table.c.status, table.c.updated_at)
+        .where(or_(
+            and_(table.c.status.in_(DUE_STATUSES), table.c.next_attempt_at <= now),
+            and_(table.c.status == OfferDelivery.SENDING, table.c.updated_at <= stale_before),
+        ))
+        .order_by(table.c.next_attempt_at, table.c.id)
+        .limit(batch_size)
+    )
+    if offer_ids is not None:
+        query = query.where(table.c.offer_id.in_(offer_ids))
+    due = db.session.execute(query).all()
+
+    claimed = []
+    for row in due:
+        result = db.session.execute(
+            update(table)
+            .where(table.c.id == row.id, table.c.status == row.status, table.c.updated_at == row.updated_at)
+            .values(status=OfferDelivery.SENDING, updated_at=now)
+        )
+        if result.rowcount == 1:
+            claimed.append(row.id)
+    db.session.commit()
+    return claimed
+
+
+def _open_connection():
+    from application import mail  # Flask-Mail instance
+    return mail.connect()
+
+
+class _SmtpSession:
+    """
+    One SMTP connection for a batch, opened on the first send. A server that
+    drops the connection mid-batch gets one reconnect per message; if the
+    server can't be reached at all, the rest of the batch fails fast instead
+    of timing out message by message.
+    """
+
+    def __init__(self):
+        self._conn = None
+        self._unreachable = None
+        self.connections = 0
+
+    def _connect(self):
+        if self._unreachable is not None:
+            raise self._unreachable
+        try:
+            ctx = _open_connection()
+            self._conn = (ctx, ctx.__enter__())
+            self.connections += 1
+        except (OSError, smtplib.SMTPException) as e:
+            self._unreachable = e
+            raise
+
+    def send(self, msg):
+        for attempt in (1, 2):
+            if self._conn is None:
+                self._connect()
+            try:
+                self._conn[1].send(msg)
+                return
+            except smtplib.SMTPServerDisconnected:
+                self.close()
+                if attempt == 2:
+                    raise
+
+    def close(self):
+        if self._conn is not None:
+            ctx, _ = self._conn
+            self._conn = None
+            try:
+                ctx.__exit__(None, None, None)
+            except Exception as e:
+                logger.debug(f"SMTP close failed: {e}")
+
+
+def _mark_sent(delivery, now):
+    delivery.status = OfferDelivery.SENT
+    delivery.attempts += 1
+    delivery.sent_at = now
+    delivery.next_attempt_at = None
+    delivery.last_error = None
+    delivery.updated_at = now
+
+    offer = db.session.get(OfferLetter, delivery.offer_id)
+    if offer:
+        offer.status = "sent"
+    application = db.session.get(Application, delivery.application_id) if delivery.application_id else None
+    if application:
+        application.status = "offered"
+        interview = Interview.query.filter_by(
+            application_id=application.id, status="completed"
+        ).filter(Interview.result.in_(["selected", "approved"])).first()
+        if interview:
+            interview.result = "offer letter sent"
+
+
+def _schedule_retry(delivery, error, now):
+    delivery.attempts += 1
+    delivery.last_error = str(error)[:1000] or error.__class__.__name__
+    delivery.updated_at = now
+    if delivery.attempts >= _config("OFFER_OUTBOX_MAX_ATTEMPTS", 5):
+        delivery.status = OfferDelivery.FAILED
+        delivery.next_attempt_at = None
+        logger.error(f"❌ Offer {delivery.offer_id} delivery failed after {delivery.attempts} attempts: {error}")
+        return
+    delay = min(
+        _config("OFFER_OUTBOX_RETRY_BASE_SECONDS", 30) * 2 ** (delivery.attempts - 1),
+        _config("OFFER_OUTBOX_RETRY_MAX_SECONDS", 3600),
+    )
+    delivery.status = OfferDelivery.RETRYING
+    delivery.next_attempt_at = now + timedelta(seconds=delay)
+    logger.warning(f"⚠️ Offer {delivery.offer_id} delivery attempt {delivery.attempts} failed, retrying in {delay}s: {error}")
+
+
+def dispatch_pending(batch_size=None, now=None, offer_ids=None):
+    """
+    Render and send one batch of due deliveries (optionally only those of
+    `offer_ids`). PDFs for the whole batch are rendered first, across the
+    render pool, then the emails go out over one SMTP connection. Returns
+    counts {"claimed", "sent", "retrying", "failed", "connections"} and
+    "outcomes": {offer_id: {"status", "error"}} for every claimed delivery.
+    """
+    batch_size = batch_size or _config("OFFER_OUTBOX_BATCH_SIZE", 25)
+    now = now or datetime.utcnow()
+    stats = {"claimed": 0, "sent": 0, "retrying": 0, "failed": 0, "connections": 0, "outcomes": {}}
+
+    claimed = _claim(batch_size, now, offer_ids)
+    if not claimed:
+        return stats
+    stats["claimed"] = len(claimed)
+
+    deliveries = OfferDelivery.query.filter(OfferDelivery.id.in_(claimed)).order_by(OfferDelivery.id).all()
+    payloads = []
+    for delivery in deliveries:
+        try:
+            payloads.append(json.loads(delivery.payload or "{}"))
+        except ValueError as e:
+            payloads.append(e)
+
+    renderable = [p for p in payloads if isinstance(p, dict) and "pdf" in p]
+    rendered = iter(render_offer_letter_pdfs([p["pdf"] for p in renderable], offer_letter_dir()))
+
+    session = _SmtpSession()
+    try:
+        for delivery, payload in zip(deliveries, payloads):
+            try:
+                if not isinstance(payload, dict):
+                    raise ValueError(f"Unreadable delivery payload: {payload}")
+                if "pdf" not in payload:
+                    raise ValueError("Delivery payload has no template values")
+                pdf_path = next(rendered)
+                if isinstance(pdf_path, Exception):
+                    raise pdf_path
+                delivery.pdf_path = pdf_path
+                msg = build_offer_message(
+                    to_email=delivery.to_email,
+                    pdf_path=delivery.pdf_path,
+                    candidate_name=payload.get("candidate_name"),
+                    company_name=payload.get("company_name"),
+                    job_title=payload.get("job_title"),
+                    application_id=payload.get("application_id"),
+                    sender=delivery.sender,
+                )
+                session.send(msg)
+            except Exception as e:
+                _schedule_retry(delivery, e, now)
+                stats["failed" if delivery.status == OfferDelivery.FAILED else "retrying"] += 1
+            else:
+                _mark_sent(delivery, now)
+                stats["sent"] += 1
+                logger.info(f"📨 Offer {delivery.offer_id} sent to {delivery.to_email}")
+            stats["outcomes"][delivery.offer_id] = {"status": delivery.status, "error": delivery.last_error}
+            # Commit per delivery so a crash mid-batch doesn't resend what already went out
+            db.session.commit()
+    finally:
+        session.close()
+
+    stats["connections"] = session.connections
+    return stats
+
+
+# ---------------------------------------------------------------------------
+# Background worker
+# ---------------------------------------------------------------------------
+
+class OutboxWorker(threading.Thread):
+    def __init__(self, app):
+        super().__init__(name="offer-outbox", daemon=True)
+        self.app = app
+        self._wake = threading.Event()
+        self._halt = threading.Event()
+
+    def kick(self):
+        self._wake.set()
+
+    def stop(self):
+        self._halt.set()
+        self._wake.set()
+
+    def run(self):
+        logger.info("📮 Offer outbox worker started")
+        while not self._halt.is_set():
+            full_batch = False
+            with self.app.app_context():
+                try:
+                    stats = dispatch_pending()
+                    full_batch = stats["claimed"] >= self.app.config.get("OFFER_OUTBOX_BATCH_SIZE", 25)
+                except Exception as e:
+                    logger.exception(f"❌ Offer outbox dispatch failed: {e}")
+                    db.session.rollback()
+                finally:
+                    db.session.remove()
+            if full_batch:
+                continue
+            self._wake.wait(self.app.config.get("OFFER_OUTBOX_POLL_SECONDS", 5))
+            self._wake.clear()
+
+
+def start_outbox_worker(app):
+    global _worker
+    if _worker is None or not _worker.is_alive():
+        _worker = OutboxWorker(app)
+        _worker.start()
+    return _worker
+
+
+def kick():
+    """Wake the worker for a newly queued delivery (no-op when none is running)."""
+    if _worker is not None:
+        _worker.kick()
@@ -0,0 +1,351 @@
+"""
+Document text extraction with resource limits.
+
+`extract_text` is what `extract_text_from_file` (parser_service.py) runs.
+PDF and DOCX parsing happens in a pool of worker processes, so a huge or
+malformed document cannot pin the web worker's CPU or stall the eventlet hub:
+
+  * files over EXTRACTION_MAX_MB are refused before they are opened
+  * only the first EXTRACTION_MAX_PAGES pages of a PDF are read
+  * each document has EXTRACTION_TIMEOUT_SECONDS in total; on timeout the
+    pool's workers are killed and a fresh pool is started
+  * workers may grow EXTRACTION_MEMORY_MB beyond their size at start
+    (RLIMIT_AS), so a decompression bomb fails with MemoryError instead of
+    swapping the host
+
+Workers come from a fork server (application/utils/processes.py), never from
+a fork of the threaded web worker. A new pool must answer a no-op task within
+EXTRACTION_POOL_START_SECONDS; if it does not, documents are extracted inline
+(with the byte and page limits) and the pool is retried a minute later.
+
+The first EXTRACTION_PAGES_PER_TASK pages of a PDF are one task, which also
+reports the page count, so short resumes (the common case) cost a single
+task. The rest of a longer PDF is split into one page range per worker and
+the ranges run at the same time.
+
+PDF parsing goes through a named backend. "pypdf2" is always available;
+"pymupdf" is used when PyMuPDF is installed (several times faster).
+EXTRACTION_PDF_BACKEND picks one explicitly, and `register_backend` adds
+others; workers receive the backend class itself, so it must be importable
+by its module path.
+
+With EXTRACTION_PROCESSES = 0 (the default outside the app config, e.g. in
+tests and scripts) everything runs inline with the byte and page limits but
+no timeout.
+"""
+import importlib.util
+import logging
+import os
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_EXCEPTION
+from concurrent.futures.process import BrokenProcessPool
+
+from application.utils.processes import pool_context, kill_pool
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractionError(ValueError):
+    """The document could not be turned into text within the limits."""
+
+
+class DocumentTooLarge(ExtractionError):
+    pass
+
+
+class ExtractionTimeout(ExtractionError):
+    pass
+
+
+# ---------------------------------------------------------------------------
+# Backends (run inside the worker processes)
+# ---------------------------------------------------------------------------
+
+class PyPDF2Backend:
+    name = "pypdf2"
+
+    @staticmethod
+    def available():
+        return importlib.util.find_spec("PyPDF2") is not None
+
+    @staticmethod
+    def extract(path, start, stop):
+        """(total page count, [text of pages start..stop))"""
+        from PyPDF2 import PdfReader
+
+        reader = PdfReader(path)
+        total = len(reader.pages)
+        stop = total if stop is None else min(stop, total)
+        return total, [reader.pages[i].extract_text() or "" for i in range(start, stop)]
+
+
+class PyMuPDFBackend:
+    name = "pymupdf"
+
+    @staticmethod
+    def available():
+        return importlib.util.find_spec("pymupdf") is not None or importlib.util.find_spec("fitz") is not None
+
+    @staticmethod
+    def extract(path, start, stop):
+        try:
+            import pymupdf
+        except ImportError:  # releases before 1.24 only ship the "fitz" name
+            import fitz as pymupdf
+
+        with pymupdf.open(path) as doc:
+            total = doc.page_count
+            stop = total if stop is None else min(stop, total)
+            return total, [doc.load_page(i).get_text() or "" for i in range(start, stop)]
+
+
+BACKENDS = {backend.name: backend for backend in (PyPDF2Backend, PyMuPDFBackend)}
+# "auto" tries these in order
+AUTO_ORDER = ("pymupdf", "pypdf2")
+
+
+def register_backend(backend):
+    """Add a PDF backend: a class with `name`, `available()` and `extract(path, start, stop)`."""
+    BACKENDS[backend.name] = backend
+
+
+def resolve_backend(name="auto"):
+    if name and name != "auto":
+        if name not in BACKENDS:
+            raise ValueError(f"Unknown PDF extraction backend: {name}")
+        return name
+    for candidate in AUTO_ORDER:
+        if BACKENDS[candidate].available():
+            return candidate
+    return "pypdf2"
+
+
+def _pdf_pages(backend, path, start, stop):
+    return backend.extract(path, start, stop)
+
+
+def _docx_text(path):
+    import docx2txt
+
+    return docx2txt.process(path)
+
+
+def _limit_worker_memory(memory_mb):
+    """Pool initializer: cap the worker's address space at its current size plus memory_mb."""
+    if not memory_mb:
+        return
+    try:
+        import resource
+
+        with open("/proc/self/statm") as f:
+            current = int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+        limit = current + int(memory_mb) * 1024 * 1024
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    except (ImportError, OSError, ValueError) as e:
+        logger.debug(f"Worker memory limit not applied: {e}")
+
+
+# ---------------------------------------------------------------------------
+# Limits and pool
+# ---------------------------------------------------------------------------
+
+Limits = namedtuple("Limits", "processes timeout start_timeout max_bytes max_pages pages_per_task memory_mb backend")
+
+DEFAULTS = {
+    "EXTRACTION_PROCESSES": 0,
+    "EXTRACTION_TIMEOUT_SECONDS": 20.0,
+    "EXTRACTION_POOL_START_SECONDS": 10.0,
+    "EXTRACTION_MAX_MB": 15.0,
+    "EXTRACTION_MAX_PAGES": 50,
+    "EXTRACTION_PAGES_PER_TASK": 8,
+    "EXTRACTION_MEMORY_MB": 512,
+    "EXTRACTION_PDF_BACKEND": "auto",
+}
+
+
+def current_limits():
+    config = dict(DEFAULTS)
+    try:
+        from flask import current_app, has_app_context
+        if has_app_context():
+            config.update({key: current_app.config.get(key, value) for key, value in DEFAULTS.items()})
+    except ImportError:
+        pass
+    return Limits(
+        processes=max(0, int(config["EXTRACTION_PROCESSES"] or 0)),
+        timeout=float(config["EXTRACTION_TIMEOUT_SECONDS"]),
+        start_timeout=float(config["EXTRACTION_POOL_START_SECONDS"]),
+        max_bytes=int(float(config["EXTRACTION_MAX_MB"]) * 1024 * 1024),
+        max_pages=max(1, int(config["EXTRACTION_MAX_PAGES"])),
+        pages_per_task=max(1, int(config["EXTRACTION_PAGES_PER_TASK"])),
+        memory_mb=int(config["EXTRACTION_MEMORY_MB"] or 0),
+        backend=resolve_backend(config["EXTRACTION_PDF_BACKEND"]),
+    )
+
+
+# A pool that did not start is not retried before then (time.monotonic())
+POOL_RETRY_SECONDS = 60.0
+
+_pool = None
+_pool_key = None
+_pool_retry_at = 0.0
+_pool_lock = threading.Lock()
+
+
+def _get_pool(limits):
+    """The shared pool for these limits, or None to extract inline."""
+    global _pool, _pool_key, _pool_retry_at
+    key = (limits.processes, limits.memory_mb)
+    with _pool_lock:
+        if _pool is not None and _pool_key != key:
+            _pool.shutdown(wait=False)
+            _pool = None
+        if _pool is None:
+            ctx = pool_context()
+            if ctx is None or time.monotonic() < _pool_retry_at:
+                return None
+            pool = ProcessPoolExecutor(
+                max_workers=limits.processes,
+                mp_context=ctx,
+                initializer=_limit_worker_memory,
+                initargs=(limits.memory_mb,),
+            )
+            try:
+                pool.submit(os.getpid).result(timeout=limits.start_timeout)
+            except Exception as e:
+                kill_pool(pool)
+                _pool_retry_at = time.monotonic() + POOL_RETRY_SECONDS
+                logger.warning(f"⚠️ Extraction pool did not start ({e!r}), extracting inline for now")
+                return None
+            _pool, _pool_key = pool, key
+        return _pool
+
+
+def _discard_pool(pool):
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    kill_pool(pool)
+
+
+def shutdown_pool():
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+class _Runner:
+    """Runs worker calls for one document, inline or in the pool, against one deadline."""
+
+    def __init__(self, limits, path):
+        self.limits = limits
+        self.path = path
+        self.pool = _get_pool(limits) if limits.processes > 0 else None
+        self.deadline = time.monotonic() + limits.timeout
+
+    def run(self, calls):
+        """[(fn, args)] -> [result], in order."""
+        if self.pool is None:
+            return [self._inline(fn, args) for fn, args in calls]
+
+        try:
+            futures = [self.pool.submit(fn, *args) for fn, args in calls]
+        except (BrokenProcessPool, RuntimeError):
+            # the pool died between documents; start a new one once
+            _discard_pool(self.pool)
+            self.pool = _get_pool(self.limits)
+            if self.pool is None:
+                return [self._inline(fn, args) for fn, args in calls]
+            futures = [self.pool.submit(fn, *args) for fn, args in calls]
+
+        done, pending = wait(futures, timeout=max(0.0, self.deadline - time.monotonic()),
+                             return_when=FIRST_EXCEPTION)
+        if pending and not any(f.exception() for f in done):
+            _discard_pool(self.pool)
+            raise ExtractionTimeout(
+                f"Extraction of {os.path.basename(self.path)} exceeded {self.limits.timeout:g}s")
+        for future in futures:
+            if future in done and future.exception() is not None:
+                for other in pending:
+                    other.cancel()
+                self._raise(future.exception())
+        return [future.result() for future in futures]
+
+    def _inline(self, fn, args):
+        try:
+            return fn(*args)
+        except Exception as e:
+            self._raise(e)
+
+    def _raise(self, error):
+        name = os.path.basename(self.path)
+        if isinstance(error, BrokenProcessPool):
+            _discard_pool(self.pool)
+            raise ExtractionError(f"Extraction worker crashed on {name}") from error
+        if isinstance(error, MemoryError):
+            raise ExtractionError(f"Extraction of {name} exceeded the {self.limits.memory_mb} MB memory limit") from error
+        if isinstance(error, ExtractionError):
+            raise error
+        raise ExtractionError(f"Could not read {name}: {error}") from error
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+def extract_pdf_pages(path, limits=None):
+    """Text of the first max_pages pages, in order, plus the document's page count."""
+    limits = limits or current_limits()
+    runner = _Runner(limits, path)
+    backend = BACKENDS[limits.backend]
+    chunk = limits.pages_per_task
+    first_stop = min(chunk, limits.max_pages)
+
+    [(total, pages)] = runner.run([(_pdf_pages, (backend, path, 0, first_stop))])
+    last = min(total, limits.max_pages)
+    if last > first_stop:
+        # one range per worker (each range re-opens the file), none shorter than a chunk
+        remaining = last - first_stop
+        parts = max(1, min(limits.processes, -(-remaining // chunk)))
+        size = -(-remaining // parts)
+        ranges = [(start, min(start + size, last)) for start in range(first_stop, last, size)]
+        for _, more in runner.run([(_pdf_pages, (backend, path, start, stop)) for start, stop in ranges]):
+            pages.extend(more)
+    if total > limits.max_pages:
+        logger.info(f"📄 {os.path.basename(path)}: read the first {limits.max_pages} of {total} pages")
+    return pages, total
+
+
+def extract_text(path, limits=None):
+    """Text of a PDF, DOCX/DOC or TXT file. Raises FileNotFoundError, ExtractionError (a ValueError)."""
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"File not found: {path}")
+    limits = limits or current_limits()
+    size = os.path.getsize(path)
+    if size > limits.max_bytes:
+        raise DocumentTooLarge(
+            f"{os.path.basename(path)} is {size / 1048576:.1f} MB; the limit is {limits.max_bytes / 1048576:g} MB")
+
+    ext = path.rsplit('.', 1)[-1].lower()
+    if ext == 'pdf':
+        pages, _ = extract_pdf_pages(path, limits)
+        text = "\n".join(page for page in pages if page)
+    elif ext in ('docx', 'doc'):
+        [text] = _Runner(limits, path).run([(_docx_text, (path,))])
+    elif ext == 'txt':
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+    else:
+        raise ValueError(f"Unsupported file extension: {ext}")
+
+    if not text or not text.strip():
+        raise ValueError(f"No text extracted from {ext.upper()}")
+    return text
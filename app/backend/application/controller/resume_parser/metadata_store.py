@@ -0,0 +1,311 @@
+"""
+Normalized storage of the LLM's resume metadata.
+
+`score_application` used to keep the validated metadata as a JSON string in
+Application.ai_metadata, and every read decoded it and ran
+`validate_and_fix_metadata` again. It is now validated once and written to
+ApplicationMetadata (contact details) plus one row per skill, experience,
+education, project and certification entry, keyed by application and kept
+in resume order.
+
+ApplicationSkill carries the job id and a normalized skill key, so "which
+applicants of job X list skill Y" is an index lookup (`applications_with_skills`)
+instead of decoding every candidate's JSON.
+
+Only the fields of the scoring schema are stored; anything else the model
+adds is dropped. Application.ai_metadata keeps a JSON copy until the backfill
+has been verified everywhere. Applications scored before the tables existed
+are moved over by `python backfill.py ai-metadata` only; until then
+`metadata_for` decodes their JSON without writing anything.
+
+`load_metadata_many` reads any number of applications with one query per
+table.
+"""
+import json
+import logging
+from datetime import datetime
+
+from sqlalchemy import func, select
+
+from application.data.database import db
+from application.data.models import Application
+from application.controller.resume_parser.models import (
+    ApplicationMetadata,
+    ApplicationSkill,
+    ApplicationExperience,
+    ApplicationEducation,
+    ApplicationProject,
+    ApplicationCertification,
+)
+
+logger = logging.getLogger(__name__)
+
+CHILD_MODELS = (ApplicationSkill, ApplicationExperience, ApplicationEducation,
+                ApplicationProject, ApplicationCertification)
+
+
+def skill_key(name):
+    """Lower-cased with whitespace collapsed: "Node JS" and "node  js" are one skill."""
+    return " ".join(str(name or "").lower().split())[:128]
+
+
+def _clip(value, size=None):
+    text = str(value).strip() if value is not None else ""
+    return text[:size] if size else text
+
+
+def _string_list(value):
+    if value is None or value == "":
+        return []
+    if not isinstance(value, list):
+        value = [value]
+    return [_clip(v) for v in value if _clip(v)]
+
+
+def _skill_name(skill):
+    if isinstance(skill, dict):
+        skill = skill.get("name") or skill.get("skill")
+    return _clip(skill, 128) if isinstance(skill, (str, int, float)) else ""
+
+
+# ---------------------------------------------------------------------------
+# Write
+# ---------------------------------------------------------------------------
+
+def _rows(application, metadata):
+    """{model: [row dicts]} for already validated metadata."""
+    app_id = application.id
+    rows = {model: [] for model in CHILD_MODELS}
+
+    seen = set()
+    for skill in metadata.get("skills") or []:
+        name = _skill_name(skill)
+        key = skill_key(name)
+        if not key or key in seen:
+            continue
+        seen.add(key)
+        rows[ApplicationSkill].append({
+            "application_id": app_id, "job_id": application.job_id,
+            "position": len(rows[ApplicationSkill]), "name": name, "skill_key": key,
+        })
+
+    for exp in metadata.get("experience") or []:
+        rows[ApplicationExperience].append({
+            "application_id": app_id, "position": len(rows[ApplicationExperience]),
+            "role": _clip(exp.get("role"), 255), "company": _clip(exp.get("company"), 255),
+            "duration": _clip(exp.get("duration"), 128),
+            "responsibilities": json.dumps(_string_list(exp.get("responsibilities"))),
+        })
+
+    for edu in metadata.get("education") or []:
+        rows[ApplicationEducation].append({
+            "application_id": app_id, "position": len(rows[ApplicationEducation]),
+            "degree": _clip(edu.get("degree"), 255), "field": _clip(edu.get("field"), 255),
+            "university": _clip(edu.get("university"), 255),
+            "graduation_year": _clip(edu.get("graduation_year"), 32),
+        })
+
+    for project in metadata.get("projects") or []:
+        if isinstance(project, str):
+            project = {"title": project}
+        if not isinstance(project, dict):
+            continue
+        rows[ApplicationProject].append({
+            "application_id": app_id, "position": len(rows[ApplicationProject]),
+            "title": _clip(project.get("title") or project.get("name"), 255),
+            "description": _clip(project.get("description")),
+            "technologies": json.dumps(_string_list(project.get("technologies"))),
+        })
+
+    for cert in metadata.get("certifications") or []:
+        if isinstance(cert, dict):
+            cert = cert.get("name") or cert.get("title")
+        name = _clip(cert, 255) if cert is not None else ""
+        if name:
+            rows[ApplicationCertification].append({
+                "application_id": app_id, "position": len(rows[ApplicationCertification]), "name": name,
+            })
+    return rows
+
+
+def store_metadata(application, metadata):
+    """
+    Replace the application's stored metadata with `metadata`, which must
+    have been through validate_and_fix_metadata, and refresh its JSON copy in
+    Application.ai_metadata. Does not commit.
+    """
+    _store_rows(application, metadata)
+    application.ai_metadata = json.dumps(metadata)
+
+
+def _store_rows(application, metadata):
+    app_id = application.id
+    for model in (ApplicationMetadata,) + CHILD_MODELS:
+        table = model.__table__
+        db.session.execute(table.delete().where(table.c.application_id == app_id))
+
+    db.session.execute(ApplicationMetadata.__table__.insert(), [{
+        "application_id": app_id,
+        "job_id": application.job_id,
+        "name": _clip(metadata.get("name"), 255),
+        "email": _clip(metadata.get("email"), 255),
+        "phone": _clip(metadata.get("phone"), 64),
+        "stored_at": datetime.utcnow(),
+    }])
+    for model, rows in _rows(application, metadata).items():
+        if rows:
+            db.session.execute(model.__table__.insert(), rows)
+
+
+# What a near-duplicate resume may share with another applicant's application
+REUSABLE_FIELDS = ("skills", "experience", "education")
+
+
+def copy_metadata(source, application, contact):
+    """
+    Store `source`'s skills, experience and education on `application`
+    (near-duplicate resume reuse), with `contact` (name, email, phone read
+    from this application's own resume) as the contact details. Nothing
+    else of the other applicant is copied. Does not commit.
+    """
+    source_metadata = metadata_for(source)
+    if source_metadata is None:
+        return None
+    metadata = {field: source_metadata.get(field) or [] for field in REUSABLE_FIELDS}
+    metadata.update(projects=[], certifications=[],
+                    name=contact.get("name") or "", email=contact.get("email") or "", phone=contact.get("phone") or "")
+    store_metadata(application, metadata)
+    return metadata
+
+
+# ---------------------------------------------------------------------------
+# Read
+# ---------------------------------------------------------------------------
+
+def _children(model, application_ids):
+    """{application_id: [rows in resume order]} with one query."""
+    grouped = {}
+    rows = (model.query.filter(model.application_id.in_(application_ids))
+            .order_by(model.application_id, model.position))
+    for row in rows:
+        grouped.setdefault(row.application_id, []).append(row)
+    return grouped
+
+
+def load_metadata_many(application_ids):
+    """
+    {application_id: metadata in the scoring schema's shape} for those that
+    have any; one query per table however many ids are given.
+    """
+    application_ids = sorted(set(application_ids))
+    if not application_ids:
+        return {}
+    headers = {h.application_id: h for h in
+               ApplicationMetadata.query.filter(ApplicationMetadata.application_id.in_(application_ids))}
+    if not headers:
+        return {}
+    ids = sorted(headers)
+    skills, experience, education, projects, certifications = (_children(model, ids) for model in CHILD_MODELS)
+
+    return {
+        app_id: {
+            "skills": [s.name for s in skills.get(app_id, [])],
+            "experience": [
+                {"role": e.role, "company": e.company, "duration": e.duration,
+                 "responsibilities": json.loads(e.responsibilities or "[]")}
+                for e in experience.get(app_id, [])
+            ],
+            "education": [
+                {"degree": e.degree, "field": e.field, "university": e.university,
+                 "graduation_year": e.graduation_year}
+                for e in education.get(app_id, [])
+            ],
+            "projects": [
+                {"title": p.title, "description": p.description or "",
+                 "technologies": json.loads(p.technologies or "[]")}
+                for p in projects.get(app_id, [])
+            ],
+            "certifications": [c.name for c in certifications.get(app_id, [])],
+            "name": header.name,
+            "email": header.email,
+            "phone": header.phone,
+        }
+        for app_id, header in headers.items()
+    }
+
+
+def load_metadata(application_id):
+    """The stored metadata in the scoring schema's shape, or None if there is none."""
+    return load_metadata_many([application_id]).get(application_id)
+
+
+def _legacy_metadata(application):
+    """The application's old JSON metadata, validated. None if unreadable."""
+    from application.controller.resume_parser.parser_service import validate_and_fix_metadata
+
+    raw = application.ai_metadata
+    try:
+        metadata = json.loads(raw) if isinstance(raw, str) else raw
+    except ValueError:
+        logger.warning("Application %s: ai_metadata is not valid JSON; left as is", application.id)
+        return None
+    return validate_and_fix_metadata(metadata)
+
+
+def metadata_for(application):
+    """
+    Stored metadata of an application; for one the backfill has not reached
+    yet, its JSON decoded in memory (nothing is written). None when the
+    application has not been parsed.
+    """
+    metadata = load_metadata(application.id)
+    if metadata is not None or not getattr(application, "ai_metadata", None):
+        return metadata
+    return _legacy_metadata(application)
+
+
+def backfill_metadata(batch_size=200):
+    """Copy every application's JSON metadata into the tables. Commits per batch. Returns (written, skipped)."""
+    written = skipped = 0
+    last_id = 0
+    while True:
+        applications = (
+            Application.query
+            .outerjoin(ApplicationMetadata, ApplicationMetadata.application_id == Application.id)
+            .filter(Application.id > last_id, Application.ai_metadata.isnot(None))
+            .filter(ApplicationMetadata.id.is_(None))
+            .order_by(Application.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not applications:
+            return written, skipped
+        for application in applications:
+            metadata = _legacy_metadata(application)
+            if metadata is None:
+                skipped += 1
+            else:
+                # the JSON stays as it was, to compare against
+                _store_rows(application, metadata)
+                written += 1
+        last_id = applications[-1].id
+        db.session.commit()
+
+
+# ---------------------------------------------------------------------------
+# Queries
+# ---------------------------------------------------------------------------
+
+def applications_with_skills(skills, job_id=None):
+    """
+    SELECT of the ids of applications listing every one of `skills`
+    (case-insensitive), optionally for one job; use with Application.id.in_().
+    """
+    keys = sorted({skill_key(skill) for skill in skills} - {""})
+    query = select(ApplicationSkill.application_id).where(ApplicationSkill.skill_key.in_(keys))
+    if job_id is not None:
+        query = query.where(ApplicationSkill.job_id == job_id)
+    if len(keys) > 1:
+        # one row per (application, skill), so a full match has a row for every key
+        query = query.group_by(ApplicationSkill.application_id).having(func.count() == len(keys))
+    return query
@@ -0,0 +1,123 @@
+"""
+Resume-parser side tables.
+
+ApplicationPrefilter holds the cheap lexical (BM25) score of each
+application's resume against its job description, written for a whole job
+at once by prefilter.py. HR can sort candidates by it before any LLM call,
+and the LLM pass can be limited to the top of the list.
+
+ApplicationMetadata and its child tables hold the LLM's validated resume
+metadata (contact details, skills, experience, education, projects,
+certifications), written once per scoring by metadata_store.py. Reads come
+from them instead of the JSON text in Application.ai_metadata (kept as a copy
+for now), so they need no decoding and ApplicationSkill can answer
+"applicants for job X with skill Y" from an index.
+"""
+from datetime import datetime
+
+from application.data.database import db
+
+
+class ApplicationPrefilter(db.Model):
+    __tablename__ = "application_prefilter"
+    __table_args__ = (
+        db.Index("ix_application_prefilter_job_score", "job_id", "score"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    application_id = db.Column(db.Integer, nullable=False, unique=True, index=True)
+    job_id = db.Column(db.Integer, nullable=False)
+    # 0-100, relative to the best resume for the job
+    score = db.Column(db.Float, nullable=False)
+    raw_score = db.Column(db.Float, nullable=False)
+    # 1 = best match for the job
+    rank = db.Column(db.Integer, nullable=False)
+    # where the text came from: "resume" (stored resume text) or "profile" (skills/summary)
+    source = db.Column(db.String(16), nullable=False)
+    # sha256 of the query text the score was computed against
+    jd_hash = db.Column(db.String(64))
+    computed_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<ApplicationPrefilter app={self.application_id} job={self.job_id} score={self.score:.1f}>"
+
+
+class ApplicationMetadata(db.Model):
+    """One row per scored application; its presence means the child rows are complete."""
+    __tablename__ = "application_metadata"
+
+    id = db.Column(db.Integer, primary_key=True)
+    application_id = db.Column(db.Integer, nullable=False, unique=True, index=True)
+    job_id = db.Column(db.Integer, nullable=False, index=True)
+    name = db.Column(db.String(255), nullable=False, default="")
+    email = db.Column(db.String(255), nullable=False, default="")
+    phone = db.Column(db.String(64), nullable=False, default="")
+    stored_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<ApplicationMetadata app={self.application_id} job={self.job_id}>"
+
+
+class ApplicationSkill(db.Model):
+    __tablename__ = "application_skill"
+    __table_args__ = (
+        db.UniqueConstraint("application_id", "skill_key", name="uq_application_skill"),
+        # "applicants with skill Y", optionally for job X
+        db.Index("ix_application_skill_key_job", "skill_key", "job_id"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    application_id = db.Column(db.Integer, nullable=False)
+    job_id = db.Column(db.Integer, nullable=False)
+    # order in the resume
+    position = db.Column(db.Integer, nullable=False)
+    # as the resume spells it
+    name = db.Column(db.String(128), nullable=False)
+    # lower-cased, whitespace-collapsed; see metadata_store.skill_key
+    skill_key = db.Column(db.String(128), nullable=False)
+
+
+class ApplicationExperience(db.Model):
+    __tablename__ = "application_experience"
+
+    id = db.Column(db.Integer, primary_key=True)
+    application_id = db.Column(db.Integer, nullable=False, index=True)
+    position = db.Column(db.Integer, nullable=False)
+    role = db.Column(db.String(255), nullable=False, default="")
+    company = db.Column(db.String(255), nullable=False, default="")
+    duration = db.Column(db.String(128), nullable=False, default="")
+    # JSON list of strings
+    responsibilities = db.Column(db.Text)
+
+
+class ApplicationEducation(db.Model):
+    __tablename__ = "application_education"
+
+    id = db.Column(db.Integer, primary_key=True)
+    application_id = db.Column(db.Integer, nullable=False, index=True)
+    position = db.Column(db.Integer, nullable=False)
+    degree = db.Column(db.String(255), nullable=False, default="")
+    field = db.Column(db.String(255), nullable=False, default="")
+    university = db.Column(db.String(255), nullable=False, default="")
+    graduation_year = db.Column(db.String(32), nullable=False, default="")
+
+
+class ApplicationProject(db.Model):
+    __tablename__ = "application_project"
+
+    id = db.Column(db.Integer, primary_key=True)
+    application_id = db.Column(db.Integer, nullable=False, index=True)
+    position = db.Column(db.Integer, nullable=False)
+    title = db.Column(db.String(255), nullable=False, default="")
+    description = db.Column(db.Text)
+    # JSON list of strings
+    technologies = db.Column(db.Text)
+
+
+class ApplicationCertification(db.Model):
+    __tablename__ = "application_certification"
+
+    id = db.Column(db.Integer, primary_key=True)
+    application_id = db.Column(db.Integer, nullable=False, index=True)
+    position = db.Column(db.Integer, nullable=False)
+    name = db.Column(db.String(255), nullable=False)
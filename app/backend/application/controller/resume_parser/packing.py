@@ -0,0 +1,248 @@
+"""
+Relevance-aware prompt packing.
+
+Resumes and job descriptions that do not fit their token budget used to be
+cut at a fixed character offset, which kept contact headers and "About us"
+boilerplate and dropped whatever came late: often the skills list or the most
+recent role. Packing instead:
+
+  1. splits the text into sections at its headings ("EXPERIENCE",
+     "Requirements:", ...), and long sections into smaller chunks
+  2. scores each section: a prior from its heading (skills and experience
+     high, hobbies and references low, requirements above benefits) times the
+     weighted overlap with the job's title, required skills and description
+  3. fills the budget with the most valuable sections per token, and
+     reassembles them in their original order with "[...]" where sections
+     were left out
+
+Text that already fits is passed through untouched.
+
+Token counts are estimates (about four characters per token for English
+prose; Gemini's tokenizer is not available offline) and are meant for
+budgeting and reporting, not billing.
+
+Config (read per call, all optional):
+    PROMPT_RESUME_TOKENS  resume budget for scoring and pre-parse prompts (default 2000)
+    PROMPT_JD_TOKENS      job description budget (default 1200)
+"""
+import math
+import re
+from collections import namedtuple
+
+CHARS_PER_TOKEN = 4
+# Sections longer than this are split at line breaks
+CHUNK_TOKENS = 300
+# The resume's contact block is always kept, up to this size
+HEADER_TOKENS = 80
+# A section cut to fit must keep at least this much
+MIN_PARTIAL_TOKENS = 60
+# Sections with a lower heading prior are only kept when they mention the job
+LOW_PRIOR = 0.5
+GAP = "[...]"
+
+_WORD_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]")
+
+STOPWORDS = frozenset("""
+a an and are as at be by for from has have in is it its of on or our that the their this to was
+we will with you your they them who what which while within across about into over per etc using
+""".split())
+
+# (keywords found in the heading, prior); the first match wins
+RESUME_PRIORS = (
+    (("skill", "technolog", "tools", "stack", "competenc"), 2.0),
+    (("experience", "employment", "work history", "career"), 1.7),
+    (("project",), 1.4),
+    (("summary", "profile", "objective", "about me"), 1.2),
+    (("certif", "licen", "achievement", "award"), 1.0),
+    (("education", "academic", "qualification"), 0.9),
+    (("publication", "volunteer", "language"), 0.6),
+    (("hobbies", "interests", "personal", "declaration", "references", "referees"), 0.15),
+)
+JD_PRIORS = (
+    (("requirement", "qualification", "must have", "skills", "who you are", "what you bring"), 2.0),
+    (("responsibilit", "what you'll do", "what you will do", "the role", "duties"), 1.6),
+    (("nice to have", "preferred", "bonus", "plus"), 1.2),
+    (("about us", "about the company", "who we are", "our mission", "culture"), 0.35),
+    (("benefit", "perks", "we offer", "compensation", "salary"), 0.3),
+    (("equal opportunity", "diversity", "how to apply", "disclaimer", "privacy"), 0.1),
+)
+
+Section = namedtuple("Section", "index heading text tokens prior")
+Packed = namedtuple("Packed", "text tokens original_tokens sections_kept sections_total")
+
+
+def estimate_tokens(text):
+    return int(math.ceil(len(text or "") / CHARS_PER_TOKEN))
+
+
+def terms(text):
+    return [t for t in _WORD_RE.findall((text or "").lower()) if t not in STOPWORDS]
+
+
+def job_query(job_title="", required_skills="", description=""):
+    """
+    term -> weight: title and required skills count three times a description
+    word. Leave the description out when packing the description itself.
+    """
+    weights = {}
+    for term in set(terms(description)):
+        weights[term] = 1.0
+    for term in set(terms(f"{job_title or ''} {required_skills or ''}")):
+        weights[term] = 3.0
+    return weights
+
+
+# ---------------------------------------------------------------------------
+# Segmentation
+# ---------------------------------------------------------------------------
+
+def _heading(line):
+    """The heading text if the line looks like one, else None."""
+    stripped = line.strip().strip("#*-=_|•").strip()
+    if not stripped or len(stripped) > 48 or len(stripped.split()) > 6:
+        return None
+    letters = [c for c in stripped if c.isalpha()]
+    if not letters:
+        return None
+    if stripped.endswith(":") or (stripped.isupper() and len(letters) > 2):
+        return stripped.rstrip(":").strip()
+    # "Work Experience", "Nice to have": short, capitalised, names a known section
+    lowered = stripped.lower()
+    if len(stripped.split()) <= 3 and stripped[0].isupper() and not any(c in stripped for c in ",.;") \
+            and any(k in lowered for priors in (RESUME_PRIORS, JD_PRIORS) for keys, _ in priors for k in keys):
+        return stripped
+    return None
+
+
+def _prior(heading, priors):
+    lowered = (heading or "").lower()
+    for keys, prior in priors:
+        if any(k in lowered for k in keys):
+            return prior
+    return 1.0
+
+
+def _chunks(lines, limit_chars):
+    chunk, size = [], 0
+    for line in lines:
+        if chunk and size + len(line) > limit_chars:
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(line)
+        size += len(line) + 1
+    if chunk:
+        yield chunk
+
+
+def segment(text, priors):
+    """Sections in document order; section 0 is whatever precedes the first heading."""
+    blocks = [(None, [])]
+    for line in (text or "").splitlines():
+        heading = _heading(line)
+        if heading is not None:
+            blocks.append((heading, [line]))
+        else:
+            blocks[-1][1].append(line)
+
+    sections = []
+    for heading, lines in blocks:
+        if not any(line.strip() for line in lines):
+            continue
+        prior = _prior(heading, priors)
+        for chunk in _chunks(lines, CHUNK_TOKENS * CHARS_PER_TOKEN):
+            body = "\n".join(chunk).strip("\n")
+            if body.strip():
+                sections.append(Section(len(sections), heading, body, estimate_tokens(body), prior))
+    return sections
+
+
+# ---------------------------------------------------------------------------
+# Packing
+# ---------------------------------------------------------------------------
+
+def _truncate(text, max_tokens):
+    """Cut at a line (or word) boundary to at most max_tokens."""
+    limit = max_tokens * CHARS_PER_TOKEN
+    if len(text) <= limit:
+        return text
+    cut = text.rfind("\n", 0, limit)
+    if cut < limit // 2:
+        cut = text.rfind(" ", 0, limit)
+    return text[:cut if cut > 0 else limit].rstrip()
+
+
+def pack(text, budget, query=None, priors=RESUME_PRIORS, keep_header=False):
+    """Fit `text` into `budget` tokens keeping the most relevant sections. Returns Packed."""
+    text = text or ""
+    original = estimate_tokens(text)
+    if original <= budget:
+        return Packed(text, original, original, 1, 1)
+
+    sections = segment(text, priors)
+    query = query or {}
+    chosen = {}
+    # room for the "[...]" gap markers and line breaks between sections
+    remaining = budget - 4 * estimate_tokens(GAP + "\n")
+
+    if keep_header and sections and sections[0].heading is None:
+        header = _truncate(sections[0].text, min(HEADER_TOKENS, budget))
+        chosen[0] = header
+        remaining -= estimate_tokens(header)
+
+    def relevance(section):
+        return sum(query.get(term, 0.0) for term in set(terms(section.text)))
+
+    ranked = []
+    for section in sections:
+        if section.index in chosen:
+            continue
+        score = relevance(section)
+        if section.prior < LOW_PRIOR and score == 0:
+            continue  # boilerplate that says nothing about the job: never used as filler
+        ranked.append((-section.prior * (1.0 + score) / max(section.tokens, 1), section.index, section))
+    ranked.sort(key=lambda r: r[:2])
+
+    cut = set()
+    for _, _, section in ranked:
+        if remaining <= 0:
+            break
+        if section.tokens <= remaining:
+            chosen[section.index] = section.text
+            remaining -= section.tokens
+        elif remaining >= MIN_PARTIAL_TOKENS:
+            part = _truncate(section.text, remaining)
+            chosen[section.index] = part
+            cut.add(section.index)
+            remaining -= estimate_tokens(part)
+
+    parts, previous = [], -1
+    for index in sorted(chosen):
+        if index != previous + 1 and (not parts or parts[-1] != GAP):
+            parts.append(GAP)
+        parts.append(chosen[index])
+        if index in cut:
+            parts.append(GAP)
+        previous = index
+    if previous != len(sections) - 1 and (not parts or parts[-1] != GAP):
+        parts.append(GAP)
+    packed = "\n".join(parts)
+    return Packed(packed, estimate_tokens(packed), original, len(chosen), len(sections))
+
+
+def pack_resume(text, budget, query=None):
+    return pack(text, budget, query=query, priors=RESUME_PRIORS, keep_header=True)
+
+
+def pack_job_description(text, budget, query=None):
+    return pack(text, budget, query=query, priors=JD_PRIORS)
+
+
+def token_report(**packs):
+    """{"<name>_tokens", "<name>_original_tokens", ..., "total_tokens"} for logging and responses."""
+    report = {}
+    for name, packed in packs.items():
+        report[f"{name}_tokens"] = packed.tokens
+        report[f"{name}_original_tokens"] = packed.original_tokens
+        report[f"{name}_sections"] = f"{packed.sections_kept}/{packed.sections_total}"
+    report["total_tokens"] = sum(p.tokens for p in packs.values())
+    return report
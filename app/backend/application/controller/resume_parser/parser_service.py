@@ -7,7 +7,7 @@ Key fixes:
  - Robust download with timeouts + retries
  - Prompt size guard + truncated logging
  - Returns candidate paths tried on resume-not-found errors
- - ✅ MODEL FALLBACK for quota exhaustion
+ - ✅ MODEL FALLBACK for quota exhaustion (latency-aware router)
  - ✅ NATIVE JSON MODE for reliable parsing
  - ✅ ROBUST REGEX for cleaning responses
  - ✅ STRUCTURED METADATA with validation
@@ -18,32 +18,44 @@ import json
 import re
 from uuid import uuid4
 from werkzeug.utils import secure_filename
-import docx2txt
-from PyPDF2 import PdfReader
 import requests
 from requests.adapters import HTTPAdapter, Retry
-import google.generativeai as genai
 from application.data.models import Application, JobPosting
 from application.data.database import db
+from application.utils.lazy import lazy_import
+from application.utils.model_router import ModelRouter, NoModelAvailable
+from application.utils.events import subscribe, ApplicationSubmitted, ApplicationsShortlisted, CELERY
+from application.controller.resume_parser.models import ApplicationPrefilter  # noqa: F401  (create_all)
+from application.controller.resume_parser import extraction, packing, metadata_store
+
+# numpy-backed; only loaded when a job is pre-ranked
+prefilter = lazy_import("application.controller.resume_parser.prefilter")
 
 resume_parser_bp = Blueprint('resume_parser', __name__)
 
 # ----- CONFIG -----
 GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
-if GEMINI_API_KEY:
-    try:
-        genai.configure(api_key=GEMINI_API_KEY)
-    except Exception:
-        # don't crash at import; will surface on call
-        pass
+
+
+def _configure_genai(module):
+    if GEMINI_API_KEY:
+        try:
+            module.configure(api_key=GEMINI_API_KEY)
+        except Exception:
+            # don't crash on first use; will surface on call
+            pass
+
+
+# The SDK takes seconds to import; load it on the first Gemini call
+genai = lazy_import("google.generativeai", on_load=_configure_genai)
 
 MODEL = os.getenv('GEMINI_MODEL', 'gemini-2.5-flash')
+GEMINI_PARSE_TIMEOUT_SECONDS = float(os.getenv('GEMINI_PARSE_TIMEOUT_SECONDS', 45))  # one model attempt
+GEMINI_PARSE_BUDGET_SECONDS = float(os.getenv('GEMINI_PARSE_BUDGET_SECONDS', 90))    # all attempts
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 # Adjust these paths relative to your actual project structure
 UPLOAD_RESUMES = os.path.join(BASE_DIR, '../..', 'uploads', 'resumes')
 UPLOAD_JDS = os.path.join(BASE_DIR, '../..', 'uploads', 'jds')
-os.makedirs(UPLOAD_RESUMES, exist_ok=True)
-os.makedirs(UPLOAD_JDS, exist_ok=True)
 
 # HTTP session for downloads with retries/timeouts
 _session = requests.Session()
@@ -52,50 +64,14 @@ _adapter = HTTPAdapter(max_retries=_retries)
 _session.mount("https://", _adapter)
 _session.mount("http://", _adapter)
 
-# Guards
+# Guards (prompt sizes: see packing.py)
 ALLOWED_EXTENSIONS = {'pdf', 'docx', 'txt'}
-MAX_PROMPT_CHARS = 15000
-PROMPT_RESUME_CHARS = 8000
-PROMPT_JD_CHARS = 6000
 DOWNLOAD_TIMEOUT = (5, 30)
 
 # ----- Helpers: file extraction -----
-def extract_text_from_pdf(path: str) -> str:
-    reader = PdfReader(path)
-    parts = []
-    for page in reader.pages:
-        t = page.extract_text()
-        if t:
-            parts.append(t)
-    full = "\n".join(parts)
-    if not full or not full.strip():
-        raise ValueError("No text extracted from PDF")
-    return full
-
-def extract_text_from_docx(path: str) -> str:
-    txt = docx2txt.process(path)
-    if not txt or not txt.strip():
-        raise ValueError("No text extracted from DOCX")
-    return txt
-
-def extract_text_from_txt(path: str) -> str:
-    with open(path, 'r', encoding='utf-8') as f:
-        txt = f.read()
-    if not txt or not txt.strip():
-        raise ValueError("No text extracted from TXT")
-    return txt
-
 def extract_text_from_file(path: str) -> str:
-    if not os.path.exists(path):
-        raise FileNotFoundError(f"File not found: {path}")
-    ext = path.rsplit('.', 1)[-1].lower()
-    if ext == 'pdf':
-        return extract_text_from_pdf(path)
-    if ext in ('docx', 'doc'):
-        return extract_text_from_docx(path)
-    if ext == 'txt':
-        return extract_text_from_txt(path)
-    raise ValueError(f"Unsupported file extension: {ext}")
+    """PDF/DOCX/TXT text; parsing runs in extraction.py's worker pool with size, page, time and memory limits."""
+    return extraction.extract_text(path)
 
 # ----- JSON cleaning -----
 def _find_first_balanced_json(text: str):
@@ -130,65 +106,44 @@ def clean_json_response(response_text: str) -> str:
 
 
 # ----- ✅ FIXED Gemini call wrapper with NATIVE JSON & FALLBACK -----
+def _gemini_json(model_name: str, prompt: str, timeout: float = None) -> str:
+    """One Gemini call in native JSON mode (the router's transport)."""
+    model = genai.GenerativeModel(model_name)
+    response = model.generate_content(
+        prompt,
+        generation_config={"response_mime_type": "application/json"},
+        request_options={"timeout": timeout} if timeout else None,
+    )
+    if hasattr(response, "text"):
+        return response.text
+    if isinstance(response, dict):
+        return response.get("text") or json.dumps(response)
+    # Fallback for complex response objects
+    return getattr(response, "parts", [{}])[0].text
+
+
+# Fastest healthy model first, quota-exhausted ones skipped (see utils/model_router.py)
+router = ModelRouter(
+    [MODEL, "gemini-2.0-flash-lite", "gemini-2.0-flash", "gemini-2.5-flash-lite",
+     "gemini-flash-latest", "gemini-2.5-pro"],
+    call=_gemini_json,
+    name="resume-parser",
+)
+
+
 def call_gemini_once(prompt: str) -> str:
     """
-    Call Gemini API with native JSON enforcement and model fallback support.
+    Call Gemini with native JSON enforcement through the model router: one
+    attempt per model, fastest healthy model first, within GEMINI_PARSE_BUDGET_SECONDS.
     """
     if not GEMINI_API_KEY:
         raise RuntimeError("Gemini API key missing. Set GEMINI_API_KEY in environment.")
-    
-    # ✅ FIXED 2: Updated model list (Removed 1.5, added 2.0/2.5/Lite)
-    models_to_try = [
-        MODEL,
-        "gemini-2.0-flash-lite",
-        "gemini-2.0-flash", 
-        "gemini-2.5-flash-lite",
-        "gemini-flash-latest",
-        "gemini-2.5-pro"
-    ]
-    
-    # ✅ FIXED 3: Using simple dict for config
-    gen_config = {
-        "response_mime_type": "application/json"
-    }
-    
-    last_error = None
-    for model_name in models_to_try:
-        try:
-            current_app.logger.info(f"🔄 Resume Parser trying model: {model_name}")
-            model = genai.GenerativeModel(model_name)
-            
-            # Pass generation_config as dict
-            response = model.generate_content(prompt, generation_config=gen_config)
-            
-            if hasattr(response, "text"):
-                result = response.text
-            elif isinstance(response, dict):
-                result = response.get("text") or json.dumps(response)
-            else:
-                # Fallback for complex response objects
-                result = getattr(response, "parts", [{}])[0].text
-            
-            if result and result.strip():
-                current_app.logger.info(f"✅ Resume Parser SUCCESS with model: {model_name}")
-                return result
-                
-        except Exception as e:
-            error_msg = str(e).lower()
-            error_type = type(e).__name__
-            
-            # Quota handling
-            if "resourceexhausted" in error_type.lower() or "quota" in error_msg or "429" in error_msg:
-                current_app.logger.warning(f"⚠️ {model_name} quota exhausted: {error_type}")
-                last_error = e
-                continue
-            
-            current_app.logger.error(f"❌ {model_name} failed: {error_type} - {error_msg}")
-            last_error = e
-            continue
-    
-    current_app.logger.error(f"❌ ALL MODELS FAILED in Resume Parser")
-    raise RuntimeError(f"All Gemini models failed. Last error: {str(last_error)[:200]}")
+
+    try:
+        return router.generate(prompt, timeout=GEMINI_PARSE_TIMEOUT_SECONDS, budget=GEMINI_PARSE_BUDGET_SECONDS)
+    except NoModelAvailable as e:
+        current_app.logger.error(f"❌ ALL MODELS FAILED in Resume Parser: {e}")
+        raise RuntimeError(f"All Gemini models failed. {str(e)[:200]}")
 
 # ----- Utilities -----
 GDRIVE_ID_RE = re.compile(r"(?:/d/|id=)([a-zA-Z0-9_-]{10,})")
@@ -220,6 +175,7 @@ def _download_url_to_path(url: str, folder: str, prefix: str = "file", timeout:
         filename = os.path.basename(url.split("?", 1)[0]) or f"{prefix}_{uuid4().hex}.bin"
 
     safe = secure_filename(filename)
+    os.makedirs(folder, exist_ok=True)
     path = os.path.join(folder, safe)
 
     try:
@@ -240,7 +196,8 @@ def _download_url_to_path(url: str, folder: str, prefix: str = "file", timeout:
 # ----- Resume retrieval (explicit resume_file_path) -----
 def get_resume_text_from_application(application: Application, tried_paths_out: list = None):
     """
-    Primary: ApplicantProfile.resume_file_path (absolute or filename in uploads/resumes)
+    Primary: text precomputed when the resume was uploaded.
+    Fallback: ApplicantProfile.resume_file_path (absolute or filename in uploads/resumes)
     """
     tried = []
     applicant_profile = getattr(application, "applicant", None)
@@ -252,6 +209,12 @@ def get_resume_text_from_application(application: Application, tried_paths_out:
     if not resume_file_path:
         raise FileNotFoundError("Applicant profile has no resume_file_path configured")
 
+    # Text extracted at upload time (applicant/resume_processing.py)
+    from application.controller.applicant.resume_processing import stored_resume_text
+    stored = stored_resume_text(applicant_profile)
+    if stored:
+        return stored
+
     # absolute
     if os.path.isabs(resume_file_path):
         tried.append(str(resume_file_path))
@@ -479,6 +442,296 @@ def validate_and_fix_metadata(metadata: dict) -> dict:
     return metadata
 
 
+# ----- Scoring -----
+def score_application(application, force=False):
+    """
+    Score an Application's resume against its job and persist resume_score,
+    ai_feedback and the metadata tables (metadata_store.py). Returns (body, http_status). Applications that
+    already have a score are left alone unless `force` is set.
+    """
+    applicantid = application.applicant_id
+    jobid = application.job_id
+
+    # idempotency check
+    if application.resume_score is not None and not force:
+        metadata = metadata_store.metadata_for(application)
+        return {
+            "success": True,
+            "message": "Already processed",
+            "applicantid": applicantid,
+            "jobid": jobid,
+            "score": application.resume_score,
+            "feedback": application.ai_feedback,
+            "metadata": metadata
+        }, 200
+
+    # get resume text
+    tried = []
+    try:
+        resume_text = get_resume_text_from_application(application, tried_paths_out=tried)
+        current_app.logger.info("Extracted resume text (len=%d)", len(resume_text))
+    except FileNotFoundError:
+        return {
+            "error": "Could not find resume file",
+            "attempted_paths": tried
+        }, 400
+    except Exception as e:
+        return {"error": f"Resume extraction error: {str(e)}"}, 400
+
+    # the same resume (under another account or file name) already scored for this JD
+    if not force:
+        from application.controller.applicant.resume_dedup import reusable_scoring
+        reused = reusable_scoring(application, resume_text)
+        if reused is not None:
+            return _copy_scoring(application, *reused, resume_text=resume_text)
+
+    # get JD text
+    job = JobPosting.query.get(jobid)
+    try:
+        jd_text = get_jd_text_from_job(job)
+        current_app.logger.info("Extracted JD text (len=%d)", len(jd_text))
+    except Exception as e:
+        return {"error": f"Could not obtain JD text: {str(e)}"}, 400
+
+    # Fit both into their token budgets, keeping the sections most relevant to the job
+    resume_pack = packing.pack_resume(
+        resume_text, current_app.config.get("PROMPT_RESUME_TOKENS", 2000),
+        packing.job_query(job.job_title, job.required_skills, jd_text),
+    )
+    jd_pack = packing.pack_job_description(
+        jd_text, current_app.config.get("PROMPT_JD_TOKENS", 1200),
+        packing.job_query(job.job_title, job.required_skills),
+    )
+    resume_label = "Resume Text" if resume_pack.text is resume_text else "Resume Text (most relevant sections)"
+    jd_label = "Job Description" if jd_pack.text is jd_text else "Job Description (most relevant sections)"
+    combined = f"{resume_label}:\n{resume_pack.text}\n\n{jd_label}:\n{jd_pack.text}"
+    prompt_tokens = packing.token_report(resume=resume_pack, jd=jd_pack)
+
+    # ✅ FIXED: Enhanced prompt with structured output
+    prompt = (
+        "You are an expert HR AI specialized in resume analysis.\n\n"
+        "Analyze the Resume and Job Description below and return a JSON object with this EXACT schema:\n\n"
+        "{\n"
+        '  "metadata": {\n'
+        '    "name": "Full Name from resume",\n'
+        '    "email": "email@example.com",\n'
+        '    "phone": "+1234567890",\n'
+        '    "skills": ["Python", "JavaScript", "SQL"],\n'
+        '    "experience": [\n'
+        '      {\n'
+        '        "role": "Software Engineer",\n'
+        '        "company": "Company Name",\n'
+        '        "duration": "Jan 2020 - Dec 2022",\n'
+        '        "responsibilities": ["Built APIs", "Led team of 3"]\n'
+        '      }\n'
+        '    ],\n'
+        '    "education": [\n'
+        '      {\n'
+        '        "degree": "Bachelor of Science",\n'
+        '        "field": "Computer Science",\n'
+        '        "university": "University Name",\n'
+        '        "graduation_year": "2020"\n'
+        '      }\n'
+        '    ],\n'
+        '    "certifications": ["AWS Certified", "PMP"],\n'
+        '    "projects": [\n'
+        '      {\n'
+        '        "title": "E-commerce Platform",\n'
+        '        "description": "Built full-stack application",\n'
+        '        "technologies": ["React", "Node.js"]\n'
+        '      }\n'
+        '    ]\n'
+        '  },\n'
+        '  "score": 85,\n'
+        '  "feedback": "Strong candidate with 5 years experience in relevant technologies. Skills align well with job requirements."\n'
+        "}\n\n"
+        "CRITICAL RULES:\n"
+        "1. Extract REAL data from the resume - NEVER use placeholder text\n"
+        "2. If a field is missing, use empty string \"\" or empty array []\n"
+        "3. For experience: Include job title, company name, dates, and key responsibilities\n"
+        "4. For education: Include degree type, field of study, university name, and year\n"
+        "5. Skills should be a flat array of technology/skill names\n"
+        "6. Score (0-100) should reflect how well the candidate matches the job requirements\n"
+        "7. Feedback should be 2-3 sentences explaining the score\n"
+        "8. Return ONLY valid JSON - no markdown, no explanations\n\n"
+        + combined
+    )
+
+    prompt_tokens["prompt_tokens"] = packing.estimate_tokens(prompt)
+    current_app.logger.info(
+        "Prompt ≈%d tokens (resume %d of %d, JD %d of %d)", prompt_tokens["prompt_tokens"],
+        resume_pack.tokens, resume_pack.original_tokens, jd_pack.tokens, jd_pack.original_tokens,
+    )
+
+    # Call Gemini
+    try:
+        raw = call_gemini_once(prompt)
+        current_app.logger.debug("Raw AI response (first 300 chars): %s", raw[:300])
+    except Exception as e:
+        current_app.logger.error("Gemini call failed", exc_info=True)
+        return {"error": f"LLM error: {str(e)}"}, 500
+
+    cleaned = clean_json_response(raw)
+    try:
+        parsed = json.loads(cleaned)
+    except Exception as parse_error:
+        current_app.logger.error("Failed to parse JSON from LLM", exc_info=True)
+        current_app.logger.debug("Cleaned response: %s", cleaned[:500])
+        return {"error": "Failed to parse response from AI"}, 500
+
+    # ✅ FIXED: Validate and fix metadata structure
+    metadata = parsed.get("metadata", {})
+    metadata = validate_and_fix_metadata(metadata)
+    
+    score_raw = parsed.get("score", 0)
+    feedback = parsed.get("feedback", "") or ""
+
+    # normalize score
+    try:
+        score = float(score_raw)
+    except Exception:
+        nums = re.findall(r'\d+\.?\d*', str(score_raw))
+        score = float(nums[0]) if nums else 0.0
+    score = max(0.0, min(100.0, score))
+
+    # ✅ ADDED: Debug logging
+    current_app.logger.info(f"Parsed metadata - Experience entries: {len(metadata.get('experience', []))}, Education entries: {len(metadata.get('education', []))}")
+    current_app.logger.debug(f"Metadata structure: {json.dumps(metadata, indent=2)[:500]}")
+
+    # persist
+    try:
+        application.resume_score = int(round(score))
+        application.ai_feedback = feedback
+        metadata_store.store_metadata(application, metadata)
+        db.session.commit()
+        current_app.logger.info(f"✅ Successfully saved to DB - Score: {application.resume_score}, "
+                                f"{len(metadata['skills'])} skills, {len(metadata['experience'])} roles")
+    except Exception as e:
+        current_app.logger.error("DB commit failed", exc_info=True)
+        db.session.rollback()
+        return {"error": "Failed to persist results"}, 500
+
+    return {
+        "success": True,
+        "applicantid": applicantid,
+        "jobid": jobid,
+        "score": round(score, 2),
+        "feedback": feedback,
+        "metadata": metadata,
+        "prompt_tokens": prompt_tokens,
+    }, 200
+
+
+EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+PHONE_RE = re.compile(r"\+?\(?\d[\d\s().-]{6,}\d")
+YEAR_RANGE_RE = re.compile(r"(?:19|20)\d\d\s*[-.]\s*(?:19|20)\d\d")
+
+
+def resume_contact(application, resume_text):
+    """Name, email and phone of this application's own applicant and resume."""
+    email = EMAIL_RE.search(resume_text or "")
+    phone = next((m.group(0).strip() for m in PHONE_RE.finditer(resume_text or "")
+                  if not YEAR_RANGE_RE.fullmatch(m.group(0).strip())), "")
+    profile = getattr(application, "applicant", None)
+    return {
+        "name": (profile.name if profile is not None else "") or "",
+        "email": email.group(0) if email else "",
+        "phone": phone,
+    }
+
+
+def _copy_scoring(application, source, similarity, resume_text=""):
+    """
+    Persist another application's LLM result on this one (near-duplicate
+    resume, same JD). The contact details come from this applicant's own
+    resume: a near-duplicate may differ exactly there.
+    """
+    application.resume_score = source.resume_score
+    application.ai_feedback = source.ai_feedback
+    try:
+        metadata = metadata_store.copy_metadata(source, application, resume_contact(application, resume_text))
+        db.session.commit()
+    except Exception:
+        current_app.logger.error("DB commit failed", exc_info=True)
+        db.session.rollback()
+        return {"error": "Failed to persist results"}, 500
+    current_app.logger.info(f"♻️ Reused score of application {source.id} for application {application.id} "
+                            f"(resume similarity {similarity:.2f})")
+    return {
+        "success": True,
+        "applicantid": application.applicant_id,
+        "jobid": application.job_id,
+        "score": application.resume_score,
+        "feedback": application.ai_feedback,
+        "metadata": metadata,
+        "reused_from": {"application_id": source.id, "similarity": round(similarity, 3)},
+    }, 200
+
+
+@subscribe(ApplicationSubmitted, mode=CELERY)
+def score_submitted_application(evt):
+    """Score a new application once it is committed, off the request path."""
+    if current_app.config.get("PREFILTER_DEFER_LLM", False):
+        # left for the job's next pre-ranking shortlist
+        return
+    application = db.session.get(Application, evt.application_id)
+    if application is None:
+        current_app.logger.warning("Application %s vanished before scoring", evt.application_id)
+        return
+    body, status = score_application(application)
+    if status == 200:
+        current_app.logger.info("Scored application %s: %s", evt.application_id, body.get("score"))
+    else:
+        current_app.logger.warning("Scoring application %s failed (%s): %s", evt.application_id, status, body.get("error"))
+
+
+@subscribe(ApplicationsShortlisted, mode=CELERY)
+def score_shortlisted_applications(evt):
+    """LLM-score the applications the pre-ranker picked for a job, best first."""
+    scored = failed = 0
+    for application_id in evt.application_ids:
+        application = db.session.get(Application, application_id)
+        if application is None:
+            continue
+        _, status = score_application(application)
+        if status == 200:
+            scored += 1
+        else:
+            failed += 1
+    current_app.logger.info("Scored shortlist for job %s: %s ok, %s failed", evt.job_id, scored, failed)
+
+
+# ----- Endpoint: pre-rank a job's applicants -----
+@resume_parser_bp.route('/prefilter/<int:jobid>', methods=['POST'])
+def prefilter_job_applicants(jobid):
+    """
+    BM25-rank every applicant of a job against its description and store
+    prefilter_score. Optional JSON body: {"llm_top_k": int, "llm_min_score": 0-100}
+    queues LLM scoring for the unscored applications that make the cut.
+    """
+    payload = request.get_json(silent=True) or {}
+    try:
+        top_k = payload.get("llm_top_k")
+        min_score = payload.get("llm_min_score")
+        top_k = int(top_k) if top_k is not None else None
+        min_score = float(min_score) if min_score is not None else None
+    except (TypeError, ValueError):
+        return jsonify({"error": "llm_top_k must be an integer and llm_min_score a number"}), 400
+    if (top_k is not None and top_k < 0) or (min_score is not None and not 0 <= min_score <= 100):
+        return jsonify({"error": "llm_top_k must be >= 0 and llm_min_score within 0-100"}), 400
+
+    try:
+        stats = prefilter.prefilter_job(jobid, llm_top_k=top_k, llm_min_score=min_score)
+    except LookupError as e:
+        return jsonify({"error": str(e)}), 404
+    except Exception as e:
+        current_app.logger.error("Pre-ranking failed", exc_info=True)
+        db.session.rollback()
+        return jsonify({"error": str(e)}), 500
+    stats["top"] = prefilter.top_prefiltered(jobid, limit=10)
+    return jsonify(stats), 200
+
+
 # ----- Endpoint: parse-resume ----- 
 @resume_parser_bp.route('/parse-resume', methods=['POST'])
 def parse_resume_from_db():
@@ -497,165 +750,9 @@ def parse_resume_from_db():
         if not application:
             return jsonify({"error": "Application for given applicantid and jobid not found"}), 404
 
-        # idempotency check
         force = str(request.form.get("force", "")).lower() in ("1", "true", "yes")
-        if application.resume_score is not None and not force:
-            metadata = None
-            if getattr(application, "ai_metadata", None):
-                try:
-                    metadata = json.loads(application.ai_metadata)
-                except Exception:
-                    metadata = {"raw": application.ai_metadata}
-            return jsonify({
-                "success": True,
-                "message": "Already processed",
-                "applicantid": applicantid,
-                "jobid": jobid,
-                "score": application.resume_score,
-                "feedback": application.ai_feedback,
-                "metadata": metadata
-            }), 200
-
-        # get resume text
-        tried = []
-        try:
-            resume_text = get_resume_text_from_application(application, tried_paths_out=tried)
-            current_app.logger.info("Extracted resume text (len=%d)", len(resume_text))
-        except FileNotFoundError:
-            return jsonify({
-                "error": "Could not find resume file",
-                "attempted_paths": tried
-            }), 400
-        except Exception as e:
-            return jsonify({"error": f"Resume extraction error: {str(e)}"}), 400
-
-        # get JD text
-        try:
-            jd_text = get_jd_text_from_job(JobPosting.query.get(jobid))
-            current_app.logger.info("Extracted JD text (len=%d)", len(jd_text))
-        except Exception as e:
-            return jsonify({"error": f"Could not obtain JD text: {str(e)}"}), 400
-
-        # Truncate to guard limits
-        resume_snip = resume_text
-        jd_snip = jd_text
-        combined = f"Resume Text:\n{resume_snip}\n\nJob Description:\n{jd_snip}"
-        
-        if len(combined) > MAX_PROMPT_CHARS:
-            resume_snip = resume_text[:PROMPT_RESUME_CHARS]
-            jd_snip = jd_text[:PROMPT_JD_CHARS]
-            combined = f"Resume Text (truncated):\n{resume_snip}\n\nJob Description (truncated):\n{jd_snip}"
-
-        # ✅ FIXED: Enhanced prompt with structured output
-        prompt = (
-            "You are an expert HR AI specialized in resume analysis.\n\n"
-            "Analyze the Resume and Job Description below and return a JSON object with this EXACT schema:\n\n"
-            "{\n"
-            '  "metadata": {\n'
-            '    "name": "Full Name from resume",\n'
-            '    "email": "email@example.com",\n'
-            '    "phone": "+1234567890",\n'
-            '    "skills": ["Python", "JavaScript", "SQL"],\n'
-            '    "experience": [\n'
-            '      {\n'
-            '        "role": "Software Engineer",\n'
-            '        "company": "Company Name",\n'
-            '        "duration": "Jan 2020 - Dec 2022",\n'
-            '        "responsibilities": ["Built APIs", "Led team of 3"]\n'
-            '      }\n'
-            '    ],\n'
-            '    "education": [\n'
-            '      {\n'
-            '        "degree": "Bachelor of Science",\n'
-            '        "field": "Computer Science",\n'
-            '        "university": "University Name",\n'
-            '        "graduation_year": "2020"\n'
-            '      }\n'
-            '    ],\n'
-            '    "certifications": ["AWS Certified", "PMP"],\n'
-            '    "projects": [\n'
-            '      {\n'
-            '        "title": "E-commerce Platform",\n'
-            '        "description": "Built full-stack application",\n'
-            '        "technologies": ["React", "Node.js"]\n'
-            '      }\n'
-            '    ]\n'
-            '  },\n'
-            '  "score": 85,\n'
-            '  "feedback": "Strong candidate with 5 years experience in relevant technologies. Skills align well with job requirements."\n'
-            "}\n\n"
-            "CRITICAL RULES:\n"
-            "1. Extract REAL data from the resume - NEVER use placeholder text\n"
-            "2. If a field is missing, use empty string \"\" or empty array []\n"
-            "3. For experience: Include job title, company name, dates, and key responsibilities\n"
-            "4. For education: Include degree type, field of study, university name, and year\n"
-            "5. Skills should be a flat array of technology/skill names\n"
-            "6. Score (0-100) should reflect how well the candidate matches the job requirements\n"
-            "7. Feedback should be 2-3 sentences explaining the score\n"
-            "8. Return ONLY valid JSON - no markdown, no explanations\n\n"
-            + combined
-        )
-
-        # Call Gemini
-        try:
-            raw = call_gemini_once(prompt)
-            current_app.logger.debug("Raw AI response (first 300 chars): %s", raw[:300])
-        except Exception as e:
-            current_app.logger.error("Gemini call failed", exc_info=True)
-            return jsonify({"error": f"LLM error: {str(e)}"}), 500
-
-        cleaned = clean_json_response(raw)
-        try:
-            parsed = json.loads(cleaned)
-        except Exception as parse_error:
-            current_app.logger.error("Failed to parse JSON from LLM", exc_info=True)
-            current_app.logger.debug("Cleaned response: %s", cleaned[:500])
-            return jsonify({"error": "Failed to parse response from AI"}), 500
-
-        # ✅ FIXED: Validate and fix metadata structure
-        metadata = parsed.get("metadata", {})
-        metadata = validate_and_fix_metadata(metadata)
-        
-        score_raw = parsed.get("score", 0)
-        feedback = parsed.get("feedback", "") or ""
-
-        # normalize score
-        try:
-            score = float(score_raw)
-        except Exception:
-            nums = re.findall(r'\d+\.?\d*', str(score_raw))
-            score = float(nums[0]) if nums else 0.0
-        score = max(0.0, min(100.0, score))
-
-        # ✅ ADDED: Debug logging
-        current_app.logger.info(f"Parsed metadata - Experience entries: {len(metadata.get('experience', []))}, Education entries: {len(metadata.get('education', []))}")
-        current_app.logger.debug(f"Metadata structure: {json.dumps(metadata, indent=2)[:500]}")
-
-        # persist
-        try:
-            application.resume_score = int(round(score))
-            application.ai_feedback = feedback
-            # ✅ FIXED: Removed hasattr check - always try to save
-            try:
-                application.ai_metadata = json.dumps(metadata)
-            except AttributeError:
-                current_app.logger.warning("Application model missing ai_metadata column")
-            
-            db.session.commit()
-            current_app.logger.info(f"✅ Successfully saved to DB - Score: {application.resume_score}, Metadata size: {len(json.dumps(metadata))} bytes")
-        except Exception as e:
-            current_app.logger.error("DB commit failed", exc_info=True)
-            db.session.rollback()
-            return jsonify({"error": "Failed to persist results"}), 500
-
-        return jsonify({
-            "success": True,
-            "applicantid": applicantid,
-            "jobid": jobid,
-            "score": round(score, 2),
-            "feedback": feedback,
-            "metadata": metadata
-        }), 200
+        body, status = score_application(application, force=force)
+        return jsonify(body), status
 
     except Exception as exc:
         current_app.logger.error("Unhandled error", exc_info=True)
@@ -671,25 +768,16 @@ def get_application_ai_results(applicationid):
 
         score = getattr(application, "resume_score", None)
         feedback = getattr(application, "ai_feedback", None)
-        metadata_raw = getattr(application, "ai_metadata", None)
+        # validated when it was stored; no decoding or re-validation here
+        metadata = metadata_store.metadata_for(application)
 
         # ✅ FIXED: Strict check - all three must exist
         processed = (
             score is not None 
             and feedback is not None 
-            and metadata_raw is not None
+            and metadata is not None
         )
 
-        metadata = {}
-        if metadata_raw:
-            try:
-                metadata = json.loads(metadata_raw) if isinstance(metadata_raw, str) else metadata_raw
-                # Validate structure
-                metadata = validate_and_fix_metadata(metadata)
-            except Exception as e:
-                current_app.logger.error(f"Failed to parse ai_metadata: {e}", exc_info=True)
-                metadata = {}
-
         # ✅ FIXED: Return null for unprocessed data instead of defaults
         return jsonify({
             "processed": processed,
@@ -713,34 +801,26 @@ def debug_metadata(applicationid):
         if not app:
             return jsonify({"error": "Application not found"}), 404
         
-        metadata_raw = app.ai_metadata
-        if not metadata_raw:
-            return jsonify({"error": "No metadata stored"}), 404
-        
-        try:
-            metadata = json.loads(metadata_raw)
+        metadata = metadata_store.load_metadata(applicationid)
+        if metadata is None:
             return jsonify({
-                "application_id": applicationid,
-                "raw_length": len(metadata_raw),
-                "parsed_successfully": True,
-                "metadata": metadata,
-                "structure": {
-                    "has_experience": bool(metadata.get("experience")),
-                    "experience_count": len(metadata.get("experience", [])),
-                    "experience_is_array": isinstance(metadata.get("experience"), list),
-                    "first_exp_structure": metadata.get("experience", [{}])[0] if metadata.get("experience") else None,
-                    "has_education": bool(metadata.get("education")),
-                    "education_count": len(metadata.get("education", [])),
-                    "education_is_array": isinstance(metadata.get("education"), list),
-                    "first_edu_structure": metadata.get("education", [{}])[0] if metadata.get("education") else None
-                }
-            }), 200
-        except Exception as e:
-            return jsonify({
-                "application_id": applicationid,
-                "raw_preview": metadata_raw[:500],
-                "parse_error": str(e)
-            }), 500
+                "error": "No metadata stored",
+                "legacy_json_pending": bool(app.ai_metadata),
+            }), 404
+
+        return jsonify({
+            "application_id": applicationid,
+            "metadata": metadata,
+            "structure": {
+                "skills_count": len(metadata["skills"]),
+                "experience_count": len(metadata["experience"]),
+                "first_exp_structure": metadata["experience"][0] if metadata["experience"] else None,
+                "education_count": len(metadata["education"]),
+                "first_edu_structure": metadata["education"][0] if metadata["education"] else None,
+                "projects_count": len(metadata["projects"]),
+                "certifications_count": len(metadata["certifications"]),
+            }
+        }), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -751,6 +831,7 @@ def health():
         "status": "healthy" if GEMINI_API_KEY else "degraded",
         "gemini_configured": bool(GEMINI_API_KEY),
         "active_model": MODEL,
+        "models": router.snapshot(),
         "json_mode": "enabled",
         "structured_metadata": "enabled"
     }), 200
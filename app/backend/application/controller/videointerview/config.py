@@ -20,6 +20,10 @@ USE_AZURE_SPEECH = os.getenv('USE_AZURE_SPEECH', 'true').lower() == 'true'
 # === Redis Session Store Configuration ===
 REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
 SESSION_TTL_HOURS = int(os.getenv('SESSION_TTL_HOURS', 24))
+# In-process (L1) session cache, invalidated over Redis pub/sub (models/session_store.py)
+SESSION_L1_CACHE = os.getenv('SESSION_L1_CACHE', 'true').lower() == 'true'
+SESSION_L1_MAX_ENTRIES = int(os.getenv('SESSION_L1_MAX_ENTRIES', 1000))
+SESSION_L1_TTL_SECONDS = int(os.getenv('SESSION_L1_TTL_SECONDS', 300))  # upper bound on an entry's age
 
 # === Interview Flow Configuration ===
 MAXQUESTIONS = int(os.getenv('MAXQUESTIONS', 10))
@@ -41,6 +45,11 @@ THINKING_PAUSE_MIN = float(os.getenv('THINKING_PAUSE_MIN', 0.8))   # Seconds bef
 THINKING_PAUSE_MAX = float(os.getenv('THINKING_PAUSE_MAX', 1.5))   # Seconds before next question (max)
 USE_ACKNOWLEDGMENTS = os.getenv('USE_ACKNOWLEDGMENTS', 'true').lower() == 'true'
 
+# Speak questions while they are generated: sentences go out as questionDelta events
+STREAM_QUESTIONS = os.getenv('STREAM_QUESTIONS', 'true').lower() == 'true'
+QUESTION_STREAM_FIRST_CHUNK_SECONDS = float(os.getenv('QUESTION_STREAM_FIRST_CHUNK_SECONDS', 4.0))  # then non-streamed fallback
+QUESTION_STREAM_MIN_SENTENCE_CHARS = int(os.getenv('QUESTION_STREAM_MIN_SENTENCE_CHARS', 20))  # shorter ones wait for the next
+
 # Acknowledgments pool (used if enabled)
 ACKNOWLEDGMENTS = [
     "Interesting, let me think about that...",
@@ -2,23 +2,123 @@
 Redis Session Store - Production-Ready with Reverse Mapping
 
 Critical fix: Early end for critical red flags...
+
+Every videoChunk / audioChunk used to GET and decode the whole session (with
+the candidate's full resume text) twice. Reads now go through an in-process
+L1 cache (LocalSessionCache). Each write bumps `session_version:<id>` and
+announces the new version on the SESSION_INVALIDATION_CHANNEL pub/sub
+channel; every worker drops its copy when it hears of a newer version. The
+cache is only used while this worker's subscription is confirmed, so a lost
+subscription means straight Redis reads, never stale ones. Pub/sub rather
+than keyspace notifications because those need `notify-keyspace-events` on
+the server, which managed Redis often doesn't allow.
 """
+import copy
 import json
 import logging
+import threading
+import time
+from collections import OrderedDict
 from typing import Optional, Dict
 from datetime import datetime, timedelta
 import redis
 from redis.connection import ConnectionPool
 from .interview_session import InterviewSession
+from application.utils.lazy import LazyObject
 
 logger = logging.getLogger(__name__)
 
+SESSION_INVALIDATION_CHANNEL = "interview:session:invalidate"
+
+
+class LocalSessionCache:
+    """
+    In-process (L1) copy of recently read sessions, each stamped with its
+    Redis version. Entries live for at most `ttl_seconds`; an invalidation
+    leaves a tombstone with the announced version so a read that raced the
+    write cannot put the older session back.
+    """
+
+    def __init__(self, max_entries: int = 1000, ttl_seconds: float = 300, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries = OrderedDict()  # session_id -> (version, session or None, stored_at)
+        self._lock = threading.Lock()
+        self.live = False
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.invalidations = 0
+
+    def set_live(self, live: bool):
+        """Enable (invalidations are being received) or disable the cache; both start empty."""
+        with self._lock:
+            self.live = live
+            self._entries.clear()
+
+    def get(self, session_id: str):
+        with self._lock:
+            if not self.live:
+                self.bypassed += 1
+                return None
+            entry = self._entries.get(session_id)
+            if entry is None or entry[1] is None or self._clock() - entry[2] > self.ttl_seconds:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(session_id)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, session_id: str, version: int, session) -> bool:
+        """Cache `session` read at `version`; refused when a newer version was announced."""
+        with self._lock:
+            if not self.live:
+                return False
+            current = self._entries.get(session_id)
+            if current is not None and current[0] > version:
+                return False
+            self._entries[session_id] = (version, session, self._clock())
+            self._entries.move_to_end(session_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return True
+
+    def invalidate(self, session_id: str, version: Optional[int] = None):
+        """Drop the entry if older than `version` (None: the session was removed)."""
+        with self._lock:
+            current = self._entries.get(session_id)
+            if version is None:
+                self._entries.pop(session_id, None)
+            elif current is None or current[0] < version:
+                self._entries[session_id] = (version, None, self._clock())
+                self._entries.move_to_end(session_id)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            else:
+                return
+            self.invalidations += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "live": self.live,
+                "entries": sum(1 for entry in self._entries.values() if entry[1] is not None),
+                "hits": self.hits,
+                "misses": self.misses,
+                "bypassed": self.bypassed,
+                "invalidations": self.invalidations,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            }
+
 
 class RedisSessionStore:
     """Redis-backed session store with reverse mapping support"""
 
     def __init__(self, redis_url: str = "redis://localhost:6379/0", 
-                 session_ttl_hours: int = 24, max_connections: int = 50):
+                 session_ttl_hours: int = 24, max_connections: int = 50,
+                 l1_cache: bool = False, l1_max_entries: int = 1000, l1_ttl_seconds: float = 300):
         try:
             self.pool = ConnectionPool.from_url(
                 redis_url,
@@ -40,10 +140,71 @@ class RedisSessionStore:
             logger.error(f"Redis Connection Error: {e}")
             raise
 
+        self.local = LocalSessionCache(max_entries=l1_max_entries, ttl_seconds=l1_ttl_seconds)
+        if l1_cache:
+            threading.Thread(target=self._listen_for_invalidations, name="session-l1-invalidation",
+                             daemon=True).start()
+
     def _key(self, session_id: str) -> str:
         """Generate key for session"""
         return f"session:{session_id}"
 
+    def _version_key(self, session_id: str) -> str:
+        """Version of the stored session, bumped by every write (outside the session:* scan)"""
+        return f"session_version:{session_id}"
+
+    # ----- L1 invalidation -----
+
+    def _announce(self, session_id: str, version: Optional[int]):
+        try:
+            self.client.publish(SESSION_INVALIDATION_CHANNEL,
+                                json.dumps({"session_id": session_id, "version": version}))
+        except Exception as e:
+            # Other workers still drop their copy when its TTL runs out
+            logger.warning(f"⚠️ Could not announce session {session_id} v{version}: {e}")
+
+    def apply_invalidation(self, data):
+        """Handle one message from SESSION_INVALIDATION_CHANNEL."""
+        try:
+            message = json.loads(data)
+            self.local.invalidate(message["session_id"], message.get("version"))
+        except (ValueError, TypeError, KeyError):
+            logger.warning(f"⚠️ Ignoring malformed session invalidation: {data!r}")
+
+    def _listen_for_invalidations(self):
+        """
+        Keep this worker subscribed to SESSION_INVALIDATION_CHANNEL. The L1
+        cache is live only between the subscribe confirmation and the next
+        connection error, so missed messages can never leave stale entries.
+        """
+        backoff = 1
+        while True:
+            pubsub = None
+            try:
+                pubsub = self.client.pubsub()
+                pubsub.subscribe(SESSION_INVALIDATION_CHANNEL)
+                while True:
+                    message = pubsub.get_message(timeout=1.0)
+                    if not message:
+                        continue
+                    if message["type"] == "subscribe":
+                        self.local.set_live(True)
+                        backoff = 1
+                        logger.info("✅ Session L1 cache live")
+                    elif message["type"] == "message":
+                        self.apply_invalidation(message["data"])
+            except Exception as e:
+                logger.warning(f"⚠️ Session invalidation subscription lost ({e}); L1 cache off for {backoff}s")
+            finally:
+                self.local.set_live(False)
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+            time.sleep(backoff)
+            backoff = min(backoff * 2, 30)
+
     def _meta_key(self, session_id: str) -> str:
         """Generate metadata key"""
         return f"interview:session:{session_id}:meta"
@@ -84,12 +245,15 @@ class RedisSessionStore:
                 'problem_solving_signals': getattr(session, 'problem_solving_signals', [])
             }
             
-            # Store as JSON string
-            self.client.setex(
-                self._key(session.session_id),
-                int(self.session_ttl.total_seconds()),
-                json.dumps(session_dict)
-            )
+            # Store as JSON string, with a new version for the L1 caches
+            ttl = int(self.session_ttl.total_seconds())
+            pipe = self.client.pipeline()
+            pipe.incr(self._version_key(session.session_id))
+            pipe.expire(self._version_key(session.session_id), ttl)
+            pipe.setex(self._key(session.session_id), ttl, json.dumps(session_dict))
+            version = int(pipe.execute()[0])
+            self.local.invalidate(session.session_id, version)
+            self._announce(session.session_id, version)
             
             # ✅ Store reverse mapping: interview_id -> session_id
             if session.interview_id:
@@ -107,13 +271,21 @@ class RedisSessionStore:
             logger.error(f"Failed to add session: {e}", exc_info=True)
             return False
 
-    def get(self, session_id: str) -> Optional[InterviewSession]:
+    def get(self, session_id: str, shared: bool = False) -> Optional[InterviewSession]:
         """
-        Retrieve session from Redis with proper deserialization
+        Retrieve session from the L1 cache, else from Redis with proper deserialization
         ✅ FIXED: Let from_dict() handle all conversions
+
+        shared=True returns the cached instance itself (read-only callers such
+        as the chunk handlers); otherwise callers get their own copy to mutate
+        and add() back.
         """
+        cached = self.local.get(session_id)
+        if cached is not None:
+            return cached if shared else copy.deepcopy(cached)
+
         try:
-            data = self.client.get(self._key(session_id))
+            data, version = self.client.mget(self._key(session_id), self._version_key(session_id))
             if not data:
                 logger.warning(f"⚠️ Session {session_id} not found in Redis")
                 return None
@@ -130,6 +302,8 @@ class RedisSessionStore:
             # ✅ Use from_dict() - it handles all conversions
             session = InterviewSession.from_dict(session_dict)
             logger.info(f"✅ Retrieved session {session_id} from Redis")
+            if self.local.put(session_id, int(version or 0), session) and not shared:
+                return copy.deepcopy(session)
             return session
             
         except Exception as e:
@@ -141,9 +315,9 @@ class RedisSessionStore:
         """Backward compatibility wrapper"""
         return self.add(session)
 
-    def get_session(self, session_id: str) -> Optional[InterviewSession]:
+    def get_session(self, session_id: str, shared: bool = False) -> Optional[InterviewSession]:
         """Backward compatibility wrapper"""
-        return self.get(session_id)
+        return self.get(session_id, shared=shared)
 
     def get_session_by_interview_id(self, interview_id: int) -> Optional[InterviewSession]:
         """
@@ -183,7 +357,9 @@ class RedisSessionStore:
             # Get session to find interview_id before deletion
             session = self.get(session_id)
 
-            deleted = self.client.delete(self._key(session_id))
+            deleted = self.client.delete(self._key(session_id), self._version_key(session_id))
+            self.local.invalidate(session_id)
+            self._announce(session_id, None)
 
             # Remove reverse mapping if session was found
             if session and hasattr(session, 'interview_id') and session.interview_id:
@@ -208,6 +384,8 @@ class RedisSessionStore:
             for key in keys:
                 # Extract session_id from key
                 session_id = key.replace("session:", "")
+                if ":" in session_id:
+                    continue  # a session:<id>:version counter written before the rename
                 session = self.get(session_id)
                 if session:
                     sessions[session_id] = session
@@ -225,6 +403,10 @@ class RedisSessionStore:
         except Exception:
             return False
 
+    def cache_stats(self) -> dict:
+        """Hit rate and size of this worker's L1 cache"""
+        return self.local.stats()
+
 
 # ============================================================================
 # Module-level singleton and wrapper functions
@@ -237,13 +419,25 @@ def get_redis_store() -> RedisSessionStore:
     """Get or create Redis store singleton"""
     global _redis_store
     if _redis_store is None:
-        from ..config import REDIS_URL, SESSION_TTL_HOURS
-        _redis_store = RedisSessionStore(redis_url=REDIS_URL, session_ttl_hours=SESSION_TTL_HOURS)
+        from ..config import (REDIS_URL, SESSION_TTL_HOURS, SESSION_L1_CACHE,
+                              SESSION_L1_MAX_ENTRIES, SESSION_L1_TTL_SECONDS)
+        _redis_store = RedisSessionStore(redis_url=REDIS_URL, session_ttl_hours=SESSION_TTL_HOURS,
+                                         l1_cache=SESSION_L1_CACHE, l1_max_entries=SESSION_L1_MAX_ENTRIES,
+                                         l1_ttl_seconds=SESSION_L1_TTL_SECONDS)
     return _redis_store
 
 
-# Create global session_store instance for convenience
-session_store = get_redis_store()
+# Global session_store for convenience. Connects to Redis on first use, so an
+# outage at boot fails the requests that need sessions, not the blueprint import.
+session_store = LazyObject(get_redis_store)
+
+
+def session_store_ready() -> bool:
+    """True when Redis is reachable; never raises (used by readiness checks)."""
+    try:
+        return bool(session_store.health_check())
+    except Exception:
+        return False
 
 
 def add_session(session) -> bool:
@@ -251,9 +445,9 @@ def add_session(session) -> bool:
     return session_store.add(session)
 
 
-def get_session(session_id: str):
+def get_session(session_id: str, shared: bool = False):
     """Module-level wrapper for get_session"""
-    return session_store.get(session_id)
+    return session_store.get(session_id, shared=shared)
 
 
 def get_session_by_interview_id(interview_id: int):
@@ -264,6 +458,14 @@ def get_session_by_interview_id(interview_id: int):
     return session_store.get_session_by_interview_id(interview_id)
 
 
+def session_cache_stats() -> dict:
+    """L1 cache stats of this worker; never raises (used by the health endpoint)."""
+    try:
+        return session_store.cache_stats()
+    except Exception:
+        return {"live": False}
+
+
 def session_exists(session_id: str) -> bool:
     """Module-level wrapper for session_exists"""
     return session_store.session_exists(session_id)
@@ -7,6 +7,7 @@ from flask import Blueprint, request, jsonify, send_file
 from datetime import datetime, timezone
 import os
 import json
+from ..services import warmup_service  # noqa: F401  (InterviewScheduled / profile change subscribers)
 RECORDINGS_FOLDER = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../../recordings'))
 logger = logging.getLogger(__name__)
 
@@ -61,114 +62,35 @@ def start_video_interview(interview_id):
             }), 200
         
         # ✅ Get interview, job, company, and candidate information from database
-        from application.data.models import Interview, JobPosting, Company, ApplicantProfile, Application
+        from application.data.models import Interview
+        from ..services.warmup_service import build_interview_context, load_warmup
         
         interview = Interview.query.get(interview_id)
         if not interview:
             return jsonify({'error': 'Interview not found'}), 404
         
-        application = interview.application
-        if not application:
-            return jsonify({'error': 'Application not found'}), 404
-        
-        job = application.job
-        if not job:
-            return jsonify({'error': 'Job posting not found'}), 404
-        
-        company = job.company
-        company_name = company.company_name if company else 'our company'
-        
-        # ✅ Get comprehensive company information
-        company_info = {
-            'name': company_name,
-            'description': company.description if company and hasattr(company, 'description') else '',
-            'industry': company.technology if company and hasattr(company, 'technology') else '',
-            'company_size': company.company_size if company and hasattr(company, 'company_size') else '',
-            'website': company.website if company and hasattr(company, 'website') else '',
-            'location': company.location if company and hasattr(company, 'location') else ''
-        }
-        
-        applicant = application.applicant
-        candidate_name = applicant.name if applicant else 'Candidate'
-        candidate_experience = f"{applicant.years_of_experience} years" if applicant and applicant.years_of_experience else 'Professional experience'
-        
-        # Get candidate skills from profile or application
-        candidate_skills = []
-        if applicant:
-            # Try to get skills from applicant profile
-            if hasattr(applicant, 'skills') and applicant.skills:
-                if isinstance(applicant.skills, str):
-                    candidate_skills = [s.strip() for s in applicant.skills.split(',')]
-                else:
-                    candidate_skills = applicant.skills if isinstance(applicant.skills, list) else [applicant.skills]
-            elif hasattr(applicant, 'technical_skills'):
-                candidate_skills = applicant.technical_skills if isinstance(applicant.technical_skills, list) else [applicant.technical_skills]
-        
-        # ✅ Extract resume text if available
-        resume_text = ''
-        resume_summary = ''
-        try:
-            from application.controller.resume_parser.parser_service import get_resume_text_from_application
-            resume_text = get_resume_text_from_application(application)
-            # Create a summary (first 1000 chars for prompt, full text available)
-            resume_summary = resume_text[:1000] if len(resume_text) > 1000 else resume_text
-            logger.info(f"✅ Extracted {len(resume_text)} characters from candidate resume")
-        except Exception as e:
-            logger.warning(f"⚠️ Could not extract resume text: {e}")
-            resume_text = ''
-            resume_summary = ''
-        
-        # ✅ Get candidate experiences and education
-        experiences = []
-        educations = []
-        if applicant:
-            if hasattr(applicant, 'experiences'):
-                experiences = [{
-                    'position': exp.position if hasattr(exp, 'position') else '',
-                    'company': exp.company if hasattr(exp, 'company') else '',
-                    'description': exp.description if hasattr(exp, 'description') else '',
-                    'start_date': str(exp.start_date) if hasattr(exp, 'start_date') and exp.start_date else '',
-                    'end_date': str(exp.end_date) if hasattr(exp, 'end_date') and exp.end_date else ''
-                } for exp in applicant.experiences[:5]]  # Limit to 5 most recent
-            
-            if hasattr(applicant, 'educations'):
-                educations = [{
-                    'university': ed.university if hasattr(ed, 'university') else '',
-                    'degree': ed.degree if hasattr(ed, 'degree') else '',
-                    'field': ed.field if hasattr(ed, 'field') else '',
-                    'grade': ed.grade if hasattr(ed, 'grade') else ''
-                } for ed in applicant.educations[:3]]  # Limit to 3 most recent
-        
-        # Get request data (may override defaults)
+        # Prepared when the interview was scheduled: context and questions are a lookup
         req_json = request.json or {}
-        job_title = req_json.get('job_title') or job.job_title or 'Software Engineer'
-        job_description = req_json.get('job_description') or job.job_description or 'Full-stack developer with Python, JavaScript experience.'
-        
-        # Build comprehensive candidate background
-        candidate_data = req_json.get('candidate_background', {})
-        if not candidate_data or not isinstance(candidate_data, dict):
-            candidate_data = {}
-        
-        # ✅ Add comprehensive company and candidate information
-        candidate_data.update({
-            'name': candidate_name,
-            'company_name': company_name,
-            'company': company_name,  # Alias
-            'company_info': company_info,  # Full company details
-            'experience': candidate_experience,
-            'years_of_experience': applicant.years_of_experience if applicant else None,
-            'skills': candidate_skills if candidate_skills else candidate_data.get('skills', ['Python', 'JavaScript']),
-            'current_company': applicant.current_company if applicant else None,
-            'resume_text': resume_text,  # Full resume text
-            'resume_summary': resume_summary,  # Summary for prompts
-            'experiences': experiences,  # Work experience
-            'educations': educations,  # Education history
-            'linkedin': applicant.linkedin_url if applicant and hasattr(applicant, 'linkedin_url') else None,
-            'github': applicant.github_url if applicant and hasattr(applicant, 'github_url') else None,
-            'portfolio': applicant.portfolio_url if applicant and hasattr(applicant, 'portfolio_url') else None,
-            'background': resume_summary or candidate_data.get('background', '')  # Use resume as background
-        })
+        warmup = load_warmup(interview_id)
+        first_question = None
+        if warmup:
+            job_title = req_json.get('job_title') or warmup['job_title']
+            job_description = req_json.get('job_description') or warmup['job_description']
+            extra = req_json.get('candidate_background')
+            candidate_data = dict(extra) if isinstance(extra, dict) else {}
+            candidate_data.update(warmup['candidate_background'])
+            candidate_data['follow_up_pool'] = warmup['follow_ups']
+            if (job_title, job_description) == (warmup['job_title'], warmup['job_description']):
+                first_question = warmup['first_question']
+            logger.info(f"🔥 Using warm-up of interview {interview_id} built at {warmup['built_at']}")
+        else:
+            try:
+                job_title, job_description, candidate_data = build_interview_context(interview, req_json)
+            except LookupError as e:
+                return jsonify({'error': str(e)}), 404
         
+        company_name = candidate_data.get('company_name', 'our company')
+        candidate_name = candidate_data.get('name', 'Candidate')
         logger.info(f"📋 Interview context: {company_name} - {job_title} - Candidate: {candidate_name}")
         
         # CREATE DIRECTORY ONCE HERE (before creating session)
@@ -191,9 +113,10 @@ def start_video_interview(interview_id):
 
         logger.info(f"✅ Session object created: {session.session_id}")
         
-        # Generate first question
-        question_service = QuestionService()
-        first_question = question_service.generate_first_question(session)
+        # Generate first question unless the warm-up has it
+        if not first_question:
+            question_service = QuestionService()
+            first_question = question_service.generate_first_question(session)
         session.current_question = first_question
         session.question_count = 1
         
@@ -216,7 +139,8 @@ def start_video_interview(interview_id):
             'first_question': first_question,
             'meeting_link': f'/video-interview/{session.session_id}',
             'mode': 'smart_adaptive_interview',
-            'video_recording_enabled': True
+            'video_recording_enabled': True,
+            'warm_start': warmup is not None
         }), 200
         
     except Exception as e:
@@ -328,6 +252,7 @@ def download_video_recording(interview_id):
 def health_check():
     """Health check endpoint"""
     from ..services.ai_service import get_ai_service
+    from ..models.session_store import session_cache_stats
     from ..config import GEMINI_MODEL
     
     services = get_services()
@@ -345,7 +270,9 @@ def health_check():
             "timeout_protection": True
         },
         "ai_initialized": ai_service.initialized if ai_service else False,
-        "model": GEMINI_MODEL
+        "model": GEMINI_MODEL,
+        "models": ai_service.router.snapshot() if ai_service else [],
+        "session_cache": session_cache_stats()
     }), 200
 
 @interview_routes_bp.route('/session/<string:session_id>/data', methods=['GET'])
@@ -1,14 +1,20 @@
 """
-AI Service - Handles all Gemini API interactions with retries and circuit breaker
+AI Service - Handles all Gemini API interactions with model routing and circuit breaker
 """
 import logging
+import queue
+import threading
 import time
-from typing import Optional, Dict, List
-import google.generativeai as genai
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from typing import Optional, Dict, List, Callable
+from application.utils.lazy import lazy_import
+from application.utils.model_router import ModelRouter, NoModelAvailable
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
+# Imported on the first Gemini call (AIService.__init__ configures it)
+genai = lazy_import("google.generativeai")
+
 # Thread pool for async AI processing
 _ai_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="AIService")
 
@@ -74,6 +80,8 @@ class AIService:
         self.timeout = GEMINI_TIMEOUT_SECONDS
         self.initialized = False
         self.circuit_breaker = CircuitBreaker(failure_threshold=20, timeout=30)
+        self.router = ModelRouter([self.primary_model] + self.fallback_models,
+                                  call=self._generate_text, name="interview")
         
         if GEMINI_API_KEY:
             try:
@@ -85,10 +93,19 @@ class AIService:
         else:
             logger.error("❌ GEMINI_API_KEY not found!")
     
-    def _call_gemini_with_retry(self, prompt: str, timeout: int = None, max_retries: int = 3) -> Optional[str]:
+    def _generate_text(self, model_name: str, prompt: str, timeout: float = None) -> str:
+        """One Gemini call (the router's transport)."""
+        model = genai.GenerativeModel(model_name)
+        response = model.generate_content(prompt, request_options={"timeout": timeout} if timeout else None)
+        return getattr(response, "text", None) or ""
+
+    def _call_gemini_with_retry(self, prompt: str, timeout: int = None, max_retries: int = 3,
+                                hedge: bool = False) -> Optional[str]:
         """
-        Call Gemini API with retry logic, exponential backoff, AND model fallback.
-        ✅ NEW: Tries multiple models if rate limited!
+        Call Gemini through the model router: fastest healthy model first, one
+        attempt per model and no backoff sleeps. `timeout` bounds each attempt
+        and timeout * max_retries the whole call. With `hedge`, a second model
+        is asked when the first is slower than its usual p95.
         """
         if not self.initialized:
             logger.error("AI Service not initialized")
@@ -101,78 +118,22 @@ class AIService:
         if timeout is None:
             timeout = self.timeout
         
-        # ✅ Build list of models to try
-        models_to_try = [self.primary_model] + self.fallback_models
-        
-        # ✅ Try each model
-        for model_name in models_to_try:
-            logger.info(f"🔄 Trying model: {model_name}")
-            
-            for attempt in range(max_retries):
-                try:
-                    def _call():
-                        try:
-                            model = genai.GenerativeModel(model_name)
-                            response = model.generate_content(prompt)
-                            return getattr(response, "text", None) or ""
-                        except Exception as e:
-                            error_msg = str(e)
-                            error_type = type(e).__name__
-                            
-                            # ✅ Check if it's a rate limit error
-                            if "ResourceExhausted" in error_type or "quota" in error_msg.lower() or "429" in error_msg:
-                                logger.warning(f"⚠️ {model_name} quota exhausted: {error_type}")
-                                raise  # Re-raise to try next model
-                            
-                            logger.error(f"Gemini API error with {model_name} (attempt {attempt + 1}): {error_type}")
-                            return None
-                    
-                    # Use thread pool to enforce timeout
-                    future = _ai_executor.submit(_call)
-                    result = future.result(timeout=timeout)
-                    
-                    if result:
-                        self.circuit_breaker.call_succeeded()
-                        logger.info(f"✅ SUCCESS with model: {model_name}")
-                        return result
-                    else:
-                        self.circuit_breaker.call_failed()
-                    
-                except FuturesTimeoutError:
-                    logger.warning(f"⏰ AI call timed out after {timeout}s with {model_name} (attempt {attempt + 1})")
-                    self.circuit_breaker.call_failed()
-                    
-                except Exception as e:
-                    error_msg = str(e)
-                    
-                    # ✅ If quota exhausted, skip to next model immediately
-                    if "ResourceExhausted" in type(e).__name__ or "quota" in error_msg.lower():
-                        logger.warning(f"❌ {model_name} quota exhausted, trying next model...")
-                        self.circuit_breaker.call_failed()
-                        break  # Skip retries for this model, try next one
-                    
-                    logger.error(f"Error with {model_name} (attempt {attempt + 1}): {type(e).__name__}")
-                    self.circuit_breaker.call_failed()
-                
-                # Exponential backoff between retries (for same model)
-                if attempt < max_retries - 1:
-                    backoff = (2 ** attempt) * 0.5  # 0.5s, 1s, 2s
-                    logger.info(f"🔄 Retrying {model_name} in {backoff}s...")
-                    time.sleep(backoff)
-            
-            # After all retries for this model failed, try next model
-            logger.warning(f"❌ All retries failed for {model_name}, trying next model...")
+        try:
+            result = self.router.generate(prompt, timeout=timeout, budget=timeout * max(1, max_retries), hedge=hedge)
+        except NoModelAvailable as e:
+            logger.error(f"❌ ALL MODELS FAILED: {e}")
+            self.circuit_breaker.call_failed()
+            return None
         
-        # All models exhausted
-        logger.error(f"❌ ALL MODELS FAILED after trying: {models_to_try}")
-        return None
+        self.circuit_breaker.call_succeeded()
+        return result
     
     def generate_question_async(self, prompt: str, callback, fallback: str):
         """
         Generate question asynchronously using executor pool (not raw threads).
         """
         def _generate():
-            result = self._call_gemini_with_retry(prompt, timeout=10, max_retries=2)
+            result = self._call_gemini_with_retry(prompt, timeout=10, max_retries=2, hedge=True)
             if result:
                 question = self._clean_question(result)
                 if question:
@@ -184,12 +145,108 @@ class AIService:
     
     def generate_question(self, prompt: str, fallback: str = "") -> str:
         """Generate question synchronously with timeout"""
-        result = self._call_gemini_with_retry(prompt, timeout=8, max_retries=2)
+        result = self._call_gemini_with_retry(prompt, timeout=8, max_retries=2, hedge=True)
         if result:
             question = self._clean_question(result)
             return question if question else fallback
         return fallback
     
+    def _stream_chunks(self, model_name: str, prompt: str):
+        """Text chunks of one streamed Gemini response, as they arrive."""
+        model = genai.GenerativeModel(model_name)
+        for chunk in model.generate_content(prompt, stream=True):
+            text = getattr(chunk, "text", None)
+            if text:
+                yield text
+
+    def stream_question(self, prompt: str, on_sentence: Callable[[str], None], timeout: float = 8,
+                        first_chunk_timeout: float = None, min_chars: int = 20) -> Optional[str]:
+        """
+        Generate a question with a streamed response from the router's best
+        model, calling on_sentence(text) for each sentence as soon as it is complete.
+
+        Returns the whole question. Returns None when nothing usable arrived
+        (error, timeout, JSON instead of text); on_sentence was not called then
+        and the caller can fall back to generate_question. If the stream breaks
+        after some sentences went out, those sentences are the question.
+        """
+        from ..utils.sentence_stream import SentenceStream
+
+        if not self.initialized:
+            logger.error("AI Service not initialized")
+            return None
+        if not self.circuit_breaker.can_attempt():
+            logger.warning("⚠️ Circuit breaker OPEN, skipping streamed call")
+            return None
+
+        started = time.monotonic()
+        deadline = started + timeout
+        first_deadline = started + (first_chunk_timeout or timeout)
+        chunks = queue.Queue()
+        cancelled = threading.Event()
+        model_name = self.router.best()
+        if model_name is None:
+            logger.warning("⚠️ No model available for a streamed call")
+            return None
+
+        def _produce():
+            try:
+                for text in self._stream_chunks(model_name, prompt):
+                    if cancelled.is_set():
+                        return
+                    chunks.put(("text", text))
+                chunks.put(("done", None))
+            except Exception as e:
+                chunks.put(("error", e))
+
+        _ai_executor.submit(_produce)
+        sentences = SentenceStream(min_chars=min_chars)
+        received = False
+        failure = None
+
+        def deliver(batch):
+            for sentence in batch:
+                if sentence is sentences.sentences[0]:
+                    logger.info(f"⚡ First sentence after {(time.monotonic() - started) * 1000:.0f} ms ({model_name})")
+                on_sentence(sentence)
+
+        # Sentences are handed over on this (the caller's) thread, in order
+        while True:
+            wait = (deadline if received else first_deadline) - time.monotonic()
+            try:
+                kind, value = chunks.get(timeout=max(0.0, wait))
+            except queue.Empty:
+                failure = "timed out" if received else "no first chunk in time"
+                self.router.record_failure(model_name, TimeoutError(failure))
+                break
+            if kind == "error":
+                failure = f"{type(value).__name__}: {value}"
+                self.router.record_failure(model_name, value)
+                break
+            if kind == "done":
+                deliver(sentences.flush())
+                break
+            received = True
+            deliver(sentences.feed(value))
+            if sentences.full:
+                break
+        cancelled.set()
+
+        if sentences.rejected:
+            failure = "model answered with JSON"
+        if not sentences.sentences:
+            failure = failure or "empty response"
+            logger.warning(f"⚠️ Streamed question failed with {model_name}: {failure}")
+            self.circuit_breaker.call_failed()
+            return None
+        if failure:
+            logger.warning(f"⚠️ Stream cut short ({failure}); keeping the {len(sentences.sentences)} sentence(s) already sent")
+        self.circuit_breaker.call_succeeded()
+        if not failure:
+            self.router.record_success(model_name, time.monotonic() - started)
+        logger.info(f"✅ Streamed question in {(time.monotonic() - started) * 1000:.0f} ms ({model_name})")
+        return sentences.text
+
     # ... rest of your methods remain the same ...
     def analyze_answer(self, question: str, answer: str) -> Dict:
         """Analyze answer quality (quick version)"""
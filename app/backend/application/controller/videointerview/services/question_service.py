@@ -101,7 +101,7 @@ Return ONLY the question (1-2 sentences)."""
             # Validate answer
             if not previous_answer or len(previous_answer.strip()) < 5:
                 logger.warning("Short/empty answer, using instant fallback")
-                return self.get_instant_fallback(session.question_count + 1)
+                return self.get_instant_fallback(session.question_count + 1, session)
             
             # Try adaptive followup (includes AI generation)
             logger.info(f"Generating question #{session.question_count + 1}")
@@ -111,14 +111,50 @@ Return ONLY the question (1-2 sentences)."""
                 return question
             
             # Final fallback
-            return self.get_instant_fallback(session.question_count + 1)
+            return self.get_instant_fallback(session.question_count + 1, session)
             
         except Exception as e:
             logger.error(f"Error generating next question: {e}", exc_info=True)
-            return self.get_instant_fallback(session.question_count + 1)
+            return self.get_instant_fallback(session.question_count + 1, session)
     
-    def get_instant_fallback(self, question_number: int) -> str:
-        """Get instant fallback question (no AI delay)"""
+    def stream_next_question(self, session, previous_answer: str, on_sentence: Callable[[str], None]) -> str:
+        """
+        Like generate_next_question, but the AI question is streamed: on_sentence
+        is called with each sentence as soon as it is complete. When streaming
+        yields nothing, the question comes from generate_next_question and
+        on_sentence is not called.
+        """
+        from ..config import QUESTION_STREAM_FIRST_CHUNK_SECONDS, QUESTION_STREAM_MIN_SENTENCE_CHARS
+
+        if self.ai_service and previous_answer and len(previous_answer.strip()) >= 10:
+            try:
+                prompt = self._build_question_prompt(session, previous_answer)
+                logger.info(f"🤖 Streaming AI question #{session.question_count + 1}")
+                question = self.ai_service.stream_question(
+                    prompt, on_sentence, timeout=8,
+                    first_chunk_timeout=QUESTION_STREAM_FIRST_CHUNK_SECONDS,
+                    min_chars=QUESTION_STREAM_MIN_SENTENCE_CHARS,
+                )
+                if question:
+                    return question
+            except Exception as e:
+                logger.error(f"❌ Streamed generation failed: {e}", exc_info=True)
+
+        return self.generate_next_question(session, previous_answer)
+
+    def get_instant_fallback(self, question_number: int, session=None) -> str:
+        """
+        Get instant fallback question (no AI delay): the next unasked one from
+        the session's job-specific pool (prepared by the interview warm-up),
+        else a generic one.
+        """
+        if session is not None:
+            pool = (getattr(session, 'candidate_background', None) or {}).get('follow_up_pool') or []
+            asked = {e.get('question') for e in getattr(session, 'conversation_history', None) or []}
+            asked.add(getattr(session, 'current_question', None))
+            for question in pool:
+                if question not in asked:
+                    return question
         idx = (question_number - 1) % len(self.FALLBACK_QUESTIONS)
         return self.FALLBACK_QUESTIONS[idx]
     
@@ -131,7 +167,7 @@ Return ONLY the question (1-2 sentences)."""
             # Validate answer
             if not previous_answer or len(previous_answer) < 10:
                 logger.warning("Answer too short for AI generation")
-                return self.get_instant_fallback(session.question_count + 1)
+                return self.get_instant_fallback(session.question_count + 1, session)
             
             # ✅ STEP 1: TRY AI GENERATION FIRST (Gemini)
             if self.ai_service:
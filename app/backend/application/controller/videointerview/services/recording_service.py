@@ -37,7 +37,7 @@ class RecordingService:
         """Save video chunk to file (append mode) with Safe Locking"""
         from ..models.session_store import get_session
 
-        session = get_session(session_id)
+        session = get_session(session_id, shared=True)
         if not session:
             logger.error(f"❌ No session found for {session_id}")
             return False
@@ -70,7 +70,7 @@ class RecordingService:
         """Save audio chunk to file (append mode) with Safe Locking"""
         from ..models.session_store import get_session
 
-        session = get_session(session_id)
+        session = get_session(session_id, shared=True)
         if not session or not session.audio_file:
             logger.warning(f"Cannot save audio chunk: session or audio_file missing for {session_id}")
             return False
@@ -132,11 +132,14 @@ class RecordingService:
             with open(eval_path, 'w', encoding='utf-8') as f:
                 json.dump(evaluation, f, indent=2, ensure_ascii=False)
             logger.info(f"📊 Evaluation saved: {eval_path}")
-            return True
         except Exception as e:
             logger.error(f"❌ Failed to save evaluation: {e}")
             return False
 
+        from application.controller.interview.evaluation_summaries import fields_from_evaluation
+        self._save_summary(session, fields_from_evaluation(evaluation))
+        return True
+
     def save_metadata(self, session, evaluation) -> bool:
         """Save interview metadata JSON file"""
         if not session.recording_path:
@@ -179,16 +182,34 @@ class RecordingService:
             with open(metadata_path, 'w', encoding='utf-8') as f:
                 json.dump(metadata, f, indent=2)
             logger.info(f"📋 Metadata saved: {metadata_path}")
-            return True
         except Exception as e:
             logger.error(f"❌ Failed to save metadata: {e}")
             return False
 
+        from application.controller.interview.evaluation_summaries import fields_from_metadata
+        self._save_summary(session, fields_from_metadata(metadata))
+        return True
+
+    def _save_summary(self, session, fields: dict) -> bool:
+        """Mirror evaluation headline numbers into the indexed summary table (needs app context)"""
+        try:
+            from application.controller.interview.evaluation_summaries import upsert_evaluation_summary
+            upsert_evaluation_summary(session.interview_id, session_id=session.session_id, **fields)
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ Evaluation summary not persisted for {session.session_id}: {e}")
+            try:
+                from application.data.database import db
+                db.session.rollback()
+            except Exception:
+                pass
+            return False
+
 
     def get_video_path(self, session_id: str) -> Optional[str]:
         """Get video file path"""
         from ..models.session_store import get_session
-        session = get_session(session_id)
+        session = get_session(session_id, shared=True)
         if session and session.video_file and os.path.exists(session.video_file):
             return session.video_file
         return None
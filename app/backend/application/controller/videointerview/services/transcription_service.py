@@ -5,10 +5,13 @@ import logging
 import time
 import threading
 from typing import Dict, Optional
-import azure.cognitiveservices.speech as speechsdk
+from application.utils.lazy import lazy_import
 
 logger = logging.getLogger(__name__)
 
+# The Azure speech SDK loads native libraries; only pay for it when credentials are set
+speechsdk = lazy_import("azure.cognitiveservices.speech")
+
 
 class StreamingRecognizer:
     """Manages streaming speech recognition for a single session with Azure Speech SDK"""
@@ -0,0 +1,308 @@
+"""
+Interview warm-up.
+
+Starting a video interview used to gather company details, the candidate's
+skills, experiences, educations and full resume text, then wait for the
+opening question from Gemini, all while the candidate sat on the start
+screen. That work now happens when the interview is scheduled: the
+InterviewScheduled subscriber builds the context bundle, the first question
+and a pool of job-specific follow-ups and stores them in InterviewWarmup,
+so /video-interview/start/<id> only does a lookup (`load_warmup`).
+
+A warm-up goes stale when the candidate's profile, experiences, educations
+or resume, or the job posting, change (ProfileUpdated / JobPostingChanged):
+it is flagged first, so /start builds everything live meanwhile, then
+rebuilt. Interviews scheduled before this existed, or whose warm-up failed,
+start the old way.
+
+Config (Flask, both optional):
+    INTERVIEW_WARMUP             build warm-ups when interviews are scheduled (default True)
+    INTERVIEW_WARMUP_FOLLOW_UPS  size of the follow-up pool (default 5)
+"""
+import json
+import logging
+import re
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+from flask import current_app
+
+from application.data.database import db
+from application.data.models import Interview
+from application.controller.interview.models import InterviewWarmup
+from application.utils.events import subscribe, CELERY, InterviewScheduled, ProfileUpdated, JobPostingChanged
+
+logger = logging.getLogger(__name__)
+
+FOLLOW_UP_PROMPT = """You are preparing an interview for the position of {job_title}.
+
+Job Description: {job_description}
+
+Candidate skills: {skills}
+Candidate background: {background}
+
+Write {count} interview questions specific to this job that can be asked at any point
+after the opening question. Mix technical depth, past projects and problem solving.
+Each question is 1-2 sentences.
+
+Return ONLY a JSON array of strings."""
+
+
+def build_interview_context(interview, overrides=None):
+    """
+    (job_title, job_description, candidate_background) of an interview, from
+    the application, job, company and candidate profile, including the full
+    resume text. `overrides` is the /start request body (job_title,
+    job_description, candidate_background). Raises LookupError when the
+    application or job is gone.
+    """
+    overrides = overrides or {}
+    application = interview.application
+    if not application:
+        raise LookupError('Application not found')
+
+    job = application.job
+    if not job:
+        raise LookupError('Job posting not found')
+
+    company = job.company
+    company_name = company.company_name if company else 'our company'
+
+    # ✅ Get comprehensive company information
+    company_info = {
+        'name': company_name,
+        'description': company.description if company and hasattr(company, 'description') else '',
+        'industry': company.technology if company and hasattr(company, 'technology') else '',
+        'company_size': company.company_size if company and hasattr(company, 'company_size') else '',
+        'website': company.website if company and hasattr(company, 'website') else '',
+        'location': company.location if company and hasattr(company, 'location') else ''
+    }
+
+    applicant = application.applicant
+    candidate_name = applicant.name if applicant else 'Candidate'
+    candidate_experience = f"{applicant.years_of_experience} years" if applicant and applicant.years_of_experience else 'Professional experience'
+
+    # Get candidate skills from profile or application
+    candidate_skills = []
+    if applicant:
+        # Try to get skills from applicant profile
+        if hasattr(applicant, 'skills') and applicant.skills:
+            if isinstance(applicant.skills, str):
+                candidate_skills = [s.strip() for s in applicant.skills.split(',')]
+            else:
+                candidate_skills = applicant.skills if isinstance(applicant.skills, list) else [applicant.skills]
+        elif hasattr(applicant, 'technical_skills'):
+            candidate_skills = applicant.technical_skills if isinstance(applicant.technical_skills, list) else [applicant.technical_skills]
+
+    # ✅ Extract resume text if available
+    resume_text = ''
+    resume_summary = ''
+    try:
+        from application.controller.resume_parser.parser_service import get_resume_text_from_application
+        resume_text = get_resume_text_from_application(application)
+        # Create a summary (first 1000 chars for prompt, full text available)
+        resume_summary = resume_text[:1000] if len(resume_text) > 1000 else resume_text
+        logger.info(f"✅ Extracted {len(resume_text)} characters from candidate resume")
+    except Exception as e:
+        logger.warning(f"⚠️ Could not extract resume text: {e}")
+        resume_text = ''
+        resume_summary = ''
+
+    # ✅ Get candidate experiences and education
+    experiences = []
+    educations = []
+    if applicant:
+        if hasattr(applicant, 'experiences'):
+            experiences = [{
+                'position': exp.position if hasattr(exp, 'position') else '',
+                'company': exp.company if hasattr(exp, 'company') else '',
+                'description': exp.description if hasattr(exp, 'description') else '',
+                'start_date': str(exp.start_date) if hasattr(exp, 'start_date') and exp.start_date else '',
+                'end_date': str(exp.end_date) if hasattr(exp, 'end_date') and exp.end_date else ''
+            } for exp in applicant.experiences[:5]]  # Limit to 5 most recent
+
+        if hasattr(applicant, 'educations'):
+            educations = [{
+                'university': ed.university if hasattr(ed, 'university') else '',
+                'degree': ed.degree if hasattr(ed, 'degree') else '',
+                'field': ed.field if hasattr(ed, 'field') else '',
+                'grade': ed.grade if hasattr(ed, 'grade') else ''
+            } for ed in applicant.educations[:3]]  # Limit to 3 most recent
+
+    job_title = overrides.get('job_title') or job.job_title or 'Software Engineer'
+    job_description = overrides.get('job_description') or job.job_description or 'Full-stack developer with Python, JavaScript experience.'
+
+    # Build comprehensive candidate background
+    candidate_data = overrides.get('candidate_background', {})
+    if not candidate_data or not isinstance(candidate_data, dict):
+        candidate_data = {}
+
+    # ✅ Add comprehensive company and candidate information
+    candidate_data.update({
+        'name': candidate_name,
+        'company_name': company_name,
+        'company': company_name,  # Alias
+        'company_info': company_info,  # Full company details
+        'experience': candidate_experience,
+        'years_of_experience': applicant.years_of_experience if applicant else None,
+        'skills': candidate_skills if candidate_skills else candidate_data.get('skills', ['Python', 'JavaScript']),
+        'current_company': applicant.current_company if applicant else None,
+        'resume_text': resume_text,  # Full resume text
+        'resume_summary': resume_summary,  # Summary for prompts
+        'experiences': experiences,  # Work experience
+        'educations': educations,  # Education history
+        'linkedin': applicant.linkedin_url if applicant and hasattr(applicant, 'linkedin_url') else None,
+        'github': applicant.github_url if applicant and hasattr(applicant, 'github_url') else None,
+        'portfolio': applicant.portfolio_url if applicant and hasattr(applicant, 'portfolio_url') else None,
+        'background': resume_summary or candidate_data.get('background', '')  # Use resume as background
+    })
+    return job_title, job_description, candidate_data
+
+
+def parse_question_list(text, limit):
+    """Questions from the model's JSON array; falls back to lines ending in '?'."""
+    if not text:
+        return []
+    cleaned = re.sub(r"^```(?:json)?|```$", "", text.strip(), flags=re.MULTILINE).strip()
+    try:
+        items = json.loads(cleaned)
+    except ValueError:
+        items = [line.strip(" -*0123456789.)\t") for line in cleaned.splitlines() if line.strip().endswith("?")]
+    if not isinstance(items, list):
+        return []
+    questions = []
+    for item in items:
+        question = str(item).strip() if isinstance(item, (str, int, float)) else ""
+        if len(question) >= 15 and question not in questions:
+            questions.append(question)
+    return questions[:limit]
+
+
+def generate_follow_ups(job_title, job_description, candidate_data, count):
+    """A pool of job-specific questions; empty when the model is unavailable."""
+    from .ai_service import get_ai_service
+
+    if count <= 0:
+        return []
+    prompt = FOLLOW_UP_PROMPT.format(
+        job_title=job_title,
+        job_description=(job_description or '')[:600],
+        skills=', '.join(str(s) for s in (candidate_data.get('skills') or [])[:8]) or 'not listed',
+        background=(candidate_data.get('resume_summary') or '')[:400] or 'not available',
+        count=count,
+    )
+    # Not on a candidate's clock: no hedging, a generous timeout
+    raw = get_ai_service()._call_gemini_with_retry(prompt, timeout=20, max_retries=2)
+    return parse_question_list(raw, count)
+
+
+# ---------------------------------------------------------------------------
+# Build / load
+# ---------------------------------------------------------------------------
+
+def warm_up(interview_id):
+    """Build and store the warm-up of a scheduled interview. Returns the row, or None."""
+    from .question_service import QuestionService
+
+    interview = db.session.get(Interview, interview_id)
+    if interview is None or interview.status != "scheduled":
+        return None
+
+    started = time.perf_counter()
+    try:
+        job_title, job_description, candidate_data = build_interview_context(interview)
+    except LookupError as e:
+        logger.warning(f"⚠️ No warm-up for interview {interview_id}: {e}")
+        return None
+
+    session = SimpleNamespace(job_title=job_title, job_description=job_description,
+                              candidate_background=candidate_data)
+    first_question = QuestionService().generate_first_question(session)
+    follow_ups = generate_follow_ups(job_title, job_description, candidate_data,
+                                     int(current_app.config.get("INTERVIEW_WARMUP_FOLLOW_UPS", 5)))
+
+    application = interview.application
+    row = InterviewWarmup.query.filter_by(interview_id=interview_id).first()
+    if row is None:
+        row = InterviewWarmup(interview_id=interview_id)
+        db.session.add(row)
+    row.applicant_id = application.applicant_id
+    row.job_id = application.job_id
+    row.job_title = job_title
+    row.job_description = job_description
+    row.context = json.dumps(candidate_data, ensure_ascii=False, default=str)
+    row.first_question = first_question
+    row.follow_ups = json.dumps(follow_ups, ensure_ascii=False)
+    row.stale = False
+    row.build_ms = int((time.perf_counter() - started) * 1000)
+    row.built_at = datetime.utcnow()
+    db.session.commit()
+    logger.info(f"🔥 Warmed up interview {interview_id} in {row.build_ms} ms ({len(follow_ups)} follow-ups)")
+    return row
+
+
+def load_warmup(interview_id):
+    """The interview's warm-up as a dict, or None when there is none or it is stale."""
+    row = InterviewWarmup.query.filter_by(interview_id=interview_id, stale=False).first()
+    if row is None or not row.first_question:
+        return None
+    try:
+        candidate_data = json.loads(row.context or "{}")
+        follow_ups = json.loads(row.follow_ups or "[]")
+    except ValueError:
+        logger.warning(f"⚠️ Unreadable warm-up for interview {interview_id}; starting live")
+        return None
+    return {
+        "job_title": row.job_title,
+        "job_description": row.job_description,
+        "candidate_background": candidate_data,
+        "first_question": row.first_question,
+        "follow_ups": follow_ups,
+        "built_at": row.built_at,
+    }
+
+
+def mark_stale(*conditions):
+    """Flag matching warm-ups stale and commit. Returns the interview ids of the flagged rows."""
+    rows = InterviewWarmup.query.filter(*conditions).all()
+    for row in rows:
+        row.stale = True
+    if rows:
+        db.session.commit()
+    return [row.interview_id for row in rows]
+
+
+def _refresh(*conditions):
+    interview_ids = mark_stale(*conditions)
+    if not interview_ids or not current_app.config.get("INTERVIEW_WARMUP", True):
+        return
+    for interview_id in interview_ids:
+        try:
+            warm_up(interview_id)  # skips interviews that are no longer scheduled
+        except Exception:
+            logger.error(f"❌ Rebuilding the warm-up of interview {interview_id} failed", exc_info=True)
+            db.session.rollback()
+
+
+# ---------------------------------------------------------------------------
+# Subscribers
+# ---------------------------------------------------------------------------
+
+@subscribe(InterviewScheduled, mode=CELERY)
+def warm_up_scheduled_interview(evt):
+    """Prepare the interview's context and questions as soon as it is scheduled."""
+    if not current_app.config.get("INTERVIEW_WARMUP", True):
+        return
+    warm_up(evt.interview_id)
+
+
+@subscribe(ProfileUpdated, mode=CELERY)
+def refresh_warmups_for_profile(evt):
+    _refresh(InterviewWarmup.applicant_id == evt.applicant_id)
+
+
+@subscribe(JobPostingChanged, mode=CELERY)
+def refresh_warmups_for_job(evt):
+    if not evt.created:
+        _refresh(InterviewWarmup.job_id == evt.job_id)
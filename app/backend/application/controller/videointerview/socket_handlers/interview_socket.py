@@ -5,24 +5,31 @@ import logging
 import random
 import time
 import os
-from flask import request
+from flask import request, current_app
 from flask_socketio import emit, join_room
 
 # ✅ FIXED: Added missing imports
-from ..config import MAXQUESTIONS
+from ..config import MAXQUESTIONS, STREAM_QUESTIONS
 from ..services.transcription_service import get_transcription_service
 from ..services.question_service import QuestionService
 from ..services.recording_service import RecordingService
 from ..models.session_store import session_store
+from application.utils.lazy import LazyObject
 
 logger = logging.getLogger(__name__)
-transcription_service = get_transcription_service()
+# Built on first use so importing the handlers doesn't load the Azure SDK
+transcription_service = LazyObject(get_transcription_service)
 pending_audio_buffers = {}
 sid_to_session = {}  # ✅ CRITICAL: Map socket.sid → session_id for disconnect cleanup
 
 # ✅ FIXED: MOVED TO TOP LEVEL - Now accessible by all handlers
-def _background_processing(session_id: str):
+def _background_processing(session_id: str, app=None):
     """Background: Finalize Video -> AI Evaluation -> Save Data"""
+    if app is not None:
+        # Green threads don't inherit the Flask app context; the summary table write needs it
+        with app.app_context():
+            return _background_processing(session_id)
+
     logger.info(f"🧵 Background processing START for {session_id}")
     
     try:
@@ -64,6 +71,68 @@ def _background_processing(session_id: str):
     except Exception as e:
         logger.error(f"❌ Background processing failed for {session_id}: {e}", exc_info=True)
 
+def _deliver_next_question(socketio, current_session, answer):
+    """
+    Generate the next question and send it to the session's room.
+
+    With STREAM_QUESTIONS each sentence goes out as a `questionDelta` as soon as
+    the model has written it, so the browser can start speaking the first one.
+    session.current_question is only set, and `question`/`aiSpeaking` only sent,
+    once the whole question is known; `streamed: true` on them tells the client
+    it has already been spoken from the deltas.
+    """
+    session_id = current_session.session_id
+    display_number = current_session.question_count
+    started = time.perf_counter()
+    deltas = []
+
+    def send_delta(sentence):
+        if not deltas:
+            logger.info(f"⚡ [BG] Q{display_number} first sentence after {(time.perf_counter() - started) * 1000:.0f} ms")
+        socketio.emit('questionDelta', {
+            'text': sentence,
+            'index': len(deltas),
+            'question_number': display_number
+        }, room=session_id, namespace='/')
+        deltas.append(sentence)
+
+    question_service = QuestionService()
+    if STREAM_QUESTIONS:
+        next_question = question_service.stream_next_question(current_session, answer, send_delta)
+    else:
+        next_question = question_service.generate_next_question(current_session, answer)
+
+    # Validate (a streamed question has been spoken already and stays as it is)
+    if not deltas and (not next_question or len(next_question.strip()) < 5):
+        logger.warning("⚠️ [BG] Generated question too short, using fallback")
+        next_question = "Tell me about a recent project you're proud of."
+
+    # Update session
+    current_session.current_question = next_question
+    session_store.add(current_session)
+
+    elapsed_ms = round((time.perf_counter() - started) * 1000)
+    logger.info(f"✅ [BG] Generated Q{display_number} in {elapsed_ms} ms "
+                f"({len(deltas)} streamed sentences): '{next_question[:50]}...'")
+
+    # ✅ CRITICAL FIX: Add namespace='/' for background thread emits
+    socketio.emit('question', {
+        'question': next_question,
+        'question_number': display_number,
+        'streamed': bool(deltas),
+        'generation_ms': elapsed_ms
+    }, room=session_id, namespace='/')
+
+    socketio.emit('aiSpeaking', {
+        'question': next_question,
+        'is_speaking': True,
+        'question_number': display_number,
+        'is_final': False,
+        'streamed': bool(deltas)
+    }, room=session_id, namespace='/')
+    return next_question
+
+
 def init_socketio(socketio):
     logger.info("=" * 70)
     logger.info("🔧 INITIALIZING VIDEO INTERVIEW SOCKET HANDLERS")
@@ -241,7 +310,7 @@ def init_socketio(socketio):
         chunk_number = data.get('chunkNumber')
         binary_data = data.get('data')
 
-        session = session_store.get(session_id)
+        session = session_store.get(session_id, shared=True)  # read-only: served from the L1 cache
         if not session:
             logger.warning(f"Video chunk for unknown session: {session_id}")
             if callback:
@@ -278,7 +347,7 @@ def init_socketio(socketio):
         chunk_number = data.get('chunkNumber')
         binary_data = data.get('data')
 
-        session = session_store.get(session_id)
+        session = session_store.get(session_id, shared=True)  # read-only: served from the L1 cache
         if not session:
             logger.warning(f"⚠️ Audio chunk for unknown session: {session_id}")
             if callback:
@@ -434,37 +503,9 @@ def init_socketio(socketio):
             session_id = current_session.session_id
             logger.info(f"🤖 [BG] Generating next question for session {session_id}")
             
-            # Generate next question
-            question_service = QuestionService()
-            next_question = question_service.generate_next_question(current_session, answer)
-            
-            # Validate
-            if not next_question or len(next_question.strip()) < 5:
-                logger.warning("⚠️ [BG] Generated question too short, using fallback")
-                next_question = "Tell me about a recent project you're proud of."
-            
-            # Update session
-            current_session.current_question = next_question
-            session_store.add(current_session)
-            
-            display_number = current_session.question_count
-            
-            logger.info(f"✅ [BG] Generated Q{display_number}: '{next_question[:50]}...'")
-            
-            # ✅ CRITICAL FIX: Add namespace='/' for background thread emits
-            socketio.emit('question', {
-                'question': next_question,
-                'question_number': display_number
-            }, room=session_id, namespace='/')
-            
-            socketio.emit('aiSpeaking', {
-                'question': next_question,
-                'is_speaking': True,
-                'question_number': display_number,
-                'is_final': False
-            }, room=session_id, namespace='/')
+            _deliver_next_question(socketio, current_session, answer)
             
-            logger.info(f"✅ [BG] Successfully emitted Q{display_number} to room {session_id}")
+            logger.info(f"✅ [BG] Successfully emitted Q{current_session.question_count} to room {session_id}")
             
         except Exception as e:
             logger.error(f"❌ [BG] FAILED to generate question: {e}", exc_info=True)
@@ -537,7 +578,7 @@ def init_socketio(socketio):
             }, room=session_id)
             
             logger.info(f"🚀 Client released. Starting background tasks for {session_id}")
-            eventlet.spawn(_background_processing, session_id)
+            eventlet.spawn(_background_processing, session_id, current_app._get_current_object())
             
         except Exception as e:
             logger.error(f"❌ endInterview error: {e}", exc_info=True)
@@ -0,0 +1,101 @@
+"""
+Sentence splitting for streamed model output
+"""
+import re
+from typing import List
+
+# Sentence end: terminal punctuation (plus closing quotes/brackets) followed by whitespace
+_BOUNDARY = re.compile(r'[.?!]+["\')\]]*(?=\s)')
+
+# A period after these does not end a sentence
+ABBREVIATIONS = frozenset({
+    "e.g.", "i.e.", "etc.", "vs.", "approx.", "mr.", "mrs.", "ms.", "dr.", "prof.",
+    "jr.", "sr.", "inc.", "ltd.", "co.", "corp.", "no.", "st.", "u.s.",
+})
+
+PREFIXES = ("Question:", "Q:", "Next Question:", "Interview Question:")
+
+
+class SentenceStream:
+    """
+    Collects streamed text and hands back whole sentences as soon as they are
+    complete, so speech synthesis can start before the model has finished.
+
+    Sentences shorter than `min_chars` are held back and sent with the next one
+    (a lone "Great." makes for choppy speech). At most `max_chars` are emitted in
+    total; a sentence that would cross that limit is dropped and `full` is set.
+    Output that opens with JSON is never emitted and sets `rejected`.
+    """
+
+    def __init__(self, min_chars: int = 20, max_chars: int = 500):
+        self.min_chars = min_chars
+        self.max_chars = max_chars
+        self.sentences: List[str] = []
+        self.full = False
+        self.rejected = False
+        self._buffer = ""
+        self._started = False
+
+    @property
+    def text(self) -> str:
+        return " ".join(self.sentences)
+
+    def feed(self, chunk: str) -> List[str]:
+        """Add streamed text; returns the sentences it completed."""
+        if self.full or not chunk:
+            return []
+        self._buffer += chunk
+        if not self._started:
+            if not self._buffer.strip():
+                return []
+            self._started = True
+            if self._buffer.lstrip().startswith(("{", "[")):
+                self.rejected = self.full = True
+                return []
+
+        ready, start = [], 0
+        for match in _BOUNDARY.finditer(self._buffer):
+            candidate = self._buffer[start:match.end()].strip()
+            last_word = candidate.rsplit(None, 1)[-1].lower().strip('"\'()[]')
+            if last_word in ABBREVIATIONS or len(candidate) < self.min_chars:
+                continue
+            start = match.end()
+            if not self._accept(candidate, ready):
+                break
+        self._buffer = self._buffer[start:]
+        return ready
+
+    def flush(self) -> List[str]:
+        """The end of the stream: whatever is left is the last sentence."""
+        ready = []
+        rest, self._buffer = self._buffer.strip(), ""
+        if rest and not self.full:
+            self._accept(rest, ready, last=True)
+        return ready
+
+    def _accept(self, sentence: str, ready: List[str], last: bool = False) -> bool:
+        if not self.sentences and not ready:
+            sentence = self._clean_first(sentence)
+        if last:
+            sentence = sentence.rstrip('"').rstrip()
+        if not sentence:
+            return True
+
+        used = len(self.text) + sum(len(s) + 1 for s in ready)
+        if used + len(sentence) + 1 > self.max_chars:
+            if self.sentences or ready:
+                self.full = True
+                return False
+            sentence = sentence[:self.max_chars].rsplit(" ", 1)[0]
+            self.full = True
+        ready.append(sentence)
+        self.sentences.append(sentence)
+        return not self.full
+
+    @staticmethod
+    def _clean_first(sentence: str) -> str:
+        sentence = sentence.strip().lstrip('"').strip()
+        for prefix in PREFIXES:
+            if sentence.startswith(prefix):
+                sentence = sentence[len(prefix):].strip()
+        return sentence
@@ -0,0 +1,351 @@
+"""
+Tag-invalidated response cache.
+
+Read-heavy endpoints are wrapped with `@response_cache.cached_view(...)` and
+declare the entity tags their output depends on, e.g. ``job:{job_id}`` or
+``company:{company_id}``. Invalidation is generational: every tag owns a
+version counter that is folded into the cache key, so bumping a tag makes all
+entries that depend on it unreachable without having to enumerate them.
+
+Tags are bumped automatically after a SQLAlchemy commit that touched a model
+with a registered tag resolver (see `register_tag_resolver`). Nothing is
+invalidated for flushes that end up rolled back.
+
+Tag keys never expire but can still be evicted under memory pressure. A
+missing tag therefore starts again from a fresh, clock-based version rather
+than 0, so entries keyed with an older version cannot become reachable again.
+
+Callers that watch a tag's version (see `track_local_bumps`) can ask whether
+the versions it moved through were all bumped by this process, i.e. whether
+they already know about every change behind them.
+
+Cache errors never fail a request: reads and writes that raise are logged and
+the value is computed as if nothing were cached.
+
+The backend is the Flask-Caching instance created in `main.create_app`
+(Redis in production); tests can pass any cachelib backend such as
+``SimpleCache``. Without a backend the decorator is a pass-through.
+"""
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import deque
+from functools import wraps
+
+from flask import current_app, request
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 300
+# Versions remembered per tracked tag
+LOCAL_BUMPS = 256
+_SESSION_TAGS_KEY = "response_cache_tags"
+
+
+class TaggedCache:
+    def __init__(self, prefix="rc"):
+        self.prefix = prefix
+        self.backend = None
+        self._resolvers = {}
+        self._stats = {}
+        self._local_bumps = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Setup
+    # ------------------------------------------------------------------
+    def init_app(self, app, backend):
+        """Attach a backend: a Flask-Caching `Cache` or a cachelib cache."""
+        self.backend = getattr(backend, "cache", backend)
+        app.extensions["response_cache"] = self
+        logger.info(f"✅ Response cache ready ({type(self.backend).__name__})")
+
+    def register_tag_resolver(self, model, resolver):
+        """`resolver(obj)` returns the tags to invalidate when `obj` changes."""
+        self._resolvers[model] = resolver
+
+    # ------------------------------------------------------------------
+    # Tag versions
+    # ------------------------------------------------------------------
+    def _tag_key(self, tag):
+        return f"{self.prefix}:tag:{tag}"
+
+    @staticmethod
+    def _fresh_version():
+        """A version no existing entry can have been keyed with."""
+        return time.time_ns()
+
+    def _tag_versions(self, tags):
+        if not tags:
+            return []
+        keys = [self._tag_key(t) for t in tags]
+        versions = list(self.backend.get_many(*keys))
+        for i, (key, version) in enumerate(zip(keys, versions)):
+            if version is None:
+                # first use, or evicted; add() loses to a worker that set it first
+                fresh = self._fresh_version()
+                versions[i] = fresh if self.backend.add(key, fresh, timeout=0) else (self.backend.get(key) or fresh)
+        return versions
+
+    def tag_version(self, tag):
+        """Current version of one tag (None without a backend); moves on every invalidation."""
+        if self.backend is None:
+            return None
+        try:
+            return self._tag_versions([tag])[0]
+        except Exception as e:
+            logger.warning(f"⚠️ Could not read tag version for {tag}: {e}")
+            return None
+
+    def invalidate(self, *tags):
+        """Bump the version of every tag; dependent entries become stale."""
+        if self.backend is None:
+            return
+        for tag in set(tags):
+            key = self._tag_key(tag)
+            try:
+                # a missing tag gets a fresh version, which is a bump by itself
+                version = self._fresh_version()
+                if not self.backend.add(key, version, timeout=0):
+                    version = self.backend.inc(key)
+                    if version is None:
+                        version = self._fresh_version()
+                        self.backend.set(key, version, timeout=0)
+            except Exception as e:
+                logger.warning(f"⚠️ Cache invalidation failed for {tag}: {e}")
+                continue
+            with self._lock:
+                if tag in self._local_bumps:
+                    self._local_bumps[tag].append(version)
+
+    def track_local_bumps(self, *tags):
+        """Remember the versions this process gives `tags`, for `bumped_here`."""
+        with self._lock:
+            for tag in tags:
+                self._local_bumps.setdefault(tag, deque(maxlen=LOCAL_BUMPS))
+
+    def bumped_here(self, tag, since, current):
+        """True when every version of a tracked tag after `since`, up to `current`, was bumped by this process."""
+        if since is None or current is None or not 0 < current - since <= LOCAL_BUMPS:
+            return False
+        with self._lock:
+            seen = set(self._local_bumps.get(tag, ()))
+        return all(version in seen for version in range(since + 1, current + 1))
+
+    # ------------------------------------------------------------------
+    # Stats
+    # ------------------------------------------------------------------
+    def _record(self, name, hit):
+        with self._lock:
+            entry = self._stats.setdefault(name, {"hits": 0, "misses": 0})
+            entry["hits" if hit else "misses"] += 1
+
+    def stats(self):
+        """Per-endpoint hit/miss counters for this process."""
+        with self._lock:
+            endpoints = {}
+            hits = misses = 0
+            for name, entry in self._stats.items():
+                total = entry["hits"] + entry["misses"]
+                endpoints[name] = dict(entry, hit_rate=round(entry["hits"] / total, 4) if total else 0.0)
+                hits += entry["hits"]
+                misses += entry["misses"]
+        total = hits + misses
+        return {
+            "backend": type(self.backend).__name__ if self.backend is not None else None,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / total, 4) if total else 0.0,
+            "endpoints": endpoints,
+        }
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats.clear()
+
+    # ------------------------------------------------------------------
+    # Values
+    # ------------------------------------------------------------------
+    def build_key(self, name, parts, tags):
+        versions = self._tag_versions(tags)
+        raw = json.dumps([parts, list(zip(tags, versions))], sort_keys=True, default=str)
+        digest = hashlib.sha1(raw.encode("utf-8")).hexdigest()
+        return f"{self.prefix}:v:{name}:{digest}"
+
+    def get_or_set(self, name, parts, producer, tags=(), timeout=None):
+        """Cache an arbitrary picklable value under tags; computed directly when the cache fails."""
+        if self.backend is None:
+            return producer()
+        try:
+            key = self.build_key(name, parts, list(tags))
+            value = self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"⚠️ Response cache unavailable: {e}")
+            return producer()
+        if value is not None:
+            self._record(name, True)
+            return value
+        self._record(name, False)
+        value = producer()
+        if value is not None:
+            try:
+                self.backend.set(key, value, timeout=timeout if timeout is not None else DEFAULT_TIMEOUT)
+            except Exception as e:
+                logger.warning(f"⚠️ Could not store cached value: {e}")
+        return value
+
+    def cached_view(self, tags=(), per_user=False, timeout=None, name=None):
+        """
+        Cache successful (200) view responses, except those marked
+        ``Cache-Control: no-store``.
+
+        `tags` are format strings filled from the view's URL kwargs, e.g.
+        ``("jobs", "applicant:{applicant_id}")``. With `per_user` the JWT
+        identity is part of the key, for responses personalised to the caller.
+        """
+        def decorator(view):
+            endpoint = name or f"{view.__module__.rsplit('.', 2)[-2]}.{view.__name__}"
+
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                if self.backend is None or request.method != "GET":
+                    return view(*args, **kwargs)
+
+                resolved = [t.format(**kwargs) for t in tags]
+                parts = {
+                    "path": request.path,
+                    "args": sorted(request.args.items(multi=True)),
+                }
+                if per_user:
+                    parts["user"] = _current_identity()
+
+                try:
+                    key = self.build_key(endpoint, parts, resolved)
+                    cached = self.backend.get(key)
+                except Exception as e:
+                    logger.warning(f"⚠️ Response cache unavailable: {e}")
+                    return view(*args, **kwargs)
+
+                if cached is not None:
+                    self._record(endpoint, True)
+                    body, status, mimetype = cached
+                    response = current_app.response_class(body, status=status, mimetype=mimetype)
+                    response.headers["X-Cache"] = "HIT"
+                    return response
+
+                self._record(endpoint, False)
+                response = current_app.make_response(view(*args, **kwargs))
+                if response.status_code == 200 and not response.direct_passthrough \
+                        and not response.cache_control.no_store:
+                    try:
+                        self.backend.set(
+                            key,
+                            (response.get_data(), response.status_code, response.mimetype),
+                            timeout=timeout if timeout is not None else _configured_timeout(),
+                        )
+                    except Exception as e:
+                        logger.warning(f"⚠️ Could not store cached response: {e}")
+                response.headers["X-Cache"] = "MISS"
+                return response
+
+            return wrapper
+        return decorator
+
+    # ------------------------------------------------------------------
+    # SQLAlchemy hooks
+    # ------------------------------------------------------------------
+    def tags_for(self, obj):
+        resolver = self._resolvers.get(type(obj))
+        if resolver is None:
+            return []
+        try:
+            return [t for t in resolver(obj) if t]
+        except Exception as e:
+            logger.warning(f"⚠️ Tag resolver failed for {type(obj).__name__}: {e}")
+            return []
+
+
+def _current_identity():
+    try:
+        from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
+        verify_jwt_in_request(optional=True)
+        return get_jwt_identity()
+    except Exception:
+        return None
+
+
+def _configured_timeout():
+    try:
+        return current_app.config.get("RESPONSE_CACHE_TIMEOUT", DEFAULT_TIMEOUT)
+    except RuntimeError:
+        return DEFAULT_TIMEOUT
+
+
+response_cache = TaggedCache()
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_tags(session, flush_context):
+    if response_cache.backend is None or not response_cache._resolvers:
+        return
+    pending = session.info.setdefault(_SESSION_TAGS_KEY, set())
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        pending.update(response_cache.tags_for(obj))
+
+
+@event.listens_for(Session, "after_commit")
+def _flush_tags(session):
+    tags = session.info.pop(_SESSION_TAGS_KEY, None)
+    if tags:
+        response_cache.invalidate(*tags)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_tags(session):
+    session.info.pop(_SESSION_TAGS_KEY, None)
+
+
+def register_default_tag_resolvers(cache=response_cache):
+    """Map the portal's models onto job/company/applicant tags."""
+    from application.data.models import (
+        Company, HRProfile, JobPosting, Application, ApplicantProfile, User,
+        Interview, OfferLetter, Onboarding,
+        PreviousExperience, PreviousEducation, Project, Certification,
+    )
+
+    def application_tags(app_row):
+        if app_row is None:
+            return []
+        tags = [f"job:{app_row.job_id}", f"applicant:{app_row.applicant_id}"]
+        job = getattr(app_row, "job", None)
+        if job is not None:
+            tags.append(f"company:{job.company_id}")
+        return tags
+
+    def company_tags(company):
+        tags = ["jobs", f"company:{company.id}"]
+        session = object_session(company)
+        if session is not None and company.id is not None:
+            # job detail pages embed the company's profile
+            postings = session.query(JobPosting.id).filter(JobPosting.company_id == company.id)
+            tags.extend(f"job:{job_id}" for (job_id,) in postings)
+        return tags
+
+    cache.register_tag_resolver(JobPosting, lambda j: ["jobs", f"job:{j.id}", f"company:{j.company_id}"])
+    cache.register_tag_resolver(Company, company_tags)
+    cache.register_tag_resolver(HRProfile, lambda h: [f"company:{h.company_id}"])
+    cache.register_tag_resolver(Application, application_tags)
+    # profile:<id> only moves with the profile row itself (completeness score)
+    cache.register_tag_resolver(ApplicantProfile, lambda a: [f"applicant:{a.applicant_id}", f"profile:{a.applicant_id}"])
+    cache.register_tag_resolver(User, lambda u: [f"applicant:{u.id}"])
+    cache.register_tag_resolver(Interview, lambda i: application_tags(i.application))
+    cache.register_tag_resolver(Onboarding, lambda o: application_tags(o.application))
+    cache.register_tag_resolver(
+        OfferLetter, lambda o: [f"applicant:{o.candidate_id}", f"company:{o.company_id}"] + application_tags(o.application)
+    )
+    for child in (PreviousExperience, PreviousEducation, Project, Certification):
+        cache.register_tag_resolver(child, lambda c: [f"applicant:{c.applicant_id}"])
@@ -29,7 +29,8 @@ class Config:
 
 class LocalDevelopmentConfig(Config):
     SQLITE_DB_DIR = os.path.join(basedir, "../../db_dir")
-    SQLALCHEMY_DATABASE_URI = "sqlite:///" + os.path.join(SQLITE_DB_DIR, "recruitement.db")
+    # DATABASE_URL lets scripts (bulk generator, benchmarks) point the app at another database
+    SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL", "sqlite:///" + os.path.join(SQLITE_DB_DIR, "recruitement.db"))
     DEBUG = True
     SQLALCHEMY_ENGINE_OPTIONS = {
         "poolclass": NullPool,
@@ -39,6 +40,9 @@ class LocalDevelopmentConfig(Config):
     SECRET_KEY = "secret key"
     SECURITY_PASSWORD_HASH = "bcrypt"
     SECURITY_PASSWORD_SALT = "wirklich super geheim"
+    # Login/registration hashing (application/auth/credentials.py); older hashes are upgraded on login
+    PASSWORD_HASH_METHOD = os.getenv("PASSWORD_HASH_METHOD", "pbkdf2:sha256:600000")
+    PASSWORD_HASH_CONCURRENCY = int(os.getenv("PASSWORD_HASH_CONCURRENCY", os.cpu_count() or 2))
     SECURITY_REGISTERABLE = True
     SECURITY_CONFIRMABLE = False
     SECURITY_SEND_REGISTER_EMAIL = False
@@ -61,3 +65,59 @@ class LocalDevelopmentConfig(Config):
     MAIL_USERNAME = None
     MAIL_PASSWORD = None
     MAIL_SENDER = "hr@company.com"
+
+    # Offer letter outbox (application/controller/offer_letter/outbox.py)
+    OFFER_LETTER_DIR = os.getenv("OFFER_LETTER_DIR", os.path.join(basedir, "../../offer_letters"))
+    OFFER_OUTBOX_WORKER = os.getenv("OFFER_OUTBOX_WORKER", "1") == "1"
+    OFFER_OUTBOX_BATCH_SIZE = int(os.getenv("OFFER_OUTBOX_BATCH_SIZE", "25"))
+    OFFER_OUTBOX_MAX_ATTEMPTS = int(os.getenv("OFFER_OUTBOX_MAX_ATTEMPTS", "5"))
+    OFFER_OUTBOX_RETRY_BASE_SECONDS = int(os.getenv("OFFER_OUTBOX_RETRY_BASE_SECONDS", "30"))
+    OFFER_OUTBOX_POLL_SECONDS = float(os.getenv("OFFER_OUTBOX_POLL_SECONDS", "5"))
+    # Processes rendering a batch's offer PDFs (0 = inline)
+    OFFER_RENDER_PROCESSES = int(os.getenv("OFFER_RENDER_PROCESSES", min(4, os.cpu_count() or 1)))
+    # Letters the pool has not rendered by then are rendered inline
+    OFFER_RENDER_TIMEOUT_SECONDS = float(os.getenv("OFFER_RENDER_TIMEOUT_SECONDS", "30"))
+
+    # Upload-time resume processing (application/controller/applicant/resume_processing.py)
+    RESUME_PREPARSE_BACKGROUND = os.getenv("RESUME_PREPARSE_BACKGROUND", "1") == "1"
+    RESUME_PREPARSE_WORKERS = int(os.getenv("RESUME_PREPARSE_WORKERS", "2"))
+
+    # Post-commit domain events (application/utils/events.py)
+    EVENT_ASYNC_DISPATCH = os.getenv("EVENT_ASYNC_DISPATCH", "pool")
+    EVENT_POOL_WORKERS = int(os.getenv("EVENT_POOL_WORKERS", "4"))
+    EVENT_CELERY_HANDLERS = os.getenv("EVENT_CELERY_HANDLERS", "0") == "1"
+
+    # Job recommendations (application/controller/job/recommendations.py)
+    RECOMMEND_EMBEDDING_MODEL = os.getenv("RECOMMEND_EMBEDDING_MODEL", "")
+    RECOMMEND_SVD_DIMENSIONS = int(os.getenv("RECOMMEND_SVD_DIMENSIONS", "128"))
+    RECOMMEND_RECONCILE_SECONDS = float(os.getenv("RECOMMEND_RECONCILE_SECONDS", "60"))
+    # Build/refit the index on a background thread, serving the old one meanwhile
+    RECOMMEND_BACKGROUND_BUILD = os.getenv("RECOMMEND_BACKGROUND_BUILD", "1") == "1"
+
+    # Lexical pre-ranking (application/controller/resume_parser/prefilter.py)
+    PREFILTER_DEFER_LLM = os.getenv("PREFILTER_DEFER_LLM", "0") == "1"
+
+    # Near-duplicate resumes (application/controller/applicant/resume_dedup.py)
+    RESUME_DUPLICATE_THRESHOLD = float(os.getenv("RESUME_DUPLICATE_THRESHOLD", "0.85"))
+    RESUME_SCORE_REUSE = os.getenv("RESUME_SCORE_REUSE", "1") == "1"
+    RESUME_SCORE_REUSE_THRESHOLD = float(os.getenv("RESUME_SCORE_REUSE_THRESHOLD", "0.95"))
+
+    # Document text extraction (application/controller/resume_parser/extraction.py)
+    EXTRACTION_PROCESSES = int(os.getenv("EXTRACTION_PROCESSES", min(4, os.cpu_count() or 1)))
+    EXTRACTION_TIMEOUT_SECONDS = float(os.getenv("EXTRACTION_TIMEOUT_SECONDS", "20"))
+    # A new worker pool that has not answered by then is skipped (inline extraction)
+    EXTRACTION_POOL_START_SECONDS = float(os.getenv("EXTRACTION_POOL_START_SECONDS", "10"))
+    EXTRACTION_MAX_MB = float(os.getenv("EXTRACTION_MAX_MB", "15"))
+    EXTRACTION_MAX_PAGES = int(os.getenv("EXTRACTION_MAX_PAGES", "50"))
+    EXTRACTION_PAGES_PER_TASK = int(os.getenv("EXTRACTION_PAGES_PER_TASK", "8"))
+    EXTRACTION_MEMORY_MB = int(os.getenv("EXTRACTION_MEMORY_MB", "512"))
+    # "auto" (PyMuPDF when installed, else PyPDF2), "pymupdf" or "pypdf2"
+    EXTRACTION_PDF_BACKEND = os.getenv("EXTRACTION_PDF_BACKEND", "auto")
+
+    # Prompt packing (application/controller/resume_parser/packing.py)
+    PROMPT_RESUME_TOKENS = int(os.getenv("PROMPT_RESUME_TOKENS", "2000"))
+    PROMPT_JD_TOKENS = int(os.getenv("PROMPT_JD_TOKENS", "1200"))
+
+    # Interview warm-up at scheduling (application/controller/videointerview/services/warmup_service.py)
+    INTERVIEW_WARMUP = os.getenv("INTERVIEW_WARMUP", "1") == "1"
+    INTERVIEW_WARMUP_FOLLOW_UPS = int(os.getenv("INTERVIEW_WARMUP_FOLLOW_UPS", "5"))
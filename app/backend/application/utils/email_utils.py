@@ -44,6 +44,68 @@ def validate_email_address(email):
     return re.match(pattern, email) is not None
 
 
+# -------------------------------------------------------------------
+#  MESSAGE BUILDER (shared by the direct sender and the outbox)
+# -------------------------------------------------------------------
+def build_offer_message(to_email, pdf_path, candidate_name=None, company_name=None, job_title=None,
+                        application_id=None, sender=None):
+    """
+    Build the offer letter Message without sending it.
+    Raises ValueError for an invalid recipient; a missing or unreadable PDF
+    only skips the attachment.
+    """
+    if not validate_email_address(to_email):
+        raise ValueError(f"Invalid recipient email: {to_email}")
+
+    sender = sender or get_current_hr_email()
+    company_display = company_name or "Our Company"
+    position_display = job_title or "Position"
+    candidate_display = candidate_name or "Candidate"
+
+    subject = f"Job Offer — {position_display} at {company_display}"
+
+    # Prepare email message
+    msg = Message(
+        subject=subject,
+        sender=sender,
+        recipients=[to_email]
+    )
+
+    msg.body = (
+        f"Dear {candidate_display},\n\n"
+        f"We are pleased to offer you the position of {position_display} at {company_display}.\n\n"
+        "Please find your official offer letter attached as a PDF, if available.\n\n"
+        f"Application ID: {application_id or 'N/A'}\n\n"
+        "Best regards,\nHR Team\n"
+        f"{company_display}"
+    )
+
+    # ----------------------------------------------------------
+    # ATTACH PDF SAFELY (only if .attach exists)
+    # ----------------------------------------------------------
+    if pdf_path and os.path.exists(pdf_path):
+        try:
+            with open(pdf_path, "rb") as f:
+                pdf_data = f.read()
+
+            if hasattr(msg, "attach"):
+                msg.attach(
+                    filename=os.path.basename(pdf_path),
+                    content_type="application/pdf",
+                    data=pdf_data
+                )
+                logger.info("PDF attached successfully: %s", pdf_path)
+            else:
+                logger.warning("msg.attach() not available — skipping PDF attachment")
+
+        except Exception as e:
+            logger.warning("Failed attaching PDF (%s): %s", pdf_path, e)
+    else:
+        logger.warning("PDF file missing, skipping attachment: %s", pdf_path)
+
+    return msg
+
+
 # -------------------------------------------------------------------
 #  MAIN EMAIL SENDER (safe, attachment-optional)
 # -------------------------------------------------------------------
@@ -57,57 +119,19 @@ def send_offer_email(to_email, pdf_path, candidate_name=None, company_name=None,
     from application import mail  # Flask-Mail instance
 
     try:
-        # Validate target email
-        if not validate_email_address(to_email):
-            logger.error("Invalid recipient email: %s", to_email)
+        try:
+            msg = build_offer_message(
+                to_email=to_email,
+                pdf_path=pdf_path,
+                candidate_name=candidate_name,
+                company_name=company_name,
+                job_title=job_title,
+                application_id=application_id
+            )
+        except ValueError as e:
+            logger.error("%s", e)
             return False
 
-        sender = get_current_hr_email()
-        company_display = company_name or "Our Company"
-        position_display = job_title or "Position"
-        candidate_display = candidate_name or "Candidate"
-
-        subject = f"Job Offer — {position_display} at {company_display}"
-
-        # Prepare email message
-        msg = Message(
-            subject=subject,
-            sender=sender,
-            recipients=[to_email]
-        )
-
-        msg.body = (
-            f"Dear {candidate_display},\n\n"
-            f"We are pleased to offer you the position of {position_display} at {company_display}.\n\n"
-            "Please find your official offer letter attached as a PDF, if available.\n\n"
-            f"Application ID: {application_id or 'N/A'}\n\n"
-            "Best regards,\nHR Team\n"
-            f"{company_display}"
-        )
-
-        # ----------------------------------------------------------
-        # ATTACH PDF SAFELY (only if .attach exists)
-        # ----------------------------------------------------------
-        if pdf_path and os.path.exists(pdf_path):
-            try:
-                with open(pdf_path, "rb") as f:
-                    pdf_data = f.read()
-
-                if hasattr(msg, "attach"):
-                    msg.attach(
-                        filename=os.path.basename(pdf_path),
-                        content_type="application/pdf",
-                        data=pdf_data
-                    )
-                    logger.info("PDF attached successfully: %s", pdf_path)
-                else:
-                    logger.warning("msg.attach() not available — skipping PDF attachment")
-
-            except Exception as e:
-                logger.warning("Failed attaching PDF (%s): %s", pdf_path, e)
-        else:
-            logger.warning("PDF file missing, skipping attachment: %s", pdf_path)
-
         # ----------------------------------------------------------
         # SEND EMAIL (safe — will not crash API)
         # ----------------------------------------------------------
@@ -0,0 +1,352 @@
+"""
+Post-commit domain events.
+
+Code that changes state publishes an event (`publish(ApplicationSubmitted(...))`)
+before committing; side effects subscribe to the event type instead of being
+called inline by the request. Events are held on the SQLAlchemy session and
+handed to subscribers only after the transaction commits, so a rolled-back
+request never triggers scoring, mail or cache work.
+
+Some events are derived from the rows themselves: after a flush, registered
+detectors look at attribute history (an Interview created as or moved back
+to "scheduled", an Interview whose status became "completed", an OfferLetter
+that became "accepted", an edited ApplicantProfile or its experience / education
+rows or stored resume, a created or edited JobPosting), so every code path that
+makes the change publishes the event without having to remember to.
+
+Each subscriber picks how it runs:
+    INLINE  right after the commit, in the committing thread. Must not touch
+            the database session (it has just committed); meant for cheap
+            work such as bumping cache tags.
+    POOL    in a background green-thread pool with its own app context.
+    CELERY  as a Celery task when EVENT_CELERY_HANDLERS is on and the worker
+            app is bound (`bind_celery`), otherwise like POOL.
+
+Config (read per dispatch, all optional):
+    EVENT_ASYNC_DISPATCH   "pool" (default), "sync" to run POOL/CELERY
+                           subscribers in the committing thread with a fresh
+                           app context, or "off" to drop them. Defaults to
+                           "off" under TESTING.
+    EVENT_POOL_WORKERS     background threads (default 4)
+    EVENT_CELERY_HANDLERS  hand CELERY subscribers to the Celery worker (default False)
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict, field
+
+from flask import current_app, has_app_context
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import get_history
+
+logger = logging.getLogger(__name__)
+
+INLINE = "inline"
+POOL = "pool"
+CELERY = "celery"
+MODES = (INLINE, POOL, CELERY)
+
+_SESSION_EVENTS_KEY = "domain_events"
+
+
+# ---------------------------------------------------------------------------
+# Events
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class ApplicationSubmitted:
+    application_id: int
+    applicant_id: int
+    job_id: int
+
+
+@dataclass(frozen=True)
+class InterviewScheduled:
+    interview_id: int
+    application_id: int
+
+
+@dataclass(frozen=True)
+class InterviewCompleted:
+    interview_id: int
+    application_id: int
+    result: str = None
+
+
+@dataclass(frozen=True)
+class OfferAccepted:
+    offer_id: int
+    application_id: int
+    candidate_id: int = None
+    company_id: int = None
+
+
+@dataclass(frozen=True)
+class ProfileUpdated:
+    applicant_id: int
+    # names of the ApplicantProfile attributes that changed
+    fields: tuple = field(default_factory=tuple)
+
+
+@dataclass(frozen=True)
+class JobPostingChanged:
+    job_id: int
+    created: bool = False
+
+
+@dataclass(frozen=True)
+class ApplicationsShortlisted:
+    job_id: int
+    # applications picked by the lexical pre-ranker for LLM scoring, best first
+    application_ids: tuple = field(default_factory=tuple)
+
+
+EVENT_TYPES = {
+    cls.__name__: cls
+    for cls in (ApplicationSubmitted, InterviewScheduled, InterviewCompleted, OfferAccepted, ProfileUpdated,
+                JobPostingChanged, ApplicationsShortlisted)
+}
+
+
+def event_payload(evt):
+    return {"type": type(evt).__name__, "data": asdict(evt)}
+
+
+def event_from_payload(payload):
+    # JSON turns tuples into lists; events are frozen and hashable, so turn them back
+    data = {k: tuple(v) if isinstance(v, list) else v for k, v in payload["data"].items()}
+    return EVENT_TYPES[payload["type"]](**data)
+
+
+# ---------------------------------------------------------------------------
+# Bus
+# ---------------------------------------------------------------------------
+
+class DomainEventBus:
+    def __init__(self):
+        self._handlers = {}
+        self._detectors = {}
+        self._executor = None
+        self._lock = threading.Lock()
+        self._celery_task = None
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+    def subscribe(self, event_type, mode=POOL):
+        """Decorator: call the function with every committed `event_type`."""
+        if mode not in MODES:
+            raise ValueError(f"Unknown handler mode: {mode}")
+
+        def decorator(handler):
+            handlers = self._handlers.setdefault(event_type, [])
+            if not any(h is handler for h, _ in handlers):
+                handlers.append((handler, mode))
+            return handler
+        return decorator
+
+    def unsubscribe(self, handler):
+        for handlers in self._handlers.values():
+            handlers[:] = [(h, m) for h, m in handlers if h is not handler]
+
+    def handlers_for(self, evt):
+        return list(self._handlers.get(type(evt), ()))
+
+    def register_detector(self, model, detector):
+        """`detector(obj, is_new)` returns the events implied by a flushed change to `obj`."""
+        self._detectors[model] = detector
+
+    def detect(self, obj, is_new=False):
+        for model, detector in self._detectors.items():
+            if isinstance(obj, model):
+                try:
+                    return detector(obj, is_new) or []
+                except Exception as e:
+                    logger.warning(f"⚠️ Event detection failed for {obj!r}: {e}")
+        return []
+
+    # ------------------------------------------------------------------
+    # Publishing
+    # ------------------------------------------------------------------
+    def publish(self, evt, session=None):
+        """Queue `evt` on the session; subscribers see it once the session commits."""
+        if type(evt) not in EVENT_TYPES.values():
+            raise TypeError(f"Not a domain event: {evt!r}")
+        if session is None:
+            from application.data.database import db
+            session = db.session()
+        pending = session.info.setdefault(_SESSION_EVENTS_KEY, [])
+        if evt not in pending:
+            pending.append(evt)
+
+    def dispatch(self, events):
+        """Hand committed events to their subscribers."""
+        app = current_app._get_current_object() if has_app_context() else None
+        for evt in events:
+            for handler, mode in self.handlers_for(evt):
+                if mode == INLINE:
+                    self._run(handler, evt)
+                elif app is None:
+                    logger.warning(f"⚠️ No app context; dropping {mode} handler {_handler_name(handler)} for {evt}")
+                else:
+                    self._dispatch_async(app, handler, mode, evt)
+
+    def _dispatch_async(self, app, handler, mode, evt):
+        how = app.config.get("EVENT_ASYNC_DISPATCH", "off" if app.config.get("TESTING") else POOL)
+        if how == "off":
+            return
+        if how == "sync":
+            self._run_in_context(app, handler, evt)
+            return
+        if mode == CELERY and self._celery_task is not None and app.config.get("EVENT_CELERY_HANDLERS", False):
+            try:
+                self._celery_task.delay(_handler_name(handler), event_payload(evt))
+                return
+            except Exception as e:
+                logger.warning(f"⚠️ Celery unavailable for {_handler_name(handler)}, using the pool: {e}")
+        workers = max(1, int(app.config.get("EVENT_POOL_WORKERS", 4)))
+        self._get_executor(workers).submit(self._run_in_context, app, handler, evt)
+
+    def _run(self, handler, evt):
+        try:
+            handler(evt)
+        except Exception as e:
+            logger.exception(f"❌ Event handler {_handler_name(handler)} failed for {evt}: {e}")
+
+    def _run_in_context(self, app, handler, evt):
+        from application.data.database import db
+        with app.app_context():
+            try:
+                self._run(handler, evt)
+            finally:
+                db.session.remove()
+
+    def _get_executor(self, workers):
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    # Green threads once main.py has monkey-patched threading
+                    self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="domain-events")
+        return self._executor
+
+    # ------------------------------------------------------------------
+    # Celery
+    # ------------------------------------------------------------------
+    def handler_by_name(self, name):
+        for handlers in self._handlers.values():
+            for handler, _ in handlers:
+                if _handler_name(handler) == name:
+                    return handler
+        return None
+
+    def bind_celery(self, celery):
+        """Register the task CELERY subscribers run in; call once with the worker app."""
+        bus = self
+
+        @celery.task(name="domain_events.run_handler")
+        def run_handler(handler_name, payload):
+            handler = bus.handler_by_name(handler_name)
+            if handler is None:
+                logger.error(f"❌ No event handler named {handler_name}")
+                return
+            handler(event_from_payload(payload))
+
+        self._celery_task = run_handler
+        return run_handler
+
+
+def _handler_name(handler):
+    return f"{handler.__module__}.{handler.__qualname__}"
+
+
+bus = DomainEventBus()
+publish = bus.publish
+subscribe = bus.subscribe
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_detected_events(session, flush_context):
+    if not bus._detectors:
+        return
+    changed = [(obj, True) for obj in session.new] + [(obj, False) for obj in session.dirty]
+    for obj, is_new in changed:
+        for evt in bus.detect(obj, is_new):
+            bus.publish(evt, session=session)
+
+
+@event.listens_for(Session, "after_commit")
+def _dispatch_committed(session):
+    events = session.info.pop(_SESSION_EVENTS_KEY, None)
+    if events:
+        bus.dispatch(events)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_events(session):
+    session.info.pop(_SESSION_EVENTS_KEY, None)
+
+
+# ---------------------------------------------------------------------------
+# Detectors
+# ---------------------------------------------------------------------------
+
+def _became(obj, attr, value):
+    history = get_history(obj, attr)
+    return value in (history.added or ()) and value not in (history.deleted or ())
+
+
+def _changed_columns(obj):
+    state = inspect(obj)
+    return tuple(sorted(
+        attr.key for attr in state.mapper.column_attrs if state.attrs[attr.key].history.has_changes()
+    ))
+
+
+def register_default_event_detectors(event_bus=bus):
+    """
+    Derive InterviewScheduled / InterviewCompleted / OfferAccepted /
+    ProfileUpdated / JobPostingChanged from flushed rows.
+    """
+    from application.data.models import (
+        Interview, OfferLetter, ApplicantProfile, JobPosting, PreviousExperience, PreviousEducation,
+    )
+    from application.controller.applicant.models import ResumeDocument
+
+    def interview_events(interview, is_new):
+        if (interview.status == "scheduled") if is_new else _became(interview, "status", "scheduled"):
+            return [InterviewScheduled(interview.id, interview.application_id)]
+        if _became(interview, "status", "completed"):
+            return [InterviewCompleted(interview.id, interview.application_id, interview.result)]
+        return []
+
+    def offer_events(offer, is_new):
+        if _became(offer, "status", "accepted"):
+            return [OfferAccepted(offer.id, offer.application_id, offer.candidate_id, offer.company_id)]
+        return []
+
+    def profile_events(profile, is_new):
+        if is_new or profile.applicant_id is None:
+            return []
+        changed = _changed_columns(profile)
+        return [ProfileUpdated(profile.applicant_id, changed)] if changed else []
+
+    def profile_rows(attribute):
+        def detector(row, is_new):
+            if row.applicant_id is None or not (is_new or _changed_columns(row)):
+                return []
+            return [ProfileUpdated(row.applicant_id, (attribute,))]
+        return detector
+
+    def job_events(job, is_new):
+        if is_new or _changed_columns(job):
+            return [JobPostingChanged(job.id, created=is_new)]
+        return []
+
+    event_bus.register_detector(Interview, interview_events)
+    event_bus.register_detector(OfferLetter, offer_events)
+    event_bus.register_detector(ApplicantProfile, profile_events)
+    event_bus.register_detector(PreviousExperience, profile_rows("experiences"))
+    event_bus.register_detector(PreviousEducation, profile_rows("educations"))
+    event_bus.register_detector(ResumeDocument, profile_rows("resume"))
+    event_bus.register_detector(JobPosting, job_events)
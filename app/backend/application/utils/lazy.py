@@ -0,0 +1,100 @@
+"""
+Deferred imports and first-use construction.
+
+Heavy SDKs (google.generativeai, the Azure speech SDK, PyPDF2, reportlab) and
+external clients (Redis) used to load or connect while `main.py` imported the
+blueprints. These helpers keep module-level names working while moving the
+cost to the first call:
+
+    genai = lazy_import("google.generativeai", on_load=configure_once)
+    session_store = LazyObject(get_redis_store)
+
+A factory that raises is retried on the next access, so a Redis outage at boot
+only fails the requests that need Redis instead of dropping the blueprint.
+"""
+import importlib
+import threading
+
+
+class LazyModule:
+    """Module stand-in that imports the real module on first attribute access."""
+
+    def __init__(self, name, on_load=None):
+        self.__dict__["_name"] = name
+        self.__dict__["_on_load"] = on_load
+        self.__dict__["_module"] = None
+        self.__dict__["_lock"] = threading.Lock()
+
+    def _load(self):
+        module = self.__dict__["_module"]
+        if module is None:
+            with self.__dict__["_lock"]:
+                module = self.__dict__["_module"]
+                if module is None:
+                    module = importlib.import_module(self.__dict__["_name"])
+                    on_load = self.__dict__["_on_load"]
+                    if on_load is not None:
+                        on_load(module)
+                    self.__dict__["_module"] = module
+        return module
+
+    @property
+    def loaded(self):
+        return self.__dict__["_module"] is not None
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        # Lets tests monkeypatch attributes of the real module
+        setattr(self._load(), attr, value)
+
+    def __repr__(self):
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<LazyModule {self.__dict__['_name']} ({state})>"
+
+
+def lazy_import(name, on_load=None):
+    """Return a LazyModule for `name`; `on_load(module)` runs once after the import."""
+    return LazyModule(name, on_load=on_load)
+
+
+class LazyObject:
+    """
+    Proxy that builds its target with `factory()` on first use.
+
+    If the factory raises, nothing is cached and the next access tries again.
+    """
+
+    def __init__(self, factory):
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_target", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def _resolve(self):
+        target = object.__getattribute__(self, "_target")
+        if target is None:
+            with object.__getattribute__(self, "_lock"):
+                target = object.__getattribute__(self, "_target")
+                if target is None:
+                    target = object.__getattribute__(self, "_factory")()
+                    object.__setattr__(self, "_target", target)
+        return target
+
+    @property
+    def resolved(self):
+        return object.__getattribute__(self, "_target") is not None
+
+    def __getattr__(self, attr):
+        return getattr(self._resolve(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._resolve(), attr, value)
+
+    def __bool__(self):
+        return bool(self._resolve())
+
+    def __repr__(self):
+        if self.resolved:
+            return f"<LazyObject {object.__getattribute__(self, '_target')!r}>"
+        return "<LazyObject (not built)>"
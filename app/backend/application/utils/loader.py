@@ -0,0 +1,105 @@
+"""
+Request-scoped batch loader.
+
+Controllers that build a row per parent object used to resolve related rows
+one `Model.query.get(id)` at a time. The loader collects the ids first and
+fetches each entity type with a single ``IN`` query, memoizing the result for
+the rest of the request:
+
+    loader = get_loader()
+    loader.want(ApplicantProfile, [i.interviewee_id for i in interviews])
+    for i in interviews:
+        profile = loader.get(ApplicantProfile, i.interviewee_id)
+
+`get` on an id that was not announced still works; it is fetched together with
+whatever else is pending for that model. Ids that do not exist are memoized
+as None so they are not looked up twice.
+"""
+from flask import g, has_app_context
+from sqlalchemy import inspect
+
+from application.data.database import db
+
+# SQLite caps bound parameters per statement; stay well below it
+MAX_IN_CLAUSE = 500
+
+
+class BatchLoader:
+    def __init__(self, session=None):
+        self.session = session or db.session
+        self._memo = {}
+        self._pending = {}
+        self.queries = 0
+
+    @staticmethod
+    def _key_column(model, key):
+        if key is not None:
+            return getattr(model, key)
+        return inspect(model).primary_key[0]
+
+    def _slot(self, model, key):
+        return (model, key)
+
+    def want(self, model, ids, key=None):
+        """Announce ids that will be needed; nothing is fetched yet."""
+        slot = self._slot(model, key)
+        memo = self._memo.setdefault(slot, {})
+        pending = self._pending.setdefault(slot, set())
+        pending.update(i for i in ids if i is not None and i not in memo)
+        return self
+
+    def _dispatch(self, model, key):
+        slot = self._slot(model, key)
+        pending = self._pending.pop(slot, set())
+        if not pending:
+            return
+        memo = self._memo.setdefault(slot, {})
+        column = self._key_column(model, key)
+        attr = column.key
+        ids = list(pending)
+        for start in range(0, len(ids), MAX_IN_CLAUSE):
+            chunk = ids[start:start + MAX_IN_CLAUSE]
+            rows = self.session.query(model).filter(column.in_(chunk)).all()
+            self.queries += 1
+            for row in rows:
+                memo[getattr(row, attr)] = row
+        for i in ids:
+            memo.setdefault(i, None)
+
+    def get(self, model, id_, key=None):
+        if id_ is None:
+            return None
+        slot = self._slot(model, key)
+        memo = self._memo.setdefault(slot, {})
+        if id_ not in memo:
+            self.want(model, [id_], key=key)
+            self._dispatch(model, key)
+        return memo.get(id_)
+
+    def get_many(self, model, ids, key=None):
+        """Return {id: obj} for the given ids (missing ids map to None)."""
+        ids = [i for i in ids if i is not None]
+        self.want(model, ids, key=key)
+        self._dispatch(model, key)
+        memo = self._memo[self._slot(model, key)]
+        return {i: memo.get(i) for i in ids}
+
+    def prime(self, model, objects, key=None):
+        """Seed the memo with rows the caller already loaded."""
+        memo = self._memo.setdefault(self._slot(model, key), {})
+        attr = self._key_column(model, key).key
+        for obj in objects:
+            if obj is not None:
+                memo[getattr(obj, attr)] = obj
+        return self
+
+
+def get_loader():
+    """The loader for the current request (a fresh one outside app context)."""
+    if not has_app_context():
+        return BatchLoader()
+    loader = g.get("_batch_loader")
+    if loader is None:
+        loader = BatchLoader()
+        g._batch_loader = loader
+    return loader
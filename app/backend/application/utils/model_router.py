@@ -0,0 +1,358 @@
+"""
+Latency-aware routing across LLM models.
+
+The resume parser and the interview service used to walk a fixed list of
+Gemini models in order, retrying each with exponential `time.sleep`
+backoff, so a slow or exhausted primary model cost every request its full
+timeout (plus the sleeps) before the next model was tried.
+
+A ModelRouter keeps rolling statistics per model:
+    latency     p50/p95 of the last `window` successful calls
+    error rate  share of failed calls among those of the last
+                ERROR_WINDOW_SECONDS (older failures are forgotten, so a
+                model that recovered gets traffic again)
+    quota       a model that answers "quota exhausted" / 429 is skipped
+                for `quota_cooldown` seconds
+
+`generate` tries the healthy models fastest-first (expected latency is the
+p50 divided by the success rate), once each and without sleeping, within a
+total time budget. Models without latency samples come after the sampled
+healthy ones, in configured order: a fallback only overtakes the primary
+once it has been measured faster. Every `explore_every`-th call starts with
+the least sampled healthy model to take those measurements. With
+`hedge=True`, used for live interview questions, a second model is started
+when the first has not answered after its own p95 (clamped to
+HEDGE_MIN/MAX_SECONDS); the first good answer wins. Calls that lose the
+race still record their latency.
+
+Python threads cannot be killed, so an attempt given up on keeps its pool
+thread until the transport's own timeout returns. Queued attempts are
+cancelled instead, and no hedge is started while MAX_ABANDONED_ATTEMPTS
+abandoned calls still hold threads, so hedging cannot fill the shared pool.
+
+The transport is injected: `call(model, prompt, timeout=...)` returns the
+response text or raises. benchmarks/fake_model_server.py provides one with
+configurable latency, errors and quota for offline tests.
+
+Tunables (environment):
+    MODEL_ROUTER_WINDOW              samples kept per model (default 50)
+    MODEL_QUOTA_COOLDOWN_SECONDS     how long an exhausted model is skipped (60)
+    MODEL_ROUTER_EXPLORE_EVERY       calls between exploring ones (20, 0 = never)
+    MODEL_HEDGE_MIN_MS / _MAX_MS     bounds of the hedge delay (250 / 4000)
+    MODEL_ROUTER_THREADS             size of the shared call pool (8)
+    MODEL_ROUTER_MAX_ABANDONED       abandoned calls still running above which
+                                     hedging pauses (4)
+"""
+import logging
+import math
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+WINDOW = int(os.getenv("MODEL_ROUTER_WINDOW", 50))
+QUOTA_COOLDOWN_SECONDS = float(os.getenv("MODEL_QUOTA_COOLDOWN_SECONDS", 60))
+EXPLORE_EVERY = int(os.getenv("MODEL_ROUTER_EXPLORE_EVERY", 20))
+HEDGE_MIN_SECONDS = float(os.getenv("MODEL_HEDGE_MIN_MS", 250)) / 1000
+HEDGE_MAX_SECONDS = float(os.getenv("MODEL_HEDGE_MAX_MS", 4000)) / 1000
+MAX_ABANDONED_ATTEMPTS = int(os.getenv("MODEL_ROUTER_MAX_ABANDONED", 4))
+
+ERROR_WINDOW_SECONDS = 300
+UNHEALTHY_ERROR_RATE = 0.5   # with at least MIN_SAMPLES recent calls: tried last
+MIN_SAMPLES = 4
+UNKNOWN_LATENCY = 2.0        # hedge delay of a model that has no samples yet
+
+# One pool for every router; attempts that time out keep their thread until the SDK returns
+_executor = ThreadPoolExecutor(max_workers=int(os.getenv("MODEL_ROUTER_THREADS", 8)),
+                               thread_name_prefix="ModelRouter")
+_abandoned_lock = threading.Lock()
+_abandoned_running = 0
+
+
+def abandoned_attempts() -> int:
+    """Attempts given up on whose transport call has not returned yet."""
+    return _abandoned_running
+
+
+class NoModelAvailable(RuntimeError):
+    """Every model failed, was cooling down, or the time budget ran out."""
+
+
+class EmptyResponse(ValueError):
+    """The model answered with no text."""
+
+
+def is_quota_error(error) -> bool:
+    """Quota / rate limit errors (google.api_core ResourceExhausted, HTTP 429)."""
+    message = str(error).lower()
+    return "resourceexhausted" in type(error).__name__.lower() or "quota" in message or "429" in message
+
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    rank = math.ceil(pct / 100 * len(ordered))  # nearest rank
+    return ordered[min(len(ordered), max(1, rank)) - 1]
+
+
+class ModelStats:
+    """Rolling latency, outcome and quota state of one model."""
+
+    def __init__(self, name: str, window: int):
+        self.name = name
+        self.latencies = deque(maxlen=window)  # seconds, successful calls
+        self.outcomes = deque(maxlen=window)   # (monotonic time, ok)
+        self.quota_until = 0.0
+        self.last_error = None
+
+    def percentile(self, pct) -> Optional[float]:
+        return _percentile(self.latencies, pct) if self.latencies else None
+
+    def recent(self, now):
+        return [ok for at, ok in self.outcomes if now - at <= ERROR_WINDOW_SECONDS]
+
+    def error_rate(self, now) -> float:
+        recent = self.recent(now)
+        return (len(recent) - sum(recent)) / len(recent) if recent else 0.0
+
+    def snapshot(self, now) -> Dict:
+        p50, p95 = self.percentile(50), self.percentile(95)
+        return {
+            "model": self.name,
+            "samples": len(self.latencies),
+            "p50_ms": round(p50 * 1000) if p50 is not None else None,
+            "p95_ms": round(p95 * 1000) if p95 is not None else None,
+            "error_rate": round(self.error_rate(now), 3),
+            "quota_cooldown_s": round(max(0.0, self.quota_until - now), 1),
+            "last_error": self.last_error,
+        }
+
+
+class _Attempt:
+    """One call to one model; records its own outcome unless the caller gave up on it."""
+
+    def __init__(self, router, model, prompt, timeout, kwargs):
+        self.router = router
+        self.model = model
+        self.abandoned = False
+        self.finished = False
+        self.future = _executor.submit(self._run, prompt, timeout, kwargs)
+
+    def _run(self, prompt, timeout, kwargs):
+        started = self.router.clock()
+        try:
+            text = self.router.call(self.model, prompt, timeout=timeout, **kwargs)
+            if not text or not str(text).strip():
+                raise EmptyResponse(f"{self.model} returned an empty response")
+        except Exception as e:
+            if not self._finish():
+                self.router.record_failure(self.model, e)
+            raise
+        # a late answer after a timeout still tells us how slow the model is
+        abandoned = self._finish()
+        self.router.record_success(self.model, self.router.clock() - started, counted=not abandoned)
+        return text
+
+    def _finish(self) -> bool:
+        """Mark the transport call returned; True if it had been abandoned."""
+        global _abandoned_running
+        with _abandoned_lock:
+            self.finished = True
+            if self.abandoned:
+                _abandoned_running -= 1
+            return self.abandoned
+
+    def abandon(self, reason):
+        global _abandoned_running
+        with _abandoned_lock:
+            if self.finished or self.future.done():
+                return
+            if self.future.cancel():
+                return  # still queued behind other calls: never reached the model
+            self.abandoned = True
+            _abandoned_running += 1
+        self.router.record_failure(self.model, TimeoutError(reason))
+
+
+class ModelRouter:
+    """Picks the fastest healthy model per call; see the module docstring."""
+
+    def __init__(self, models: List[str], call: Callable[..., str], name: str = "llm",
+                 window: int = WINDOW, quota_cooldown: float = QUOTA_COOLDOWN_SECONDS,
+                 explore_every: int = EXPLORE_EVERY, clock: Callable[[], float] = time.monotonic):
+        self.models = list(dict.fromkeys(m for m in models if m))
+        self.call = call
+        self.name = name
+        self.quota_cooldown = quota_cooldown
+        self.explore_every = explore_every
+        self.clock = clock
+        self._calls = 0
+        self._stats = {m: ModelStats(m, window) for m in self.models}
+        self._lock = threading.Lock()
+
+    # ----- statistics -----
+
+    def record_success(self, model: str, seconds: float, counted: bool = True):
+        with self._lock:
+            stats = self._stats[model]
+            stats.latencies.append(seconds)
+            if counted:
+                stats.outcomes.append((self.clock(), True))
+
+    def record_failure(self, model: str, error):
+        with self._lock:
+            stats = self._stats[model]
+            stats.last_error = f"{type(error).__name__}: {str(error)[:120]}"
+            if is_quota_error(error):
+                stats.quota_until = self.clock() + self.quota_cooldown
+                logger.warning(f"⚠️ [{self.name}] {model} quota exhausted; skipped for {self.quota_cooldown:.0f}s")
+            else:
+                stats.outcomes.append((self.clock(), False))
+                logger.warning(f"⚠️ [{self.name}] {model} failed: {stats.last_error}")
+
+    def ranked(self) -> List[str]:
+        """
+        Models not cooling down from a quota error, best first: healthy
+        sampled models by expected latency, then models without samples in
+        configured order, then unhealthy ones.
+        """
+        now = self.clock()
+        with self._lock:
+            def key(item):
+                order, model = item
+                stats = self._stats[model]
+                recent = stats.recent(now)
+                error_rate = stats.error_rate(now)
+                unhealthy = len(recent) >= MIN_SAMPLES and error_rate >= UNHEALTHY_ERROR_RATE
+                p50 = stats.percentile(50)
+                if p50 is None:
+                    return unhealthy, True, 0.0, order
+                return unhealthy, False, p50 / max(1.0 - error_rate, 0.1), order
+
+            available = [(i, m) for i, m in enumerate(self.models) if self._stats[m].quota_until <= now]
+            return [m for _, m in sorted(available, key=key)]
+
+    def _explore(self, candidates: List[str]) -> List[str]:
+        """`candidates` with the least sampled model that has not been failing moved to the front."""
+        now = self.clock()
+        with self._lock:
+            healthy = [m for m in candidates[1:] if self._stats[m].error_rate(now) < UNHEALTHY_ERROR_RATE]
+            if not healthy:
+                return candidates
+            model = min(healthy, key=lambda m: len(self._stats[m].latencies))
+        return [model] + [m for m in candidates if m != model]
+
+    def best(self) -> Optional[str]:
+        ranked = self.ranked()
+        return ranked[0] if ranked else None
+
+    def hedge_delay(self, model: str) -> float:
+        """How long to wait for `model` before starting a second one: its p95, clamped."""
+        with self._lock:
+            p95 = self._stats[model].percentile(95)
+        if p95 is None:
+            p95 = UNKNOWN_LATENCY
+        return min(HEDGE_MAX_SECONDS, max(HEDGE_MIN_SECONDS, p95))
+
+    def snapshot(self) -> List[Dict]:
+        now = self.clock()
+        ranked = self.ranked()
+        with self._lock:
+            rows = [self._stats[m].snapshot(now) for m in self.models]
+        for row in rows:
+            row["rank"] = ranked.index(row["model"]) + 1 if row["model"] in ranked else None
+        return rows
+
+    # ----- calls -----
+
+    def generate(self, prompt: str, timeout: float = 15, budget: float = None,
+                 hedge: bool = False, **kwargs) -> str:
+        """
+        Response text of the first model that answers. `timeout` bounds one
+        attempt, `budget` (default 2 x timeout) the whole call. Raises
+        NoModelAvailable when nothing answered in time.
+        """
+        candidates = self.ranked()
+        if not candidates:
+            raise NoModelAvailable(f"[{self.name}] all models are cooling down after quota errors")
+        with self._lock:
+            self._calls += 1
+            explore = self.explore_every and self._calls % self.explore_every == 0
+        if explore and len(candidates) > 1:
+            candidates = self._explore(candidates)
+        end = self.clock() + (budget if budget is not None else 2 * timeout)
+        if hedge and len(candidates) > 1:
+            return self._hedged(prompt, candidates, timeout, end, kwargs)
+
+        for model in candidates:
+            remaining = end - self.clock()
+            if remaining <= 0:
+                break
+            attempt_timeout = min(timeout, remaining)
+            attempt = _Attempt(self, model, prompt, attempt_timeout, kwargs)
+            try:
+                return attempt.future.result(timeout=attempt_timeout)
+            except FuturesTimeoutError:
+                attempt.abandon(f"no answer within {attempt_timeout:.1f}s")
+            except Exception:
+                pass  # recorded by the attempt; try the next model
+        raise NoModelAvailable(f"[{self.name}] no model answered; tried {', '.join(candidates)}")
+
+    def _hedged(self, prompt, candidates, timeout, end, kwargs):
+        waiting = list(candidates)
+        running = {}
+
+        def start():
+            model = waiting.pop(0)
+            attempt_timeout = min(timeout, max(0.0, end - self.clock()))
+            attempt = _Attempt(self, model, prompt, attempt_timeout, kwargs)
+            running[attempt.future] = (attempt, self.clock() + attempt_timeout)
+            return model
+
+        first = start()
+        hedge_at = self.clock() + self.hedge_delay(first)
+
+        while running:
+            now = self.clock()
+            limits = [until for _, until in running.values()] + [end]
+            if waiting and hedge_at is not None:
+                limits.append(hedge_at)
+            done, _ = wait(list(running), timeout=max(0.0, min(limits) - now), return_when=FIRST_COMPLETED)
+
+            for future in done:
+                attempt, _ = running.pop(future)
+                if future.exception() is None:
+                    if attempt.model != first:
+                        logger.info(f"⚡ [{self.name}] hedged request to {attempt.model} beat {first}")
+                    return future.result()
+
+            now = self.clock()
+            for future, (attempt, until) in list(running.items()):
+                if now >= until or now >= end:
+                    attempt.abandon(f"no answer within {timeout:.1f}s")
+                    del running[future]
+
+            if now >= end:
+                break
+            if waiting and not running:
+                # the last one failed: replace it (a hedge still pending moves along)
+                model = start()
+                if hedge_at is not None:
+                    hedge_at = self.clock() + self.hedge_delay(model)
+            elif waiting and hedge_at is not None and now >= hedge_at:
+                hedge_at = None  # one hedge per call
+                if abandoned_attempts() >= MAX_ABANDONED_ATTEMPTS:
+                    logger.warning(f"⚠️ [{self.name}] {abandoned_attempts()} abandoned calls still running; "
+                                   f"not hedging {first}")
+                    continue
+                model = start()
+                logger.info(f"🔀 [{self.name}] no answer from {first} in time; hedging with {model}")
+
+        for attempt, _ in running.values():
+            attempt.abandon("time budget exhausted")
+        raise NoModelAvailable(f"[{self.name}] no model answered; tried "
+                               f"{', '.join(m for m in candidates if m not in waiting)}")
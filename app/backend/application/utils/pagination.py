@@ -0,0 +1,229 @@
+"""
+Keyset (cursor) pagination.
+
+`query.paginate()` issues a COUNT plus an OFFSET scan, so page N costs
+O(N * per_page). Keyset pagination instead remembers the sort key of the last
+row served and asks for rows strictly after it, which is an index range read
+whatever the depth.
+
+Cursors are opaque to clients: URL-safe base64 of a small JSON document
+holding the last row's sort values and the running position (used for serial
+numbers). Every ordering must end in a unique column (usually the primary key)
+so the order is total and no row is skipped or repeated.
+
+Sort keys are plain columns so an index on (filter columns, sort column, id)
+serves both the ORDER BY and the seek. A nullable first key is read in two
+index ranges, its non-NULL rows and then its NULL rows, which keeps NULLs last
+in either direction on SQLite and Postgres alike without a NULLS LAST index.
+
+Totals are optional. `approximate_total` counts at most `cap` rows, so its cost
+is bounded even on very large tables.
+"""
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+from sqlalchemy import and_, func, or_
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+TOTAL_CAP = 10000
+
+
+class CursorError(ValueError):
+    """Raised for malformed or tampered cursors."""
+
+
+class SortKey:
+    """
+    One component of a keyset ordering.
+
+    `expr` is the SQL expression ordered on; `value` reads the same value back
+    from a result row, either as an attribute name or a callable(row). Only the
+    first key may be `nullable`; its NULL rows come after all others.
+    """
+
+    def __init__(self, expr, descending=False, value=None, nullable=False):
+        self.expr = expr
+        self.descending = descending
+        self.value = value or getattr(expr, "key", None)
+        self.nullable = nullable
+
+    def order_clause(self):
+        return self.expr.desc() if self.descending else self.expr.asc()
+
+    def nulls_last_clause(self):
+        return self.order_clause().nulls_last() if self.nullable else self.order_clause()
+
+    def read(self, row):
+        if callable(self.value):
+            return self.value(row)
+        return getattr(row, self.value)
+
+
+class Page:
+    def __init__(self, items, next_cursor, position, total=None, total_is_exact=True):
+        self.items = items
+        self.next_cursor = next_cursor
+        # Number of rows served before this page (0 for the first page)
+        self.position = position
+        self.total = total
+        self.total_is_exact = total_is_exact
+
+    @property
+    def has_more(self):
+        return self.next_cursor is not None
+
+
+# ---------------------------------------------------------------------------
+# Cursor encoding
+# ---------------------------------------------------------------------------
+
+def _dump_value(value):
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"dec": str(value)}
+    return value
+
+
+def _load_value(value):
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+        if "dec" in value:
+            return Decimal(value["dec"])
+        raise CursorError("Unknown cursor value type")
+    return value
+
+
+def encode_cursor(values, position=0):
+    payload = {"k": [_dump_value(v) for v in values], "n": position}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token):
+    """Return (values, position) from a cursor string."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        values = [_load_value(v) for v in payload["k"]]
+        position = int(payload.get("n", 0))
+    except (CursorError, KeyError, TypeError, ValueError, binascii.Error, UnicodeError) as e:
+        raise CursorError(f"Invalid cursor: {e}")
+    return values, position
+
+
+# ---------------------------------------------------------------------------
+# Query helpers
+# ---------------------------------------------------------------------------
+
+def _after(keys, values):
+    """Predicate for rows strictly after `values` in the given ordering (no NULLs among them)."""
+    clauses = []
+    for i, key in enumerate(keys):
+        equal_prefix = [keys[j].expr == values[j] for j in range(i)]
+        step = key.expr < values[i] if key.descending else key.expr > values[i]
+        clauses.append(and_(*equal_prefix, step))
+    # the redundant bound on the first key is what makes the OR an index range
+    first = keys[0].expr <= values[0] if keys[0].descending else keys[0].expr >= values[0]
+    return and_(first, or_(*clauses))
+
+
+def _fetch(query, keys, values, limit):
+    """Rows after `values` (None: from the start), ordered by `keys`; a nullable first key's NULLs last."""
+    ranges = [(query, keys, values)]
+    head = keys[0]
+    if head.nullable:
+        tail_values = values[1:] if values is not None and values[0] is None else None
+        ranges = [(query.filter(head.expr.is_(None)), keys[1:], tail_values)]
+        if values is None or values[0] is not None:
+            ranges.insert(0, (query.filter(head.expr.isnot(None)), keys, values))
+
+    rows = []
+    for ranged, range_keys, range_values in ranges:
+        ranged = ranged.order_by(*[k.order_clause() for k in range_keys])
+        if range_values is not None:
+            ranged = ranged.filter(_after(range_keys, range_values))
+        if limit is None:
+            rows.extend(ranged.all())
+            continue
+        rows.extend(ranged.limit(limit + 1 - len(rows)).all())
+        if len(rows) > limit:
+            break
+    return rows
+
+
+def parse_limit(raw, default=DEFAULT_LIMIT, maximum=MAX_LIMIT):
+    try:
+        limit = int(raw) if raw not in (None, "") else default
+    except (TypeError, ValueError):
+        limit = default
+    return max(1, min(limit, maximum))
+
+
+def requested_limit(args, default=DEFAULT_LIMIT, maximum=MAX_LIMIT):
+    """
+    Page size for listings that used to return every row: None (no limit)
+    unless the client asked for pages by sending `limit` or `cursor`.
+    """
+    if args.get("limit") in (None, "") and not args.get("cursor"):
+        return None
+    return parse_limit(args.get("limit"), default=default, maximum=maximum)
+
+
+def approximate_total(query, cap=TOTAL_CAP):
+    """
+    Count matching rows, stopping at `cap`.
+    Returns (count, exact) where exact is False once the cap was reached.
+    """
+    limited = query.order_by(None).limit(cap + 1).subquery()
+    count = query.session.query(func.count()).select_from(limited).scalar() or 0
+    if count > cap:
+        return cap, False
+    return count, True
+
+
+def keyset_paginate(query, keys, cursor=None, limit=DEFAULT_LIMIT, page=None,
+                    with_total=False, total_cap=TOTAL_CAP):
+    """
+    Fetch one page of `query` ordered by `keys` (a list of SortKey).
+
+    `cursor` continues after a previous page. Without a cursor, `page` > 1
+    falls back to an OFFSET for legacy page-number clients. One extra row is
+    fetched to decide whether a next page exists. `limit=None` returns every
+    row (in the same order) with no next cursor.
+    """
+    position = 0
+    unordered = query.order_by(None)
+
+    if cursor:
+        values, position = decode_cursor(cursor)
+        if len(values) != len(keys):
+            raise CursorError("Cursor does not match this listing")
+        rows = _fetch(unordered, keys, values, limit)
+    elif page and page > 1 and limit is not None:
+        position = (page - 1) * limit
+        ordered = unordered.order_by(*[k.nulls_last_clause() for k in keys])
+        rows = ordered.offset(position).limit(limit + 1).all()
+    else:
+        rows = _fetch(unordered, keys, None, limit)
+    items = rows if limit is None else rows[:limit]
+
+    next_cursor = None
+    if limit is not None and len(rows) > limit and items:
+        last = items[-1]
+        next_cursor = encode_cursor([k.read(last) for k in keys], position + len(items))
+
+    total, exact = None, True
+    if with_total:
+        total, exact = approximate_total(query, cap=total_cap)
+
+    return Page(items, next_cursor, position, total=total, total_is_exact=exact)
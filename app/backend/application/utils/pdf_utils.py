@@ -1,53 +1,167 @@
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import letter
+"""
+Offer letter PDFs.
 
-def generate_offer_letter_pdf(offer, offer_details=None):
-    # Handle missing data gracefully
-    joining_date_str = "TBD"
-    if offer.joining_date:
-        joining_date_str = offer.joining_date.strftime("%Y-%m-%d")
-
-    # Use provided offer_details or defaults
-    if offer_details is None:
-        offer_details = {}
-
-    offer_data = {
-        "candidate_name": offer.candidate.name,
-        "job_title": offer.application.job.job_title,
-        "department": offer_details.get('department', 'Engineering'),
-        "joining_date": joining_date_str,
-        "ctc": str(offer.ctc) if offer.ctc else "TBD",
-        "work_mode": offer_details.get('work_mode', 'Remote'),
-        "benefits": offer_details.get('benefits', 'Standard benefits package')
-    }
+The layout is a list of line templates laid out once and cached; a
+render only fills in values and draws, so it works on plain dicts and can run
+in a worker process. Files go to OFFER_LETTER_DIR (default:
+app/backend/offer_letters) and are written atomically.
+
+`render_offer_letter_pdfs` renders many letters across a process pool
+(OFFER_RENDER_PROCESSES, see application/utils/processes.py); a pool failure,
+or letters still unrendered after OFFER_RENDER_TIMEOUT_SECONDS, fall back to
+rendering inline.
+"""
+import os
+import logging
+from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+
+from application.utils.processes import pool_context, kill_pool
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_OFFER_LETTER_DIR = os.path.join(BACKEND_DIR, "offer_letters")
 
+# (text template, gap to the next line) — one entry per drawn line
+OFFER_LETTER_TEMPLATE = (
+    ("Offer Letter for {candidate_name}", 30),
+    ("Job Title: {job_title}", 30),
+    ("Department: {department}", 30),
+    ("Joining Date: {joining_date}", 30),
+    ("Annual CTC: {ctc}", 30),
+    ("Work Mode: {work_mode}", 30),
+    ("Benefits: {benefits}", 0),
+)
+TOP_Y = 750
+LEFT_X = 50
+
+
+@lru_cache(maxsize=1)
+def _compiled_template():
+    """Line templates with precomputed y positions, plus the reportlab pieces."""
     from reportlab.lib.pagesizes import letter
     from reportlab.pdfgen import canvas
-    import os
 
-    folder = os.path.join(os.getcwd(), "offer_letters")
+    lines = []
+    y = TOP_Y
+    for text, step in OFFER_LETTER_TEMPLATE:
+        lines.append((text, LEFT_X, y))
+        y -= step
+    return tuple(lines), letter, canvas.Canvas
+
+
+def offer_letter_dir():
+    """Configured storage directory (created on first use)."""
+    folder = DEFAULT_OFFER_LETTER_DIR
+    try:
+        from flask import current_app, has_app_context
+        if has_app_context():
+            folder = current_app.config.get("OFFER_LETTER_DIR") or folder
+    except ImportError:
+        pass
     os.makedirs(folder, exist_ok=True)
+    return folder
 
-    pdf_path = os.path.join(folder, f"offer_{offer.id}.pdf")
 
-    c = canvas.Canvas(pdf_path, pagesize=letter)
+def offer_template_values(offer_id, candidate_name, job_title, joining_date=None, ctc=None, offer_details=None):
+    """Plain dict of everything the template needs."""
+    offer_details = offer_details or {}
+    return {
+        "offer_id": offer_id,
+        "candidate_name": candidate_name,
+        "job_title": job_title,
+        "department": offer_details.get('department', 'Engineering'),
+        "joining_date": joining_date.strftime("%Y-%m-%d") if joining_date else "TBD",
+        "ctc": str(ctc) if ctc else "TBD",
+        "work_mode": offer_details.get('work_mode', 'Remote'),
+        "benefits": offer_details.get('benefits', 'Standard benefits package'),
+    }
 
-    y = 750
 
-    c.drawString(50, y, f"Offer Letter for {offer_data['candidate_name']}")
-    y -= 30
-    c.drawString(50, y, f"Job Title: {offer_data['job_title']}")
-    y -= 30
-    c.drawString(50, y, f"Department: {offer_data['department']}")
-    y -= 30
-    c.drawString(50, y, f"Joining Date: {offer_data['joining_date']}")
-    y -= 30
-    c.drawString(50, y, f"Annual CTC: {offer_data['ctc']}")
-    y -= 30
-    c.drawString(50, y, f"Work Mode: {offer_data['work_mode']}")
-    y -= 30
+def offer_pdf_data(offer, offer_details=None):
+    """Template values read from the ORM objects."""
+    return offer_template_values(
+        offer.id,
+        offer.candidate.name,
+        offer.application.job.job_title,
+        joining_date=offer.joining_date,
+        ctc=offer.ctc,
+        offer_details=offer_details,
+    )
 
-    c.drawString(50, y, f"Benefits: {offer_data['benefits']}")
-    c.save()
 
+def render_offer_letter_pdf(data, folder):
+    """Render `data` (see offer_pdf_data) to <folder>/offer_<offer_id>.pdf and return the path."""
+    lines, pagesize, Canvas = _compiled_template()
+    pdf_path = os.path.join(folder, f"offer_{data['offer_id']}.pdf")
+    tmp_path = f"{pdf_path}.{os.getpid()}.tmp"
+
+    c = Canvas(tmp_path, pagesize=pagesize)
+    for text, x, y in lines:
+        c.drawString(x, y, text.format(**data))
+    c.save()
+    os.replace(tmp_path, pdf_path)
     return pdf_path
+
+
+def _render_config(key, default):
+    try:
+        from flask import current_app, has_app_context
+        if has_app_context():
+            return current_app.config.get(key, default)
+    except ImportError:
+        pass
+    return default
+
+
+def _render_inline(data, folder):
+    try:
+        return render_offer_letter_pdf(data, folder)
+    except Exception as e:
+        return e
+
+
+def render_offer_letter_pdfs(items, folder, processes=None, timeout=None):
+    """
+    Render several letters. Returns one entry per item, in order: the PDF
+    path, or the exception that item raised. With more than one item and
+    processes > 1 (default: OFFER_RENDER_PROCESSES) the work is spread over
+    worker processes; letters the pool has not finished within timeout
+    seconds (default: OFFER_RENDER_TIMEOUT_SECONDS) are rendered inline.
+    """
+    items = list(items)
+    processes = int(_render_config("OFFER_RENDER_PROCESSES", 0) or 0) if processes is None else processes
+    timeout = float(_render_config("OFFER_RENDER_TIMEOUT_SECONDS", 30)) if timeout is None else timeout
+    processes = min(processes, len(items))
+    results = [None] * len(items)
+
+    ctx = pool_context() if processes > 1 else None
+    if ctx is not None:
+        pool = None
+        try:
+            pool = ProcessPoolExecutor(max_workers=processes, mp_context=ctx)
+            futures = [pool.submit(render_offer_letter_pdf, data, folder) for data in items]
+            done, pending = wait(futures, timeout=timeout)
+            for i, future in enumerate(futures):
+                if future in done:
+                    error = future.exception()
+                    if isinstance(error, BrokenProcessPool):
+                        raise error
+                    results[i] = error if error is not None else future.result()
+            if pending:
+                logger.warning(f"⚠️ {len(pending)} offer letters not rendered after {timeout:g}s, rendering them inline")
+        except Exception as e:
+            logger.warning(f"⚠️ Offer letter render pool unavailable, rendering inline: {e}")
+            results = [None] * len(items)
+        finally:
+            if pool is not None:
+                kill_pool(pool)
+
+    return [result if result is not None else _render_inline(data, folder)
+            for data, result in zip(items, results)]
+
+
+def generate_offer_letter_pdf(offer, offer_details=None):
+    return render_offer_letter_pdf(offer_pdf_data(offer, offer_details), offer_letter_dir())
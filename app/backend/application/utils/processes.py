@@ -0,0 +1,39 @@
+"""
+Worker process pools started from the web server.
+
+The server runs eventlet's monkey patching and several threads, so forking it
+directly can leave a child blocked forever on a lock that another thread held
+at the moment of the fork. Pools use the "forkserver" start method instead:
+a small single-threaded process, started once without importing main.py,
+forks every worker. It preloads FORKSERVER_PRELOAD, so workers start fast;
+the functions a pool runs must be importable from one of those modules.
+Each worker also imports the parent's main script as __mp_main__, which is
+why main.py builds the app only under its other names.
+
+`pool_context()` is None where forkserver does not exist (Windows); callers
+then do the work inline.
+"""
+import multiprocessing
+
+FORKSERVER_PRELOAD = [
+    "application.utils.pdf_utils",
+    "application.controller.resume_parser.extraction",
+]
+
+
+def pool_context():
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return None
+    ctx = multiprocessing.get_context("forkserver")
+    ctx.set_forkserver_preload(FORKSERVER_PRELOAD)
+    return ctx
+
+
+def kill_pool(pool):
+    """Kill a ProcessPoolExecutor's workers and shut it down; a running task cannot be cancelled any other way."""
+    for process in list((getattr(pool, "_processes", None) or {}).values()):
+        try:
+            process.kill()
+        except Exception:
+            pass
+    pool.shutdown(wait=False, cancel_futures=True)
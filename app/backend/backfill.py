@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Backfill Jobs
+=============
+Rebuilds derived/aggregate tables from the source tables. Safe to re-run:
+every job recomputes its rows from scratch.
+
+Usage:
+    python backfill.py hiring-rollups [--company-id ID]
+    python backfill.py interview-summaries [--recordings-dir PATH]
+    python backfill.py resume-signatures
+    python backfill.py ai-metadata
+    python backfill.py listing-indexes
+"""
+
+import os
+import sys
+import argparse
+
+# Add the backend directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from main import app
+from application.data.database import db
+
+
+def backfill_hiring_rollups(args):
+    from application.controller.company.rollups import rebuild_hiring_rollups
+
+    written = rebuild_hiring_rollups(company_id=args.company_id, batch_size=args.batch_size)
+    print(f"✅ Hiring summary rollups rebuilt: {written} buckets")
+
+
+def backfill_interview_summaries(args):
+    from application.controller.interview.evaluation_summaries import backfill_from_recordings
+
+    recordings_dir = args.recordings_dir or os.path.join(os.path.dirname(os.path.abspath(__file__)), "recordings")
+    written, skipped = backfill_from_recordings(recordings_dir, batch_size=args.batch_size)
+    print(f"✅ Interview evaluation summaries: {written} written, {skipped} skipped")
+
+
+def backfill_resume_signatures(args):
+    from application.controller.applicant.resume_dedup import backfill_signatures
+
+    written = backfill_signatures(batch_size=args.batch_size)
+    print(f"✅ Resume MinHash signatures: {written} written")
+
+
+def backfill_ai_metadata(args):
+    from application.controller.resume_parser.metadata_store import backfill_metadata
+
+    written, skipped = backfill_metadata(batch_size=args.batch_size)
+    print(f"✅ Application AI metadata copied to tables: {written} written, {skipped} unreadable")
+
+
+def backfill_listing_indexes(args):
+    # importing the controllers declares the indexes their keyset listings sort on
+    import application.controller.applications.controllers  # noqa: F401
+    import application.controller.interview.controllers  # noqa: F401
+    from application.data.models import Application, Interview
+
+    inspector = db.inspect(db.engine)
+    created = []
+    for table in (Application.__table__, Interview.__table__):
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in sorted(table.indexes, key=lambda i: i.name):
+            if index.name not in existing:
+                index.create(bind=db.engine)
+                created.append(index.name)
+    print(f"✅ Listing indexes: {len(created)} created{': ' + ', '.join(created) if created else ''}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Rebuild derived tables from source data")
+    sub = parser.add_subparsers(dest="job", required=True)
+
+    rollups = sub.add_parser("hiring-rollups", help="Monthly hiring summary used by /company/dashboard")
+    rollups.add_argument("--company-id", type=int, default=None, help="Only rebuild one company")
+    rollups.add_argument("--batch-size", type=int, default=5000)
+    rollups.set_defaults(func=backfill_hiring_rollups)
+
+    summaries = sub.add_parser("interview-summaries", help="Evaluation summaries used by /api/hr/interviews")
+    summaries.add_argument("--recordings-dir", default=None, help="Defaults to ./recordings")
+    summaries.add_argument("--batch-size", type=int, default=200)
+    summaries.set_defaults(func=backfill_interview_summaries)
+
+    signatures = sub.add_parser("resume-signatures", help="Near-duplicate index used by /applications/<id>/duplicates")
+    signatures.add_argument("--batch-size", type=int, default=200)
+    signatures.set_defaults(func=backfill_resume_signatures)
+
+    metadata = sub.add_parser("ai-metadata", help="Skill/experience tables used by /resumeparser and candidate skill filters")
+    metadata.add_argument("--batch-size", type=int, default=500)
+    metadata.set_defaults(func=backfill_ai_metadata)
+
+    indexes = sub.add_parser("listing-indexes", help="Indexes behind the keyset-paginated application and interview lists")
+    indexes.set_defaults(func=backfill_listing_indexes)
+
+    return parser
+
+
+def main():
+    args = build_parser().parse_args()
+    with app.app_context():
+        db.create_all()
+        args.func(args)
+
+
+if __name__ == "__main__":
+    main()
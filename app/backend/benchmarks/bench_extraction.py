@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Document Extraction Benchmark
+=============================
+Generates a corpus of resume-sized and very long PDFs with reportlab and runs
+the extraction engine (`application.controller.resume_parser.extraction`)
+over it, inline and through the worker pool, for every installed PDF
+backend. Reports:
+
+  * pages per second over the resume corpus
+  * wall time for one long PDF (page ranges spread over the pool)
+  * the same long PDF under the default page limit
+
+Usage:
+    python benchmarks/bench_extraction.py [--resumes 40] [--long-pages 300] [--processes 4]
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+# Add the backend directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from application.controller.resume_parser import extraction
+
+LINE = ("Senior engineer building Python and Flask services on PostgreSQL, "
+        "owning releases, reviews and on-call for the hiring platform.")
+
+
+def write_pdf(path, pages, lines_per_page=45):
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+
+    c = canvas.Canvas(path, pagesize=letter)
+    for page in range(pages):
+        y = 750
+        c.drawString(50, y, f"Page {page + 1}")
+        for line in range(lines_per_page):
+            y -= 15
+            c.drawString(50, y, f"{line:02d} {LINE}"[:110])
+        c.showPage()
+    c.save()
+
+
+def run(paths, limits):
+    pages = 0
+    t0 = time.perf_counter()
+    for path in paths:
+        if path.endswith(".pdf"):
+            extracted, _ = extraction.extract_pdf_pages(path, limits)
+            pages += len(extracted)
+        else:
+            extraction.extract_text(path, limits)
+    return pages, time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumes", type=int, default=40)
+    parser.add_argument("--resume-pages", type=int, default=2)
+    parser.add_argument("--long-pages", type=int, default=300)
+    parser.add_argument("--processes", type=int, default=min(4, os.cpu_count() or 1))
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_extraction_")
+    resumes = []
+    for i in range(args.resumes):
+        path = os.path.join(workdir, f"resume_{i}.pdf")
+        write_pdf(path, args.resume_pages)
+        resumes.append(path)
+    long_pdf = os.path.join(workdir, "long.pdf")
+    write_pdf(long_pdf, args.long_pages)
+
+    base = extraction.Limits(processes=0, timeout=600.0, max_bytes=1 << 30, max_pages=10 ** 6,
+                             pages_per_task=8, memory_mb=1024, backend="pypdf2")
+    backends = [name for name, backend in extraction.BACKENDS.items() if backend.available()]
+    print(f"Corpus: {args.resumes} x {args.resume_pages}-page resumes, one {args.long_pages}-page PDF "
+          f"({os.cpu_count()} CPUs)")
+
+    for backend in backends:
+        inline = base._replace(backend=backend)
+        pooled = inline._replace(processes=args.processes)
+        print(f"\n[{backend}]")
+        for label, limits in (("inline", inline), (f"pool x{args.processes}", pooled)):
+            run(resumes[:1], limits)  # warm-up (imports, pool start)
+            pages, seconds = run(resumes, limits)
+            print(f"  resumes  {label:<9} {pages / seconds:8.0f} pages/s  ({seconds * 1000:.0f} ms)")
+            pages, seconds = run([long_pdf], limits)
+            print(f"  long PDF {label:<9} {pages / seconds:8.0f} pages/s  ({seconds * 1000:.0f} ms)")
+        capped = pooled._replace(max_pages=extraction.DEFAULTS["EXTRACTION_MAX_PAGES"])
+        pages, seconds = run([long_pdf], capped)
+        print(f"  long PDF capped at {capped.max_pages} pages: {seconds * 1000:.0f} ms")
+        extraction.shutdown_pool()
+
+
+if __name__ == "__main__":
+    main()
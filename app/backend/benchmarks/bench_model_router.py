@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Model Router Benchmark
+======================
+Runs question-sized requests against the fake model server
+(benchmarks/fake_model_server.py) in three modes and reports p50 / p95 / max
+latency and failures:
+
+  * fixed     the old fallback loop: models in configured order, each tried
+              --retries times with 0.5s, 1s... sleeps, quota errors skip ahead
+  * router    ModelRouter, fastest healthy model first
+  * hedged    ModelRouter with a hedged second request after the p95
+
+Scenario (latency per model, ms): the configured primary is slow with a
+heavy tail, the first fallback is out of quota, the others are fast but one
+of them fails 20% of requests.
+
+Usage:
+    python benchmarks/bench_model_router.py [--requests 200] [--timeout 3]
+"""
+
+import os
+import sys
+import time
+import argparse
+
+# Add the backend directory to path
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from application.utils.model_router import ModelRouter, NoModelAvailable, is_quota_error
+from benchmarks.fake_model_server import FakeModelServer
+
+PROFILES = {
+    "primary": {"latency_ms": 700, "jitter_ms": 300, "tail_rate": 0.1, "tail_ms": 2500},
+    "exhausted": {"quota": True},
+    "flaky": {"latency_ms": 150, "jitter_ms": 100, "error_rate": 0.2},
+    "steady": {"latency_ms": 300, "jitter_ms": 100, "tail_rate": 0.05, "tail_ms": 1500},
+}
+MODELS = ["primary", "exhausted", "flaky", "steady"]
+
+
+def fixed_order(call, prompt, timeout, retries):
+    """The loop the services used before the router (timeouts enforced by the transport)."""
+    for model in MODELS:
+        for attempt in range(retries):
+            try:
+                return call(model, prompt, timeout=timeout)
+            except Exception as e:
+                if is_quota_error(e):
+                    break
+            if attempt < retries - 1:
+                time.sleep((2 ** attempt) * 0.5)
+    raise NoModelAvailable("all models failed")
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))]
+
+
+def run(name, fn, requests):
+    latencies, failures = [], 0
+    for i in range(requests):
+        started = time.perf_counter()
+        try:
+            fn(f"question prompt {i}")
+        except NoModelAvailable:
+            failures += 1
+        latencies.append(time.perf_counter() - started)
+    print(f"{name:<8} p50 {percentile(latencies, 50) * 1000:7.0f} ms   "
+          f"p95 {percentile(latencies, 95) * 1000:7.0f} ms   "
+          f"max {max(latencies) * 1000:7.0f} ms   failures {failures}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--timeout", type=float, default=3.0, help="per-attempt timeout, seconds")
+    parser.add_argument("--retries", type=int, default=2, help="attempts per model in the fixed loop")
+    args = parser.parse_args()
+
+    print(f"{args.requests} requests, timeout {args.timeout}s")
+    with FakeModelServer(PROFILES) as server:
+        run("fixed", lambda p: fixed_order(server.call, p, args.timeout, args.retries), args.requests)
+
+        router = ModelRouter(MODELS, call=server.call, name="bench")
+        run("router", lambda p: router.generate(p, timeout=args.timeout, budget=args.timeout * args.retries),
+            args.requests)
+
+        hedged = ModelRouter(MODELS, call=server.call, name="bench-hedged")
+        run("hedged", lambda p: hedged.generate(p, timeout=args.timeout, budget=args.timeout * args.retries,
+                                                hedge=True), args.requests)
+
+        print("\nrouter state after the run:")
+        for row in hedged.snapshot():
+            print(f"  {row['model']:<10} rank {row['rank']}  p50 {row['p50_ms']} ms  "
+                  f"p95 {row['p95_ms']} ms  errors {row['error_rate']:.0%}  quota wait {row['quota_cooldown_s']}s")
+
+
+if __name__ == "__main__":
+    main()
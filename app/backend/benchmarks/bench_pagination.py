@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Pagination Benchmark
+====================
+Compares OFFSET pagination (`query.paginate`) with keyset pagination
+(`application.utils.pagination.keyset_paginate`) on the job listing query
+at shallow and deep pages.
+
+OFFSET latency grows with page depth, keyset latency should stay flat.
+
+`--order created` lists one company's jobs newest first with undated jobs
+last, behind an index on (company_id, created_date, id). It also times the
+old coalesce(created_date, epoch) sort key, which no plain index can serve.
+
+Usage:
+    python benchmarks/bench_pagination.py [--jobs 50000] [--per-page 20] [--pages 1 100 1000]
+    python benchmarks/bench_pagination.py --order created
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+import tempfile
+from datetime import datetime, timedelta
+
+# Add the backend directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+from sqlalchemy import Index, func
+from application.data.database import db
+from application.data.models import Company, JobPosting, User
+from application.utils.pagination import SortKey, encode_cursor, keyset_paginate
+
+
+def build_app(db_path):
+    app = Flask(__name__)
+    app.config.update(
+        SQLALCHEMY_DATABASE_URI=f"sqlite:///{db_path}",
+        SQLALCHEMY_TRACK_MODIFICATIONS=False,
+    )
+    db.init_app(app)
+    return app
+
+
+EPOCH = datetime(1970, 1, 1)
+# Every UNDATED_EVERY-th job has no created_date
+UNDATED_EVERY = 10
+
+
+def seed(num_jobs, batch_size=5000):
+    db.session.execute(User.__table__.insert(), [
+        {"id": 1, "name": "Bench HR", "email": "bench-hr@example.com", "password_hashed": "x"}
+    ])
+    db.session.execute(Company.__table__.insert(), [
+        {"id": 1, "company_name": "Bench Co", "user_id": 1, "company_email": "bench@example.com"}
+    ])
+    start = datetime(2023, 1, 1)
+    for offset in range(0, num_jobs, batch_size):
+        rows = [
+            {
+                "company_id": 1,
+                "hr_id": 1,
+                "job_title": f"Engineer {i}",
+                "location": "Remote",
+                "status": "open",
+                "created_date": None if i % UNDATED_EVERY == 0 else start + timedelta(minutes=i),
+            }
+            for i in range(offset, min(offset + batch_size, num_jobs))
+        ]
+        db.session.execute(JobPosting.__table__.insert(), rows)
+    db.session.commit()
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=50000)
+    parser.add_argument("--per-page", type=int, default=20)
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=15)
+    parser.add_argument("--order", choices=["id", "created"], default="id",
+                        help="id: all jobs by id; created: one company's jobs, newest first")
+    args = parser.parse_args()
+
+    needed = max(args.pages) * args.per_page
+    if args.jobs < needed:
+        parser.error(f"--jobs must be at least {needed} to reach page {max(args.pages)}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = build_app(os.path.join(tmp, "bench.db"))
+        with app.app_context():
+            db.create_all()
+            print(f"🌱 Seeding {args.jobs} job postings...")
+            seed(args.jobs)
+
+            if args.order == "id":
+                query = JobPosting.query.join(Company)
+                variants = {"keyset": [SortKey(JobPosting.id)]}
+            else:
+                Index("ix_bench_job_company_created", JobPosting.company_id, JobPosting.created_date,
+                      JobPosting.id).create(bind=db.engine)
+                query = JobPosting.query.filter(JobPosting.company_id == 1)
+                variants = {
+                    "keyset coalesce": [
+                        SortKey(func.coalesce(JobPosting.created_date, EPOCH), descending=True,
+                                value=lambda j: j.created_date or EPOCH),
+                        SortKey(JobPosting.id, descending=True),
+                    ],
+                    "keyset column": [
+                        SortKey(JobPosting.created_date, descending=True, nullable=True),
+                        SortKey(JobPosting.id, descending=True),
+                    ],
+                }
+            reference = list(variants.values())[-1]
+            ordering = [k.nulls_last_clause() for k in reference]
+
+            print(f"\n{'page':>6} | {'offset (ms)':>12} | " + " | ".join(f"{name + ' (ms)':>21}" for name in variants))
+            print("-" * (24 + 24 * len(variants)))
+            for page in args.pages:
+                # Cursors a client would hold after reading page-1 pages
+                cursors = dict.fromkeys(variants)
+                if page > 1:
+                    last = query.order_by(*ordering).offset((page - 1) * args.per_page - 1).limit(1).one()
+                    for name, keys in variants.items():
+                        cursors[name] = encode_cursor([k.read(last) for k in keys], (page - 1) * args.per_page)
+
+                offset_ms = timed(
+                    lambda: query.order_by(*ordering).paginate(page=page, per_page=args.per_page, error_out=False).items,
+                    args.repeat,
+                )
+                keyset_ms = [
+                    timed(lambda: keyset_paginate(query, keys, cursor=cursors[name], limit=args.per_page).items,
+                          args.repeat)
+                    for name, keys in variants.items()
+                ]
+                print(f"{page:>6} | {offset_ms:>12.2f} | " + " | ".join(f"{ms:>21.2f}" for ms in keyset_ms))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Applicant Pre-ranking Benchmark
+===============================
+Runs the BM25 pre-ranker (`application.controller.resume_parser.prefilter`)
+over a synthetic pool of resumes for one job description and reports:
+
+  * tokenize time (streaming the resumes into per-term counts)
+  * scoring time (the vectorized BM25 pass)
+  * how many of the resumes written for the job's own role family land in
+    the top-K, i.e. how safe it is to send only the top-K to the LLM
+
+The database is not involved; this measures the part that scales with the
+number of applicants.
+
+Usage:
+    python benchmarks/bench_prefilter.py [--resumes 50000] [--words 600] [--top 500] [--relevant 0.05]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+import numpy as np
+
+# Add the backend directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from application.controller.resume_parser.prefilter import TermCounts, bm25_scores, query_terms
+
+FAMILIES = {
+    "backend": ["python", "django", "flask", "postgresql", "redis", "celery", "rest", "apis", "microservices"],
+    "frontend": ["javascript", "typescript", "react", "vue", "css", "webpack", "accessibility", "ui"],
+    "data": ["pandas", "numpy", "scikit-learn", "tensorflow", "statistics", "sql", "spark", "modelling"],
+    "devops": ["kubernetes", "docker", "terraform", "aws", "prometheus", "linux", "ci", "helm"],
+    "finance": ["excel", "accounting", "sap", "ifrs", "auditing", "taxation", "reporting", "payroll"],
+}
+
+FILLER = ("experience team project delivered worked led improved managed responsible collaborated "
+          "stakeholders designed built maintained company years role results customers quality "
+          "communication problem solving deadlines documentation reviews mentoring ownership").split()
+
+JD = ("Senior Backend Engineer\nPython, Django, PostgreSQL, Redis, Celery\n"
+      "You will design REST APIs and microservices in Python, own our PostgreSQL schema, "
+      "run background jobs on Celery and Redis, and review code with the team.")
+
+
+def synthetic_resume(family, words, rng):
+    skills = FAMILIES[family]
+    share = rng.uniform(0.04, 0.12)
+    return " ".join(rng.choice(skills) if rng.random() < share else rng.choice(FILLER) for _ in range(words))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumes", type=int, default=50000)
+    parser.add_argument("--words", type=int, default=600)
+    parser.add_argument("--top", type=int, default=500)
+    parser.add_argument("--relevant", type=float, default=0.05, help="share of backend resumes")
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    others = [f for f in FAMILIES if f != "backend"]
+    families = ["backend" if rng.random() < args.relevant else rng.choice(others) for _ in range(args.resumes)]
+    t0 = time.perf_counter()
+    resumes = [synthetic_resume(f, args.words, rng) for f in families]
+    generate_s = time.perf_counter() - t0
+
+    weights = query_terms(JD)
+    counts = TermCounts(weights)
+    t0 = time.perf_counter()
+    for text in resumes:
+        counts.add(text)
+    tokenize_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    scores = bm25_scores(weights, counts)
+    order = np.argsort(-scores, kind="stable")
+    score_s = time.perf_counter() - t0
+
+    relevant = np.array([f == "backend" for f in families])
+    top = order[:args.top]
+    captured = relevant[top].sum() / max(1, min(args.top, relevant.sum()))
+
+    print(f"Resumes:              {args.resumes} x {args.words} words (generated in {generate_s:.1f} s)")
+    print(f"Query terms:          {len(weights)}   (term, resume) pairs: {len(counts._docs)}")
+    print(f"Tokenize:             {tokenize_s * 1000:.0f} ms ({tokenize_s / args.resumes * 1e6:.1f} us/resume)")
+    print(f"BM25 + sort:          {score_s * 1000:.1f} ms")
+    print(f"Backend resumes:      {int(relevant.sum())}   captured in top-{args.top}: {captured:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Job Recommendation Benchmark
+============================
+Builds the job vector index (`application.controller.job.recommendations`)
+over a synthetic corpus and reports:
+
+  * build time, per-job incremental upsert time
+  * top-N query latency (p50/p95)
+  * recall@N of the SVD-projected index against exact cosine search in the
+    full TF-IDF space
+  * family precision@N for queries written with skill spellings that never
+    appear in the corpus ("postgres" for "postgresql", "nodejs" for "node.js")
+
+Usage:
+    python benchmarks/bench_recommendations.py [--jobs 20000] [--queries 200] [--top 10] [--dims 128]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import statistics
+
+import numpy as np
+
+# Add the backend directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from application.controller.job.recommendations import HashedTfidfSvd, JobVectorIndex, job_text
+
+FAMILIES = {
+    "backend": (["Backend Engineer", "Python Developer", "API Engineer"],
+                ["python", "django", "flask", "postgresql", "redis", "celery", "rest apis"]),
+    "frontend": (["Frontend Engineer", "UI Developer", "Web Developer"],
+                 ["javascript", "typescript", "react", "vue", "node.js", "css", "webpack"]),
+    "data": (["Data Scientist", "ML Engineer", "Data Analyst"],
+             ["pandas", "numpy", "scikit-learn", "tensorflow", "statistics", "sql", "spark"]),
+    "devops": (["DevOps Engineer", "Site Reliability Engineer", "Cloud Engineer"],
+               ["kubernetes", "docker", "terraform", "aws", "prometheus", "linux", "ci/cd"]),
+    "finance": (["Accountant", "Financial Analyst", "Auditor"],
+                ["excel", "accounting", "sap", "ifrs", "auditing", "taxation", "reporting"]),
+    "mobile": (["Android Developer", "iOS Developer", "Mobile Engineer"],
+               ["kotlin", "swift", "android", "ios", "flutter", "firebase", "xcode"]),
+}
+
+# Spellings used only in queries
+VARIANTS = {
+    "postgresql": "postgres", "node.js": "nodejs", "scikit-learn": "sklearn", "kubernetes": "kubernetes k8s",
+    "javascript": "javascript es6", "tensorflow": "tensorflow2", "accounting": "accountancy", "auditing": "audit",
+}
+
+FILLER = ("We are a growing team building products used by thousands of customers. You will own features "
+          "end to end, review code, and work closely with product and design.").split()
+
+
+def synthetic_jobs(count, rng):
+    names = list(FAMILIES)
+    for job_id in range(1, count + 1):
+        family = rng.choice(names)
+        titles, skills = FAMILIES[family]
+        picked = rng.sample(skills, 4)
+        description = " ".join(rng.sample(FILLER, 12) + rng.sample(skills, 2))
+        yield job_id, family, job_text(rng.choice(titles), ", ".join(picked), description)
+
+
+def synthetic_query(rng):
+    family = rng.choice(list(FAMILIES))
+    _, skills = FAMILIES[family]
+    picked = [VARIANTS.get(s, s) for s in rng.sample(skills, 3)]
+    return family, ", ".join(picked)
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--dims", type=int, default=128)
+    parser.add_argument("--upserts", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    jobs = list(synthetic_jobs(args.jobs, rng))
+    family_of = {job_id: family for job_id, family, _ in jobs}
+    items = [(job_id, text) for job_id, _, text in jobs]
+
+    index = JobVectorIndex(HashedTfidfSvd(dimensions=args.dims))
+    t0 = time.perf_counter()
+    index.build(items)
+    build_ms = (time.perf_counter() - t0) * 1000
+
+    # Exact reference: same corpus, full TF-IDF space, brute force
+    exact = JobVectorIndex(HashedTfidfSvd(dimensions=0))
+    exact.build(items)
+
+    queries = [synthetic_query(rng) for _ in range(args.queries)]
+    latencies, recalls, precisions = [], [], []
+    for family, text in queries:
+        vector = index.embed(text)
+        t0 = time.perf_counter()
+        hits = index.search(vector, limit=args.top)
+        latencies.append((time.perf_counter() - t0) * 1000)
+
+        truth = {job_id for job_id, _ in exact.search(exact.embed(text), limit=args.top)}
+        recalls.append(len(truth & {job_id for job_id, _ in hits}) / max(1, len(truth)))
+        precisions.append(sum(family_of[job_id] == family for job_id, _ in hits) / max(1, len(hits)))
+
+    upsert_ms = []
+    for job_id, family, text in synthetic_jobs(args.upserts, rng):
+        t0 = time.perf_counter()
+        index.upsert([(args.jobs + job_id, text)])
+        upsert_ms.append((time.perf_counter() - t0) * 1000)
+
+    print(f"Jobs indexed:         {len(index)} ({index.embedder.name}, {index.embedder.dim} dims, "
+          f"{index._matrix[:len(index)].nbytes / 1e6:.1f} MB)")
+    print(f"Build:                {build_ms:.0f} ms")
+    print(f"Upsert (1 job):       p50 {statistics.median(upsert_ms):.2f} ms   p95 {percentile(upsert_ms, 95):.2f} ms")
+    print(f"Query top-{args.top}:         p50 {statistics.median(latencies):.2f} ms   p95 {percentile(latencies, 95):.2f} ms")
+    print(f"Recall@{args.top} vs exact:   {np.mean(recalls):.3f}")
+    print(f"Family precision@{args.top}: {np.mean(precisions):.3f} (queries use unseen skill spellings)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Fake LLM Model Server
+=====================
+A local HTTP server that plays several models with injectable behaviour, so
+the model router (application/utils/model_router.py) can be tested and
+benchmarked offline.
+
+Each model has a profile:
+    latency_ms   base response time
+    jitter_ms    uniform extra time, 0..jitter_ms
+    tail_rate    share of requests that take tail_ms instead (slow outliers)
+    tail_ms
+    error_rate   share of requests answered with HTTP 500
+    quota        answer every request with HTTP 429 "quota exhausted"
+    text         the response (default "<model>: ok")
+
+    with FakeModelServer({"fast": {"latency_ms": 20}, "slow": {"latency_ms": 400}}) as server:
+        router = ModelRouter(["slow", "fast"], call=server.call)
+        server.set("fast", quota=True)
+
+`call(model, prompt, timeout=...)` is the router transport: it POSTs to
+/models/<model>:generate and raises like the Gemini SDK does (a
+ResourceExhausted for 429). `requests` counts calls per model.
+"""
+
+import json
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_PROFILE = {
+    "latency_ms": 50, "jitter_ms": 0, "tail_rate": 0.0, "tail_ms": 0,
+    "error_rate": 0.0, "quota": False, "text": None,
+}
+
+
+class ResourceExhausted(Exception):
+    """Same name as google.api_core.exceptions.ResourceExhausted."""
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        server = self.server.fake
+        model = self.path.strip("/").split("/")[-1].split(":")[0]
+        length = int(self.headers.get("Content-Length") or 0)
+        prompt = json.loads(self.rfile.read(length) or b"{}").get("prompt", "")
+
+        profile = server.profile(model)
+        if profile is None:
+            return self._reply(404, {"error": f"unknown model {model}"})
+        server.count(model)
+
+        delay, status = server.draw(profile)
+        time.sleep(delay)
+        if status == 429:
+            return self._reply(429, {"error": f"429 Resource has been exhausted (check quota) for {model}"})
+        if status == 500:
+            return self._reply(500, {"error": f"500 internal error in {model}"})
+        return self._reply(200, {"text": profile["text"] or f"{model}: ok", "prompt_chars": len(prompt)})
+
+    def _reply(self, status, body):
+        data = json.dumps(body).encode()
+        try:
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # the client timed out and went away
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeModelServer:
+    def __init__(self, profiles, seed=7):
+        self._profiles = {name: dict(DEFAULT_PROFILE, **(profile or {})) for name, profile in profiles.items()}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.requests = Counter()
+        self._httpd = None
+
+    # ----- server side -----
+
+    def profile(self, model):
+        with self._lock:
+            profile = self._profiles.get(model)
+            return dict(profile) if profile else None
+
+    def set(self, model, **changes):
+        with self._lock:
+            self._profiles[model].update(changes)
+
+    def count(self, model):
+        with self._lock:
+            self.requests[model] += 1
+
+    def draw(self, profile):
+        """(seconds to sleep, HTTP status) of one request."""
+        if profile["quota"]:
+            return 0.005, 429
+        with self._lock:
+            tail = self._random.random() < profile["tail_rate"]
+            failed = self._random.random() < profile["error_rate"]
+            jitter = self._random.uniform(0, profile["jitter_ms"])
+        ms = profile["tail_ms"] if tail else profile["latency_ms"] + jitter
+        return ms / 1000, 500 if failed else 200
+
+    def start(self):
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.fake = self
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address
+        return f"http://{host}:{port}"
+
+    # ----- client side -----
+
+    def call(self, model, prompt, timeout=None):
+        request = urllib.request.Request(
+            f"{self.url}/models/{model}:generate",
+            data=json.dumps({"prompt": prompt}).encode(),
+            headers={"Content-Type": "application/json"},
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                return json.loads(response.read())["text"]
+        except urllib.error.HTTPError as e:
+            message = json.loads(e.read() or b"{}").get("error", str(e))
+            if e.code == 429:
+                raise ResourceExhausted(message) from None
+            raise RuntimeError(message) from None
@@ -0,0 +1,587 @@
+#!/usr/bin/env python3
+"""
+Video Interview Load Harness
+============================
+Finds how many concurrent video interviews one node can carry.
+
+`run` starts a local server (this script's `serve` command, in a subprocess)
+with fake AI and transcription backends, then drives N simulated candidates
+against it. Each candidate:
+
+    POST /video-interview/start/<interview_id>
+    joinInterview -> startRecording
+    per question: videoChunk + audioChunk every VIDEO_CHUNK_INTERVAL_MS,
+                  then finishSpeaking and wait for the next `question`
+    stopRecording -> endInterview -> wait for interviewComplete
+
+Reported: chunk-ack latency, time-to-next-question, time to the first
+`questionDelta` (when the browser can start speaking; streamed questions
+only), dropped chunks (negative or missing acks), the server process' RSS
+and CPU sampled from /proc, and the server's L1 session cache counters
+(cumulative since it started, from /video-interview/health).
+
+Usage:
+    python benchmarks/interview_load.py run --candidates 25
+    python benchmarks/interview_load.py run --sweep 10 25 50 100 --max-ack-p95-ms 250 --max-drop-rate 0.01
+    python benchmarks/interview_load.py run --url http://staging:8086 --interview-ids 11 12 13
+
+The session store is the real Redis-backed store, so REDIS_URL must point at a
+running Redis. `--sweep` exits with status 1 if even the first level fails.
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import socket
+import argparse
+import tempfile
+import threading
+import subprocess
+import urllib.request
+from statistics import mean
+
+# Add the backend directory to path
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+# Same env var and default as videointerview/config.py; importing that package
+# here would start its cleanup scheduler and Redis connection in the client
+VIDEO_CHUNK_INTERVAL_MS = int(os.getenv("VIDEO_CHUNK_INTERVAL_MS", 2000))
+
+FAKE_QUESTION = "Can you walk me through a recent project and the trade-offs you made?"
+FAKE_STREAMED_QUESTION = "That sounds like a useful project to dig into. " + FAKE_QUESTION
+FAKE_ANALYSIS = {"quality": "good", "depth": 3, "technical_terms": ["python"], "red_flags": []}
+FAKE_EVALUATION = {
+    "overall_rating": 3.5,
+    "recommendation": {"decision": "Maybe", "reasoning": "Synthetic load-test candidate"},
+    "strengths": ["communication"],
+    "weaknesses": [],
+}
+
+
+# ---------------------------------------------------------------------------
+# Server side: fake backends + app
+# ---------------------------------------------------------------------------
+def install_fake_backends(ai_latency_ms, transcription_latency_ms):
+    """Swap the Gemini and Azure Speech singletons for local fakes."""
+    from application.controller.videointerview.services import ai_service
+    from application.controller.videointerview.socket_handlers import interview_socket
+    from application.utils.model_router import ModelRouter
+
+    class FakeAIService(ai_service.AIService):
+        def __init__(self):
+            self.initialized = True
+            self.primary_model = "fake"
+            self.fallback_models = []
+            self.timeout = 5
+            self.circuit_breaker = ai_service.CircuitBreaker()
+            self.router = ModelRouter(["fake"], call=self._generate_text)
+
+        def _call_gemini_with_retry(self, prompt, timeout=None, max_retries=3, hedge=False):
+            time.sleep(ai_latency_ms / 1000)
+            lowered = prompt.lower()
+            if "evaluat" in lowered:
+                return json.dumps(FAKE_EVALUATION)
+            if "json" in lowered:
+                return json.dumps(FAKE_ANALYSIS)
+            return FAKE_QUESTION
+
+        def _stream_chunks(self, model_name, prompt):
+            # the same total latency, spread over the words of a two-sentence question
+            words = FAKE_STREAMED_QUESTION.split(" ")
+            for i, word in enumerate(words):
+                time.sleep(ai_latency_ms / 1000 / len(words))
+                yield word if i == 0 else " " + word
+
+    class FakeTranscriptionService:
+        def __init__(self):
+            self.initialized = True
+            self.active_streams = {}
+            self.lock = threading.Lock()
+
+        def start_streaming(self, session_id, socketio, room=None):
+            time.sleep(transcription_latency_ms / 1000)
+            with self.lock:
+                self.active_streams[session_id] = 0
+            return True
+
+        def push_audio_chunk(self, session_id, chunk):
+            with self.lock:
+                if session_id in self.active_streams:
+                    self.active_streams[session_id] += len(chunk)
+
+        def stop_streaming(self, session_id):
+            with self.lock:
+                received = self.active_streams.pop(session_id, 0)
+            return f"[synthetic transcript: {received} bytes of audio]"
+
+    ai_service._ai_service_instance = FakeAIService()
+    interview_socket.transcription_service = FakeTranscriptionService()
+
+
+def seed_interviews(db, count):
+    """One company/job with `count` scheduled interviews; returns their ids."""
+    from datetime import date
+    from application.data.models import (
+        User, Company, HRProfile, JobPosting, ApplicantProfile, Application, Interview
+    )
+
+    hr = User(name="Load HR", email=f"load-hr-{time.time_ns()}@bench.local", password_hashed="x", role="hr")
+    db.session.add(hr)
+    db.session.flush()
+    company = Company(company_name="LoadCorp", user_id=hr.id, company_email=f"load-{hr.id}@bench.local")
+    db.session.add(company)
+    db.session.flush()
+    db.session.add(HRProfile(hr_id=hr.id, company_id=company.id, first_name="Load", last_name="HR",
+                             contact_email=hr.email))
+    job = JobPosting(hr_id=hr.id, company_id=company.id, job_title="Backend Engineer", status="open",
+                     job_description="Python, Flask, SQL and distributed systems.")
+    db.session.add(job)
+    db.session.flush()
+
+    ids = []
+    for n in range(count):
+        user = User(name=f"Load Candidate {n}", email=f"load-{hr.id}-{n}@bench.local",
+                    password_hashed="x", role="applicant")
+        db.session.add(user)
+        db.session.flush()
+        db.session.add(ApplicantProfile(applicant_id=user.id, name=user.name, skills="Python, SQL",
+                                        years_of_experience=3))
+        application = Application(job_id=job.id, applicant_id=user.id, status="interview")
+        db.session.add(application)
+        db.session.flush()
+        interview = Interview(application_id=application.id, interviewee_id=user.id, interviewer_id=hr.id,
+                              interview_date=date.today(), status="scheduled", mode="video")
+        db.session.add(interview)
+        db.session.flush()
+        ids.append(interview.id)
+    db.session.commit()
+    return ids
+
+
+def serve(args):
+    os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(args.workdir, 'load.db')}")
+    os.environ.setdefault("CACHE_TYPE", "NullCache")
+    os.environ.setdefault("OFFER_OUTBOX_WORKER", "0")
+
+    import logging
+    logging.disable(logging.WARNING)
+
+    from main import app, socketio
+    from application.data.database import db
+    from application.controller.videointerview.routes import interview_routes
+
+    install_fake_backends(args.ai_latency_ms, args.transcription_latency_ms)
+    interview_routes.RECORDINGS_FOLDER = os.path.join(args.workdir, "recordings")
+    os.makedirs(interview_routes.RECORDINGS_FOLDER, exist_ok=True)
+
+    with app.app_context():
+        ids = seed_interviews(db, args.interviews)
+    with open(args.ids_file, "w", encoding="utf-8") as f:
+        json.dump(ids, f)
+
+    socketio.run(app, host="127.0.0.1", port=args.port, debug=False, use_reloader=False, log_output=False)
+
+
+# ---------------------------------------------------------------------------
+# Server process sampling (/proc, Linux)
+# ---------------------------------------------------------------------------
+class ProcSampler(threading.Thread):
+    """Samples RSS (MiB) and CPU (% of one core) of a pid every `interval` seconds."""
+
+    def __init__(self, pid, interval=0.5):
+        super().__init__(daemon=True)
+        self.pid = pid
+        self.interval = interval
+        self.rss_mib = []
+        self.cpu_pct = []
+        self._halt = threading.Event()
+        self._ticks = os.sysconf("SC_CLK_TCK")
+        self._page = os.sysconf("SC_PAGE_SIZE")
+
+    def _read(self):
+        with open(f"/proc/{self.pid}/stat", "r") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        # fields[0] is state (field 3); utime/stime are fields 14/15, rss is field 24
+        cpu_seconds = (int(fields[11]) + int(fields[12])) / self._ticks
+        rss = int(fields[21]) * self._page / (1024 * 1024)
+        return cpu_seconds, rss
+
+    def run(self):
+        try:
+            last_cpu, _ = self._read()
+        except OSError:
+            return
+        last_t = time.monotonic()
+        while not self._halt.wait(self.interval):
+            try:
+                cpu, rss = self._read()
+            except OSError:
+                return
+            now = time.monotonic()
+            self.cpu_pct.append(100 * (cpu - last_cpu) / max(now - last_t, 1e-9))
+            self.rss_mib.append(rss)
+            last_cpu, last_t = cpu, now
+
+    def stop(self):
+        self._halt.set()
+        self.join(timeout=2)
+
+
+# ---------------------------------------------------------------------------
+# Client side: simulated candidates
+# ---------------------------------------------------------------------------
+class Metrics:
+    """Thread-safe collector shared by all candidates."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.ack_ms = []
+        self.next_question_ms = []
+        self.first_delta_ms = []
+        self.chunks_sent = 0
+        self.chunks_dropped = 0
+        self.completed = 0
+        self.errors = []
+
+    def add(self, field, value):
+        with self.lock:
+            getattr(self, field).append(value)
+
+    def incr(self, field, by=1):
+        with self.lock:
+            setattr(self, field, getattr(self, field) + by)
+
+
+class Candidate(threading.Thread):
+    def __init__(self, url, interview_id, args, metrics):
+        super().__init__(daemon=True)
+        self.url = url
+        self.interview_id = interview_id
+        self.args = args
+        self.metrics = metrics
+        self.session_id = None
+        self.question_number = 0
+        self.question_event = threading.Event()
+        self.asked_at = None
+        self.complete_event = threading.Event()
+        self.pending = {}
+        self.pending_lock = threading.Lock()
+
+    # -- socket callbacks --
+    def _on_question(self, data):
+        self.question_number = data.get("question_number") or self.question_number + 1
+        self.question_event.set()
+
+    def _on_delta(self, data):
+        asked_at, self.asked_at = self.asked_at, None
+        if asked_at is not None:
+            self.metrics.add("first_delta_ms", (time.perf_counter() - asked_at) * 1000)
+
+    def _on_complete(self, data):
+        self.complete_event.set()
+
+    def _ack(self, key, sent_at):
+        def callback(response=None):
+            with self.pending_lock:
+                self.pending.pop(key, None)
+            if isinstance(response, dict) and response.get("ok"):
+                self.metrics.add("ack_ms", (time.perf_counter() - sent_at) * 1000)
+            else:
+                self.metrics.incr("chunks_dropped")
+        return callback
+
+    def _send_chunk(self, sio, event, number, payload):
+        key = (event, number)
+        sent_at = time.perf_counter()
+        with self.pending_lock:
+            self.pending[key] = sent_at
+        self.metrics.incr("chunks_sent")
+        sio.emit(event, {"sessionId": self.session_id, "chunkNumber": number, "data": payload},
+                 callback=self._ack(key, sent_at))
+
+    def _expire_pending(self, final=False):
+        """Chunks still unacknowledged after --ack-timeout (or at the end) count as dropped."""
+        deadline = time.perf_counter() - (0 if final else self.args.ack_timeout)
+        with self.pending_lock:
+            expired = [k for k, t in self.pending.items() if t < deadline]
+            for k in expired:
+                del self.pending[k]
+        if expired:
+            self.metrics.incr("chunks_dropped", len(expired))
+
+    def run(self):
+        import requests
+        import socketio
+
+        sio = socketio.Client(reconnection=False)
+        sio.on("question", self._on_question)
+        sio.on("questionDelta", self._on_delta)
+        sio.on("interviewComplete", self._on_complete)
+        try:
+            res = requests.post(f"{self.url}/video-interview/start/{self.interview_id}", json={}, timeout=30)
+            res.raise_for_status()
+            self.session_id = res.json()["session_id"]
+
+            sio.connect(self.url, wait_timeout=10)
+            sio.emit("joinInterview", {"sessionId": self.session_id, "speech_mode": "server"})
+            if not self.question_event.wait(self.args.question_timeout):
+                raise TimeoutError("no first question")
+            sio.emit("startRecording", {"sessionId": self.session_id})
+
+            video = os.urandom(self.args.video_chunk_kib * 1024)
+            audio = os.urandom(self.args.audio_chunk_kib * 1024)
+            interval = self.args.chunk_interval_ms / 1000
+            chunks_per_answer = max(1, math.ceil(self.args.answer_seconds / interval))
+            chunk_number = 0
+
+            for q in range(self.args.questions):
+                for _ in range(chunks_per_answer):
+                    chunk_number += 1
+                    self._send_chunk(sio, "videoChunk", chunk_number, video)
+                    self._send_chunk(sio, "audioChunk", chunk_number, audio)
+                    time.sleep(interval)
+                    self._expire_pending()
+
+                if q == self.args.questions - 1:
+                    break
+                current = self.question_number
+                self.question_event.clear()
+                asked_at = self.asked_at = time.perf_counter()
+                sio.emit("finishSpeaking", {"sessionId": self.session_id,
+                                            "answer": f"Synthetic answer {q + 1} from candidate {self.interview_id}."})
+                while self.question_number <= current:
+                    if not self.question_event.wait(self.args.question_timeout):
+                        raise TimeoutError(f"no question after answer {q + 1}")
+                    self.question_event.clear()
+                self.metrics.add("next_question_ms", (time.perf_counter() - asked_at) * 1000)
+
+            sio.emit("stopRecording", {"sessionId": self.session_id})
+            sio.emit("endInterview", {"sessionId": self.session_id})
+            if not self.complete_event.wait(self.args.question_timeout):
+                raise TimeoutError("no interviewComplete")
+
+            time.sleep(min(self.args.ack_timeout, 1.0))
+            self._expire_pending(final=True)
+            self.metrics.incr("completed")
+        except Exception as e:
+            self.metrics.add("errors", f"interview {self.interview_id}: {type(e).__name__}: {e}")
+        finally:
+            try:
+                sio.disconnect()
+            except Exception:
+                pass
+
+
+# ---------------------------------------------------------------------------
+# Orchestration
+# ---------------------------------------------------------------------------
+def percentile(samples, pct):
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[max(1, math.ceil(pct / 100 * len(ordered))) - 1]
+
+
+def summarize(metrics, sampler, candidates, elapsed):
+    def ms(v):
+        return round(v, 1) if v is not None else None
+
+    return {
+        "candidates": candidates,
+        "completed": metrics.completed,
+        "errors": len(metrics.errors),
+        "elapsed_s": round(elapsed, 1),
+        "chunks_sent": metrics.chunks_sent,
+        "chunks_dropped": metrics.chunks_dropped,
+        "drop_rate": round(metrics.chunks_dropped / metrics.chunks_sent, 4) if metrics.chunks_sent else 0.0,
+        "ack_p50_ms": ms(percentile(metrics.ack_ms, 50)),
+        "ack_p95_ms": ms(percentile(metrics.ack_ms, 95)),
+        "ack_p99_ms": ms(percentile(metrics.ack_ms, 99)),
+        "next_question_p50_ms": ms(percentile(metrics.next_question_ms, 50)),
+        "next_question_p95_ms": ms(percentile(metrics.next_question_ms, 95)),
+        "first_delta_p50_ms": ms(percentile(metrics.first_delta_ms, 50)),
+        "first_delta_p95_ms": ms(percentile(metrics.first_delta_ms, 95)),
+        "server_rss_peak_mib": ms(max(sampler.rss_mib)) if sampler and sampler.rss_mib else None,
+        "server_cpu_avg_pct": ms(mean(sampler.cpu_pct)) if sampler and sampler.cpu_pct else None,
+        "server_cpu_peak_pct": ms(max(sampler.cpu_pct)) if sampler and sampler.cpu_pct else None,
+    }
+
+
+def passes(report, args):
+    if report["errors"] or report["completed"] < report["candidates"]:
+        return False
+    if args.max_drop_rate is not None and report["drop_rate"] > args.max_drop_rate:
+        return False
+    if args.max_ack_p95_ms is not None and (report["ack_p95_ms"] or 0) > args.max_ack_p95_ms:
+        return False
+    if args.max_next_question_p95_ms is not None and (report["next_question_p95_ms"] or 0) > args.max_next_question_p95_ms:
+        return False
+    return True
+
+
+def run_level(url, interview_ids, args, server_pid):
+    metrics = Metrics()
+    sampler = ProcSampler(server_pid) if server_pid else None
+    if sampler:
+        sampler.start()
+
+    started = time.perf_counter()
+    candidates = [Candidate(url, iid, args, metrics) for iid in interview_ids]
+    delay = args.ramp_seconds / max(len(candidates), 1)
+    for c in candidates:
+        c.start()
+        time.sleep(delay)
+    for c in candidates:
+        c.join()
+    elapsed = time.perf_counter() - started
+
+    if sampler:
+        sampler.stop()
+    for line in metrics.errors[:5]:
+        print(f"   ⚠️ {line}")
+    report = summarize(metrics, sampler, len(candidates), elapsed)
+    report["session_cache"] = session_cache_stats(url)
+    return report
+
+
+def session_cache_stats(url):
+    """The server's L1 session cache counters, or None when /health doesn't report them."""
+    try:
+        with urllib.request.urlopen(f"{url}/video-interview/health", timeout=10) as response:
+            return json.loads(response.read()).get("session_cache")
+    except Exception:
+        return None
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(args, interviews):
+    workdir = tempfile.mkdtemp(prefix="interview-load-")
+    port = free_port()
+    ids_file = os.path.join(workdir, "interview_ids.json")
+    cmd = [
+        sys.executable, os.path.abspath(__file__), "serve",
+        "--port", str(port), "--workdir", workdir, "--ids-file", ids_file,
+        "--interviews", str(interviews),
+        "--ai-latency-ms", str(args.ai_latency_ms),
+        "--transcription-latency-ms", str(args.transcription_latency_ms),
+    ]
+    proc = subprocess.Popen(cmd, cwd=BACKEND_DIR)
+    url = f"http://127.0.0.1:{port}"
+
+    deadline = time.monotonic() + args.startup_timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"server exited with status {proc.returncode}")
+        if os.path.exists(ids_file):
+            try:
+                with socket.create_connection(("127.0.0.1", port), timeout=1):
+                    with open(ids_file, "r", encoding="utf-8") as f:
+                        return proc, url, json.load(f)
+            except OSError:
+                pass
+        time.sleep(0.25)
+    proc.terminate()
+    raise RuntimeError("server did not start in time")
+
+
+def run(args):
+    if args.chunk_interval_ms is None:
+        args.chunk_interval_ms = VIDEO_CHUNK_INTERVAL_MS
+    levels = args.sweep or [args.candidates]
+
+    proc = None
+    if args.url:
+        url, ids = args.url, list(args.interview_ids or [])
+        if len(ids) < sum(levels):
+            print(f"❌ --url needs at least {sum(levels)} fresh --interview-ids (one per candidate per level)")
+            sys.exit(2)
+        server_pid = args.server_pid
+    else:
+        print(f"🚀 Starting local server with fake AI/transcription ({sum(levels)} interviews)...")
+        proc, url, ids = start_server(args, sum(levels))
+        server_pid = proc.pid
+
+    reports = []
+    ceiling = None
+    try:
+        for n in levels:
+            print(f"\n👥 {n} concurrent candidates, {args.questions} questions each...")
+            level_ids, ids = ids[:n], ids[n:]
+            report = run_level(url, level_ids, args, server_pid)
+            report["passed"] = passes(report, args)
+            reports.append(report)
+            print(json.dumps(report, indent=2))
+            if not report["passed"]:
+                break
+            ceiling = n
+    finally:
+        if proc is not None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"levels": reports, "ceiling": ceiling}, f, indent=2)
+
+    if args.sweep:
+        print(f"\n📈 Concurrency ceiling: {ceiling if ceiling is not None else 'below ' + str(levels[0])}")
+    if ceiling is None:
+        sys.exit(1)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    r = sub.add_parser("run", help="Drive simulated candidates and report")
+    r.add_argument("--candidates", type=int, default=10)
+    r.add_argument("--sweep", type=int, nargs="+", default=None, help="Increasing concurrency levels to try")
+    r.add_argument("--questions", type=int, default=3)
+    r.add_argument("--answer-seconds", type=float, default=10)
+    r.add_argument("--chunk-interval-ms", type=int, default=None, help="Defaults to VIDEO_CHUNK_INTERVAL_MS")
+    r.add_argument("--video-chunk-kib", type=int, default=64)
+    r.add_argument("--audio-chunk-kib", type=int, default=16)
+    r.add_argument("--ramp-seconds", type=float, default=5)
+    r.add_argument("--ack-timeout", type=float, default=5, help="Seconds before an unacked chunk counts as dropped")
+    r.add_argument("--question-timeout", type=float, default=30)
+    r.add_argument("--max-ack-p95-ms", type=float, default=None)
+    r.add_argument("--max-next-question-p95-ms", type=float, default=None)
+    r.add_argument("--max-drop-rate", type=float, default=None)
+    r.add_argument("--url", default=None, help="Use an already running server instead of starting one")
+    r.add_argument("--interview-ids", type=int, nargs="+", default=None, help="Scheduled interviews (with --url)")
+    r.add_argument("--server-pid", type=int, default=None, help="Pid to sample RSS/CPU from (with --url)")
+    r.add_argument("--output", default=None, help="Write the JSON report here")
+    r.set_defaults(func=run)
+
+    s = sub.add_parser("serve", help="Local server with fake backends (started by `run`)")
+    s.add_argument("--port", type=int, default=8086)
+    s.add_argument("--workdir", default=tempfile.gettempdir())
+    s.add_argument("--ids-file", required=True)
+    s.add_argument("--interviews", type=int, default=50)
+    s.set_defaults(func=serve)
+
+    for p in (r, s):
+        p.add_argument("--ai-latency-ms", type=float, default=800, help="Simulated Gemini latency")
+        p.add_argument("--transcription-latency-ms", type=float, default=1500, help="Simulated Azure connect time")
+    r.add_argument("--startup-timeout", type=float, default=60)
+    return parser
+
+
+def main():
+    args = build_parser().parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Startup Profiler
+================
+Measures cold start of the backend: how long `import main` (which builds the
+app) takes, and where the import time goes.
+
+Each run is a fresh interpreter started with `-X importtime`; the report
+shows the median wall time over --runs, the slowest modules by cumulative
+import time, and totals per top-level package (self time, so nothing is
+counted twice).
+
+Usage:
+    python benchmarks/profile_startup.py [--runs 5] [--top 25]
+    python benchmarks/profile_startup.py --module application.controller.resume_parser.parser_service
+    python benchmarks/profile_startup.py --json startup.json
+
+Redis and the database URL are taken from the environment as usual; pass
+--redis-url to point at a dead port and confirm boot doesn't wait on Redis.
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+import tempfile
+from collections import defaultdict
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# "import time:       123 |       4567 |     package.module"
+IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+# Modules that should no longer load at startup
+WATCHED = (
+    "google.generativeai",
+    "azure.cognitiveservices.speech",
+    "PyPDF2",
+    "docx2txt",
+    "reportlab",
+)
+
+
+def parse_importtime(stderr):
+    """Return [(module, self_us, cumulative_us, depth)] from -X importtime output."""
+    rows = []
+    for line in stderr.splitlines():
+        m = IMPORTTIME_RE.match(line)
+        if not m:
+            continue
+        self_us, cumulative_us, indent, module = m.groups()
+        rows.append((module, int(self_us), int(cumulative_us), len(indent) // 2))
+    return rows
+
+
+def run_once(module, env):
+    code = (
+        "import time, sys\n"
+        "t0 = time.perf_counter()\n"
+        f"import {module}\n"
+        "sys.stdout.write(repr(time.perf_counter() - t0))\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        tail = "\n".join(proc.stderr.splitlines()[-15:])
+        raise RuntimeError(f"`import {module}` failed:\n{tail}")
+    return float(proc.stdout.strip().splitlines()[-1]), parse_importtime(proc.stderr)
+
+
+def summarize(rows, top):
+    slowest = sorted(rows, key=lambda r: r[2], reverse=True)[:top]
+    by_package = defaultdict(int)
+    for module, self_us, _, _ in rows:
+        by_package[module.split(".", 1)[0]] += self_us
+    packages = sorted(by_package.items(), key=lambda kv: kv[1], reverse=True)[:top]
+    loaded = {r[0] for r in rows}
+    watched = {name: any(m == name or m.startswith(name + ".") for m in loaded) for name in WATCHED}
+    return slowest, packages, watched
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="main", help="Module to import (default: main, which builds the app)")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--redis-url", default=None, help="Override REDIS_URL for the child interpreters")
+    parser.add_argument("--json", dest="json_path", default=None, help="Write the report as JSON")
+    return parser
+
+
+def main():
+    args = build_parser().parse_args()
+
+    env = dict(os.environ)
+    env.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='startup-'), 'startup.db')}")
+    if args.redis_url:
+        env["REDIS_URL"] = args.redis_url
+
+    # The first run also warms the bytecode cache so runs are comparable
+    print(f"⏱  Importing `{args.module}` {args.runs} times (+1 warm-up)...")
+    run_once(args.module, env)
+    walls, rows = [], None
+    for _ in range(args.runs):
+        wall, rows = run_once(args.module, env)
+        walls.append(wall)
+
+    slowest, packages, watched = summarize(rows, args.top)
+
+    print(f"\n🚀 Cold start: median {statistics.median(walls) * 1000:.0f} ms "
+          f"(min {min(walls) * 1000:.0f}, max {max(walls) * 1000:.0f})")
+
+    print(f"\n{'cumulative ms':>14} {'self ms':>9}  module")
+    print("-" * 70)
+    for module, self_us, cumulative_us, depth in slowest:
+        print(f"{cumulative_us / 1000:>14.1f} {self_us / 1000:>9.1f}  {'  ' * min(depth, 6)}{module}")
+
+    print(f"\n{'self ms':>9}  top-level package")
+    print("-" * 40)
+    for package, self_us in packages:
+        print(f"{self_us / 1000:>9.1f}  {package}")
+
+    print("\nDeferred SDKs at startup:")
+    for name, was_loaded in watched.items():
+        print(f"  {'❌ loaded' if was_loaded else '✅ deferred':<12} {name}")
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "module": args.module,
+                "wall_ms": [round(w * 1000, 1) for w in walls],
+                "median_ms": round(statistics.median(walls) * 1000, 1),
+                "slowest": [{"module": m, "self_ms": s / 1000, "cumulative_ms": c / 1000} for m, s, c, _ in slowest],
+                "packages": [{"package": p, "self_ms": s / 1000} for p, s in packages],
+                "deferred": {name: not was_loaded for name, was_loaded in watched.items()},
+            }, f, indent=2)
+        print(f"\n💾 Report written to {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
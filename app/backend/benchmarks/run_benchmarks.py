@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Endpoint Benchmarks
+===================
+Boots the real app (`main.create_app`) against a freshly seeded SQLite
+database and measures the hot read endpoints plus resume parsing with a
+stubbed LLM. For every endpoint it records:
+
+    p50_ms / p95_ms   latency over --iterations requests (after warm-up)
+    queries           SQL statements issued by one request
+    peak_kib          peak Python allocations during one request (tracemalloc)
+
+Results are compared with a JSON baseline; the run exits with status 1 when a
+metric regresses beyond its tolerance, and also when there is nothing to compare
+against (no baseline, one recorded with another --scale/--with-cache, or one
+missing a measured endpoint). Latency depends on the machine, so record the
+baseline on the machine that runs the check.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--scale small|medium|large] [--iterations 30]
+    python benchmarks/run_benchmarks.py --update-baseline      # record a new baseline
+    python benchmarks/run_benchmarks.py --only job.opportunities company.dashboard
+
+The response cache is disabled (NullCache) so handlers are measured; pass
+--with-cache to benchmark with an in-process SimpleCache instead.
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import argparse
+import platform
+import tempfile
+import tracemalloc
+from datetime import date
+
+# Add the backend directory to path
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# Arguments for generate_bulk_data.generate
+SCALES = {
+    "small": dict(companies=5, jobs_per_company=10, hrs_per_company=2, applicants=500, applications_per_job=20),
+    "medium": dict(companies=20, jobs_per_company=25, hrs_per_company=2, applicants=5000, applications_per_job=50),
+    "large": dict(companies=100, jobs_per_company=50, hrs_per_company=3, applicants=50000, applications_per_job=200),
+}
+
+# Fixed so latencies stay comparable across runs
+SEED = 1234
+ANCHOR_DATE = date(2025, 1, 15)
+
+# Absolute slack added on top of the relative tolerance, so tiny numbers
+# (sub-millisecond latencies, a few KiB) don't flap
+LATENCY_SLACK_MS = 1.0
+MEMORY_SLACK_KIB = 64
+
+FAKE_LLM_RESPONSE = json.dumps({
+    "metadata": {
+        "name": "Bench Candidate",
+        "email": "bench@example.com",
+        "phone": "",
+        "skills": ["Python", "SQL", "Flask"],
+        "experience": [{"role": "Engineer", "company": "BenchCorp", "duration": "2020 - 2024",
+                        "responsibilities": ["Built APIs"]}],
+        "education": [{"degree": "B.Tech", "field": "CS", "university": "Bench University",
+                       "graduation_year": "2020"}],
+        "certifications": [],
+        "projects": [],
+    },
+    "score": 72,
+    "feedback": "Good overlap with the required skills.",
+})
+
+RESUME_TEXT = """Bench Candidate
+Software Engineer with 4 years of experience building Flask and React applications.
+Skills: Python, SQL, Flask, Docker, AWS, Redis, PostgreSQL.
+Experience: BenchCorp (2020 - 2024) - Built REST APIs, owned the search service.
+Education: B.Tech Computer Science, Bench University, 2020.
+"""
+
+
+# ---------------------------------------------------------------------------
+# Statistics and baseline comparison
+# ---------------------------------------------------------------------------
+def percentile(samples, pct):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def compare(current, baseline, latency_tolerance=0.25, memory_tolerance=0.25, query_tolerance=0):
+    """
+    Compare endpoint results with a baseline and return a list of regression
+    messages (empty when everything is within tolerance). Endpoints missing
+    from the baseline are ignored.
+    """
+    regressions = []
+    for name, now in sorted(current.items()):
+        before = baseline.get(name)
+        if not before:
+            continue
+        for metric in ("p50_ms", "p95_ms"):
+            limit = before[metric] * (1 + latency_tolerance) + LATENCY_SLACK_MS
+            if now[metric] > limit:
+                regressions.append(f"{name}: {metric} {now[metric]:.2f} > {limit:.2f} (baseline {before[metric]:.2f})")
+        if now["queries"] > before["queries"] + query_tolerance:
+            regressions.append(f"{name}: queries {now['queries']} > {before['queries'] + query_tolerance} "
+                               f"(baseline {before['queries']})")
+        limit = before["peak_kib"] * (1 + memory_tolerance) + MEMORY_SLACK_KIB
+        if now["peak_kib"] > limit:
+            regressions.append(f"{name}: peak_kib {now['peak_kib']:.0f} > {limit:.0f} (baseline {before['peak_kib']:.0f})")
+    return regressions
+
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def baseline_problem(baseline, path, meta, endpoints):
+    """Why `baseline` cannot be compared with a run, or None when it can."""
+    if baseline is None:
+        return f"No baseline at {path}; run with --update-baseline to record one"
+    recorded = baseline.get("meta", {})
+    if (recorded.get("scale"), recorded.get("with_cache")) != (meta["scale"], meta["with_cache"]):
+        return (f"Baseline was recorded with scale={recorded.get('scale')} with_cache={recorded.get('with_cache')}, "
+                f"this run used scale={meta['scale']} with_cache={meta['with_cache']}")
+    missing = sorted(set(endpoints) - set(baseline.get("endpoints", {})))
+    if missing:
+        return f"Baseline has no entry for {', '.join(missing)}; run with --update-baseline --only {' '.join(missing)}"
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+class QueryCounter:
+    """Counts statements sent through an engine."""
+
+    def __init__(self, engine):
+        from sqlalchemy import event
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args, **kwargs):
+        self.count += 1
+
+
+def measure(client, request, counter, iterations, warmup):
+    """Run one endpoint and return its metrics."""
+    for _ in range(warmup):
+        response = request(client)
+        if response.status_code != 200:
+            raise RuntimeError(f"HTTP {response.status_code}: {response.get_data(as_text=True)[:300]}")
+
+    samples = []
+    for _ in range(iterations):
+        t0 = time.perf_counter()
+        request(client)
+        samples.append((time.perf_counter() - t0) * 1000)
+
+    counter.count = 0
+    request(client)
+    queries = counter.count
+
+    # tracemalloc slows allocation-heavy code, so memory gets its own pass
+    tracemalloc.start()
+    try:
+        request(client)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "p50_ms": round(percentile(samples, 50), 3),
+        "p95_ms": round(percentile(samples, 95), 3),
+        "queries": queries,
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def pick_targets(db, models):
+    """Busiest company and applicant, so the endpoints have real work to do."""
+    from sqlalchemy import func
+
+    company_id = (
+        db.session.query(models.JobPosting.company_id)
+        .join(models.Application, models.Application.job_id == models.JobPosting.id)
+        .group_by(models.JobPosting.company_id)
+        .order_by(func.count(models.Application.id).desc())
+        .limit(1)
+        .scalar()
+    )
+    applicant_id = (
+        db.session.query(models.Application.applicant_id)
+        .group_by(models.Application.applicant_id)
+        .order_by(func.count(models.Application.id).desc())
+        .limit(1)
+        .scalar()
+    )
+    job_id = (
+        db.session.query(models.Application.job_id)
+        .filter(models.Application.applicant_id == applicant_id)
+        .order_by(models.Application.id)
+        .limit(1)
+        .scalar()
+    )
+    return company_id, applicant_id, job_id
+
+
+def build_endpoints(company_id, applicant_id, job_id):
+    parse_form = {"applicantid": str(applicant_id), "jobid": str(job_id), "force": "1"}
+    return {
+        "job.opportunities": lambda c: c.get(f"/job/opportunities/{applicant_id}"),
+        "job.stats": lambda c: c.get(f"/job/stats/{company_id}"),
+        "shortlist.candidates": lambda c: c.get(f"/shortlist/{company_id}/candidates"),
+        "company.dashboard": lambda c: c.get(f"/company/dashboard/{company_id}"),
+        "applicant.dashboard": lambda c: c.get(f"/applicant_dashboard/{applicant_id}"),
+        "hr.interviews": lambda c: c.get(f"/api/hr/interviews/{company_id}"),
+        "resumeparser.parse_resume": lambda c: c.post("/resumeparser/parse-resume", data=parse_form),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--only", nargs="+", default=None, help="Endpoint names to run")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true", help="Write results as the new baseline")
+    parser.add_argument("--output", default=None, help="Also write this run's results to a JSON file")
+    parser.add_argument("--latency-tolerance", type=float, default=0.25, help="Allowed relative p50/p95 increase")
+    parser.add_argument("--memory-tolerance", type=float, default=0.25, help="Allowed relative peak memory increase")
+    parser.add_argument("--query-tolerance", type=int, default=0, help="Allowed extra queries per request")
+    parser.add_argument("--with-cache", action="store_true", help="Enable the response cache (SimpleCache)")
+    return parser
+
+
+def main():
+    args = build_parser().parse_args()
+    workdir = tempfile.mkdtemp(prefix="bench-")
+
+    # Must be set before the config module is imported
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    os.environ["CACHE_TYPE"] = "SimpleCache" if args.with_cache else "NullCache"
+    # No background outbox polling the database while we measure
+    os.environ["OFFER_OUTBOX_WORKER"] = "0"
+
+    import logging
+    logging.disable(logging.WARNING)
+
+    from main import app
+    from application.data import models
+    from application.data.database import db
+    from application.controller.resume_parser import parser_service
+    from flask_jwt_extended import create_access_token
+    from generate_bulk_data import generate
+
+    # No network: the benchmark measures our code around the LLM call
+    parser_service.call_gemini_once = lambda prompt: FAKE_LLM_RESPONSE
+
+    print(f"🌱 Seeding '{args.scale}' dataset into {workdir} ...")
+    with app.app_context():
+        t0 = time.perf_counter()
+        generate(db.session, seed=SEED, anchor_date=ANCHOR_DATE, log=lambda *a: None, **SCALES[args.scale])
+        print(f"   done in {time.perf_counter() - t0:.1f}s")
+
+        company_id, applicant_id, job_id = pick_targets(db, models)
+        resume_path = os.path.join(workdir, "resume.txt")
+        with open(resume_path, "w", encoding="utf-8") as f:
+            f.write(RESUME_TEXT)
+        profile = db.session.get(models.ApplicantProfile, applicant_id)
+        profile.resume_file_path = resume_path
+        db.session.commit()
+
+        counter = QueryCounter(db.engine)
+        token = create_access_token(identity={"id": applicant_id, "role": "applicant"})
+
+    client = app.test_client()
+    client.environ_base["HTTP_COOKIE"] = f"access_token_cookie={token}"
+
+    endpoints = build_endpoints(company_id, applicant_id, job_id)
+    if args.only:
+        unknown = set(args.only) - set(endpoints)
+        if unknown:
+            print(f"❌ Unknown endpoints: {', '.join(sorted(unknown))}. Choose from {', '.join(endpoints)}")
+            sys.exit(2)
+        endpoints = {name: endpoints[name] for name in args.only}
+
+    results = {}
+    print(f"\n{'endpoint':<28} {'p50 ms':>9} {'p95 ms':>9} {'queries':>8} {'peak KiB':>10}")
+    print("-" * 68)
+    for name, request in endpoints.items():
+        try:
+            metrics = measure(client, request, counter, args.iterations, args.warmup)
+        except Exception as e:
+            print(f"{name:<28} ❌ {e}")
+            sys.exit(1)
+        results[name] = metrics
+        print(f"{name:<28} {metrics['p50_ms']:>9.2f} {metrics['p95_ms']:>9.2f} "
+              f"{metrics['queries']:>8} {metrics['peak_kib']:>10.1f}")
+
+    report = {
+        "meta": {
+            "scale": args.scale,
+            "seed": SEED,
+            "iterations": args.iterations,
+            "with_cache": args.with_cache,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "endpoints": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+    if args.update_baseline:
+        baseline = load_baseline(args.baseline) or {"endpoints": {}}
+        baseline["meta"] = report["meta"]
+        baseline["endpoints"].update(results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"\n💾 Baseline written to {args.baseline}")
+        return
+
+    baseline = load_baseline(args.baseline)
+    problem = baseline_problem(baseline, args.baseline, report["meta"], results)
+    if problem:
+        print(f"\n❌ {problem}")
+        sys.exit(1)
+
+    regressions = compare(
+        results,
+        baseline.get("endpoints", {}),
+        latency_tolerance=args.latency_tolerance,
+        memory_tolerance=args.memory_tolerance,
+        query_tolerance=args.query_tolerance,
+    )
+    if regressions:
+        print("\n❌ Regressions against baseline:")
+        for line in regressions:
+            print(f"   - {line}")
+        sys.exit(1)
+    print("\n✅ Within tolerance of baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Bulk Synthetic Data Generator
+=============================
+Generates large, reproducible datasets for benchmarking. Rows are written
+with Core `insert()` executemany batches inside large transactions instead of
+one ORM commit per row, so a million applications take minutes, not hours.
+
+The same --seed (and --anchor-date) always produces the same rows.
+
+Usage:
+    python generate_bulk_data.py --companies 200 --jobs-per-company 50 \\
+        --applicants 100000 --applications-per-job 100 --seed 42
+
+    # Write into a separate database instead of db_dir/recruitement.db
+    python generate_bulk_data.py --database-url sqlite:////tmp/bench.db --reset
+
+Notes:
+    - Every generated user has the password "password123".
+    - Derived tables maintained by ORM listeners (hiring rollups) are rebuilt
+      at the end because Core inserts bypass those listeners.
+    - Ids continue from each table's max(id). On Postgres the id sequences
+      are moved past them at the end, so do not run it while the app writes.
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+from datetime import datetime, date, timedelta
+
+# Add the backend directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+JOB_TITLES = [
+    "Software Engineer", "Data Scientist", "Backend Developer", "Frontend Engineer",
+    "ML Engineer", "DevOps Engineer", "QA Engineer", "Product Analyst",
+]
+SKILL_POOL = [
+    "Python", "SQL", "Flask", "Django", "React", "Node.js", "JavaScript", "Java",
+    "Spring Boot", "C++", "Go", "Docker", "Kubernetes", "AWS", "Machine Learning",
+    "Pandas", "Git", "Redis", "PostgreSQL", "TypeScript",
+]
+LOCATIONS = ["Bengaluru", "Mumbai", "Chennai", "Delhi", "Pune", "Hyderabad", "Remote"]
+EMPLOYMENT_TYPES = ["Remote", "Hybrid", "On-site"]
+QUALIFICATIONS = ["B.Tech", "M.Tech", "B.Sc", "MCA", "MBA"]
+STAGES = ["Screening", "Round 1", "Round 2", "Final"]
+
+
+class BulkWriter:
+    """Buffers rows per table and flushes them as executemany batches."""
+
+    def __init__(self, session, batch_size):
+        self.session = session
+        self.batch_size = batch_size
+        self.buffers = {}
+        self.counts = {}
+
+    def add(self, table, row):
+        buf = self.buffers.setdefault(table, [])
+        buf.append(row)
+        if len(buf) >= self.batch_size:
+            self.flush(table)
+
+    def flush(self, table=None):
+        tables = [table] if table is not None else list(self.buffers)
+        for t in tables:
+            rows = self.buffers.get(t)
+            if rows:
+                self.session.execute(t.insert(), rows)
+                self.counts[t.name] = self.counts.get(t.name, 0) + len(rows)
+                self.buffers[t] = []
+
+
+def _next_id(session, column):
+    from sqlalchemy import func
+    return (session.query(func.max(column)).scalar() or 0) + 1
+
+
+def _sync_id_sequences(session, columns):
+    """
+    Ids are assigned here, not by the database. Postgres hands out ids from a
+    sequence per column that knows nothing about them, so move each sequence
+    to max(id); otherwise the app's next insert reuses a generated id.
+    """
+    bind = session.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+    from sqlalchemy import func, text
+    for column in columns:
+        last = session.query(func.max(column)).scalar()
+        if last is not None:
+            session.execute(text("SELECT setval(pg_get_serial_sequence(:table, :column), :last)"), {
+                "table": bind.dialect.identifier_preparer.format_table(column.table),
+                "column": column.name,
+                "last": last,
+            })
+    session.commit()
+
+
+def _role_link(roles_users, user_id, role_id):
+    row = {}
+    for col in roles_users.c:
+        if "user" in col.name:
+            row[col.name] = user_id
+        elif "role" in col.name:
+            row[col.name] = role_id
+    return row
+
+
+def generate(session, companies=20, jobs_per_company=20, hrs_per_company=2, applicants=5000,
+             applications_per_job=50, interview_ratio=0.2, offer_ratio=0.3, seed=42,
+             anchor_date=None, batch_size=10000, log=print):
+    """
+    Insert a synthetic dataset through `session` and return per-table row counts.
+
+    Applications per job are drawn without replacement from the applicant
+    pool; interviews are created for `interview_ratio` of applications and
+    offers for `offer_ratio` of interviewed applications.
+    """
+    from werkzeug.security import generate_password_hash
+    from application.data.models import (
+        Role, User, Company, HRProfile, ApplicantProfile, JobPosting,
+        Application, Interview, OfferLetter, Onboarding, roles_users,
+    )
+
+    rng = random.Random(seed)
+    anchor = anchor_date or date.today()
+    anchor_dt = datetime(anchor.year, anchor.month, anchor.day, 9, 0)
+    applications_per_job = min(applications_per_job, applicants)
+    writer = BulkWriter(session, batch_size)
+    password = generate_password_hash("password123")
+
+    for name in ("admin", "hr", "applicant", "company"):
+        if not session.query(Role).filter_by(name=name).first():
+            session.add(Role(name=name, description=f"{name} role"))
+    session.flush()
+    role_ids = {r.name: r.id for r in session.query(Role).all()}
+
+    user_id = _next_id(session, User.id)
+    company_id = _next_id(session, Company.id)
+    job_id = _next_id(session, JobPosting.id)
+    application_id = _next_id(session, Application.id)
+    interview_id = _next_id(session, Interview.id)
+    offer_id = _next_id(session, OfferLetter.id)
+    onboarding_id = _next_id(session, Onboarding.id)
+    tag = f"s{seed}u{user_id}"
+
+    def add_user(name, email, role):
+        nonlocal user_id
+        uid = user_id
+        user_id += 1
+        writer.add(User.__table__, {
+            "id": uid, "name": name, "email": email, "password_hashed": password, "role": role,
+        })
+        writer.add(roles_users, _role_link(roles_users, uid, role_ids[role]))
+        return uid
+
+    t0 = time.perf_counter()
+
+    # ---- Companies and HRs ----
+    company_hrs = {}
+    for c in range(companies):
+        owner = add_user(f"Owner {c}", f"owner{c}.{tag}@bench.local", "company")
+        cid = company_id
+        company_id += 1
+        writer.add(Company.__table__, {
+            "id": cid, "user_id": owner, "company_name": f"BenchCorp {c}",
+            "company_email": f"contact{c}.{tag}@bench.local",
+            "location": rng.choice(LOCATIONS), "technology": ", ".join(rng.sample(SKILL_POOL, 3)),
+            "company_size": rng.choice(["50-100", "100-200", "200-500", "500+"]),
+            "description": "Synthetic benchmark company",
+        })
+        company_hrs[cid] = []
+        for h in range(hrs_per_company):
+            hr_uid = add_user(f"HR {c}-{h}", f"hr{c}-{h}.{tag}@bench.local", "hr")
+            writer.add(HRProfile.__table__, {
+                "hr_id": hr_uid, "company_id": cid, "first_name": f"HR{c}", "last_name": f"Manager{h}",
+                "contact_email": f"hr{c}-{h}.{tag}@bench.local",
+            })
+            company_hrs[cid].append(hr_uid)
+    writer.flush()
+    log(f"🏢 {companies} companies, {companies * hrs_per_company} HRs")
+
+    # ---- Applicants ----
+    applicant_ids = []
+    for a in range(applicants):
+        uid = add_user(f"Applicant {a}", f"applicant{a}.{tag}@bench.local", "applicant")
+        writer.add(ApplicantProfile.__table__, {
+            "applicant_id": uid, "name": f"Applicant {a}",
+            "gender": rng.choice(["Male", "Female", "Other"]),
+            "highest_qualification": rng.choice(QUALIFICATIONS),
+            "institution_name": "Bench University",
+            "graduation_year": rng.randint(2012, 2024),
+            "skills": ", ".join(rng.sample(SKILL_POOL, rng.randint(3, 7))),
+            "years_of_experience": rng.randint(0, 12),
+            "preferred_location": rng.choice(LOCATIONS),
+        })
+        applicant_ids.append(uid)
+    writer.flush()
+    session.commit()
+    log(f"🧑‍💼 {applicants} applicants")
+
+    # ---- Jobs, applications, interviews, offers ----
+    for cid, hrs in company_hrs.items():
+        for _ in range(jobs_per_company):
+            jid = job_id
+            job_id += 1
+            hr_id = rng.choice(hrs)
+            created = anchor_dt - timedelta(days=rng.randint(0, 365), minutes=rng.randint(0, 1440))
+            writer.add(JobPosting.__table__, {
+                "id": jid, "hr_id": hr_id, "company_id": cid,
+                "job_title": rng.choice(JOB_TITLES), "level": rng.choice(["Junior", "Mid", "Senior"]),
+                "basic_salary": rng.randint(6, 40) * 100000,
+                "required_skills": ", ".join(rng.sample(SKILL_POOL, rng.randint(3, 6))),
+                "job_description": "Synthetic benchmark job", "required_experience": "0-5 years",
+                "location": rng.choice(LOCATIONS), "employment_type": rng.choice(EMPLOYMENT_TYPES),
+                "created_date": created, "status": "open" if rng.random() < 0.8 else "closed",
+                "num_positions": rng.randint(1, 5),
+            })
+
+            for applicant in rng.sample(applicant_ids, applications_per_job):
+                aid = application_id
+                application_id += 1
+                applied = created + timedelta(hours=rng.randint(1, 24 * 30))
+                interviewed = rng.random() < interview_ratio
+                offered = interviewed and rng.random() < offer_ratio
+                status = "offered" if offered else (
+                    "interview" if interviewed else rng.choice(["submitted", "submitted", "shortlisted", "rejected"])
+                )
+                writer.add(Application.__table__, {
+                    "id": aid, "job_id": jid, "applicant_id": applicant,
+                    "applied_date": applied, "status": status,
+                    "resume_score": round(rng.uniform(20, 95), 1),
+                })
+                if not interviewed:
+                    continue
+
+                interview_day = applied.date() + timedelta(days=rng.randint(1, 21))
+                completed = interview_day < anchor
+                writer.add(Interview.__table__, {
+                    "id": interview_id, "application_id": aid, "interview_date": interview_day,
+                    "interviewee_id": applicant, "interviewer_id": hr_id,
+                    "mode": rng.choice(["online", "video"]), "stage": rng.choice(STAGES),
+                    "duration_minutes": 60, "status": "completed" if completed else "scheduled",
+                    "result": ("selected" if offered else rng.choice(["rejected", None])) if completed else None,
+                })
+                interview_id += 1
+                if not offered:
+                    continue
+
+                joining = interview_day + timedelta(days=rng.randint(15, 60))
+                accepted = rng.random() < 0.6
+                writer.add(OfferLetter.__table__, {
+                    "id": offer_id, "application_id": aid, "candidate_id": applicant, "company_id": cid,
+                    "joining_date": joining, "ctc": rng.randint(8, 40) * 100000,
+                    "status": "accepted" if accepted else "sent",
+                })
+                offer_id += 1
+                if accepted:
+                    writer.add(Onboarding.__table__, {
+                        "id": onboarding_id, "application_id": aid, "contact_email": f"hr.{tag}@bench.local",
+                        "offer_accepted": True, "status": "pending", "joining_date": joining,
+                    })
+                    onboarding_id += 1
+        writer.flush()
+        session.commit()
+
+    elapsed = time.perf_counter() - t0
+    total_apps = writer.counts.get(Application.__tablename__, 0)
+    log(f"📝 {total_apps} applications in {elapsed:.1f}s ({total_apps / max(elapsed, 1e-9):,.0f} rows/s)")
+
+    _sync_id_sequences(session, [User.id, Company.id, JobPosting.id, Application.id,
+                                 Interview.id, OfferLetter.id, Onboarding.id])
+
+    # Core inserts bypass ORM listeners; rebuild derived tables in one pass
+    from application.controller.company.rollups import rebuild_hiring_rollups
+    rebuild_hiring_rollups()
+
+    return dict(writer.counts)
+
+
+def _tune_sqlite(session):
+    """Trade durability for speed while bulk loading a throwaway database."""
+    if session.get_bind().dialect.name == "sqlite":
+        from sqlalchemy import text
+        session.execute(text("PRAGMA synchronous=OFF"))
+        session.execute(text("PRAGMA journal_mode=MEMORY"))
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Generate a large deterministic dataset")
+    parser.add_argument("--companies", type=int, default=20)
+    parser.add_argument("--jobs-per-company", type=int, default=20)
+    parser.add_argument("--hrs-per-company", type=int, default=2)
+    parser.add_argument("--applicants", type=int, default=5000)
+    parser.add_argument("--applications-per-job", type=int, default=50)
+    parser.add_argument("--interview-ratio", type=float, default=0.2)
+    parser.add_argument("--offer-ratio", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--anchor-date", type=date.fromisoformat, default=None,
+                        help="Date the data is generated around (YYYY-MM-DD, default today)")
+    parser.add_argument("--batch-size", type=int, default=10000)
+    parser.add_argument("--database-url", default=None, help="Overrides DATABASE_URL")
+    parser.add_argument("--reset", action="store_true", help="Drop and recreate all tables first")
+    parser.add_argument("--fast-sqlite", action="store_true", help="PRAGMA synchronous=OFF while loading")
+    return parser
+
+
+def main():
+    args = build_parser().parse_args()
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("OFFER_OUTBOX_WORKER", "0")
+
+    from main import app
+    from application.data.database import db
+
+    with app.app_context():
+        print("\n" + "=" * 80)
+        print("🏭 BULK DATA GENERATOR")
+        print("=" * 80)
+        if args.reset:
+            print("🗑 Dropping and recreating all tables...")
+            db.drop_all()
+        db.create_all()
+        if args.fast_sqlite:
+            _tune_sqlite(db.session)
+
+        counts = generate(
+            db.session,
+            companies=args.companies,
+            jobs_per_company=args.jobs_per_company,
+            hrs_per_company=args.hrs_per_company,
+            applicants=args.applicants,
+            applications_per_job=args.applications_per_job,
+            interview_ratio=args.interview_ratio,
+            offer_ratio=args.offer_ratio,
+            seed=args.seed,
+            anchor_date=args.anchor_date,
+            batch_size=args.batch_size,
+        )
+
+        print("\n📋 ROWS WRITTEN:")
+        for table, count in sorted(counts.items()):
+            print(f"  ✅ {table}: {count:,}")
+        print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
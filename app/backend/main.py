@@ -13,7 +13,10 @@ import logging
 from dotenv import load_dotenv
 load_dotenv()  # Load environment variables from .env file
 import eventlet
-eventlet.monkey_patch()
+# Worker pools (application/utils/processes.py) import this file again as
+# __mp_main__; they only run library functions and stay unpatched, with no app
+if __name__ != '__mp_main__':
+    eventlet.monkey_patch()
 
 from flask import Flask, request, jsonify, send_from_directory
 from flask_migrate import Migrate
@@ -45,6 +48,8 @@ from application.controller.applicant.profile import applicant_profile_bp
 from application.controller.resume_parser.parser_service import resume_parser_bp
 
 from application.utils.config import LocalDevelopmentConfig
+from application.utils.cache import response_cache, register_default_tag_resolvers
+from application.utils.events import bus as event_bus, register_default_event_detectors
 
 from flask_restful import Api
 from application.data.database import db
@@ -300,27 +305,41 @@ def create_app():
 
     cache = Cache(app)
 
+    # Tag-invalidated response cache on top of the Flask-Caching backend
+    response_cache.init_app(app, cache)
+    register_default_tag_resolvers()
+
+    # Domain events derived from flushed rows (interview completed, offer accepted, profile or job edited)
+    register_default_event_detectors()
+
+    # Offer letter emails are rendered and sent off the request path
+    if not app.config.get("TESTING") and app.config.get("OFFER_OUTBOX_WORKER", True):
+        from application.controller.offer_letter.outbox import start_outbox_worker
+        start_outbox_worker(app)
+
     return app, api, cache, mail, socketio
 
-# Create app and get instances
-app, api, cache, mail, socketio = create_app()
-
-celery = make_celery(app)
-logger.info("✅ Celery initialized!")
-
-# Register REST API resources
-api.add_resource(HRApi, '/hr', '/hr/<int:hr_id>')
-api.add_resource(JobAPI, '/job', '/job/<int:job_id>')
-api.add_resource(ApplicantAPI, '/applicant', '/applicant/<int:applicant_id>')
-api.add_resource(ApplicationApi, '/application', '/application/<int:application_id>')
-api.add_resource(OfferLetterApi, '/offer_letter', '/offer_letter/<int:offer_letter_id>')
-api.add_resource(InterviewApi, '/interview', '/interview/<int:interview_id>')
-api.add_resource(OnboardingApi, '/onboarding', '/onboarding/<int:onboarding_id>')
-api.add_resource(HRInterviewList, '/api/hr/interviews/<int:company_id>')
-api.add_resource(HRInterviewDetail, '/api/hr/interview/<string:session_id>')
-api.add_resource(UserAPI, '/api/user', '/api/user/<int:user_id>')
-api.add_resource(ScheduleInterviewResource, '/api/interview/schedule/<int:application_id>/<int:hr_id>')
-api.add_resource(InterviewByApplication, '/api/interview/by-application/<int:application_id>')
+if __name__ != '__mp_main__':
+    # Create app and get instances
+    app, api, cache, mail, socketio = create_app()
+
+    celery = make_celery(app)
+    event_bus.bind_celery(celery)
+    logger.info("✅ Celery initialized!")
+
+    # Register REST API resources
+    api.add_resource(HRApi, '/hr', '/hr/<int:hr_id>')
+    api.add_resource(JobAPI, '/job', '/job/<int:job_id>')
+    api.add_resource(ApplicantAPI, '/applicant', '/applicant/<int:applicant_id>')
+    api.add_resource(ApplicationApi, '/application', '/application/<int:application_id>')
+    api.add_resource(OfferLetterApi, '/offer_letter', '/offer_letter/<int:offer_letter_id>')
+    api.add_resource(InterviewApi, '/interview', '/interview/<int:interview_id>')
+    api.add_resource(OnboardingApi, '/onboarding', '/onboarding/<int:onboarding_id>')
+    api.add_resource(HRInterviewList, '/api/hr/interviews/<int:company_id>')
+    api.add_resource(HRInterviewDetail, '/api/hr/interview/<string:session_id>')
+    api.add_resource(UserAPI, '/api/user', '/api/user/<int:user_id>')
+    api.add_resource(ScheduleInterviewResource, '/api/interview/schedule/<int:application_id>/<int:hr_id>')
+    api.add_resource(InterviewByApplication, '/api/interview/by-application/<int:application_id>')
 
 if __name__ == '__main__':
     app.debug = True
@@ -71,6 +71,24 @@ export const sendOfferLetter = async (applicationId, offerData = {}) => {
   }
 }
 
+/**
+ * Send offer letters to several candidates of a company in one request
+ * @param {number} companyId - Company ID
+ * @param {Array<number>|null} applicationIds - Application IDs, or null for all eligible candidates
+ * @param {Object} offerData - Shared offer details (salary, start_date, department, work_mode, benefits)
+ * @returns {Promise} Per-candidate report: { summary, results: [{ application_id, status, reason }] }
+ */
+export const sendBulkOfferLetters = async (companyId, applicationIds = null, offerData = {}) => {
+  try {
+    const body = applicationIds ? { ...offerData, application_ids: applicationIds } : { ...offerData, all_eligible: true }
+    const response = await api.post(`/offer/send_bulk/${companyId}`, body)
+    return response.data
+  } catch (error) {
+    console.error('Error sending bulk offer letters:', error)
+    throw error
+  }
+}
+
 /**
  * Get offer acceptance rate for a company
  * @param {number} companyId - Company ID
@@ -101,23 +119,6 @@ export const getOfferStatus = async (applicationId) => {
   }
 }
 
-/**
- * Bulk send offer letters to multiple candidates
- * @param {Array} applicationIds - Array of Application IDs
- * @returns {Promise} Response with bulk send results
- */
-export const sendBulkOfferLetters = async (applicationIds) => {
-  try {
-    const response = await api.post('/offer/send_bulk', {
-      application_ids: applicationIds
-    })
-    return response.data
-  } catch (error) {
-    console.error('Error sending bulk offer letters:', error)
-    throw error
-  }
-}
-
 // ========================================
 // EMAIL STATUS TRACKING HELPERS
 // ========================================
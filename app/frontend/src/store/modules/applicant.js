@@ -1,5 +1,8 @@
 import api from "@/services/api"
 
+// next_cursor of each opportunities page, for the current filters
+let opportunityCursors = { key: null, pages: {} }
+
 export default {
   namespaced: true,
 
@@ -240,13 +243,41 @@ export default {
       if (!user || !user.id)
         throw new Error("Applicant ID not found")
 
+      // A page reached from the one before it continues from that page's
+      // cursor (an index range read); other pages fall back to the page number
+      const key = JSON.stringify([user.id, role, search, perPage])
+      if (opportunityCursors.key !== key)
+        opportunityCursors = { key, pages: {} }
+      const cursor = page > 1 ? opportunityCursors.pages[page] : null
+
       const res = await api.get(
         `/job/opportunities/${user.id}`,
         {
-          params: { role, search, page, per_page: perPage }
+          params: cursor
+            ? { role, search, cursor, per_page: perPage }
+            : { role, search, page, per_page: perPage }
         }
       )
 
+      if (res.data.next_cursor)
+        opportunityCursors.pages[page + 1] = res.data.next_cursor
+
+      return res.data
+    },
+
+    // ------------------------------------------------------------------
+    // JOB RECOMMENDATIONS
+    // ------------------------------------------------------------------
+    async fetchJobRecommendations({ rootState }, { limit = 10 } = {}) {
+      const user = rootState.auth.currentUser
+      if (!user || !user.id)
+        throw new Error("Applicant ID not found")
+
+      const res = await api.get(
+        `/job/recommendations/${user.id}`,
+        { params: { limit } }
+      )
+
       return res.data
     },
 
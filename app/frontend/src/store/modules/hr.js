@@ -247,15 +247,34 @@ export default {
       return res.data.roles || [];
     },
 
-    async fetchCandidates({ commit }, { companyId, role, search, page, perPage }) {
+    // skill: comma-separated, candidates must list all of them; jobId narrows to one posting
+    // cursor: next_cursor of the previous page (takes precedence over page)
+    async fetchCandidates({ commit }, { companyId, role, search, page, perPage, sort, jobId, skill, cursor }) {
       const url = `/applications/${companyId}/candidates`;
       const res = await api.get(url, {
-        params: { role, search, page, per_page: perPage },
+        params: { role, search, page, per_page: perPage, sort, job_id: jobId, skill, cursor },
       });
       commit("SET_CANDIDATES_LIST", res.data);
       return res.data;
     },
 
+    // Groups of candidates whose resumes are near-duplicates of each other
+    async fetchDuplicateCandidates(_, { companyId, threshold }) {
+      const res = await api.get(`/applications/${companyId}/duplicates`, {
+        params: { threshold },
+      });
+      return res.data;
+    },
+
+    // BM25-rank a job's applicants; optionally queue LLM scoring for the best ones
+    async prefilterJobApplicants(_, { jobId, llmTopK, llmMinScore }) {
+      const res = await api.post(`/resumeparser/prefilter/${jobId}`, {
+        llm_top_k: llmTopK,
+        llm_min_score: llmMinScore,
+      });
+      return res.data;
+    },
+
     /* ---------------------------
        Candidate profile page
     ----------------------------*/
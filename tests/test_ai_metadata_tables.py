@@ -0,0 +1,166 @@
+# tests/test_ai_metadata_tables.py
+import json
+from sqlalchemy import event
+import application.controller.resume_parser.parser_service as parser_service
+from application.controller.resume_parser import metadata_store
+from application.controller.resume_parser.models import ApplicationMetadata, ApplicationSkill, ApplicationExperience
+from application.controller.applicant.models import ResumeDocument
+from application.data.database import db as _db
+from application.data.models import User, Role, Company, HRProfile, JobPosting, ApplicantProfile, Application
+
+METADATA = {
+    "name": "Jordan Lee",
+    "email": "jordan@example.com",
+    "phone": "+1 555 0100",
+    "skills": ["Python", "Flask", " python ", "PostgreSQL"],
+    "experience": [{"role": "Backend Engineer", "company": "Acme", "duration": "2019 - 2024",
+                    "responsibilities": ["Built REST APIs", "Ran on-call"]}],
+    "education": [{"degree": "BSc", "field": "Computer Science", "university": "State U", "graduation_year": 2018}],
+    "projects": [{"title": "Job board", "description": "Flask app", "technologies": ["Flask", "Redis"]}],
+    "certifications": ["AWS Certified Developer"],
+}
+
+# -------------- DB helper functions --------------
+def create_company(app, hr_id, jobs=1):
+    with app.app_context():
+        if not Role.query.filter_by(name="applicant").first():
+            _db.session.add(Role(name="applicant", description="applicant role"))
+        _db.session.add(User(id=hr_id, name="Meta HR", email=f"hr{hr_id}@test.local", password_hashed="pw"))
+        company = Company(company_name=f"MetaCo{hr_id}", user_id=hr_id, company_email=f"mt{hr_id}@test")
+        _db.session.add(company)
+        _db.session.flush()
+        _db.session.add(HRProfile(hr_id=hr_id, company_id=company.id, first_name="HR", last_name="Mt", contact_email="hr@mt.test"))
+        job_ids = []
+        for i in range(jobs):
+            job = JobPosting(hr_id=hr_id, company_id=company.id, job_title=f"Engineer {i}",
+                             required_skills="Python", job_description="Python services")
+            _db.session.add(job)
+            _db.session.flush()
+            job_ids.append(job.id)
+        _db.session.commit()
+        return company.id, job_ids
+
+def create_application(app, applicant_id, job_id, **fields):
+    with app.app_context():
+        resume_path = f"/tmp/resume_{applicant_id}.pdf"
+        if _db.session.get(User, applicant_id) is None:
+            _db.session.add(User(id=applicant_id, name=f"Cand {applicant_id}", email=f"cand{applicant_id}@test.local", password_hashed="pw"))
+            _db.session.add(ApplicantProfile(applicant_id=applicant_id, name=f"Cand {applicant_id}", resume_file_path=resume_path))
+            _db.session.add(ResumeDocument(applicant_id=applicant_id, file_path=resume_path, text="Python developer"))
+        application = Application(job_id=job_id, applicant_id=applicant_id, status="submitted", **fields)
+        _db.session.add(application)
+        _db.session.commit()
+        return application.id
+
+def store(app, application_id, metadata):
+    with app.app_context():
+        application = _db.session.get(Application, application_id)
+        application.resume_score, application.ai_feedback = 70, "Fine."
+        metadata_store.store_metadata(application, parser_service.validate_and_fix_metadata(dict(metadata)))
+        _db.session.commit()
+
+# ---------------- Tests ----------------
+
+def test_scoring_writes_tables_once_and_reads_skip_validation(client, app, monkeypatch):
+    _, (job_id,) = create_company(app, 8200)
+    application_id = create_application(app, 8201, job_id)
+    monkeypatch.setattr(parser_service, "call_gemini_once",
+                        lambda prompt: json.dumps({"metadata": METADATA, "score": 77, "feedback": "Good."}))
+
+    res = client.post("/resumeparser/parse-resume", data={"applicantid": 8201, "jobid": job_id})
+    assert res.status_code == 200
+    with app.app_context():
+        assert ApplicationMetadata.query.filter_by(application_id=application_id).count() == 1
+        skills = ApplicationSkill.query.filter_by(application_id=application_id).order_by(ApplicationSkill.position).all()
+        assert [(s.name, s.skill_key, s.job_id) for s in skills] == [
+            ("Python", "python", job_id), ("Flask", "flask", job_id), ("PostgreSQL", "postgresql", job_id)]
+        # the JSON copy stays until the backfill has been verified
+        assert json.loads(_db.session.get(Application, application_id).ai_metadata)["skills"] == [
+            "Python", "Flask", "PostgreSQL"]
+
+    def no_validation(metadata):
+        raise AssertionError("metadata re-validated on read")
+
+    monkeypatch.setattr(parser_service, "validate_and_fix_metadata", no_validation)
+    body = client.get(f"/resumeparser/application/{application_id}/ai-results").get_json()
+    assert body["processed"] is True and body["score"] == 77
+    metadata = body["metadata"]
+    assert metadata["skills"] == ["Python", "Flask", "PostgreSQL"]
+    assert metadata["experience"] == METADATA["experience"]
+    assert metadata["education"][0]["graduation_year"] == "2018"
+    assert metadata["projects"] == METADATA["projects"]
+    assert metadata["certifications"] == ["AWS Certified Developer"]
+    assert (metadata["name"], metadata["email"]) == ("Jordan Lee", "jordan@example.com")
+
+    # re-scoring replaces the rows instead of adding to them
+    monkeypatch.undo()
+    monkeypatch.setattr(parser_service, "call_gemini_once",
+                        lambda prompt: json.dumps({"metadata": {"skills": ["Go"]}, "score": 40, "feedback": "Meh."}))
+    client.post("/resumeparser/parse-resume", data={"applicantid": 8201, "jobid": job_id, "force": "true"})
+    with app.app_context():
+        assert metadata_store.load_metadata(application_id)["skills"] == ["Go"]
+        assert ApplicationExperience.query.filter_by(application_id=application_id).count() == 0
+
+
+def test_legacy_json_is_read_without_writes_and_copied_by_backfill(client, app):
+    _, (job_id,) = create_company(app, 8220)
+    legacy = json.dumps({"skills": ["Python"], "experience": ["Engineer at Acme (2020 - 2022)"]})
+    read_id = create_application(app, 8221, job_id, resume_score=60, ai_feedback="Ok.", ai_metadata=legacy)
+    backfill_id = create_application(app, 8222, job_id, resume_score=65, ai_feedback="Ok.", ai_metadata=legacy)
+    broken_id = create_application(app, 8223, job_id, resume_score=50, ai_feedback="Ok.", ai_metadata="{not json")
+
+    body = client.get(f"/resumeparser/application/{read_id}/ai-results").get_json()
+    assert body["processed"] is True
+    assert body["metadata"]["experience"] == [
+        {"role": "Engineer", "company": "Acme", "duration": "2020 - 2022", "responsibilities": []}]
+
+    with app.app_context():
+        assert metadata_store.load_metadata(read_id) is None  # a GET writes nothing
+        assert metadata_store.backfill_metadata(batch_size=1) == (2, 1)
+        assert metadata_store.load_metadata(backfill_id)["skills"] == ["Python"]
+        assert _db.session.get(Application, backfill_id).ai_metadata == legacy
+        assert metadata_store.load_metadata(broken_id) is None
+        assert _db.session.get(Application, broken_id).ai_metadata == "{not json"
+
+
+def test_metadata_of_many_applications_takes_one_query_per_table(client, app):
+    _, (job_id,) = create_company(app, 8230)
+    ids = [create_application(app, 8231 + i, job_id) for i in range(3)]
+    for i, application_id in enumerate(ids[:2]):
+        store(app, application_id, {"skills": [f"Skill {i}", "Python"], "experience": [f"Engineer at Co{i} (2020 - 2022)"]})
+
+    with app.app_context():
+        statements = []
+        listen = lambda *args: statements.append(args[2])
+        event.listen(_db.engine, "before_cursor_execute", listen)
+        try:
+            many = metadata_store.load_metadata_many(ids)
+        finally:
+            event.remove(_db.engine, "before_cursor_execute", listen)
+
+    assert len(statements) == 6
+    assert sorted(many) == ids[:2]
+    assert many[ids[1]]["skills"] == ["Skill 1", "Python"]
+    assert many[ids[0]]["experience"][0]["company"] == "Co0"
+
+
+def test_candidates_filter_by_job_and_skills(client, app):
+    company_id, (job_a, job_b) = create_company(app, 8240, jobs=2)
+    both = create_application(app, 8241, job_a)
+    python_only = create_application(app, 8242, job_a)
+    other_job = create_application(app, 8243, job_b)
+    create_application(app, 8244, job_a)  # not parsed yet
+    store(app, both, {"skills": ["Python", "Node JS"]})
+    store(app, python_only, {"skills": ["python"]})
+    store(app, other_job, {"skills": ["Python", "node  js"]})
+
+    def candidate_ids(**params):
+        res = client.get(f"/applications/{company_id}/candidates", query_string=params)
+        assert res.status_code == 200
+        return sorted(int(c["action_url"].rsplit("/", 1)[1]) for c in res.get_json()["candidates"])
+
+    assert candidate_ids(job_id=job_a, skill="PYTHON") == [both, python_only]
+    assert candidate_ids(job_id=job_a, skill="python, node js") == [both]
+    assert candidate_ids(skill="Node JS") == [both, other_job]
+    assert candidate_ids(job_id=job_b, skill="rust") == []
+    assert len(candidate_ids(job_id=job_a)) == 3
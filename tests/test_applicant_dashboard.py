@@ -276,3 +276,40 @@ def test_404_if_applicant_not_found(client, app):
         assert ApplicantProfile.query.get(non_existent) is None
     res = client.get(_dashboard(non_existent))
     assert res.status_code == 404
+
+def test_dashboard_costs_at_most_three_queries(client, app):
+    from sqlalchemy import event
+    hr = 5020
+    cand = 5021
+
+    create_user_id(app, hr)
+    comp = create_company_id(app, hr, company_name="QueryBudgetCo")
+    create_hr_profile_id(app, hr, comp)
+    create_applicant_profile(app, cand, name="Budget Candidate", skills="py")
+
+    # several applications/interviews so lazy loading would show up as extra queries
+    for n in range(4):
+        job = create_job_id(app, hr, comp, title=f"BudgetJob{n}")
+        app_id = create_application_id(app, job, cand, status=["submitted", "shortlisted", "rejected", "offered"][n])
+        create_interview_id(app, app_id, hr, interview_date=date.today() + timedelta(days=n + 1), status="scheduled")
+
+    statements = []
+    with app.app_context():
+        engine = _db.engine
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        res = client.get(_dashboard(cand))
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert_response(res, expected_status=200)
+    j = res.get_json()
+    assert j["application_status_counts"]["Applied"] == 1
+    assert j["application_status_counts"]["Shortlisted"] == 1
+    assert j["application_status_counts"]["Offer"] == 1
+    assert len(j["upcoming_interviews"]) == 4
+    assert len(statements) <= 3
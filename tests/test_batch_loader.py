@@ -0,0 +1,96 @@
+# tests/test_batch_loader.py
+import pytest
+from contextlib import contextmanager
+from datetime import date, timedelta
+from flask import Blueprint
+from sqlalchemy import event
+import application.controller.interview.controllers as interview_controllers
+import application.controller.offer_letter.controllers as offer_controllers
+from application.data.database import db as _db
+from application.data.models import (
+    User, Company, HRProfile, JobPosting, ApplicantProfile, Application, Interview
+)
+from application.utils.loader import BatchLoader
+
+# -------------- Register test-only routes --------------
+@pytest.fixture(scope="session", autouse=True)
+def register_test_routes(app):
+    test_bp = Blueprint("test_batch_loader_bp", __name__)
+    test_bp.add_url_rule("/cards/<int:company_id>", endpoint="test_loader_cards",
+                         view_func=interview_controllers.get_interview_cards, methods=["GET"])
+    test_bp.add_url_rule("/sorted/<int:hr_id>", endpoint="test_loader_sorted",
+                         view_func=interview_controllers.get_interviews_for_hr_sorted, methods=["GET"])
+    test_bp.add_url_rule("/eligible/<int:company_id>", endpoint="test_loader_eligible",
+                         view_func=offer_controllers.get_eligible_candidates, methods=["GET"])
+    app.register_blueprint(test_bp, url_prefix="/_test_loader")
+    yield
+
+@contextmanager
+def count_queries(app):
+    statements = []
+    with app.app_context():
+        engine = _db.engine
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+# -------------- DB helper functions --------------
+def seed_interviews(app, hr_user_id, num_candidates):
+    with app.app_context():
+        _db.session.add(User(id=hr_user_id, name=f"User{hr_user_id}", email=f"user{hr_user_id}@test.local", password_hashed="pw-hash"))
+        _db.session.commit()
+        c = Company(company_name=f"LoaderCo{hr_user_id}", user_id=hr_user_id, company_email=f"loader{hr_user_id}@test")
+        _db.session.add(c)
+        _db.session.commit()
+        _db.session.add(HRProfile(hr_id=hr_user_id, company_id=c.id, first_name="HR", last_name="Person", contact_email=f"hr{hr_user_id}@test"))
+        job = JobPosting(hr_id=hr_user_id, company_id=c.id, job_title="Loader Job", status="open")
+        _db.session.add(job)
+        _db.session.commit()
+        for n in range(num_candidates):
+            uid = hr_user_id + 1 + n
+            _db.session.add(User(id=uid, name=f"Cand {uid}", email=f"user{uid}@test.local", password_hashed="pw-hash"))
+            _db.session.add(ApplicantProfile(applicant_id=uid, name=f"Cand {uid}"))
+            application = Application(job_id=job.id, applicant_id=uid, status="submitted")
+            _db.session.add(application)
+            _db.session.flush()
+            _db.session.add(Interview(application_id=application.id, interviewee_id=uid, interviewer_id=hr_user_id,
+                                      interview_date=date.today() + timedelta(days=n),
+                                      status="completed", result="selected"))
+        _db.session.commit()
+        return c.id
+
+# ---------------- Tests ----------------
+
+def test_loader_batches_and_memoizes(client, app):
+    seed_interviews(app, 16001, 3)
+    with app.app_context():
+        loader = BatchLoader()
+        loader.want(ApplicantProfile, [16002, 16003, 16004, 99999])
+        assert loader.get(ApplicantProfile, 16002).name == "Cand 16002"
+        assert loader.get(ApplicantProfile, 16004).name == "Cand 16004"
+        assert loader.get(ApplicantProfile, 99999) is None
+        assert loader.queries == 1
+
+        # unknown ids are memoized, repeated lookups are free
+        assert loader.get(ApplicantProfile, 99999) is None
+        assert loader.get_many(ApplicantProfile, [16003])[16003].applicant_id == 16003
+        assert loader.queries == 1
+
+@pytest.mark.parametrize("path", ["cards/{company}", "sorted/{hr}", "eligible/{company}"])
+def test_query_count_independent_of_rows(client, app, path):
+    small = seed_interviews(app, 16100, 2)
+    large = seed_interviews(app, 16200, 8)
+
+    with count_queries(app) as small_queries:
+        r_small = client.get("/_test_loader/" + path.format(company=small, hr=16100))
+    with count_queries(app) as large_queries:
+        r_large = client.get("/_test_loader/" + path.format(company=large, hr=16200))
+
+    assert r_small.status_code == 200 and r_large.status_code == 200
+    assert len(large_queries) == len(small_queries)
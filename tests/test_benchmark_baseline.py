@@ -0,0 +1,41 @@
+# tests/test_benchmark_baseline.py
+from benchmarks.run_benchmarks import baseline_problem, compare, percentile
+
+BASELINE = {
+    "job.opportunities": {"p50_ms": 10.0, "p95_ms": 20.0, "queries": 4, "peak_kib": 400.0},
+}
+
+def result(**overrides):
+    metrics = dict(BASELINE["job.opportunities"])
+    metrics.update(overrides)
+    return {"job.opportunities": metrics}
+
+# ---------------- Tests ----------------
+
+def test_percentile_nearest_rank():
+    samples = list(range(1, 101))
+    assert percentile(samples, 50) == 50
+    assert percentile(samples, 95) == 95
+    assert percentile([7.0], 95) == 7.0
+
+def test_within_tolerance_passes():
+    assert compare(result(p50_ms=12.0, p95_ms=25.0, peak_kib=480.0), BASELINE) == []
+
+def test_latency_query_and_memory_regressions_are_reported():
+    regressions = compare(result(p95_ms=40.0, queries=5, peak_kib=900.0), BASELINE)
+    assert len(regressions) == 3
+    assert any("p95_ms" in r for r in regressions)
+    assert any("queries 5" in r for r in regressions)
+    assert any("peak_kib" in r for r in regressions)
+
+def test_query_tolerance_and_unknown_endpoints():
+    assert compare(result(queries=5), BASELINE, query_tolerance=1) == []
+    assert compare({"new.endpoint": {"p50_ms": 1e6, "p95_ms": 1e6, "queries": 999, "peak_kib": 1e6}}, BASELINE) == []
+
+def test_missing_or_mismatched_baseline_is_a_problem():
+    meta = {"scale": "small", "with_cache": False}
+    recorded = {"meta": dict(meta), "endpoints": BASELINE}
+    assert baseline_problem(recorded, "baseline.json", meta, result()) is None
+    assert "No baseline at baseline.json" in baseline_problem(None, "baseline.json", meta, result())
+    assert "scale=medium" in baseline_problem(recorded, "baseline.json", dict(meta, scale="medium"), result())
+    assert "company.dashboard" in baseline_problem(recorded, "baseline.json", meta, {**result(), "company.dashboard": {}})
@@ -0,0 +1,122 @@
+# tests/test_credentials.py
+import json
+import os
+import subprocess
+import sys
+import pytest
+from werkzeug.security import generate_password_hash
+from application.auth import credentials
+from application.data.database import db as _db
+from application.data.models import Role, User
+
+AUTH_BASE = "/auth"
+FAST_METHOD = "pbkdf2:sha256:2000"
+
+# Run with `python -c`: prints the heartbeat gaps seen while 16 logins hash at once
+LOGIN_STORM = """
+import eventlet
+eventlet.monkey_patch()
+import json, sys, time
+from flask import Flask
+from werkzeug.security import generate_password_hash
+from application.auth import credentials
+
+slow_method, tick = sys.argv[1], 0.01
+app = Flask("login-storm")
+app.config["PASSWORD_HASH_METHOD"] = slow_method
+
+def heartbeat(stop, gaps):
+    last = time.perf_counter()
+    while not stop[0]:
+        eventlet.sleep(tick)
+        now = time.perf_counter()
+        gaps.append(now - last - tick)
+        last = now
+
+def login_hash(_):
+    # green threads don't inherit the app context
+    with app.app_context():
+        return credentials.hash_password("pw")
+
+# Time one inline hash: the stall every heartbeat would see without offloading
+t0 = time.perf_counter()
+generate_password_hash("pw", method=slow_method)
+inline_stall = time.perf_counter() - t0
+
+stop, gaps = [False], []
+beat = eventlet.spawn(heartbeat, stop, gaps)
+eventlet.sleep(tick * 5)
+hashes = list(eventlet.GreenPool(16).imap(login_hash, range(16)))
+stop[0] = True
+beat.wait()
+print(json.dumps({
+    "patched": eventlet.patcher.is_monkey_patched("thread"),
+    "hashes": sum(h.startswith(slow_method) for h in hashes),
+    "beats": len(gaps),
+    "max_gap": max(gaps),
+    "inline_stall": inline_stall,
+}))
+"""
+
+@pytest.fixture
+def hash_method(app):
+    original = app.config.get("PASSWORD_HASH_METHOD")
+    app.config["PASSWORD_HASH_METHOD"] = FAST_METHOD
+    yield FAST_METHOD
+    if original is None:
+        app.config.pop("PASSWORD_HASH_METHOD", None)
+    else:
+        app.config["PASSWORD_HASH_METHOD"] = original
+
+# -------------- DB helper functions --------------
+def create_user_with_hash(app, email, password_hashed):
+    with app.app_context():
+        if not Role.query.filter_by(name="applicant").first():
+            _db.session.add(Role(name="applicant", description="applicant role"))
+        user = User(name="Rehash Me", email=email, password_hashed=password_hashed, role="applicant")
+        _db.session.add(user)
+        _db.session.commit()
+        return user.id
+
+# ---------------- Tests ----------------
+
+def test_hash_and_verify_roundtrip(app, hash_method):
+    with app.app_context():
+        hashed = credentials.hash_password("s3cret")
+        assert hashed.startswith(FAST_METHOD + "$")
+        assert credentials.verify_password(hashed, "s3cret")
+        assert not credentials.verify_password(hashed, "wrong")
+        assert not credentials.verify_password("not-a-hash", "s3cret")
+        assert not credentials.needs_rehash(hashed)
+        assert credentials.needs_rehash(generate_password_hash("s3cret", method="pbkdf2:sha256:1000"))
+
+def test_login_rehashes_outdated_hash(client, app, hash_method):
+    old = generate_password_hash("oldpw", method="pbkdf2:sha256:1000")
+    user_id = create_user_with_hash(app, "rehash@example.com", old)
+
+    res = client.post(f"{AUTH_BASE}/login", json={"email": "rehash@example.com", "password": "oldpw"})
+    assert res.status_code == 200
+
+    with app.app_context():
+        stored = _db.session.get(User, user_id).password_hashed
+        assert stored != old
+        assert stored.startswith(FAST_METHOD + "$")
+
+    # still logs in with the upgraded hash; wrong password still rejected
+    assert client.post(f"{AUTH_BASE}/login", json={"email": "rehash@example.com", "password": "oldpw"}).status_code == 200
+    assert client.post(f"{AUTH_BASE}/login", json={"email": "rehash@example.com", "password": "nope"}).status_code == 401
+
+def test_ping_latency_flat_during_login_storm():
+    """A heartbeat green thread keeps ticking while 16 expensive hashes run."""
+    pytest.importorskip("eventlet")
+    # monkey_patch has to come first, so the storm gets a process of its own
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+    done = subprocess.run([sys.executable, "-c", LOGIN_STORM, "pbkdf2:sha256:300000"],
+                          capture_output=True, text=True, timeout=300, env=env)
+    assert done.returncode == 0, done.stderr
+    result = json.loads(done.stdout.strip().splitlines()[-1])
+
+    assert result["patched"] and result["hashes"] == 16
+    assert result["beats"] > 10
+    # The hub was never blocked for anything close to one inline hash
+    assert result["max_gap"] < max(result["inline_stall"] / 2, 0.05)
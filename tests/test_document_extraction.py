@@ -0,0 +1,105 @@
+# tests/test_document_extraction.py
+import time
+import pytest
+from application.controller.resume_parser import extraction
+from application.controller.resume_parser.parser_service import extract_text_from_file
+
+
+class SlowBackend:
+    name = "test-slow"
+
+    @staticmethod
+    def available():
+        return True
+
+    @staticmethod
+    def extract(path, start, stop):
+        time.sleep(30)
+        return 1, ["never"]
+
+
+@pytest.fixture
+def pool_config(app, monkeypatch):
+    """Worker pool on, small limits; the pool is torn down afterwards."""
+    extraction.register_backend(SlowBackend)
+    for key, value in {
+        "EXTRACTION_PROCESSES": 2,
+        "EXTRACTION_TIMEOUT_SECONDS": 1.0,
+        "EXTRACTION_MAX_PAGES": 10,
+        "EXTRACTION_PAGES_PER_TASK": 4,
+        "EXTRACTION_PDF_BACKEND": "pypdf2",
+    }.items():
+        monkeypatch.setitem(app.config, key, value)
+    yield app
+    extraction.shutdown_pool()
+    extraction.BACKENDS.pop(SlowBackend.name, None)
+
+# -------------- helper functions --------------
+def write_pdf(path, pages):
+    from reportlab.pdfgen import canvas
+
+    c = canvas.Canvas(str(path))
+    for page in range(pages):
+        c.drawString(50, 750, f"marker page {page + 1}")
+        c.showPage()
+    c.save()
+    return str(path)
+
+# ---------------- Tests ----------------
+
+def test_pool_extracts_page_ranges_in_order_up_to_the_page_limit(pool_config, tmp_path):
+    pdf = write_pdf(tmp_path / "long.pdf", 12)
+    with pool_config.app_context():
+        text = extract_text_from_file(pdf)
+        pages, total = extraction.extract_pdf_pages(pdf)
+
+    assert total == 12 and len(pages) == 10
+    markers = [line for line in text.splitlines() if line.startswith("marker")]
+    assert markers == [f"marker page {i}" for i in range(1, 11)]
+
+
+def test_timeout_kills_the_worker_and_the_pool_recovers(pool_config, tmp_path, monkeypatch):
+    pdf = write_pdf(tmp_path / "resume.pdf", 2)
+    with pool_config.app_context():
+        monkeypatch.setitem(pool_config.config, "EXTRACTION_PDF_BACKEND", SlowBackend.name)
+        started = time.monotonic()
+        with pytest.raises(extraction.ExtractionTimeout):
+            extract_text_from_file(pdf)
+        assert time.monotonic() - started < 5
+
+        monkeypatch.setitem(pool_config.config, "EXTRACTION_PDF_BACKEND", "pypdf2")
+        assert "marker page 2" in extract_text_from_file(pdf)
+
+
+
+def test_pool_that_does_not_start_in_time_falls_back_inline(pool_config, tmp_path, monkeypatch):
+    pdf = write_pdf(tmp_path / "resume.pdf", 2)
+    monkeypatch.setitem(pool_config.config, "EXTRACTION_POOL_START_SECONDS", 0.0)
+    monkeypatch.setattr(extraction, "_pool_retry_at", 0.0)
+    with pool_config.app_context():
+        assert "marker page 2" in extract_text_from_file(pdf)
+        assert extraction._pool is None
+        assert extraction._pool_retry_at > time.monotonic()  # not retried on every upload
+
+def test_inline_limits_and_errors(app, tmp_path, monkeypatch):
+    broken = tmp_path / "broken.pdf"
+    broken.write_bytes(b"%PDF-1.4 not really a pdf")
+    empty = tmp_path / "empty.txt"
+    empty.write_text("   ")
+    photo = tmp_path / "photo.png"
+    photo.write_bytes(b"\x89PNG")
+    with app.app_context():
+        assert extraction.current_limits().processes == 0  # no pool unless configured
+
+        with pytest.raises(FileNotFoundError):
+            extract_text_from_file(str(tmp_path / "missing.pdf"))
+        with pytest.raises(extraction.ExtractionError, match="Could not read broken.pdf"):
+            extract_text_from_file(str(broken))
+        with pytest.raises(ValueError, match="No text extracted from TXT"):
+            extract_text_from_file(str(empty))
+        with pytest.raises(ValueError, match="Unsupported file extension"):
+            extract_text_from_file(str(photo))
+
+        monkeypatch.setitem(app.config, "EXTRACTION_MAX_MB", 0.00001)
+        with pytest.raises(extraction.DocumentTooLarge):
+            extract_text_from_file(str(broken))
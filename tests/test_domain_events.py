@@ -0,0 +1,141 @@
+# tests/test_domain_events.py
+import json
+import pytest
+import application.controller.resume_parser.parser_service as parser_service
+from application.controller.resume_parser.metadata_store import load_metadata
+from application.controller.applicant.models import ResumeDocument
+from application.utils.events import (
+    bus, publish, INLINE, EVENT_TYPES, event_payload, event_from_payload,
+    ApplicationSubmitted, InterviewCompleted, OfferAccepted, ProfileUpdated
+)
+from application.data.database import db as _db
+from application.data.models import (
+    User, Role, ApplicantProfile, Company, HRProfile, JobPosting,
+    Application, Interview, OfferLetter
+)
+
+@pytest.fixture
+def received():
+    """Every committed domain event, recorded by an inline subscriber."""
+    seen = []
+
+    def record(evt):
+        seen.append(evt)
+
+    for event_type in EVENT_TYPES.values():
+        bus.subscribe(event_type, mode=INLINE)(record)
+    yield seen
+    bus.unsubscribe(record)
+
+# -------------- DB helper functions --------------
+def create_job_and_applicant(app, base_id, resume_text="Python developer, 6 years of Flask"):
+    """HR + company + job with an inline description, and an applicant whose resume text is stored."""
+    with app.app_context():
+        if not Role.query.filter_by(name="applicant").first():
+            _db.session.add(Role(name="applicant", description="applicant role"))
+        _db.session.add(User(id=base_id, name="Events HR", email=f"hr{base_id}@test.local", password_hashed="pw"))
+        _db.session.add(User(id=base_id + 1, name="Events Cand", email=f"cand{base_id}@test.local", password_hashed="pw"))
+        company = Company(company_name=f"EventsCo{base_id}", user_id=base_id, company_email=f"ev{base_id}@test")
+        _db.session.add(company)
+        _db.session.flush()
+        _db.session.add(HRProfile(hr_id=base_id, company_id=company.id, first_name="HR", last_name="Ev", contact_email="hr@ev.test"))
+        job = JobPosting(hr_id=base_id, company_id=company.id, job_title="Backend Engineer",
+                         job_description="Python, Flask and SQL for our hiring platform")
+        _db.session.add(job)
+        resume_path = f"/tmp/resume_{base_id}.pdf"
+        _db.session.add(ApplicantProfile(applicant_id=base_id + 1, name="Events Cand", resume_file_path=resume_path))
+        _db.session.add(ResumeDocument(applicant_id=base_id + 1, file_path=resume_path, text=resume_text))
+        _db.session.commit()
+        return job.id, base_id + 1
+
+# ---------------- Tests ----------------
+
+def test_apply_scores_after_commit_without_self_http(client, app, received, monkeypatch):
+    job_id, applicant_id = create_job_and_applicant(app, 7600)
+    monkeypatch.setitem(app.config, "EVENT_ASYNC_DISPATCH", "sync")
+    prompts = []
+
+    def fake_gemini(prompt):
+        prompts.append(prompt)
+        return json.dumps({"metadata": {"skills": ["Python", "Flask"]}, "score": 81, "feedback": "Good match."})
+
+    monkeypatch.setattr(parser_service, "call_gemini_once", fake_gemini)
+
+    res = client.post("/applications/apply", json={"applicant_id": applicant_id, "job_id": job_id, "resume_filename": "r.pdf"})
+    assert res.status_code == 201
+    application_id = res.get_json()["application_id"]
+
+    assert received == [ApplicationSubmitted(application_id, applicant_id, job_id)]
+    assert len(prompts) == 1 and "6 years of Flask" in prompts[0]
+    with app.app_context():
+        application = _db.session.get(Application, application_id)
+        assert application.resume_score == 81 and application.ai_feedback == "Good match."
+        assert load_metadata(application_id)["skills"] == ["Python", "Flask"]
+
+    # the endpoint shares the same scoring and stays idempotent
+    res = client.post("/resumeparser/parse-resume", data={"applicantid": applicant_id, "jobid": job_id})
+    assert res.get_json()["message"] == "Already processed"
+    assert len(prompts) == 1
+
+
+def test_background_handlers_are_skipped_under_testing_by_default(client, app, received, monkeypatch):
+    job_id, applicant_id = create_job_and_applicant(app, 7620)
+
+    def must_not_score(prompt):
+        raise AssertionError("scoring ran on the request path")
+
+    monkeypatch.setattr(parser_service, "call_gemini_once", must_not_score)
+    res = client.post("/applications/apply", json={"applicant_id": applicant_id, "job_id": job_id, "resume_filename": "r.pdf"})
+    assert res.status_code == 201
+    assert [type(e) for e in received] == [ApplicationSubmitted]
+
+
+def test_rolled_back_events_are_never_dispatched(app, received):
+    with app.app_context():
+        publish(ApplicationSubmitted(1, 2, 3))
+        _db.session.rollback()
+        _db.session.commit()
+    assert received == []
+
+
+def test_detected_events_for_interview_offer_and_profile(client, app, received):
+    job_id, applicant_id = create_job_and_applicant(app, 7640)
+    with app.app_context():
+        application = Application(job_id=job_id, applicant_id=applicant_id, status="interview_scheduled")
+        _db.session.add(application)
+        _db.session.flush()
+        interview = Interview(application_id=application.id, status="scheduled")
+        _db.session.add(interview)
+        _db.session.commit()
+        application_id, interview_id = application.id, interview.id
+    received.clear()
+
+    res = client.put(f"/interview/decision/{interview_id}", json={"decision": "approved"})
+    assert res.status_code == 200
+    assert received == [InterviewCompleted(interview_id, application_id, "approved")]
+
+    with app.app_context():
+        company_id = _db.session.get(JobPosting, job_id).company_id
+        offer = OfferLetter(application_id=application_id, candidate_id=applicant_id, company_id=company_id, ctc=100, status="sent")
+        _db.session.add(offer)
+        _db.session.commit()
+        offer_id = offer.id
+        # unrelated edits publish nothing
+        offer.ctc = 120
+        _db.session.commit()
+        assert [type(e) for e in received] == [InterviewCompleted]
+
+        offer.status = "accepted"
+        _db.session.commit()
+
+        profile = _db.session.get(ApplicantProfile, applicant_id)
+        profile.skills = "Python, Flask"
+        profile.name = "Events Candidate"
+        _db.session.commit()
+
+    assert received[1] == OfferAccepted(offer_id, application_id, applicant_id, company_id)
+    assert isinstance(received[2], ProfileUpdated) and received[2].applicant_id == applicant_id
+    assert {"name", "skills"} <= set(received[2].fields)
+    assert len(received) == 3
+    # events survive the round trip through a Celery payload
+    assert all(event_from_payload(json.loads(json.dumps(event_payload(e)))) == e for e in received)
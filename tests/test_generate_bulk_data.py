@@ -0,0 +1,84 @@
+# tests/test_generate_bulk_data.py
+from datetime import date
+from types import SimpleNamespace
+from sqlalchemy.dialects import postgresql
+from sqlalchemy import func
+from application.data.database import db as _db
+from application.data.models import Application, Interview, OfferLetter, JobPosting
+from application.controller.company.models import HiringSummaryRollup
+from generate_bulk_data import generate, _sync_id_sequences
+
+ANCHOR = date(2025, 6, 1)
+
+def run(seed):
+    return generate(_db.session, companies=2, jobs_per_company=3, hrs_per_company=1, applicants=20,
+                    applications_per_job=8, interview_ratio=0.5, offer_ratio=0.5, seed=seed,
+                    anchor_date=ANCHOR, batch_size=7, log=lambda *_: None)
+
+def application_rows(first_id):
+    rows = (Application.query.filter(Application.id >= first_id)
+            .order_by(Application.id).all())
+    return [(r.status, r.resume_score, r.applied_date) for r in rows]
+
+# ---------------- Tests ----------------
+
+def test_generates_requested_volume(client, app):
+    with app.app_context():
+        before = _db.session.query(func.count(Application.id)).scalar()
+        counts = run(seed=7)
+
+        assert counts[JobPosting.__table__.name] == 6
+        assert counts[Application.__table__.name] == 48
+        assert _db.session.query(func.count(Application.id)).scalar() == before + 48
+        interviews = counts.get(Interview.__table__.name, 0)
+        assert 0 < interviews < 48
+        assert counts.get(OfferLetter.__table__.name, 0) <= interviews
+
+        # distinct applicants per job
+        dupes = (_db.session.query(Application.job_id, Application.applicant_id, func.count())
+                 .group_by(Application.job_id, Application.applicant_id)
+                 .having(func.count() > 1).all())
+        assert dupes == []
+
+        # derived rollups are rebuilt after the Core inserts
+        assert HiringSummaryRollup.query.count() > 0
+
+def test_same_seed_produces_same_rows(client, app):
+    with app.app_context():
+        first = (_db.session.query(func.max(Application.id)).scalar() or 0) + 1
+        run(seed=11)
+        second = (_db.session.query(func.max(Application.id)).scalar() or 0) + 1
+        run(seed=11)
+
+        a = application_rows(first)[:48]
+        b = application_rows(second)
+        assert a == b
+
+def test_postgres_id_sequences_move_past_generated_ids(client, app):
+    class PostgresSession:
+        """Reports the Postgres dialect and records the statements it is given."""
+
+        def __init__(self, session):
+            self.session, self.statements = session, []
+
+        def get_bind(self):
+            return SimpleNamespace(dialect=postgresql.dialect())
+
+        def query(self, *args):
+            return self.session.query(*args)
+
+        def execute(self, statement, params=None):
+            self.statements.append((str(statement), params))
+
+        def commit(self):
+            pass
+
+    with app.app_context():
+        run(seed=13)
+        last = _db.session.query(func.max(Application.id)).scalar()
+        session = PostgresSession(_db.session)
+        _sync_id_sequences(session, [Application.id])
+        assert session.statements == [(
+            "SELECT setval(pg_get_serial_sequence(:table, :column), :last)",
+            {"table": Application.__table__.name, "column": "id", "last": last},
+        )]
@@ -0,0 +1,145 @@
+# tests/test_hiring_rollups.py
+import pytest
+from datetime import datetime, date, timedelta
+from application.data.database import db as _db
+from application.data.models import (
+    User, Company, HRProfile, JobPosting, ApplicantProfile,
+    Application, Interview, Onboarding
+)
+from application.controller.company.models import HiringSummaryRollup
+from application.controller.company.rollups import (
+    OPENINGS, ONBOARDED, INTERVIEWING,
+    get_hiring_summary, get_monthly_count, rebuild_hiring_rollups,
+    month_start, shift_months,
+)
+from application.controller.company import rollups
+
+# -------------- DB helper functions --------------
+def create_company_with_hr(app, hr_user_id, company_name):
+    with app.app_context():
+        _db.session.add(User(id=hr_user_id, name=f"User{hr_user_id}", email=f"user{hr_user_id}@test.local", password_hashed="pw-hash"))
+        _db.session.commit()
+        c = Company(company_name=company_name, user_id=hr_user_id, company_email=f"{company_name.lower()}@test")
+        _db.session.add(c)
+        _db.session.commit()
+        _db.session.add(HRProfile(hr_id=hr_user_id, company_id=c.id, first_name="HR", last_name="Person", contact_email=f"hr{hr_user_id}@test"))
+        _db.session.commit()
+        return c.id
+
+def create_job_id(app, hr_id, company_id, created_date):
+    with app.app_context():
+        job = JobPosting(hr_id=hr_id, company_id=company_id, job_title="Engineer", created_date=created_date, status="open")
+        _db.session.add(job)
+        _db.session.commit()
+        return job.id
+
+def create_application_id(app, job_id, user_id):
+    with app.app_context():
+        _db.session.add(User(id=user_id, name=f"User{user_id}", email=f"user{user_id}@test.local", password_hashed="pw-hash"))
+        _db.session.add(ApplicantProfile(applicant_id=user_id, name=f"Cand{user_id}"))
+        _db.session.commit()
+        application = Application(job_id=job_id, applicant_id=user_id, status="offered")
+        _db.session.add(application)
+        _db.session.commit()
+        return application.id
+
+def rollup_rows(app, company_id):
+    with app.app_context():
+        rows = HiringSummaryRollup.query.filter_by(company_id=company_id).all()
+        return {(r.metric, r.month): r.count for r in rows if r.count}
+
+# ---------------- Tests ----------------
+
+def test_month_helpers():
+    assert month_start(datetime(2024, 3, 17, 10, 5)) == date(2024, 3, 1)
+    assert month_start(date(2024, 3, 31)) == date(2024, 3, 1)
+    assert shift_months(date(2024, 1, 1), -1) == date(2023, 12, 1)
+    assert shift_months(date(2024, 11, 1), 3) == date(2025, 2, 1)
+
+def test_rollups_follow_insert_update_delete(client, app):
+    comp = create_company_with_hr(app, 13001, "RollupCo")
+    this_month = month_start(datetime.utcnow())
+    last_month = shift_months(this_month, -1)
+
+    job = create_job_id(app, 13001, comp, datetime.combine(this_month, datetime.min.time()))
+    app_id = create_application_id(app, job, 13010)
+
+    with app.app_context():
+        _db.session.add(Interview(application_id=app_id, interview_date=last_month + timedelta(days=2),
+                                  interviewee_id=13010, interviewer_id=13001, status="scheduled"))
+        _db.session.add(Onboarding(application_id=app_id, offer_accepted=True, status="pending",
+                                   joining_date=last_month + timedelta(days=4)))
+        _db.session.commit()
+
+    rows = rollup_rows(app, comp)
+    assert rows[(OPENINGS, this_month)] == 1
+    assert rows[(INTERVIEWING, last_month)] == 1
+    assert rows[(ONBOARDED, last_month)] == 1
+
+    # moving the interview moves the bucket
+    with app.app_context():
+        intr = Interview.query.filter_by(application_id=app_id).first()
+        intr.interview_date = this_month + timedelta(days=1)
+        _db.session.commit()
+    rows = rollup_rows(app, comp)
+    assert (INTERVIEWING, last_month) not in rows
+    assert rows[(INTERVIEWING, this_month)] == 1
+
+    # an onboarding that is no longer accepted drops out
+    with app.app_context():
+        ob = Onboarding.query.filter_by(application_id=app_id).first()
+        ob.offer_accepted = False
+        _db.session.commit()
+    assert (ONBOARDED, last_month) not in rollup_rows(app, comp)
+
+    # rebuild from source matches incremental maintenance
+    incremental = rollup_rows(app, comp)
+    with app.app_context():
+        rebuild_hiring_rollups(company_id=comp)
+    assert rollup_rows(app, comp) == incremental
+
+def test_onboarded_last_month_scoped_to_company(client, app):
+    comp_a = create_company_with_hr(app, 13101, "ScopeA")
+    comp_b = create_company_with_hr(app, 13102, "ScopeB")
+    last_month = shift_months(month_start(datetime.utcnow()), -1)
+
+    job_b = create_job_id(app, 13102, comp_b, datetime.utcnow())
+    app_b = create_application_id(app, job_b, 13110)
+    with app.app_context():
+        _db.session.add(Onboarding(application_id=app_b, offer_accepted=True, status="completed",
+                                   joining_date=last_month + timedelta(days=1)))
+        _db.session.commit()
+
+        assert get_monthly_count(comp_a, ONBOARDED, last_month) == 0
+        assert get_monthly_count(comp_b, ONBOARDED, last_month) == 1
+
+        summary = get_hiring_summary(comp_b, months=12)
+        assert summary[ONBOARDED] == {f"{last_month.year}-{last_month.month:02d}": 1}
+        assert get_hiring_summary(comp_a, months=12)[ONBOARDED] == {}
+
+def test_hiring_summary_limited_to_window(client, app):
+    comp = create_company_with_hr(app, 13201, "WindowCo")
+    old = datetime.utcnow() - timedelta(days=500)
+    create_job_id(app, 13201, comp, old)
+    create_job_id(app, 13201, comp, datetime.utcnow())
+
+    with app.app_context():
+        openings = get_hiring_summary(comp, months=12)[OPENINGS]
+    assert len(openings) == 1
+    assert sum(openings.values()) == 1
+
+
+@pytest.mark.parametrize("upsert", [True, False])
+def test_bump_creates_each_bucket_once(app, monkeypatch, upsert):
+    if not upsert:
+        monkeypatch.setattr(rollups, "_dialect_insert", lambda name: None)  # UPDATE / SAVEPOINT INSERT path
+    company_id = 13500 if upsert else 13501
+    may, june = date(2024, 5, 1), date(2024, 6, 1)
+    with app.app_context():
+        connection = _db.session.connection()
+        rollups._bump(connection, company_id, may, OPENINGS, 1)
+        rollups._bump(connection, company_id, may, OPENINGS, 2)
+        rollups._bump(connection, company_id, june, OPENINGS, -1)  # nothing to decrement
+        _db.session.commit()
+        assert HiringSummaryRollup.query.filter_by(company_id=company_id).count() == 1
+    assert rollup_rows(app, company_id) == {(OPENINGS, may): 3}
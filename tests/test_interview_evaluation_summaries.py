@@ -0,0 +1,133 @@
+# tests/test_interview_evaluation_summaries.py
+import json
+import pytest
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+from flask import Blueprint
+from flask_restful import Api as RestfulApi
+from application.controller.apis.interview_apis import HRInterviewList
+from application.controller.interview.models import InterviewEvaluationSummary
+from application.controller.interview.evaluation_summaries import backfill_from_recordings
+from application.controller.videointerview.services.recording_service import RecordingService
+from application.data.database import db as _db
+from application.data.models import (
+    User, Company, HRProfile, JobPosting, ApplicantProfile, Application, Interview
+)
+
+# -------------- Register test-only routes --------------
+@pytest.fixture(scope="session", autouse=True)
+def register_test_routes(app):
+    test_bp = Blueprint("test_eval_summaries_bp", __name__)
+    api = RestfulApi(test_bp)
+    api.add_resource(HRInterviewList, "/interviews/<int:company_id>")
+    app.register_blueprint(test_bp, url_prefix="/_test_eval_summaries")
+    yield
+
+# -------------- DB helper functions --------------
+def seed_completed_interviews(app, hr_user_id, count):
+    ids = []
+    with app.app_context():
+        _db.session.add(User(id=hr_user_id, name=f"User{hr_user_id}", email=f"user{hr_user_id}@test.local", password_hashed="pw-hash"))
+        _db.session.commit()
+        c = Company(company_name=f"EvalCo{hr_user_id}", user_id=hr_user_id, company_email=f"eval{hr_user_id}@test")
+        _db.session.add(c)
+        _db.session.commit()
+        _db.session.add(HRProfile(hr_id=hr_user_id, company_id=c.id, first_name="HR", last_name="Person", contact_email=f"hr{hr_user_id}@test"))
+        job = JobPosting(hr_id=hr_user_id, company_id=c.id, job_title="Eval Job", status="open")
+        _db.session.add(job)
+        _db.session.commit()
+        for n in range(count):
+            uid = hr_user_id + 1 + n
+            _db.session.add(User(id=uid, name=f"Cand {uid}", email=f"user{uid}@test.local", password_hashed="pw-hash"))
+            _db.session.add(ApplicantProfile(applicant_id=uid, name=f"Cand {uid}"))
+            application = Application(job_id=job.id, applicant_id=uid, status="submitted")
+            _db.session.add(application)
+            _db.session.flush()
+            intr = Interview(application_id=application.id, interviewee_id=uid, interviewer_id=hr_user_id,
+                             interview_date=date.today(), status="completed",
+                             interview_recording_url=f"/static/recordings/sess-{uid}/video.mp4")
+            _db.session.add(intr)
+            _db.session.flush()
+            ids.append(intr.id)
+        _db.session.commit()
+        return c.id, ids
+
+def fake_session(tmp_path, interview_id, session_id):
+    path = tmp_path / session_id
+    path.mkdir()
+    return SimpleNamespace(
+        session_id=session_id,
+        interview_id=interview_id,
+        recording_path=str(path),
+        job_title="Eval Job",
+        candidate_background={"name": "Cand"},
+        started_at=datetime.now(timezone.utc),
+        get_duration_minutes=lambda: 12.5,
+        conversation_history=[1, 2, 3, 4],
+        topics_covered=set(),
+        candidate_expertise_level="mid",
+    )
+
+def evaluation(rating, decision):
+    return {"overall_rating": rating, "recommendation": {"decision": decision, "reasoning": "r"}}
+
+# ---------------- Tests ----------------
+
+def test_recording_service_persists_summary(client, app, tmp_path):
+    _, (intr_id,) = seed_completed_interviews(app, 17001, 1)
+    session = fake_session(tmp_path, intr_id, "sess-17002")
+    service = RecordingService()
+
+    with app.app_context():
+        assert service.save_evaluation(session, evaluation(4.5, "Hire"))
+        assert service.save_metadata(session, evaluation(4.5, "Hire"))
+
+        summary = InterviewEvaluationSummary.query.filter_by(interview_id=intr_id).one()
+        assert summary.overall_rating == 4.5
+        assert summary.recommendation == "Hire"
+        assert summary.duration_minutes == 12.5
+        assert summary.questions_asked == 4
+        assert summary.session_id == "sess-17002"
+
+    # the JSON files are still written for HRInterviewDetail
+    assert json.loads((tmp_path / "sess-17002" / "evaluation.json").read_text())["overall_rating"] == 4.5
+
+def test_backfill_scans_recording_folders(client, app, tmp_path):
+    _, (first, second) = seed_completed_interviews(app, 17101, 2)
+
+    # folder with metadata carrying interview_id
+    (tmp_path / "sess-17102").mkdir()
+    (tmp_path / "sess-17102" / "metadata.json").write_text(json.dumps(
+        {"interview_id": first, "duration_minutes": 20, "questions_asked": 6}))
+    (tmp_path / "sess-17102" / "evaluation.json").write_text(json.dumps(evaluation(3.5, "Maybe")))
+    # folder resolved through Interview.interview_recording_url
+    (tmp_path / "sess-17103").mkdir()
+    (tmp_path / "sess-17103" / "evaluation.json").write_text(json.dumps(evaluation(2.0, "No Hire")))
+    # unrelated folder
+    (tmp_path / "orphan").mkdir()
+
+    with app.app_context():
+        written, skipped = backfill_from_recordings(str(tmp_path))
+        assert (written, skipped) == (2, 1)
+        by_id = {s.interview_id: s for s in InterviewEvaluationSummary.query.all()}
+        assert by_id[first].questions_asked == 6 and by_id[first].overall_rating == 3.5
+        assert by_id[second].recommendation == "No Hire"
+
+def test_hr_list_filters_and_sorts_by_rating(client, app):
+    company_id, ids = seed_completed_interviews(app, 17201, 3)
+    with app.app_context():
+        for intr_id, rating in zip(ids, [2.0, 4.5, 3.5]):
+            _db.session.add(InterviewEvaluationSummary(interview_id=intr_id, overall_rating=rating,
+                                                       recommendation="Hire" if rating > 3 else "No Hire",
+                                                       duration_minutes=10, questions_asked=5))
+        _db.session.commit()
+
+    res = client.get(f"/_test_eval_summaries/interviews/{company_id}?sort=rating&order=desc")
+    assert res.status_code == 200
+    ratings = [row["overall_rating"] for row in res.get_json()]
+    assert ratings == [4.5, 3.5, 2.0]
+
+    res = client.get(f"/_test_eval_summaries/interviews/{company_id}?min_rating=3&recommendation=Hire")
+    rows = res.get_json()
+    assert {row["interview_id"] for row in rows} == {ids[1], ids[2]}
+    assert all(row["questions_asked"] == 5 for row in rows)
@@ -0,0 +1,192 @@
+# tests/test_interview_warmup.py
+import json
+import pytest
+from types import SimpleNamespace
+import application.controller.resume_parser.parser_service as parser_service
+from application.controller.videointerview.services import ai_service, warmup_service
+from application.controller.videointerview.services.question_service import QuestionService
+from application.controller.videointerview.models import session_store as session_store_module
+from application.controller.videointerview.routes import interview_routes
+from application.controller.interview.models import InterviewWarmup
+from application.controller.applicant.models import ResumeDocument
+from application.utils.model_router import ModelRouter
+from application.data.database import db as _db
+from application.data.models import (
+    User, Role, Company, HRProfile, JobPosting, ApplicantProfile, Application, PreviousExperience
+)
+
+OPENING = "Welcome! What drew you to building hiring platforms with Flask?"
+FOLLOW_UPS = [
+    "How would you shard the applications table once it outgrows one Postgres node?",
+    "Walk me through how you would make resume scoring idempotent.",
+    "What would you cache in front of the job search endpoint, and how would you invalidate it?",
+]
+
+
+class FakeAI(ai_service.AIService):
+    """Answers follow-up prompts with FOLLOW_UPS as JSON and everything else with OPENING."""
+
+    def __init__(self):
+        self.initialized = True
+        self.primary_model = "fake"
+        self.fallback_models = []
+        self.timeout = 5
+        self.circuit_breaker = ai_service.CircuitBreaker()
+        self.router = ModelRouter(["fake"], call=self._generate_text)
+        self.prompts = []
+
+    def _call_gemini_with_retry(self, prompt, timeout=None, max_retries=3, hedge=False):
+        self.prompts.append(prompt)
+        if "JSON array" in prompt:
+            return "```json\n" + json.dumps(FOLLOW_UPS) + "\n```"
+        return OPENING
+
+
+class FakeSessionStore:
+    def __init__(self):
+        self.sessions = {}
+
+    def add(self, session):
+        self.sessions[session.session_id] = session
+        return True
+
+    def get_session_by_interview_id(self, interview_id):
+        return next((s for s in self.sessions.values() if s.interview_id == interview_id), None)
+
+    def session_exists(self, session_id):
+        return session_id in self.sessions
+
+# -------------- DB helper functions --------------
+def create_application(app, base_id):
+    """HR, company, job and an applicant with a stored resume who applied to the job."""
+    with app.app_context():
+        if not Role.query.filter_by(name="applicant").first():
+            _db.session.add(Role(name="applicant", description="applicant role"))
+        _db.session.add(User(id=base_id, name="Warm HR", email=f"hr{base_id}@test.local", password_hashed="pw"))
+        _db.session.add(User(id=base_id + 1, name="Warm Cand", email=f"cand{base_id}@test.local", password_hashed="pw"))
+        company = Company(company_name=f"WarmCo{base_id}", user_id=base_id, company_email=f"wm{base_id}@test")
+        _db.session.add(company)
+        _db.session.flush()
+        _db.session.add(HRProfile(hr_id=base_id, company_id=company.id, first_name="HR", last_name="Wm", contact_email="hr@wm.test"))
+        job = JobPosting(hr_id=base_id, company_id=company.id, job_title="Backend Engineer",
+                         required_skills="Python, Flask", job_description="Python and Flask services for hiring")
+        _db.session.add(job)
+        resume_path = f"/tmp/resume_{base_id + 1}.pdf"
+        _db.session.add(ApplicantProfile(applicant_id=base_id + 1, name="Warm Cand", skills="Python, Flask",
+                                         resume_file_path=resume_path))
+        _db.session.add(ResumeDocument(applicant_id=base_id + 1, file_path=resume_path,
+                                       text="Backend engineer, six years of Python and Flask"))
+        _db.session.flush()
+        application = Application(job_id=job.id, applicant_id=base_id + 1, status="shortlisted")
+        _db.session.add(application)
+        _db.session.commit()
+        return application.id, job.id, base_id + 1
+
+def schedule(client, application_id, hr_id):
+    res = client.post(f"/interview/schedule/{application_id}/{hr_id}", json={
+        "stage": "Technical Round", "interview_date": "2030-06-10", "interview_time": "14:30", "duration": 45})
+    assert res.status_code == 201
+    return res.get_json()["interview_id"]
+
+@pytest.fixture
+def fake_ai(app, monkeypatch):
+    ai = FakeAI()
+    monkeypatch.setattr(ai_service, "_ai_service_instance", ai)
+    monkeypatch.setitem(app.config, "EVENT_ASYNC_DISPATCH", "sync")
+    monkeypatch.setitem(app.config, "INTERVIEW_WARMUP_FOLLOW_UPS", 3)
+    return ai
+
+@pytest.fixture
+def sessions(monkeypatch, tmp_path):
+    store = FakeSessionStore()
+    monkeypatch.setattr(session_store_module, "session_store", store)
+    monkeypatch.setattr(interview_routes, "RECORDINGS_FOLDER", str(tmp_path))
+    return store
+
+# ---------------- Tests ----------------
+
+def test_scheduling_warms_up_and_start_is_a_lookup(client, app, fake_ai, sessions, monkeypatch):
+    application_id, job_id, applicant_id = create_application(app, 8300)
+    interview_id = schedule(client, application_id, 8300)
+
+    with app.app_context():
+        row = InterviewWarmup.query.filter_by(interview_id=interview_id).one()
+        assert (row.applicant_id, row.job_id, row.stale) == (applicant_id, job_id, False)
+        assert row.first_question == OPENING and json.loads(row.follow_ups) == FOLLOW_UPS
+        context = json.loads(row.context)
+        assert context["resume_text"] == "Backend engineer, six years of Python and Flask"
+        assert context["skills"] == ["Python", "Flask"] and context["company_name"] == "WarmCo8300"
+    assert len(fake_ai.prompts) == 2  # opening question + follow-up pool
+
+    # /start neither reads the resume nor calls the model
+    def no_resume(application, tried_paths_out=None):
+        raise AssertionError("resume read at start")
+
+    monkeypatch.setattr(parser_service, "get_resume_text_from_application", no_resume)
+    fake_ai.prompts.clear()
+    res = client.post(f"/video-interview/start/{interview_id}", json={})
+    assert res.status_code == 200
+    body = res.get_json()
+    assert body["warm_start"] is True and body["first_question"] == OPENING
+    assert fake_ai.prompts == []
+    session = sessions.sessions[body["session_id"]]
+    assert session.current_question == OPENING and session.job_title == "Backend Engineer"
+    assert session.candidate_background["follow_up_pool"] == FOLLOW_UPS
+    assert session.candidate_background["resume_summary"].startswith("Backend engineer")
+
+
+def test_profile_and_job_changes_make_the_warmup_stale(client, app, fake_ai, sessions, monkeypatch):
+    application_id, job_id, applicant_id = create_application(app, 8320)
+    interview_id = schedule(client, application_id, 8320)
+
+    # a new experience row rebuilds the warm-up with it
+    res = client.post(f"/applicant/{applicant_id}/experiences", json={
+        "position": "Staff Engineer", "company": "Acme", "start_date": "2020-01-01", "description": "Search"})
+    assert res.status_code == 201
+    with app.app_context():
+        row = InterviewWarmup.query.filter_by(interview_id=interview_id).one()
+        assert row.stale is False
+        assert [e["position"] for e in json.loads(row.context)["experiences"]] == ["Staff Engineer"]
+    assert len(fake_ai.prompts) == 4
+
+    # without rebuilding, a job edit leaves it stale and /start builds everything live
+    monkeypatch.setitem(app.config, "INTERVIEW_WARMUP", False)
+    with app.app_context():
+        _db.session.get(JobPosting, job_id).job_description = "Go and Kubernetes platform work"
+        _db.session.commit()
+        assert InterviewWarmup.query.filter_by(interview_id=interview_id).one().stale is True
+
+    fake_ai.prompts.clear()
+    res = client.post(f"/video-interview/start/{interview_id}", json={})
+    assert res.status_code == 200
+    body = res.get_json()
+    assert body["warm_start"] is False and body["first_question"] == OPENING
+    assert len(fake_ai.prompts) == 1 and "Go and Kubernetes" in fake_ai.prompts[0]
+    assert "follow_up_pool" not in sessions.sessions[body["session_id"]].candidate_background
+
+    # bulk deletes publish the change explicitly
+    monkeypatch.setitem(app.config, "INTERVIEW_WARMUP", True)
+    with app.app_context():
+        warmup_service.warm_up(interview_id)
+    assert client.delete(f"/applicant/{applicant_id}/experiences").status_code == 200
+    with app.app_context():
+        assert PreviousExperience.query.filter_by(applicant_id=applicant_id).count() == 0
+        assert json.loads(InterviewWarmup.query.filter_by(interview_id=interview_id).one().context)["experiences"] == []
+
+
+def test_follow_up_pool_feeds_instant_fallbacks():
+    assert warmup_service.parse_question_list("```json\n" + json.dumps(FOLLOW_UPS + ["Ok?", 7]) + "\n```", 5) == FOLLOW_UPS
+    assert warmup_service.parse_question_list("1. " + FOLLOW_UPS[0] + "\n2. " + FOLLOW_UPS[1] + "\nThanks.", 1) == FOLLOW_UPS[:1]
+    assert warmup_service.parse_question_list('{"questions": []}', 5) == []
+
+    service = QuestionService.__new__(QuestionService)
+    session = SimpleNamespace(
+        question_count=2, current_question=FOLLOW_UPS[0],
+        conversation_history=[{"question": OPENING, "answer": "I like Flask."}],
+        candidate_background={"follow_up_pool": FOLLOW_UPS},
+    )
+    assert service.get_instant_fallback(3, session) == FOLLOW_UPS[1]
+    session.conversation_history.append({"question": FOLLOW_UPS[1], "answer": "..."})
+    session.current_question = FOLLOW_UPS[2]
+    assert service.get_instant_fallback(4, session) == QuestionService.FALLBACK_QUESTIONS[3]
+    assert service.get_instant_fallback(1) == QuestionService.FALLBACK_QUESTIONS[0]
@@ -0,0 +1,218 @@
+# tests/test_job_recommendations.py
+import threading
+import pytest
+from cachelib import SimpleCache
+from sqlalchemy import update
+import application.controller.job.recommendations as recommendations
+from application.utils.cache import response_cache
+from application.data.database import db as _db
+from application.data.models import User, Role, Company, HRProfile, JobPosting, ApplicantProfile, Application
+
+@pytest.fixture(autouse=True)
+def fresh_index(app, monkeypatch):
+    """A new index per test, built inline unless a test turns the background build back on."""
+    monkeypatch.setitem(app.config, "RECOMMEND_BACKGROUND_BUILD", False)
+    recommendations.reset_index()
+    yield
+    recommendations.reset_index()
+
+def _recommend(applicant_id):
+    return f"/job/recommendations/{applicant_id}"
+
+# -------------- DB helper functions --------------
+def create_company(app, hr_id):
+    with app.app_context():
+        if not Role.query.filter_by(name="applicant").first():
+            _db.session.add(Role(name="applicant", description="applicant role"))
+        _db.session.add(User(id=hr_id, name="Rec HR", email=f"hr{hr_id}@test.local", password_hashed="pw"))
+        company = Company(company_name=f"RecCo{hr_id}", user_id=hr_id, company_email=f"rec{hr_id}@test")
+        _db.session.add(company)
+        _db.session.flush()
+        _db.session.add(HRProfile(hr_id=hr_id, company_id=company.id, first_name="HR", last_name="Rec", contact_email="hr@rec.test"))
+        _db.session.commit()
+        return company.id
+
+def create_job(app, hr_id, company_id, title, skills, description=""):
+    with app.app_context():
+        job = JobPosting(hr_id=hr_id, company_id=company_id, job_title=title, required_skills=skills,
+                         job_description=description, status="open")
+        _db.session.add(job)
+        _db.session.commit()
+        return job.id
+
+def create_applicant(app, applicant_id, skills, summary=""):
+    with app.app_context():
+        _db.session.add(User(id=applicant_id, name="Rec Cand", email=f"cand{applicant_id}@test.local", password_hashed="pw"))
+        _db.session.add(ApplicantProfile(applicant_id=applicant_id, name="Rec Cand", skills=skills, summary=summary))
+        _db.session.commit()
+
+# ---------------- Tests ----------------
+
+def test_ranks_by_similarity_and_matches_similar_skill_names(client, app):
+    hr = 7800
+    company_id = create_company(app, hr)
+    backend = create_job(app, hr, company_id, "Backend Engineer", "Python, Flask, PostgreSQL", "Build REST APIs in Python")
+    frontend = create_job(app, hr, company_id, "Frontend Developer", "JavaScript, React, CSS", "Build user interfaces")
+    finance = create_job(app, hr, company_id, "Accountant", "Excel, SAP, Auditing", "Monthly close and reporting")
+    applied = create_job(app, hr, company_id, "Python Developer", "Python, Django, Postgres", "Django services")
+    create_applicant(app, 7801, "python, flask, postgres", "Backend developer building APIs")
+    with app.app_context():
+        _db.session.add(Application(job_id=applied, applicant_id=7801, status="submitted"))
+        _db.session.commit()
+
+    res = client.get(_recommend(7801), query_string={"limit": 3})
+    assert res.status_code == 200
+    body = res.get_json()
+    ranked = [r["job_id"] for r in body["recommendations"]]
+
+    assert ranked[0] == backend
+    assert set(ranked) == {backend, frontend, finance}  # applied job excluded
+    top = body["recommendations"][0]
+    assert top["matched_skills"] == ["Python", "Flask", "PostgreSQL"]
+    assert top["skills_matched"] == "3/3"
+    assert body["engine"] == "tfidf-svd" and body["indexed_jobs"] == 4
+
+    res = client.get(_recommend(7801), query_string={"include_applied": "true", "limit": 2})
+    assert {r["job_id"] for r in res.get_json()["recommendations"]} == {backend, applied}
+
+    assert client.get(_recommend(99999)).status_code == 404
+
+
+def test_index_follows_job_changes_without_rebuilding(client, app):
+    hr = 7850
+    company_id = create_company(app, hr)
+    create_job(app, hr, company_id, "Accountant", "Excel, SAP", "Bookkeeping")
+    create_job(app, hr, company_id, "Frontend Developer", "React, CSS", "User interfaces")
+    create_applicant(app, 7851, "kubernetes, terraform, docker")
+
+    first = client.get(_recommend(7851)).get_json()
+    index = recommendations._index
+    assert first["indexed_jobs"] == 2 and index is not None
+
+    # a new posting is embedded incrementally and ranks first
+    devops = create_job(app, hr, company_id, "DevOps Engineer", "Kubernetes, Terraform, Docker", "Run our clusters")
+    body = client.get(_recommend(7851)).get_json()
+    assert recommendations._index is index
+    assert body["indexed_jobs"] == 3
+    assert body["recommendations"][0]["job_id"] == devops
+
+    # editing a posting re-embeds just that row
+    with app.app_context():
+        job = _db.session.get(JobPosting, devops)
+        job.job_title = "Payroll Clerk"
+        job.required_skills = "Excel, Payroll"
+        job.job_description = "Monthly payroll"
+        _db.session.commit()
+    body = client.get(_recommend(7851)).get_json()
+    assert recommendations._index is index
+    assert body["recommendations"][0]["job_id"] != devops
+
+    # deleted postings never come back
+    with app.app_context():
+        _db.session.delete(_db.session.get(JobPosting, devops))
+        _db.session.commit()
+    body = client.get(_recommend(7851)).get_json()
+    assert devops not in [r["job_id"] for r in body["recommendations"]]
+
+
+
+def test_background_build_serves_skill_overlap_until_the_index_is_ready(client, app, monkeypatch):
+    hr = 7870
+    company_id = create_company(app, hr)
+    data = create_job(app, hr, company_id, "Data Engineer", "Python, Spark, Airflow", "Pipelines")
+    create_job(app, hr, company_id, "Accountant", "Excel, SAP", "Bookkeeping")
+    create_applicant(app, 7871, "python, airflow")
+    monkeypatch.setitem(app.config, "RECOMMEND_BACKGROUND_BUILD", True)
+
+    building = threading.Event()
+    build_index = recommendations._build_index
+
+    def slow_build():
+        building.wait(5)
+        return build_index()
+
+    monkeypatch.setattr(recommendations, "_build_index", slow_build)
+    res = client.get(_recommend(7871))
+    body = res.get_json()
+    assert body["engine"] == recommendations.FALLBACK_ENGINE and body["indexed_jobs"] == 0
+    assert [r["job_id"] for r in body["recommendations"]] == [data]
+    assert body["recommendations"][0]["matched_skills"] == ["Python", "Airflow"]
+    assert "no-store" in res.headers["Cache-Control"]
+    assert recommendations._index is None
+
+    # a job posted while the build runs is indexed too
+    devops = create_job(app, hr, company_id, "DevOps Engineer", "Kubernetes, Python", "Clusters")
+    building.set()
+    recommendations.wait_for_build(5)
+    body = client.get(_recommend(7871)).get_json()
+    assert body["engine"] == "tfidf-svd" and body["indexed_jobs"] == 3
+    assert devops in [r["job_id"] for r in body["recommendations"]]
+
+def test_reconcile_runs_in_the_background_and_skips_our_own_changes(client, app, monkeypatch):
+    previous = response_cache.backend
+    response_cache.init_app(app, SimpleCache())
+    monkeypatch.setitem(app.config, "RECOMMEND_RECONCILE_SECONDS", 0)
+    try:
+        hr = 7890
+        company_id = create_company(app, hr)
+        create_job(app, hr, company_id, "Accountant", "Excel, SAP", "Bookkeeping")
+        payroll = create_job(app, hr, company_id, "Payroll Clerk", "Excel, Payroll", "Monthly payroll")
+        create_applicant(app, 7891, "kubernetes, terraform, docker")
+        assert client.get(_recommend(7891)).get_json()["indexed_jobs"] == 2
+
+        full_reads = []
+        job_rows = recommendations._job_rows
+
+        def counting_job_rows(job_ids=None):
+            if job_ids is None:
+                full_reads.append(threading.current_thread().name)
+            return job_rows(job_ids)
+
+        monkeypatch.setattr(recommendations, "_job_rows", counting_job_rows)
+        monkeypatch.setitem(app.config, "RECOMMEND_BACKGROUND_BUILD", True)
+
+        # our own edit bumps "jobs" but is applied from the stale set alone
+        devops = create_job(app, hr, company_id, "DevOps Engineer", "Kubernetes, Terraform, Docker", "Clusters")
+        body = client.get(_recommend(7891)).get_json()
+        assert body["recommendations"][0]["job_id"] == devops and body["indexed_jobs"] == 3
+        assert full_reads == []
+
+        # another worker's edit: no events here, just the tag version moving
+        with app.app_context():
+            _db.session.execute(update(JobPosting).where(JobPosting.id == payroll).values(
+                job_title="Platform Engineer", required_skills="Kubernetes, Terraform, Docker"))
+            _db.session.commit()
+        response_cache.backend.inc(response_cache._tag_key("jobs"))
+        client.get(_recommend(7891))
+        recommendations.wait_for_build(5)
+        assert full_reads == ["job-index-reconcile"]
+        body = client.get(_recommend(7891)).get_json()
+        assert {r["job_id"] for r in body["recommendations"][:2]} == {devops, payroll}
+        assert full_reads == ["job-index-reconcile"]
+    finally:
+        response_cache.backend = previous
+
+
+def test_vector_index_upsert_remove_and_search():
+    index = recommendations.JobVectorIndex(recommendations.HashedTfidfSvd(dimensions=4))
+    index.build([(i, f"job {i} python flask") for i in range(1, 9)] + [(9, "excel accounting audit")])
+    assert len(index) == 9
+
+    hits = index.search(index.embed("accounting"), limit=1)
+    assert hits[0][0] == 9
+
+    index.upsert([(10, "accounting payroll excel"), (9, "excel accounting audit")])  # 9 unchanged: skipped
+    assert len(index) == 10
+    index.remove([9])
+    assert [job_id for job_id, _ in index.search(index.embed("accounting"), limit=1)] == [10]
+    assert 9 not in index.job_ids()
+    hits = index.search(index.embed("python flask"), limit=3, exclude={1, 2})
+    assert len(hits) == 3 and {job_id for job_id, _ in hits} <= {3, 4, 5, 6, 7, 8}
+    assert [score for _, score in hits] == sorted((score for _, score in hits), reverse=True)
+
+
+def test_similar_skill_names():
+    assert recommendations.skills_similar("postgres", "PostgreSQL")
+    assert recommendations.skills_similar("Node.js", "nodejs")
+    assert not recommendations.skills_similar("Java", "JavaScript")
+    assert not recommendations.skills_similar("go", "golang")
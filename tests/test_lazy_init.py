@@ -0,0 +1,43 @@
+# tests/test_lazy_init.py
+import sys
+import pytest
+from application.utils.lazy import lazy_import, LazyObject
+
+# ---------------- Tests ----------------
+
+def test_lazy_module_imports_on_first_attribute():
+    sys.modules.pop("colorsys", None)
+    loaded = []
+    mod = lazy_import("colorsys", on_load=loaded.append)
+
+    assert not mod.loaded and "colorsys" not in sys.modules
+    assert mod.rgb_to_hsv(1.0, 0.0, 0.0)[0] == 0.0
+    assert mod.loaded and len(loaded) == 1
+
+    mod.ONE_THIRD  # no second on_load
+    assert len(loaded) == 1
+
+def test_lazy_object_retries_failed_factory():
+    calls = []
+
+    def factory():
+        calls.append(1)
+        if len(calls) == 1:
+            raise ConnectionError("redis down")
+        return {"ok": True}
+
+    store = LazyObject(factory)
+    assert not store.resolved
+    with pytest.raises(ConnectionError):
+        store.get("ok")
+    assert store.get("ok") is True
+    assert store.get("ok") is True
+    assert len(calls) == 2
+
+def test_readiness_reports_database_and_redis(client):
+    res = client.get("/health/ready")
+    body = res.get_json()
+    assert res.status_code == 200
+    assert body["checks"]["database"] == "ok"
+    assert "redis" in body["checks"]
+    assert body["status"] in ("ready", "degraded")
@@ -0,0 +1,127 @@
+# tests/test_model_router.py
+import time
+import pytest
+import application.controller.resume_parser.parser_service as parser_service
+from application.controller.videointerview.services import ai_service
+from application.utils import model_router
+from application.utils.model_router import ModelRouter, NoModelAvailable
+from benchmarks.fake_model_server import FakeModelServer
+
+QUESTION = "Which part of that migration would you design differently today?"
+
+# -------------- helper functions --------------
+@pytest.fixture
+def server():
+    with FakeModelServer({
+        "primary": {"latency_ms": 150},
+        "fast": {"latency_ms": 10},
+        "medium": {"latency_ms": 40},
+    }) as fake:
+        yield fake
+
+def warm(router, server, rounds=3):
+    """Give the router a few latency samples of every model."""
+    for _ in range(rounds):
+        for model in router.models:
+            started = time.monotonic()
+            server.call(model, "warm-up")
+            router.record_success(model, time.monotonic() - started)
+
+def make_ai_service(router):
+    ai = ai_service.AIService.__new__(ai_service.AIService)
+    ai.initialized = True
+    ai.primary_model = router.models[0]
+    ai.fallback_models = router.models[1:]
+    ai.timeout = 5
+    ai.circuit_breaker = ai_service.CircuitBreaker()
+    ai.router = router
+    return ai
+
+# ---------------- Tests ----------------
+
+def test_fastest_healthy_model_first_and_exhausted_quota_skipped(server):
+    skipped = [0.0]  # seconds added to the router's clock
+    router = ModelRouter(["primary", "fast", "medium"], call=server.call, quota_cooldown=60,
+                         clock=lambda: time.monotonic() + skipped[0])
+    assert router.ranked() == ["primary", "fast", "medium"]  # no samples: configured order
+    router.record_success("primary", 3.0)
+    assert router.ranked() == ["primary", "fast", "medium"]  # a slow measurement beats no measurement
+    router.record_success("medium", 0.5)
+    assert router.ranked() == ["medium", "primary", "fast"]
+    warm(router, server)
+    assert router.ranked() == ["fast", "medium", "primary"]
+    assert router.generate("prompt", timeout=2) == "fast: ok"
+
+    server.set("fast", quota=True)
+    assert router.generate("prompt", timeout=2) == "medium: ok"
+    calls = server.requests["fast"]
+    assert router.generate("prompt", timeout=2) == "medium: ok"
+    assert server.requests["fast"] == calls  # not asked again while cooling down
+    stats = {row["model"]: row for row in router.snapshot()}
+    assert stats["fast"]["rank"] is None and stats["fast"]["quota_cooldown_s"] > 0
+    assert stats["medium"]["rank"] == 1 and stats["medium"]["p50_ms"] < stats["primary"]["p50_ms"]
+
+    # a model that keeps failing is tried last; one back from its quota cooldown is tried again
+    server.set("medium", error_rate=1.0)
+    for _ in range(6):
+        assert router.generate("prompt", timeout=2) == "primary: ok"
+    assert router.ranked() == ["primary", "medium"]
+    server.set("fast", quota=False)
+    skipped[0] += 61
+    assert router.best() == "fast"
+
+
+def test_hedged_request_beats_a_slow_primary(server, monkeypatch):
+    monkeypatch.setattr(model_router, "HEDGE_MIN_SECONDS", 0.05)
+    router = ModelRouter(["medium", "fast"], call=server.call)
+    server.set("fast", latency_ms=60)
+    warm(router, server)
+    assert router.best() == "medium"
+
+    server.set("medium", latency_ms=3000)
+    started = time.monotonic()
+    assert router.generate("prompt", timeout=5, hedge=True) == "fast: ok"
+    assert time.monotonic() - started < 1.0
+    assert router.hedge_delay("medium") < 0.2  # from the p95 of the warm-up calls
+    assert server.requests == {"medium": 4, "fast": 4}
+
+    # while abandoned calls still hold pool threads, no new hedge is started
+    monkeypatch.setattr(model_router, "MAX_ABANDONED_ATTEMPTS", 0)
+    server.set("medium", latency_ms=300)
+    assert router.generate("prompt", timeout=5, hedge=True) == "medium: ok"
+    assert server.requests == {"medium": 5, "fast": 4}
+    monkeypatch.setattr(model_router, "MAX_ABANDONED_ATTEMPTS", 4)
+
+    # nothing answers: the call ends with the budget, not after every model's timeout
+    server.set("medium", latency_ms=3000)
+    server.set("fast", latency_ms=3000)
+    started = time.monotonic()
+    with pytest.raises(NoModelAvailable):
+        router.generate("prompt", timeout=2, budget=0.4, hedge=True)
+    assert time.monotonic() - started < 0.8
+
+
+def test_parser_and_interview_calls_go_through_the_router(app, server, monkeypatch):
+    monkeypatch.setattr(model_router, "HEDGE_MIN_SECONDS", 0.05)
+    server.set("fast", text='{"score": 80}')
+    monkeypatch.setattr(parser_service, "GEMINI_API_KEY", "test-key")
+    monkeypatch.setattr(parser_service, "router", ModelRouter(["primary", "fast"], call=server.call))
+    with app.app_context():
+        server.set("primary", quota=True)
+        assert parser_service.call_gemini_once("prompt") == '{"score": 80}'
+        server.set("fast", quota=True)
+        with pytest.raises(RuntimeError, match="All Gemini models failed"):
+            parser_service.call_gemini_once("prompt")
+
+    server.set("medium", text=QUESTION)
+    server.set("primary", quota=False, latency_ms=3000, text=QUESTION)
+    ai = make_ai_service(ModelRouter(["primary", "medium"], call=server.call))
+    started = time.monotonic()
+    assert ai.generate_question("prompt", fallback="Fallback?") == QUESTION
+    assert time.monotonic() - started < 2.5  # hedged to "medium" after the default delay
+    assert server.requests["medium"] == 1
+
+    server.set("primary", quota=True)
+    server.set("medium", quota=True)
+    assert ai.generate_question("prompt", fallback="Fallback?") == "Fallback?"
+    assert ai.circuit_breaker.failures == 1
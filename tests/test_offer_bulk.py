@@ -0,0 +1,140 @@
+# tests/test_offer_bulk.py
+import os
+from sqlalchemy import event
+from application.controller.offer_letter.bulk import send_bulk_offers
+from application.controller.offer_letter.models import OfferDelivery
+from tests.utils.smtp import smtp  # noqa: F401 (fixture)
+from application.data.database import db as _db
+from application.data.models import (
+    User, Company, HRProfile, JobPosting, ApplicantProfile,
+    Role, Application, Interview, OfferLetter
+)
+
+def _bulk(company_id):
+    return f"/offer/send_bulk/{company_id}"
+
+# -------------- DB helper functions --------------
+def create_company_with_candidates(app, base_id, eligible=0, pending=0, basic_salary=900000):
+    """
+    Company + job with `eligible` selected candidates and `pending` candidates
+    whose interview is still scheduled. Returns (company_id, eligible_app_ids, pending_app_ids).
+    """
+    with app.app_context():
+        if not Role.query.filter_by(name="applicant").first():
+            _db.session.add(Role(name="applicant", description="applicant role"))
+        hr = User(id=base_id, name="Bulk HR", email=f"hr{base_id}@test.local", password_hashed="pw")
+        _db.session.add(hr)
+        _db.session.flush()
+        company = Company(company_name=f"BulkCo{base_id}", user_id=hr.id, company_email=f"bulk{base_id}@test")
+        _db.session.add(company)
+        _db.session.flush()
+        _db.session.add(HRProfile(hr_id=hr.id, company_id=company.id, first_name="HR", last_name="Bulk", contact_email=f"hr{base_id}@bulk.test"))
+        job = JobPosting(hr_id=hr.id, company_id=company.id, job_title="Bulk Engineer", basic_salary=basic_salary)
+        _db.session.add(job)
+        _db.session.flush()
+
+        groups = {"completed": [], "scheduled": []}
+        uid = base_id
+        for status, count in (("completed", eligible), ("scheduled", pending)):
+            for _ in range(count):
+                uid += 1
+                _db.session.add(User(id=uid, name=f"Cand {uid}", email=f"cand{uid}@test.local", password_hashed="pw"))
+                _db.session.add(ApplicantProfile(applicant_id=uid, name=f"Cand {uid}", gender="male"))
+                _db.session.flush()
+                application = Application(job_id=job.id, applicant_id=uid, status="interviewed")
+                _db.session.add(application)
+                _db.session.flush()
+                _db.session.add(Interview(application_id=application.id, status=status,
+                                          result="selected" if status == "completed" else None))
+                groups[status].append(application.id)
+        _db.session.commit()
+        return company.id, groups["completed"], groups["scheduled"]
+
+# ---------------- Tests ----------------
+
+def test_bulk_all_eligible_sends_over_one_connection(client, app, smtp, tmp_path):
+    server = smtp()
+    app.config["OFFER_RENDER_PROCESSES"] = 2
+    company_id, eligible, pending = create_company_with_candidates(app, 9800, eligible=4, pending=2)
+
+    res = client.post(_bulk(company_id), json={"all_eligible": True, "start_date": "2026-01-05", "work_mode": "Hybrid"})
+    assert res.status_code == 200
+    report = res.get_json()
+
+    assert report["summary"] == {"sent": 4}
+    assert report["smtp_connections"] == 1
+    assert sorted(r["application_id"] for r in report["results"]) == sorted(eligible)
+    assert server.connections == 1 and len(server.messages) == 4
+
+    with app.app_context():
+        for result in report["results"]:
+            offer = _db.session.get(OfferLetter, result["offer_id"])
+            assert offer.status == "sent" and offer.ctc == 900000
+            delivery = OfferDelivery.query.filter_by(offer_id=offer.id).first()
+            assert delivery.status == OfferDelivery.SENT
+            assert os.path.dirname(delivery.pdf_path) == str(tmp_path)
+            assert Interview.query.filter_by(application_id=result["application_id"]).first().result == "offer letter sent"
+        for app_id in pending:
+            assert OfferLetter.query.filter_by(application_id=app_id).first() is None
+
+
+def test_bulk_reports_per_candidate_reasons(client, app, smtp):
+    smtp()
+    company_id, eligible, pending = create_company_with_candidates(app, 9850, eligible=2, pending=1)
+    other_company, other_eligible, _ = create_company_with_candidates(app, 9870, eligible=1)
+    no_salary_company, no_salary_eligible, _ = create_company_with_candidates(app, 9890, eligible=1, basic_salary=None)
+
+    res = client.post(_bulk(company_id), json={
+        "application_ids": [eligible[0], pending[0], other_eligible[0], 999999, "abc", eligible[1], eligible[0], "abc"]
+    })
+    assert res.status_code == 200
+    report = res.get_json()
+    by_id = {str(r["application_id"]): r for r in report["results"]}
+
+    assert report["requested"] == 6  # duplicates dropped
+    assert len(report["results"]) == 6
+    assert by_id[str(eligible[0])]["status"] == "sent"
+    assert by_id[str(eligible[1])]["status"] == "sent"
+    assert by_id[str(pending[0])]["status"] == "skipped" and "not eligible" in by_id[str(pending[0])]["reason"]
+    assert "another company" in by_id[str(other_eligible[0])]["reason"]
+    assert by_id["999999"]["reason"] == "Application not found"
+    assert by_id["abc"]["reason"] == "Invalid application id"
+    assert report["summary"] == {"sent": 2, "skipped": 4}
+
+    res = client.post(_bulk(no_salary_company), json={"application_ids": no_salary_eligible})
+    assert res.get_json()["results"][0]["reason"].startswith("Salary is required")
+    # an explicit salary covers jobs without a basic salary
+    res = client.post(_bulk(no_salary_company), json={"application_ids": no_salary_eligible, "salary": "1,000,000"})
+    assert res.get_json()["summary"] == {"sent": 1}
+
+
+def test_bulk_rejects_malformed_requests(client, app):
+    company_id, _, _ = create_company_with_candidates(app, 9900, eligible=1)
+    assert client.post(_bulk(company_id), json={}).status_code == 400
+    assert client.post(_bulk(company_id), json={"application_ids": []}).status_code == 400
+    assert client.post(_bulk(company_id), json={"all_eligible": True, "start_date": "05/01/2026"}).status_code == 400
+    assert client.post(_bulk(987654), json={"all_eligible": True}).status_code == 404
+
+
+def test_bulk_validation_query_count_does_not_grow_with_candidates(client, app):
+    """Skipped candidates cost no per-candidate queries: validation is set-based."""
+    small_company, _, small = create_company_with_candidates(app, 9920, pending=2)
+    large_company, _, large = create_company_with_candidates(app, 9940, pending=12)
+
+    def count_queries(company_id, ids):
+        counter = {"n": 0}
+
+        def before_cursor_execute(*args):
+            counter["n"] += 1
+
+        with app.test_request_context():
+            engine = _db.engine
+            event.listen(engine, "before_cursor_execute", before_cursor_execute)
+            try:
+                report = send_bulk_offers(company_id, {"application_ids": ids})
+            finally:
+                event.remove(engine, "before_cursor_execute", before_cursor_execute)
+        assert all(r["status"] == "skipped" for r in report["results"])
+        return counter["n"]
+
+    assert count_queries(large_company, large) == count_queries(small_company, small)
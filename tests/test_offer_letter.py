@@ -1,9 +1,11 @@
 # tests/test_offer_apis.py
+import os
 import pytest
 import json
 from datetime import date
 from flask import Blueprint
 import application.controller.offer_letter.controllers as offer_controllers
+import application.controller.offer_letter.outbox as outbox
 from application.data.database import db as _db
 from application.data.models import (
     User, Company, HRProfile, JobPosting, ApplicantProfile,
@@ -251,7 +253,7 @@ def test_get_eligible_candidates_returns_selected_after_completed(client, app):
     matched = [x for x in arr if int(x.get("application_id")) == application_id]
     assert matched and matched[0].get("email") == User.query.get(cand).email
 
-def test_send_offer_posts_and_calls_email_and_pdf(monkeypatch, client, app):
+def test_send_offer_queues_then_outbox_renders_and_emails(monkeypatch, client, app):
     hr_user = 9020
     cand = 9021
 
@@ -270,24 +272,29 @@ def test_send_offer_posts_and_calls_email_and_pdf(monkeypatch, client, app):
     # Create OfferLetter in DB; controller expects OfferLetter exists for application_id
     ol_id = create_offer_letter_id(app, application_id, comp, status="draft", candidate_id=cand)
 
-    # Monkeypatch the PDF/email utilities to avoid file IO or real email sending
+    # Monkeypatch the outbox's PDF renderer and SMTP connection to avoid file IO or real email sending
     called = {"pdf": False, "email": False, "pdf_path": None, "email_to": None}
 
-    def fake_generate_offer_letter_pdf(offer, offer_details=None):
+    def fake_render_offer_letter_pdfs(items, folder):
         called["pdf"] = True
-        # ensure the passed offer id matches
-        assert offer.id == ol_id
+        # ensure the rendered offer id matches
+        assert [data["offer_id"] for data in items] == [ol_id]
         called["pdf_path"] = "/tmp/fake_offer.pdf"
-        return called["pdf_path"]
+        return [called["pdf_path"]]
 
-    def fake_send_offer_email(email_to, pdf_path):
-        called["email"] = True
-        called["email_to"] = email_to
-        assert pdf_path == called["pdf_path"]
+    class FakeConnection:
+        def __enter__(self):
+            return self
 
-    # patch functions where they are imported in the controller module
-    monkeypatch.setattr(offer_controllers, "generate_offer_letter_pdf", fake_generate_offer_letter_pdf)
-    monkeypatch.setattr(offer_controllers, "send_offer_email", fake_send_offer_email)
+        def __exit__(self, *exc):
+            return False
+
+        def send(self, msg):
+            called["email"] = True
+            called["email_to"] = msg.recipients[0]
+
+    monkeypatch.setattr(outbox, "render_offer_letter_pdfs", fake_render_offer_letter_pdfs)
+    monkeypatch.setattr(outbox, "_open_connection", FakeConnection)
 
     # Send offer with required JSON data (salary is required)
     offer_data = {
@@ -298,12 +305,41 @@ def test_send_offer_posts_and_calls_email_and_pdf(monkeypatch, client, app):
         "work_mode": "Hybrid"
     }
     r = client.post(_send_offer(application_id), json=offer_data)
-    assert_response(r, expected_status=200, expected_message="offer letter sent")
+    assert_response(r, expected_status=202, expected_message="offer letter queued")
+    assert r.get_json()["offer_id"] == ol_id
+
+    # nothing is rendered or sent on the request path
+    with app.app_context():
+        assert called["pdf"] is False and called["email"] is False
+        assert OfferLetter.query.get(ol_id).status == "draft"
+        assert outbox.delivery_status(ol_id)["status"] == "queued"
+
+        stats = outbox.dispatch_pending()
+        assert stats["sent"] == 1
 
-    # verify that offer status updated to 'sent'
+    # verify that offer status updated to 'sent' once the outbox delivered it
     with app.app_context():
         ol = OfferLetter.query.filter_by(application_id=application_id).first()
         assert ol is not None
         assert ol.status == "sent"
+        assert Interview.query.filter_by(application_id=application_id).first().result == "offer letter sent"
         assert called["pdf"] is True and called["email"] is True
         assert called["email_to"] == User.query.get(cand).email
+        assert outbox.delivery_status(ol_id)["status"] == "sent"
+
+
+def test_render_pool_falls_back_inline_after_the_timeout(tmp_path):
+    from application.utils.pdf_utils import render_offer_letter_pdfs
+
+    letters = [{"offer_id": i, "candidate_name": f"Candidate {i}", "job_title": "Engineer", "department": "R&D",
+                "joining_date": "2030-01-01", "ctc": "100000", "work_mode": "Remote", "benefits": "None"}
+               for i in range(4)]
+    pooled = render_offer_letter_pdfs(letters + [{"offer_id": 99}], str(tmp_path), processes=2)
+    assert [os.path.basename(p) for p in pooled[:4]] == [f"offer_{i}.pdf" for i in range(4)]
+    assert isinstance(pooled[4], KeyError)
+
+    # nothing finishes within a zero timeout: every letter is rendered inline instead
+    for path in pooled[:4]:
+        os.remove(path)
+    inline = render_offer_letter_pdfs(letters, str(tmp_path), processes=2, timeout=0)
+    assert inline == pooled[:4] and all(os.path.exists(p) for p in inline)
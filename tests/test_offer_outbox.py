@@ -0,0 +1,128 @@
+# tests/test_offer_outbox.py
+import os
+from datetime import datetime, timedelta
+import application.controller.offer_letter.outbox as outbox
+from tests.utils.smtp import smtp  # noqa: F401 (fixture)
+from application.controller.offer_letter.models import OfferDelivery
+from application.data.database import db as _db
+from application.data.models import (
+    User, Company, HRProfile, JobPosting, ApplicantProfile,
+    Role, Application, Interview, OfferLetter
+)
+
+# -------------- DB helper functions --------------
+def create_offers(app, count, base_id=9500):
+    """Company + job + `count` selected candidates with an offer each; returns offer ids."""
+    with app.app_context():
+        if not Role.query.filter_by(name="applicant").first():
+            _db.session.add(Role(name="applicant", description="applicant role"))
+        hr = User(id=base_id, name="Outbox HR", email=f"hr{base_id}@test.local", password_hashed="pw")
+        _db.session.add(hr)
+        _db.session.flush()
+        company = Company(company_name="OutboxCo", user_id=hr.id, company_email="outbox@test")
+        _db.session.add(company)
+        _db.session.flush()
+        _db.session.add(HRProfile(hr_id=hr.id, company_id=company.id, first_name="HR", last_name="Outbox", contact_email="hr@outbox.test"))
+        job = JobPosting(hr_id=hr.id, company_id=company.id, job_title="Outbox Engineer", basic_salary=1200000)
+        _db.session.add(job)
+        _db.session.flush()
+
+        offer_ids = []
+        for i in range(1, count + 1):
+            uid = base_id + i
+            _db.session.add(User(id=uid, name=f"Cand {i}", email=f"cand{uid}@test.local", password_hashed="pw"))
+            _db.session.add(ApplicantProfile(applicant_id=uid, name=f"Cand {i}", gender="female"))
+            _db.session.flush()
+            application = Application(job_id=job.id, applicant_id=uid, status="interviewed")
+            _db.session.add(application)
+            _db.session.flush()
+            _db.session.add(Interview(application_id=application.id, status="completed", result="selected"))
+            offer = OfferLetter(application_id=application.id, candidate_id=uid, company_id=company.id, ctc=1200000, status="issued")
+            _db.session.add(offer)
+            _db.session.flush()
+            offer_ids.append(offer.id)
+        _db.session.commit()
+
+        for offer_id in offer_ids:
+            outbox.enqueue_offer(_db.session.get(OfferLetter, offer_id), {"work_mode": "Hybrid"}, sender="hr@outbox.test")
+        return offer_ids
+
+# ---------------- Tests ----------------
+
+def test_batch_is_rendered_and_sent_over_one_connection(client, app, smtp, tmp_path):
+    server = smtp()
+    offer_ids = create_offers(app, 3)
+
+    with app.app_context():
+        stats = outbox.dispatch_pending()
+        assert stats["sent"] == 3 and stats["connections"] == 1
+
+        for offer_id in offer_ids:
+            delivery = OfferDelivery.query.filter_by(offer_id=offer_id).first()
+            assert delivery.status == OfferDelivery.SENT and delivery.attempts == 1
+            assert os.path.dirname(delivery.pdf_path) == str(tmp_path)
+            with open(delivery.pdf_path, "rb") as f:
+                assert f.read(5) == b"%PDF-"
+            assert _db.session.get(OfferLetter, offer_id).status == "sent"
+            application = _db.session.get(Application, delivery.application_id)
+            assert application.status == "offered"
+
+        # nothing left to do
+        assert outbox.dispatch_pending()["claimed"] == 0
+
+    assert server.connections == 1
+    assert len(server.messages) == 3
+    assert all(b"application/pdf" in m for m in server.messages)
+
+    res = client.get(f"/offer/delivery/{offer_ids[0]}")
+    assert res.status_code == 200
+    assert res.get_json()["status"] == "sent"
+    assert client.get("/offer/delivery/999999").status_code == 404
+
+
+def test_reconnects_when_server_drops_the_connection(client, app, smtp):
+    server = smtp(drop_after=1)
+    create_offers(app, 2, base_id=9600)
+
+    with app.app_context():
+        stats = outbox.dispatch_pending()
+
+    assert stats["sent"] == 2 and stats["connections"] == 2
+    assert server.connections == 2 and len(server.messages) == 2
+
+
+def test_failed_send_backs_off_then_gives_up(client, app, smtp):
+    server = smtp(reject_data=True)
+    app.config["OFFER_OUTBOX_MAX_ATTEMPTS"] = 3
+    [offer_id] = create_offers(app, 1, base_id=9700)
+    now = datetime.utcnow()
+
+    with app.app_context():
+        stats = outbox.dispatch_pending(now=now)
+        assert stats["retrying"] == 1
+        delivery = OfferDelivery.query.filter_by(offer_id=offer_id).first()
+        assert delivery.status == OfferDelivery.RETRYING and delivery.attempts == 1
+        assert delivery.last_error
+        first_retry = delivery.next_attempt_at
+        assert first_retry > now
+
+        # not due yet
+        assert outbox.dispatch_pending(now=now)["claimed"] == 0
+
+        stats = outbox.dispatch_pending(now=first_retry)
+        assert stats["retrying"] == 1
+        _db.session.expire_all()
+        delivery = OfferDelivery.query.filter_by(offer_id=offer_id).first()
+        # exponential: the second wait is longer than the first
+        assert delivery.next_attempt_at - first_retry > first_retry - now
+
+        stats = outbox.dispatch_pending(now=delivery.next_attempt_at + timedelta(seconds=1))
+        assert stats["failed"] == 1
+        _db.session.expire_all()
+        delivery = OfferDelivery.query.filter_by(offer_id=offer_id).first()
+        assert delivery.status == OfferDelivery.FAILED and delivery.attempts == 3
+        assert delivery.next_attempt_at is None
+        assert _db.session.get(OfferLetter, offer_id).status == "issued"
+
+    assert server.messages == []
+    assert client.get(f"/offer/delivery/{offer_id}").get_json()["status"] == "failed"
@@ -0,0 +1,160 @@
+# tests/test_pagination.py
+import pytest
+from datetime import datetime, date, timedelta
+from flask import Blueprint
+import application.controller.job.controllers as job_controllers
+import application.controller.interview.controllers as interview_controllers
+from application.data.database import db as _db
+from application.data.models import (
+    User, Company, HRProfile, JobPosting, ApplicantProfile, Application, Interview
+)
+from application.utils.pagination import (
+    SortKey, CursorError, encode_cursor, decode_cursor, keyset_paginate, approximate_total
+)
+
+# -------------- Register test-only routes --------------
+@pytest.fixture(scope="session", autouse=True)
+def register_test_routes(app):
+    test_bp = Blueprint("test_pagination_bp", __name__)
+    test_bp.add_url_rule(
+        "/opportunities/<int:applicant_id>",
+        endpoint="test_pagination_opportunities",
+        view_func=job_controllers.get_job_opportunities,
+        methods=["GET"],
+    )
+    test_bp.add_url_rule(
+        "/cards/<int:company_id>",
+        endpoint="test_pagination_cards",
+        view_func=interview_controllers.get_interview_cards,
+        methods=["GET"],
+    )
+    app.register_blueprint(test_bp, url_prefix="/_test_pagination")
+    yield
+
+# -------------- DB helper functions --------------
+def seed_company_jobs(app, hr_user_id, num_jobs):
+    with app.app_context():
+        _db.session.add(User(id=hr_user_id, name=f"User{hr_user_id}", email=f"user{hr_user_id}@test.local", password_hashed="pw-hash"))
+        _db.session.commit()
+        c = Company(company_name="PageCo", user_id=hr_user_id, company_email="pageco@test")
+        _db.session.add(c)
+        _db.session.commit()
+        _db.session.add(HRProfile(hr_id=hr_user_id, company_id=c.id, first_name="HR", last_name="Person", contact_email=f"hr{hr_user_id}@test"))
+        for i in range(num_jobs):
+            _db.session.add(JobPosting(hr_id=hr_user_id, company_id=c.id, job_title=f"Job {i}", required_skills="python", status="open"))
+        _db.session.commit()
+        return c.id
+
+def create_applicant_id(app, user_id):
+    with app.app_context():
+        _db.session.add(User(id=user_id, name=f"User{user_id}", email=f"user{user_id}@test.local", password_hashed="pw-hash"))
+        _db.session.add(ApplicantProfile(applicant_id=user_id, name=f"Cand {user_id}", skills="python"))
+        _db.session.commit()
+        return user_id
+
+# ---------------- Tests ----------------
+
+def test_cursor_round_trip():
+    token = encode_cursor([datetime(2024, 5, 1, 12, 30), date(2024, 5, 2), "acme", 42], position=60)
+    values, position = decode_cursor(token)
+    assert values == [datetime(2024, 5, 1, 12, 30), date(2024, 5, 2), "acme", 42]
+    assert position == 60
+
+@pytest.mark.parametrize("bad", ["not-a-cursor", "e30", "!!!!"])
+def test_invalid_cursor_rejected(bad):
+    with pytest.raises(CursorError):
+        decode_cursor(bad)
+
+def test_keyset_walk_covers_every_row_once(client, app):
+    seed_company_jobs(app, 15001, 23)
+    with app.app_context():
+        query = JobPosting.query
+        keys = [SortKey(JobPosting.id, descending=True)]
+        seen, cursor = [], None
+        while True:
+            page = keyset_paginate(query, keys, cursor=cursor, limit=5)
+            assert page.position == len(seen)
+            seen.extend(j.id for j in page.items)
+            cursor = page.next_cursor
+            if not cursor:
+                break
+        assert len(seen) == 23
+        assert seen == sorted(seen, reverse=True)
+
+        assert approximate_total(query, cap=100) == (23, True)
+        assert approximate_total(query, cap=10) == (10, False)
+
+@pytest.mark.parametrize("descending", [True, False])
+def test_nullable_key_walk_puts_nulls_last(client, app, descending):
+    comp = seed_company_jobs(app, 15051 + descending, 0)
+    with app.app_context():
+        for i in range(11):
+            _db.session.add(JobPosting(hr_id=15051 + descending, company_id=comp, job_title=f"Job {i}",
+                                       location=None if i % 3 == 0 else f"City {i % 4}", status="open"))
+        _db.session.commit()
+
+        query = JobPosting.query.filter(JobPosting.company_id == comp)
+        keys = [SortKey(JobPosting.location, descending=descending, nullable=True),
+                SortKey(JobPosting.id, descending=descending)]
+        jobs = query.all()
+        expected = [j.id for j in sorted(jobs, key=lambda j: j.id, reverse=descending)]
+        expected.sort(key=lambda job_id: next(j.location for j in jobs if j.id == job_id) or "", reverse=descending)
+        expected.sort(key=lambda job_id: next(j.location for j in jobs if j.id == job_id) is None)
+
+        seen, cursor = [], None
+        while True:
+            page = keyset_paginate(query, keys, cursor=cursor, limit=2)
+            seen.extend(j.id for j in page.items)
+            cursor = page.next_cursor
+            if not cursor:
+                break
+        assert seen == expected
+        assert [j.id for j in keyset_paginate(query, keys, limit=None).items] == expected
+        assert [j.id for j in keyset_paginate(query, keys, limit=3, page=3).items] == expected[6:9]
+
+def test_opportunities_next_cursor_and_legacy_fields(client, app):
+    seed_company_jobs(app, 15101, 7)
+    cand = create_applicant_id(app, 15110)
+
+    r1 = client.get(f"/_test_pagination/opportunities/{cand}?per_page=3")
+    j1 = r1.get_json()
+    assert r1.status_code == 200
+    assert j1["total_jobs"] == 7 and j1["total_pages"] == 3 and j1["per_page"] == 3
+    assert len(j1["jobs"]) == 3 and j1["next_cursor"]
+
+    r2 = client.get(f"/_test_pagination/opportunities/{cand}?per_page=3&cursor={j1['next_cursor']}")
+    j2 = r2.get_json()
+    assert j2["page"] == 2
+    assert not {j["job_id"] for j in j1["jobs"]} & {j["job_id"] for j in j2["jobs"]}
+
+    # totals can be skipped entirely
+    r3 = client.get(f"/_test_pagination/opportunities/{cand}?per_page=3&include_total=false")
+    assert r3.get_json()["total_jobs"] is None
+
+    assert client.get(f"/_test_pagination/opportunities/{cand}?cursor=garbage").status_code == 400
+
+def test_interview_cards_cursor_header_only_when_paging(client, app):
+    comp = seed_company_jobs(app, 15201, 1)
+    cand = create_applicant_id(app, 15210)
+    with app.app_context():
+        job = JobPosting.query.filter_by(company_id=comp).first()
+        application = Application(job_id=job.id, applicant_id=cand, status="submitted")
+        _db.session.add(application)
+        _db.session.commit()
+        for d in range(3):
+            _db.session.add(Interview(application_id=application.id, interviewee_id=cand, interviewer_id=15201,
+                                      interview_date=date.today() + timedelta(days=d), status="scheduled"))
+        _db.session.commit()
+
+    r1 = client.get(f"/_test_pagination/cards/{comp}?limit=2")
+    assert isinstance(r1.get_json(), list) and len(r1.get_json()) == 2
+    cursor = r1.headers["X-Next-Cursor"]
+
+    r2 = client.get(f"/_test_pagination/cards/{comp}?limit=2&cursor={cursor}")
+    assert len(r2.get_json()) == 1
+    assert "X-Next-Cursor" not in r2.headers
+
+    # clients that don't page still get every row
+    r3 = client.get(f"/_test_pagination/cards/{comp}")
+    assert [c["id"] for c in r3.get_json()] == [c["id"] for c in r1.get_json() + r2.get_json()]
+    assert "X-Next-Cursor" not in r3.headers
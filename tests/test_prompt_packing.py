@@ -0,0 +1,104 @@
+# tests/test_prompt_packing.py
+import json
+import application.controller.resume_parser.parser_service as parser_service
+from application.controller.resume_parser import packing
+from application.controller.applicant.models import ResumeDocument
+from application.data.database import db as _db
+from application.data.models import User, Role, Company, HRProfile, JobPosting, ApplicantProfile
+
+RESUME = "\n".join([
+    "Jordan Lee",
+    "jordan@example.com | +1 555 0100",
+    "SUMMARY",
+    "Backend engineer with eight years building hiring platforms.",
+    "HOBBIES AND INTERESTS",
+    *[f"Weekend hobby {i}: trail running, photography, board games and cooking." for i in range(60)],
+    "Work Experience",
+    *[f"Built Python and Flask REST APIs on PostgreSQL at Acme, project {i}." for i in range(20)],
+    "REFERENCES",
+    *[f"Reference {i}: available on request from former managers." for i in range(40)],
+    "Technical Skills:",
+    "Python, Flask, PostgreSQL, Redis, Celery, Docker",
+])
+JD = "\n".join([
+    "About us",
+    *[f"We are a fast-growing company with mission {i} to change how people find work." for i in range(40)],
+    "Requirements:",
+    "5+ years of Python and Flask",
+    "Strong PostgreSQL and Redis",
+    "Benefits",
+    *[f"Perk {i}: gym membership, free lunch and generous holidays." for i in range(40)],
+])
+
+# -------------- DB helper functions --------------
+def create_job_and_applicant(app, base_id):
+    with app.app_context():
+        if not Role.query.filter_by(name="applicant").first():
+            _db.session.add(Role(name="applicant", description="applicant role"))
+        _db.session.add(User(id=base_id, name="Pack HR", email=f"hr{base_id}@test.local", password_hashed="pw"))
+        _db.session.add(User(id=base_id + 1, name="Pack Cand", email=f"cand{base_id}@test.local", password_hashed="pw"))
+        company = Company(company_name=f"PackCo{base_id}", user_id=base_id, company_email=f"pk{base_id}@test")
+        _db.session.add(company)
+        _db.session.flush()
+        _db.session.add(HRProfile(hr_id=base_id, company_id=company.id, first_name="HR", last_name="Pk", contact_email="hr@pk.test"))
+        job = JobPosting(hr_id=base_id, company_id=company.id, job_title="Backend Engineer",
+                         required_skills="Python, Flask, PostgreSQL", job_description=JD)
+        _db.session.add(job)
+        resume_path = f"/tmp/resume_{base_id + 1}.pdf"
+        _db.session.add(ApplicantProfile(applicant_id=base_id + 1, name="Pack Cand", resume_file_path=resume_path))
+        _db.session.add(ResumeDocument(applicant_id=base_id + 1, file_path=resume_path, text=RESUME))
+        _db.session.commit()
+        return job.id, base_id + 1
+
+# ---------------- Tests ----------------
+
+def test_resume_packing_keeps_relevant_sections_in_order():
+    query = packing.job_query("Backend Engineer", "Python, Flask, PostgreSQL", JD)
+    packed = packing.pack_resume(RESUME, 400, query)
+
+    assert packed.tokens <= 400 < packed.original_tokens
+    text = packed.text
+    assert text.startswith("Jordan Lee\njordan@example.com")  # contact block kept
+    assert "Python, Flask, PostgreSQL, Redis, Celery, Docker" in text  # skills at the very end kept
+    assert "project 0." in text
+    assert "Weekend hobby" not in text and "Reference 0" not in text
+    assert text.index("SUMMARY") < text.index("Work Experience") < text.index("Technical Skills")
+    assert packing.GAP in text
+
+    # text that fits is passed through as is
+    short = "Python developer\nSKILLS\nFlask"
+    assert packing.pack_resume(short, 400, query).text is short
+
+
+def test_job_description_packing_drops_boilerplate():
+    packed = packing.pack_job_description(JD, 150, packing.job_query("Backend Engineer", "Python, Flask, PostgreSQL"))
+    assert "5+ years of Python and Flask" in packed.text and "Strong PostgreSQL and Redis" in packed.text
+    assert "fast-growing" not in packed.text and "gym membership" not in packed.text
+    assert packed.sections_kept == 1 and packed.tokens < 50
+
+
+def test_scoring_prompt_is_packed_and_token_counts_reported(client, app, monkeypatch):
+    job_id, applicant_id = create_job_and_applicant(app, 8100)
+    monkeypatch.setitem(app.config, "PROMPT_RESUME_TOKENS", 500)
+    monkeypatch.setitem(app.config, "PROMPT_JD_TOKENS", 200)
+    prompts = []
+
+    def fake_gemini(prompt):
+        prompts.append(prompt)
+        return json.dumps({"metadata": {"skills": ["Python"]}, "score": 70, "feedback": "Good."})
+
+    monkeypatch.setattr(parser_service, "call_gemini_once", fake_gemini)
+    client.post("/applications/apply", json={"applicant_id": applicant_id, "job_id": job_id, "resume_filename": "r.pdf"})
+
+    res = client.post("/resumeparser/parse-resume", data={"applicantid": applicant_id, "jobid": job_id, "force": "true"})
+    assert res.status_code == 200
+    tokens = res.get_json()["prompt_tokens"]
+    assert tokens["resume_tokens"] <= 500 < tokens["resume_original_tokens"]
+    assert tokens["jd_tokens"] <= 200 < tokens["jd_original_tokens"]
+    assert tokens["total_tokens"] == tokens["resume_tokens"] + tokens["jd_tokens"]
+    assert tokens["prompt_tokens"] > tokens["total_tokens"]
+
+    prompt = prompts[-1]
+    assert "Resume Text (most relevant sections):" in prompt
+    assert "Python, Flask, PostgreSQL, Redis, Celery, Docker" in prompt and "Weekend hobby" not in prompt
+    assert "Strong PostgreSQL and Redis" in prompt and "gym membership" not in prompt
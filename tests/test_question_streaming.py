@@ -0,0 +1,147 @@
+# tests/test_question_streaming.py
+import time
+import pytest
+from types import SimpleNamespace
+from application.controller.videointerview.services import ai_service
+from application.controller.videointerview.socket_handlers import interview_socket
+from application.controller.videointerview.utils.sentence_stream import SentenceStream
+from application.utils.model_router import ModelRouter
+
+QUESTION = ("That sounds like a demanding migration, e.g. with zero downtime. "
+            "How did you keep the old and new schemas in sync while traffic moved over?")
+
+
+class FakeStreamingAI(ai_service.AIService):
+    """AIService whose streamed responses come from `chunks` with a delay between them."""
+
+    def __init__(self, chunks, delay=0.0, fail_after=None):
+        self.initialized = True
+        self.primary_model = "fake"
+        self.fallback_models = []
+        self.timeout = 5
+        self.circuit_breaker = ai_service.CircuitBreaker()
+        self.router = ModelRouter(["fake"], call=self._generate_text)
+        self.chunks = chunks
+        self.delay = delay
+        self.fail_after = fail_after
+        self.log = []
+
+    def _stream_chunks(self, model_name, prompt):
+        for i, chunk in enumerate(self.chunks):
+            if i == self.fail_after:
+                raise RuntimeError("stream reset")
+            time.sleep(self.delay)
+            self.log.append(f"chunk {i}")
+            yield chunk
+
+    def _call_gemini_with_retry(self, prompt, timeout=None, max_retries=3, hedge=False):
+        self.log.append("blocking call")
+        return "What did you learn from your last code review?"
+
+
+class FakeSocketIO:
+    def __init__(self):
+        self.emitted = []
+
+    def emit(self, event, data, room=None, namespace=None):
+        self.emitted.append((event, data))
+
+
+def words(text):
+    parts = text.split(" ")
+    return [parts[0]] + [" " + p for p in parts[1:]]
+
+# -------------- helper functions --------------
+@pytest.fixture
+def fake_ai(monkeypatch):
+    def install(ai):
+        monkeypatch.setattr(ai_service, "_ai_service_instance", ai)
+        return ai
+    return install
+
+@pytest.fixture
+def saved_sessions(monkeypatch):
+    saved = []
+    monkeypatch.setattr(interview_socket, "session_store", SimpleNamespace(add=lambda s: saved.append(s.current_question)))
+    return saved
+
+def make_session():
+    return SimpleNamespace(
+        session_id="sess-stream", question_count=3, current_question="Previous question?",
+        conversation_history=[{"question": "Previous question?", "answer": "We moved Postgres to a new cluster."}],
+        job_title="Backend Engineer", job_description="Python services", candidate_background={},
+    )
+
+# ---------------- Tests ----------------
+
+def test_sentence_stream_splits_at_sentence_ends_only():
+    stream = SentenceStream(min_chars=20)
+    out = []
+    for chunk in words('"Question: Good. ' + QUESTION + '"'):
+        out.extend(stream.feed(chunk))
+    assert out == ["Good. That sounds like a demanding migration, e.g. with zero downtime."]  # short one merged
+    assert stream.flush() == ["How did you keep the old and new schemas in sync while traffic moved over?"]
+    assert stream.text.startswith("Good. That sounds") and stream.text.endswith("moved over?")
+
+    rejected = SentenceStream()
+    assert rejected.feed('{"question": "Why?"} ') == [] and rejected.rejected and rejected.flush() == []
+
+    capped = SentenceStream(max_chars=90)
+    assert capped.feed(QUESTION + " Anything else? ") == [QUESTION.split(" How")[0]]
+    assert capped.full and capped.flush() == []
+
+
+def test_first_sentence_is_delivered_while_the_model_is_still_writing(app, fake_ai):
+    ai = fake_ai(FakeStreamingAI(words(QUESTION), delay=0.01))
+    delivered = []
+    with app.app_context():
+        question = ai.stream_question("prompt", lambda s: delivered.append((s, len(ai.log))))
+
+    assert question == QUESTION
+    assert [s for s, _ in delivered] == [QUESTION.split(" How")[0], "How" + QUESTION.split(" How")[1]]
+    first_at = delivered[0][1]
+    assert first_at < len(ai.chunks) // 2  # spoken before half the words were generated
+
+    # a stream that breaks after a sentence went out keeps that sentence
+    broken = FakeStreamingAI(words(QUESTION), fail_after=12)
+    assert broken.stream_question("prompt", lambda s: None) == QUESTION.split(" How")[0]
+    # nothing usable: None, so the caller can fall back
+    assert FakeStreamingAI(words(QUESTION), fail_after=2).stream_question("prompt", lambda s: None) is None
+    stalled = FakeStreamingAI(["Tell me"], delay=1.0)
+    started = time.monotonic()
+    assert stalled.stream_question("prompt", lambda s: None, timeout=3, first_chunk_timeout=0.2) is None
+    assert time.monotonic() - started < 0.9
+
+
+def test_next_question_streams_deltas_then_finalizes_the_session(app, fake_ai, saved_sessions, monkeypatch):
+    socketio = FakeSocketIO()
+    session = make_session()
+    fake_ai(FakeStreamingAI(words(QUESTION)))
+    with app.app_context():
+        interview_socket._deliver_next_question(socketio, session, "We moved Postgres with logical replication.")
+
+    events = [event for event, _ in socketio.emitted]
+    assert events == ["questionDelta", "questionDelta", "question", "aiSpeaking"]
+    assert " ".join(data["text"] for event, data in socketio.emitted[:2]) == QUESTION
+    assert [data["index"] for _, data in socketio.emitted[:2]] == [0, 1]
+    final = dict(socketio.emitted)["aiSpeaking"]
+    assert final["question"] == QUESTION and final["streamed"] is True and final["question_number"] == 3
+    assert saved_sessions == [QUESTION] and session.current_question == QUESTION
+
+    # streaming fails before any text: the blocking path answers and nothing was streamed
+    socketio = FakeSocketIO()
+    ai = fake_ai(FakeStreamingAI(words(QUESTION), fail_after=0))
+    with app.app_context():
+        interview_socket._deliver_next_question(socketio, session, "We moved Postgres with logical replication.")
+    assert [event for event, _ in socketio.emitted] == ["question", "aiSpeaking"]
+    assert dict(socketio.emitted)["question"]["streamed"] is False
+    assert session.current_question == "What did you learn from your last code review?"
+    assert "blocking call" in ai.log
+
+    # with streaming switched off the old events are sent as before
+    monkeypatch.setattr(interview_socket, "STREAM_QUESTIONS", False)
+    socketio = FakeSocketIO()
+    fake_ai(FakeStreamingAI(words(QUESTION)))
+    with app.app_context():
+        interview_socket._deliver_next_question(socketio, session, "We moved Postgres with logical replication.")
+    assert [event for event, _ in socketio.emitted] == ["question", "aiSpeaking"]
@@ -0,0 +1,162 @@
+# tests/test_response_cache.py
+import pytest
+from flask import Blueprint
+from cachelib import SimpleCache
+import application.controller.company.controllers as company_controllers
+import application.controller.job.controllers as job_controllers
+from application.utils.cache import response_cache
+from application.data.database import db as _db
+from application.data.models import User, Company, HRProfile, JobPosting, ApplicantProfile
+
+# -------------- Register test-only routes --------------
+@pytest.fixture(scope="session", autouse=True)
+def register_test_routes(app):
+    test_bp = Blueprint("test_response_cache_bp", __name__)
+    test_bp.add_url_rule(
+        "/dashboard/<int:company_id>",
+        endpoint="test_cache_dashboard",
+        view_func=company_controllers.get_company_dashboard,
+        methods=["GET"],
+    )
+    test_bp.add_url_rule(
+        "/opportunities/<int:applicant_id>",
+        endpoint="test_cache_opportunities",
+        view_func=job_controllers.get_job_opportunities,
+        methods=["GET"],
+    )
+    app.register_blueprint(test_bp, url_prefix="/_test_cache")
+    yield
+
+@pytest.fixture
+def memory_cache(app):
+    """Swap the response cache onto an in-memory backend for one test."""
+    previous = response_cache.backend
+    response_cache.init_app(app, SimpleCache())
+    response_cache.reset_stats()
+    yield response_cache
+    response_cache.backend = previous
+    response_cache.reset_stats()
+
+# -------------- DB helper functions --------------
+def create_company_id(app, owner_user_id, company_name):
+    with app.app_context():
+        _db.session.add(User(id=owner_user_id, name=f"User{owner_user_id}", email=f"user{owner_user_id}@test.local", password_hashed="pw-hash"))
+        _db.session.commit()
+        c = Company(company_name=company_name, user_id=owner_user_id, company_email=f"{company_name.lower()}@test")
+        _db.session.add(c)
+        _db.session.commit()
+        _db.session.add(HRProfile(hr_id=owner_user_id, company_id=c.id, first_name="HR", last_name="Person", contact_email=f"hr{owner_user_id}@test"))
+        _db.session.commit()
+        return c.id
+
+def create_applicant_id(app, user_id, skills):
+    with app.app_context():
+        _db.session.add(User(id=user_id, name=f"User{user_id}", email=f"user{user_id}@test.local", password_hashed="pw-hash"))
+        _db.session.add(ApplicantProfile(applicant_id=user_id, name=f"Cand{user_id}", skills=skills))
+        _db.session.commit()
+        return user_id
+
+# ---------------- Tests ----------------
+
+def test_dashboard_hit_then_invalidated_by_commit(client, app, memory_cache):
+    comp = create_company_id(app, 14001, "CacheCo")
+
+    r1 = client.get(f"/_test_cache/dashboard/{comp}")
+    r2 = client.get(f"/_test_cache/dashboard/{comp}")
+    assert r1.headers["X-Cache"] == "MISS"
+    assert r2.headers["X-Cache"] == "HIT"
+    assert r2.get_json()["company_name"] == "CacheCo"
+
+    with app.app_context():
+        Company.query.get(comp).company_name = "RenamedCo"
+        _db.session.commit()
+
+    r3 = client.get(f"/_test_cache/dashboard/{comp}")
+    assert r3.headers["X-Cache"] == "MISS"
+    assert r3.get_json()["company_name"] == "RenamedCo"
+
+    stats = memory_cache.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 2
+    assert stats["endpoints"]["company.get_company_dashboard"]["hit_rate"] == pytest.approx(1 / 3, abs=1e-3)
+
+def test_rollback_does_not_invalidate(client, app, memory_cache):
+    comp = create_company_id(app, 14101, "StableCo")
+    client.get(f"/_test_cache/dashboard/{comp}")
+
+    with app.app_context():
+        Company.query.get(comp).company_name = "Discarded"
+        _db.session.flush()
+        _db.session.rollback()
+
+    r = client.get(f"/_test_cache/dashboard/{comp}")
+    assert r.headers["X-Cache"] == "HIT"
+    assert r.get_json()["company_name"] == "StableCo"
+
+def test_job_change_invalidates_listings_per_user(client, app, memory_cache, auth_headers):
+    comp = create_company_id(app, 14201, "ListCo")
+    cand = create_applicant_id(app, 14210, "python, sql")
+    with app.app_context():
+        _db.session.add(JobPosting(hr_id=14201, company_id=comp, job_title="Dev", required_skills="python", status="open"))
+        _db.session.commit()
+
+    url = f"/_test_cache/opportunities/{cand}"
+    assert client.get(url, headers=auth_headers("applicant", cand)).headers["X-Cache"] == "MISS"
+    assert client.get(url, headers=auth_headers("applicant", cand)).headers["X-Cache"] == "HIT"
+    # a different caller gets its own entry
+    assert client.get(url, headers=auth_headers("admin", 1)).headers["X-Cache"] == "MISS"
+
+    with app.app_context():
+        _db.session.add(JobPosting(hr_id=14201, company_id=comp, job_title="Dev 2", required_skills="sql", status="open"))
+        _db.session.commit()
+
+    r = client.get(url, headers=auth_headers("applicant", cand))
+    assert r.headers["X-Cache"] == "MISS"
+    assert r.get_json()["total_jobs"] == 2
+
+
+def test_company_edit_invalidates_its_job_details(client, app, memory_cache):
+    comp = create_company_id(app, 14301, "DetailCo")
+    cand = create_applicant_id(app, 14310, "python")
+    with app.app_context():
+        job = JobPosting(hr_id=14301, company_id=comp, job_title="Dev", required_skills="python", status="open")
+        _db.session.add(job)
+        _db.session.commit()
+        job_id = job.id
+
+    url = f"/job/detail/{job_id}/{cand}"
+    assert client.get(url).headers["X-Cache"] == "MISS"
+    assert client.get(url).headers["X-Cache"] == "HIT"
+
+    with app.app_context():
+        Company.query.get(comp).website = "https://detail.example"
+        _db.session.commit()
+
+    r = client.get(url)
+    assert r.headers["X-Cache"] == "MISS"
+    assert r.get_json()["company_info"]["website"] == "https://detail.example"
+
+def test_evicted_tag_and_broken_backend_never_serve_stale_or_fail(memory_cache):
+    computed = []
+
+    def produce(value):
+        computed.append(value)
+        return value
+
+    assert memory_cache.get_or_set("t.eviction", {}, lambda: produce("v1"), tags=["job:1"]) == "v1"
+    assert memory_cache.get_or_set("t.eviction", {}, lambda: produce("v2"), tags=["job:1"]) == "v1"
+    memory_cache.invalidate("job:1")
+    assert memory_cache.get_or_set("t.eviction", {}, lambda: produce("v3"), tags=["job:1"]) == "v3"
+
+    # the tag key is evicted: the next version must not collide with the one "v1" was stored under
+    memory_cache.backend.delete(memory_cache._tag_key("job:1"))
+    assert memory_cache.get_or_set("t.eviction", {}, lambda: produce("v4"), tags=["job:1"]) == "v4"
+    assert computed == ["v1", "v3", "v4"]
+
+    class DownBackend:
+        def __getattr__(self, name):
+            def fail(*args, **kwargs):
+                raise ConnectionError("redis is down")
+            return fail
+
+    memory_cache.backend = DownBackend()
+    assert memory_cache.get_or_set("t.eviction", {}, lambda: produce("v5"), tags=["job:1"]) == "v5"
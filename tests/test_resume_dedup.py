@@ -0,0 +1,127 @@
+# tests/test_resume_dedup.py
+import json
+import application.controller.resume_parser.parser_service as parser_service
+from application.controller.resume_parser.metadata_store import load_metadata
+from application.controller.applicant import resume_dedup
+from application.controller.applicant.resume_dedup import update_resume_signature
+from application.controller.applicant.models import ResumeDocument, ResumeSignature, ResumeLshBucket
+from application.data.database import db as _db
+from application.data.models import User, Role, Company, HRProfile, JobPosting, ApplicantProfile, Application
+
+RESUME = "Jordan Lee\njordan@example.com +1 555 0100\n" + "\n".join(
+    f"Delivered project {i} in Python, Flask and PostgreSQL for client {i * 7}, cutting latency by {i + 10}%"
+    for i in range(30)
+)
+OTHER_RESUME = "Sam Park\n" + "\n".join(
+    f"Closed the books for quarter {i}, audited {i * 3} vendor accounts in SAP and Excel" for i in range(30)
+)
+
+# -------------- DB helper functions --------------
+def create_job(app, hr_id):
+    with app.app_context():
+        if not Role.query.filter_by(name="applicant").first():
+            _db.session.add(Role(name="applicant", description="applicant role"))
+        _db.session.add(User(id=hr_id, name="Dedup HR", email=f"hr{hr_id}@test.local", password_hashed="pw"))
+        company = Company(company_name=f"DedupCo{hr_id}", user_id=hr_id, company_email=f"dd{hr_id}@test")
+        _db.session.add(company)
+        _db.session.flush()
+        _db.session.add(HRProfile(hr_id=hr_id, company_id=company.id, first_name="HR", last_name="Dd", contact_email="hr@dd.test"))
+        job = JobPosting(hr_id=hr_id, company_id=company.id, job_title="Backend Engineer",
+                         job_description="Python and Flask services on PostgreSQL", status="open")
+        _db.session.add(job)
+        _db.session.commit()
+        return company.id, job.id
+
+def create_applicant(app, applicant_id, name, resume_text):
+    """Profile with stored resume text and its signature, as upload processing leaves it."""
+    with app.app_context():
+        resume_path = f"/tmp/resume_{applicant_id}.pdf"
+        _db.session.add(User(id=applicant_id, name=name, email=f"cand{applicant_id}@test.local", password_hashed="pw"))
+        _db.session.add(ApplicantProfile(applicant_id=applicant_id, name=name, resume_file_path=resume_path))
+        doc = ResumeDocument(applicant_id=applicant_id, file_path=resume_path, content_hash=f"h{applicant_id}", text=resume_text)
+        _db.session.add(doc)
+        _db.session.flush()
+        update_resume_signature(doc)
+        _db.session.commit()
+
+# ---------------- Tests ----------------
+
+def test_near_duplicates_are_found_and_grouped_for_hr(client, app):
+    company_id, job_id = create_job(app, 8000)
+    create_applicant(app, 8001, "Jordan Lee", RESUME)
+    create_applicant(app, 8002, "J Lee", RESUME.replace("jordan@example.com +1 555 0100", "jlee@mail.test +1 555 0199")
+                     .replace("client 14,", "client 15,"))
+    create_applicant(app, 8003, "Sam Park", OTHER_RESUME)
+    with app.app_context():
+        for applicant_id in (8001, 8002, 8003):
+            _db.session.add(Application(job_id=job_id, applicant_id=applicant_id, status="submitted"))
+        _db.session.commit()
+
+        assert ResumeLshBucket.query.filter_by(applicant_id=8001).count() == resume_dedup.BANDS
+        signature = resume_dedup.minhash(RESUME)
+        found = dict(resume_dedup.near_duplicates(signature, 0.8, exclude_applicant=8001))
+        assert 8001 not in found and 8003 not in found
+        assert 0.8 <= found[8002] < 1.0
+
+    res = client.get(f"/applications/{company_id}/duplicates")
+    assert res.status_code == 200
+    groups = res.get_json()["groups"]
+    assert len(groups) == 1
+    assert {c["applicant_id"] for c in groups[0]["candidates"]} == {8001, 8002}
+    assert groups[0]["similarity"] >= 0.85
+
+    assert client.get(f"/applications/{company_id}/duplicates", query_string={"threshold": "2"}).status_code == 400
+
+
+def test_scoring_reuses_a_near_identical_resume_for_the_same_job(client, app, monkeypatch):
+    _, job_id = create_job(app, 8050)
+    create_applicant(app, 8051, "Jordan Lee", RESUME)
+    create_applicant(app, 8052, "Jordan L", RESUME.replace("+1 555 0100", "+1 555 0142"))
+    monkeypatch.setitem(app.config, "EVENT_ASYNC_DISPATCH", "sync")
+    prompts = []
+
+    def fake_gemini(prompt):
+        prompts.append(prompt)
+        return json.dumps({"metadata": {"name": "Jordan Lee", "email": "jordan@example.com", "phone": "+1 555 0100",
+                                        "skills": ["Python"], "projects": [{"title": "Jordan's side project"}]},
+                           "score": 88, "feedback": "Strong match."})
+
+    monkeypatch.setattr(parser_service, "call_gemini_once", fake_gemini)
+
+    first = client.post("/applications/apply", json={"applicant_id": 8051, "job_id": job_id, "resume_filename": "r.pdf"})
+    second = client.post("/applications/apply", json={"applicant_id": 8052, "job_id": job_id, "resume_filename": "r.pdf"})
+    assert len(prompts) == 1
+    with app.app_context():
+        copy = _db.session.get(Application, second.get_json()["application_id"])
+        assert copy.resume_score == 88 and copy.ai_feedback == "Strong match."
+        metadata = load_metadata(copy.id)
+        assert metadata["skills"] == ["Python"] and metadata["projects"] == []
+        # contact details are this applicant's own, never the other applicant's
+        assert (metadata["name"], metadata["email"], metadata["phone"]) == ("Jordan L", "jordan@example.com", "+1 555 0142")
+
+    # force=true always asks the model again
+    res = client.post("/resumeparser/parse-resume", data={"applicantid": 8052, "jobid": job_id, "force": "true"})
+    assert res.status_code == 200 and "reused_from" not in res.get_json()
+    assert len(prompts) == 2
+    assert first.status_code == 201
+
+
+def test_minhash_estimates_similarity_and_signature_follows_text(app):
+    edited = RESUME.replace("client 21,", "client 22,")
+    a, b = resume_dedup.minhash(RESUME), resume_dedup.minhash(edited)
+    assert resume_dedup.similarity(a, a) == 1.0
+    assert 0.85 < resume_dedup.similarity(a, b) < 1.0
+    assert resume_dedup.similarity(a, resume_dedup.minhash(OTHER_RESUME)) < 0.2
+    assert resume_dedup.minhash("") is None
+    assert resume_dedup.band_buckets(a) == resume_dedup.band_buckets(resume_dedup.minhash(RESUME))
+
+    with app.app_context():
+        doc = ResumeDocument(applicant_id=8099, file_path="/tmp/r8099.pdf", content_hash="x", text=RESUME)
+        _db.session.add(doc)
+        _db.session.flush()
+        update_resume_signature(doc)
+        doc.text = None
+        update_resume_signature(doc)
+        _db.session.commit()
+        assert ResumeSignature.query.filter_by(applicant_id=8099).first() is None
+        assert ResumeLshBucket.query.filter_by(applicant_id=8099).count() == 0
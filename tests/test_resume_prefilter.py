@@ -0,0 +1,131 @@
+# tests/test_resume_prefilter.py
+import json
+import application.controller.resume_parser.parser_service as parser_service
+from application.controller.resume_parser import prefilter
+from application.controller.resume_parser.models import ApplicationPrefilter
+from application.controller.applicant.models import ResumeDocument
+from application.data.database import db as _db
+from application.data.models import User, Role, Company, HRProfile, JobPosting, ApplicantProfile, Application
+
+# -------------- DB helper functions --------------
+def create_job(app, hr_id, description="Python, Flask and PostgreSQL for our REST APIs"):
+    with app.app_context():
+        if not Role.query.filter_by(name="applicant").first():
+            _db.session.add(Role(name="applicant", description="applicant role"))
+        _db.session.add(User(id=hr_id, name="Prefilter HR", email=f"hr{hr_id}@test.local", password_hashed="pw"))
+        company = Company(company_name=f"PrefilterCo{hr_id}", user_id=hr_id, company_email=f"pf{hr_id}@test")
+        _db.session.add(company)
+        _db.session.flush()
+        _db.session.add(HRProfile(hr_id=hr_id, company_id=company.id, first_name="HR", last_name="Pf", contact_email="hr@pf.test"))
+        job = JobPosting(hr_id=hr_id, company_id=company.id, job_title="Backend Engineer",
+                         required_skills="Python, Flask", job_description=description, status="open")
+        _db.session.add(job)
+        _db.session.commit()
+        return company.id, job.id
+
+def create_applicant(app, applicant_id, name, resume_text=None, skills="", apply_to=None):
+    """Applicant with stored resume text (or only profile skills) and optionally an application."""
+    with app.app_context():
+        resume_path = f"/tmp/resume_{applicant_id}.pdf" if resume_text else None
+        _db.session.add(User(id=applicant_id, name=name, email=f"cand{applicant_id}@test.local", password_hashed="pw"))
+        _db.session.add(ApplicantProfile(applicant_id=applicant_id, name=name, skills=skills, resume_file_path=resume_path))
+        if resume_text:
+            _db.session.add(ResumeDocument(applicant_id=applicant_id, file_path=resume_path, text=resume_text))
+        application_id = None
+        if apply_to:
+            application = Application(job_id=apply_to, applicant_id=applicant_id, status="submitted")
+            _db.session.add(application)
+            _db.session.flush()
+            application_id = application.id
+        _db.session.commit()
+        return application_id
+
+# ---------------- Tests ----------------
+
+def test_prefilter_ranks_applicants_and_candidates_sort_by_it(client, app):
+    company_id, job_id = create_job(app, 7900)
+    backend = create_applicant(app, 7901, "Bea Backend", "Built REST APIs in Python and Flask on PostgreSQL", apply_to=job_id)
+    frontend = create_applicant(app, 7902, "Finn Frontend", "React and CSS user interfaces, some Python scripts", apply_to=job_id)
+    profile_only = create_applicant(app, 7903, "Pat Profile", skills="Python, Flask", apply_to=job_id)
+    unrelated = create_applicant(app, 7904, "Una Unrelated", "Bookkeeping, payroll and audits", apply_to=job_id)
+
+    res = client.post(f"/resumeparser/prefilter/{job_id}")
+    assert res.status_code == 200
+    body = res.get_json()
+    assert body["scored"] == 4 and body["from_resume"] == 3 and body["from_profile"] == 1
+    assert body["llm_shortlisted"] == []
+    assert body["top"][0] == {"application_id": backend, "prefilter_score": 100.0, "rank": 1, "source": "resume"}
+
+    with app.app_context():
+        rows = {r.application_id: r for r in ApplicationPrefilter.query.filter_by(job_id=job_id)}
+    assert rows[backend].rank == 1
+    assert rows[unrelated].score == 0.0 and rows[unrelated].rank == 4
+    assert rows[profile_only].source == "profile" and rows[profile_only].score > rows[frontend].score > 0
+
+    # keyset pages follow the pre-ranking, best first
+    seen, cursor = [], None
+    for _ in range(4):
+        params = {"sort": "prefilter", "per_page": 1, "include_total": "false"}
+        if cursor:
+            params["cursor"] = cursor
+        page = client.get(f"/applications/{company_id}/candidates", query_string=params).get_json()
+        seen.extend((c["first_name"], c["prefilter_score"]) for c in page["candidates"])
+        cursor = page["next_cursor"]
+    assert [name for name, _ in seen] == ["Bea", "Pat", "Finn", "Una"]
+    assert seen[0][1] == 100.0
+
+    # re-running replaces the job's rows instead of adding to them
+    client.post(f"/resumeparser/prefilter/{job_id}")
+    with app.app_context():
+        assert ApplicationPrefilter.query.filter_by(job_id=job_id).count() == 4
+
+    assert client.post("/resumeparser/prefilter/999999").status_code == 404
+    assert client.post(f"/resumeparser/prefilter/{job_id}", json={"llm_top_k": "many"}).status_code == 400
+    assert client.post(f"/resumeparser/prefilter/{job_id}", json={"llm_min_score": 150}).status_code == 400
+
+
+def test_llm_scores_only_the_shortlist_when_deferred(client, app, monkeypatch):
+    _, job_id = create_job(app, 7950)
+    create_applicant(app, 7951, "Bea Backend", "Python and Flask services on PostgreSQL, REST APIs")
+    create_applicant(app, 7952, "Finn Frontend", "React and CSS, a little Python")
+    create_applicant(app, 7953, "Una Unrelated", "Bookkeeping and payroll")
+    monkeypatch.setitem(app.config, "EVENT_ASYNC_DISPATCH", "sync")
+    monkeypatch.setitem(app.config, "PREFILTER_DEFER_LLM", True)
+    prompts = []
+
+    def fake_gemini(prompt):
+        prompts.append(prompt)
+        return json.dumps({"metadata": {"skills": ["Python"]}, "score": 77, "feedback": "Fits."})
+
+    monkeypatch.setattr(parser_service, "call_gemini_once", fake_gemini)
+
+    ids = {}
+    for applicant_id in (7951, 7952, 7953):
+        res = client.post("/applications/apply", json={"applicant_id": applicant_id, "job_id": job_id, "resume_filename": "r.pdf"})
+        ids[applicant_id] = res.get_json()["application_id"]
+    assert prompts == []  # nothing scored on submit
+
+    res = client.post(f"/resumeparser/prefilter/{job_id}", json={"llm_top_k": 2, "llm_min_score": 1})
+    assert res.get_json()["llm_shortlisted"] == [ids[7951], ids[7952]]
+    assert len(prompts) == 2 and "PostgreSQL, REST APIs" in prompts[0]
+    with app.app_context():
+        scores = {a.id: a.resume_score for a in Application.query.filter_by(job_id=job_id)}
+    assert scores == {ids[7951]: 77, ids[7952]: 77, ids[7953]: None}
+
+    # already-scored applications are not sent again; a zero score never makes the cut
+    res = client.post(f"/resumeparser/prefilter/{job_id}", json={"llm_min_score": 1})
+    assert res.get_json()["llm_shortlisted"] == []
+    assert len(prompts) == 2
+
+
+def test_bm25_saturates_term_frequency_and_weights_rare_terms():
+    weights = prefilter.query_terms("kubernetes python")
+    counts = prefilter.TermCounts(weights)
+    for text in ["python " * 3, "python " * 30, "kubernetes", "python and more", "cooking"]:
+        counts.add(text)
+    scores = prefilter.bm25_scores(weights, counts)
+
+    assert scores[4] == 0.0
+    assert scores[2] > scores[1]       # the rare term outweighs any amount of the common one
+    assert scores[1] < 2 * scores[0]   # ten times the mentions, far less than twice the score
+    assert prefilter.tokenize("C++, C# and the Node.js") == ["c++", "c#", "node", "js"]
@@ -0,0 +1,184 @@
+# tests/test_resume_processing.py
+import io
+import json
+import os
+import pytest
+from werkzeug.security import generate_password_hash
+import application.controller.applicant.resume_processing as resume_processing
+import application.controller.resume_parser.parser_service as parser_service
+from application.controller.applicant.models import ResumeDocument
+from application.data.database import db as _db
+from application.data.models import (
+    User, Role, ApplicantProfile, Application, JobPosting, Company, HRProfile,
+    PreviousExperience, PreviousEducation, Certification
+)
+
+RESUME_TEXT = "Jane Roe\nSenior Engineer at Acme 2019-2024\nPython, SQL, Docker"
+
+PARSED = {
+    "skills": ["Python", "SQL", "python", "Docker"],
+    "total_experience_years": 5.4,
+    "experience": [
+        {"position": "Senior Engineer", "company": "Acme", "start_date": "2019-03", "end_date": "present", "description": "APIs"},
+        {"position": None, "company": None},
+    ],
+    "education": [{"university": "State U", "degree": "BSc", "field": "CS", "start_date": "2014", "end_date": "2018"}],
+    "certifications": [{"certificate_name": "CKA", "issuing_organization": "CNCF", "issue_date": "Jun 2022"}],
+}
+
+def _base():
+    return "/_test_applicant/applicant"
+
+def _resume(content=b"%PDF-resume-bytes", filename="resume.pdf"):
+    return (io.BytesIO(content), filename)
+
+@pytest.fixture
+def extraction(monkeypatch):
+    """Count real extractions; return RESUME_TEXT instead of opening the PDF."""
+    calls = []
+
+    def fake_extract(path):
+        calls.append(path)
+        return RESUME_TEXT
+
+    monkeypatch.setattr(resume_processing, "extract_text_from_file", fake_extract)
+    return calls
+
+# -------------- DB helper functions --------------
+def create_user(app, user_id):
+    with app.app_context():
+        if not Role.query.filter_by(name="applicant").first():
+            _db.session.add(Role(name="applicant", description="applicant role"))
+        _db.session.add(User(id=user_id, name=f"User{user_id}", email=f"user{user_id}@example.test",
+                             password_hashed=generate_password_hash("pw")))
+        _db.session.commit()
+
+def upload_profile(client, app, user_id, content=b"%PDF-resume-bytes"):
+    create_user(app, user_id)
+    res = client.post(_base(), data={"applicant_id": str(user_id), "name": "Jane Roe", "resume": _resume(content)},
+                      content_type="multipart/form-data")
+    assert res.status_code == 201
+    return res.get_json()
+
+# ---------------- Tests ----------------
+
+def test_upload_extracts_text_once_with_content_hash(client, app, extraction):
+    profile = upload_profile(client, app, 3101)
+    try:
+        with app.app_context():
+            doc = ResumeDocument.query.filter_by(applicant_id=3101).first()
+            assert doc.text == RESUME_TEXT and doc.char_count == len(RESUME_TEXT)
+            assert doc.content_hash == resume_processing.file_sha256(profile["resume_file_path"])
+            assert doc.file_path == profile["resume_file_path"]
+            assert doc.parse_status == ResumeDocument.PENDING
+        assert len(extraction) == 1
+
+        # identical bytes re-uploaded: new file, same hash, no second extraction
+        res = client.put(f"{_base()}/3101", data={"resume": _resume()}, content_type="multipart/form-data")
+        assert res.status_code == 200
+        new_path = res.get_json()["resume_file_path"]
+        assert new_path != profile["resume_file_path"]
+        assert len(extraction) == 1
+        with app.app_context():
+            assert ResumeDocument.query.filter_by(applicant_id=3101).first().file_path == new_path
+
+        # another applicant uploading the same file reuses the stored text
+        upload_profile(client, app, 3102)
+        assert len(extraction) == 1
+
+        # a different file is extracted again
+        client.put(f"{_base()}/3101", data={"resume": _resume(b"%PDF-other")}, content_type="multipart/form-data")
+        assert len(extraction) == 2
+
+        status = client.get("/applicant/3101/resume/processing")
+        assert status.status_code == 200 and status.get_json()["has_text"] is True
+    finally:
+        with app.app_context():
+            for p in ApplicantProfile.query.filter(ApplicantProfile.applicant_id.in_([3101, 3102])).all():
+                if p.resume_file_path and os.path.exists(p.resume_file_path):
+                    os.remove(p.resume_file_path)
+
+
+def test_failed_extraction_does_not_fail_upload(client, app, monkeypatch):
+    def broken(path):
+        raise ValueError("No text extracted from PDF")
+
+    monkeypatch.setattr(resume_processing, "extract_text_from_file", broken)
+    profile = upload_profile(client, app, 3111)
+    with app.app_context():
+        doc = ResumeDocument.query.filter_by(applicant_id=3111).first()
+        assert doc.text is None and doc.parse_status == ResumeDocument.SKIPPED
+        assert "No text extracted" in doc.extract_error
+    os.remove(profile["resume_file_path"])
+
+
+def test_apply_path_reads_precomputed_text(client, app, extraction, monkeypatch):
+    profile = upload_profile(client, app, 3121)
+
+    def must_not_open(path):
+        raise AssertionError(f"resume file opened on the apply path: {path}")
+
+    monkeypatch.setattr(parser_service, "extract_text_from_file", must_not_open)
+    with app.app_context():
+        _db.session.add(Company(id=3120, company_name="ResumeCo", user_id=3121, company_email="r@co.test"))
+        _db.session.add(HRProfile(hr_id=3121, company_id=3120, first_name="HR", last_name="R", contact_email="hr@co.test"))
+        job = JobPosting(hr_id=3121, company_id=3120, job_title="Engineer")
+        _db.session.add(job)
+        _db.session.flush()
+        application = Application(job_id=job.id, applicant_id=3121, status="submitted")
+        _db.session.add(application)
+        _db.session.commit()
+
+        assert parser_service.get_resume_text_from_application(application) == RESUME_TEXT
+    os.remove(profile["resume_file_path"])
+
+
+def test_preparse_fills_profile_tables_and_replaces_its_own_rows(client, app, extraction, monkeypatch):
+    profile = upload_profile(client, app, 3131)
+    monkeypatch.setattr(resume_processing, "call_gemini_once", lambda prompt: "```json\n" + json.dumps(PARSED) + "\n```")
+
+    with app.app_context():
+        # applicant already keeps certifications by hand
+        _db.session.add(Certification(applicant_id=3131, certificate_name="Manual cert", issuing_organization="Me"))
+        _db.session.commit()
+
+        doc = resume_processing.preparse_resume(3131)
+        assert doc.parse_status == ResumeDocument.PARSED
+
+        exps = PreviousExperience.query.filter_by(applicant_id=3131).all()
+        assert [(e.position, e.company, str(e.start_date), e.end_date) for e in exps] == [("Senior Engineer", "Acme", "2019-03-01", None)]
+        assert [e.university for e in PreviousEducation.query.filter_by(applicant_id=3131)] == ["State U"]
+        assert [c.certificate_name for c in Certification.query.filter_by(applicant_id=3131)] == ["Manual cert"]
+
+        cand = _db.session.get(ApplicantProfile, 3131)
+        assert cand.skills == "Python, SQL, Docker"
+        assert cand.years_of_experience == 5
+        assert json.loads(doc.profile_json)["skills"] == ["Python", "SQL", "Docker"]
+
+        # a second parse replaces the rows it inserted instead of duplicating them
+        reparsed = dict(PARSED, experience=[{"position": "Staff Engineer", "company": "Beta"}])
+        monkeypatch.setattr(resume_processing, "call_gemini_once", lambda prompt: json.dumps(reparsed))
+        resume_processing.preparse_resume(3131)
+        assert [e.position for e in PreviousExperience.query.filter_by(applicant_id=3131)] == ["Staff Engineer"]
+        assert PreviousEducation.query.filter_by(applicant_id=3131).count() == 1
+        # hand-entered values are never overwritten
+        assert _db.session.get(ApplicantProfile, 3131).skills == "Python, SQL, Docker"
+
+    status = client.get("/applicant/3131/resume/processing").get_json()
+    assert status["parse_status"] == "parsed" and status["profile"]["experience"][0]["position"] == "Staff Engineer"
+    os.remove(profile["resume_file_path"])
+
+
+def test_preparse_failure_is_recorded(client, app, extraction, monkeypatch):
+    profile = upload_profile(client, app, 3141)
+
+    def quota(prompt):
+        raise RuntimeError("All Gemini models failed")
+
+    monkeypatch.setattr(resume_processing, "call_gemini_once", quota)
+    with app.app_context():
+        doc = resume_processing.preparse_resume(3141)
+        assert doc.parse_status == ResumeDocument.FAILED
+        assert "Gemini" in doc.parse_error
+        assert PreviousExperience.query.filter_by(applicant_id=3141).count() == 0
+    os.remove(profile["resume_file_path"])
@@ -0,0 +1,177 @@
+# tests/test_session_cache.py
+import logging
+from collections import Counter
+from fnmatch import fnmatch
+from datetime import timedelta
+from application.controller.videointerview.models import session_store as session_store_module
+from application.controller.videointerview.models.session_store import (
+    RedisSessionStore, LocalSessionCache, SESSION_INVALIDATION_CHANNEL
+)
+from application.controller.videointerview.models.interview_session import InterviewSession
+from application.controller.videointerview.services.recording_service import RecordingService
+
+
+class FakeRedis:
+    """The commands the session store uses; publish delivers to the subscribed stores at once."""
+
+    def __init__(self):
+        self.data = {}
+        self.calls = Counter()
+        self.subscribers = []
+
+    def get(self, key):
+        self.calls["get"] += 1
+        return self.data.get(key)
+
+    def mget(self, *keys):
+        self.calls["mget"] += 1
+        return [self.data.get(key) for key in keys]
+
+    def setex(self, key, ttl, value):
+        self.calls["setex"] += 1
+        self.data[key] = value
+
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key) or 0) + 1)
+        return int(self.data[key])
+
+    def expire(self, key, ttl):
+        return True
+
+    def delete(self, *keys):
+        return sum(1 for key in keys if self.data.pop(key, None) is not None)
+
+    def exists(self, key):
+        return int(key in self.data)
+
+    def keys(self, pattern):
+        return [key for key in self.data if fnmatch(key, pattern)]
+
+    def publish(self, channel, message):
+        assert channel == SESSION_INVALIDATION_CHANNEL
+        for store in self.subscribers:
+            store.apply_invalidation(message)
+        return len(self.subscribers)
+
+    def pipeline(self):
+        redis, ops = self, []
+
+        class Pipeline:
+            def __getattr__(self, name):
+                return lambda *args: ops.append((name, args))
+
+            def execute(self):
+                return [getattr(redis, name)(*args) for name, args in ops]
+
+        return Pipeline()
+
+# -------------- helper functions --------------
+def make_worker(redis):
+    """A session store as one worker process would hold it, subscribed to invalidations."""
+    store = RedisSessionStore.__new__(RedisSessionStore)
+    store.client = store.redis_client = redis
+    store.session_ttl = timedelta(hours=1)
+    store.local = LocalSessionCache()
+    store.local.set_live(True)
+    redis.subscribers.append(store)
+    return store
+
+def make_session(tmp_path):
+    session = InterviewSession(interview_id=41, job_title="Backend Engineer", job_description="Python APIs",
+                               candidate_background={"resume_text": "Python " * 5000}, recording_path=str(tmp_path))
+    session.current_question = "Tell me about yourself."
+    return session
+
+# ---------------- Tests ----------------
+
+def test_local_cache_counts_hits_expires_and_evicts():
+    now = [0.0]
+    cache = LocalSessionCache(max_entries=2, ttl_seconds=10, clock=lambda: now[0])
+    assert cache.put("a", 1, "A") is False and cache.get("a") is None  # not subscribed yet
+    assert cache.stats()["bypassed"] == 1
+
+    cache.set_live(True)
+    assert cache.get("a") is None
+    cache.put("a", 1, "A")
+    assert cache.get("a") == "A" and cache.get("a") == "A"
+    cache.put("b", 1, "B")
+    cache.get("a")  # "b" is now the least recently used
+    cache.put("c", 1, "C")
+    assert cache.get("b") is None and cache.get("c") == "C"
+
+    now[0] = 11
+    assert cache.get("a") is None
+    assert cache.stats() == {"live": True, "entries": 2, "hits": 4, "misses": 3, "bypassed": 1,
+                             "invalidations": 0, "hit_rate": 0.571}
+    cache.set_live(False)
+    assert cache.get("c") is None and cache.stats()["entries"] == 0
+
+
+def test_invalidation_versions_keep_stale_reads_out():
+    cache = LocalSessionCache()
+    cache.set_live(True)
+    cache.put("s", 3, "v3")
+    cache.invalidate("s", 3)  # our own write's announcement: nothing newer
+    assert cache.get("s") == "v3"
+
+    cache.invalidate("s", 5)
+    assert cache.get("s") is None
+    assert cache.put("s", 4, "v4") is False  # a read that raced the v5 write
+    assert cache.get("s") is None
+    assert cache.put("s", 5, "v5") and cache.get("s") == "v5"
+
+    cache.invalidate("s")  # removed
+    assert cache.get("s") is None and cache.put("s", 0, "old") is True
+    assert cache.stats()["invalidations"] == 2
+
+
+def test_chunks_skip_redis_until_another_worker_writes(tmp_path, monkeypatch):
+    redis = FakeRedis()
+    web, socket_worker = make_worker(redis), make_worker(redis)
+    session = make_session(tmp_path)
+    assert web.add(session)
+    assert redis.data[f"session_version:{session.session_id}"] == "1"
+
+    monkeypatch.setattr(session_store_module, "session_store", socket_worker)
+    recording = RecordingService()
+    assert socket_worker.get(session.session_id, shared=True).current_question == "Tell me about yourself."
+    reads = redis.calls["mget"]
+    for _ in range(20):
+        cached = socket_worker.get(session.session_id, shared=True)
+        assert recording.save_video_chunk(session.session_id, b"chunk")
+    assert redis.calls["mget"] == reads  # steady state: no Redis round trips
+    assert (tmp_path / "video_stream.webm").read_bytes() == b"chunk" * 20
+
+    # callers that mutate get their own copy
+    copy = socket_worker.get(session.session_id)
+    copy.current_question = "Unsaved edit"
+    assert socket_worker.get(session.session_id, shared=True) is cached
+    assert cached.current_question == "Tell me about yourself."
+
+    # a write on another worker is announced and the next read sees it
+    session.current_question = "How would you scale the chunk upload path?"
+    session.question_count = 2
+    web.add(session)
+    fresh = socket_worker.get(session.session_id, shared=True)
+    assert fresh.current_question == "How would you scale the chunk upload path?" and fresh.question_count == 2
+    assert redis.calls["mget"] == reads + 1
+    stats = socket_worker.cache_stats()
+    assert stats["hits"] == 42 and stats["misses"] == 2 and stats["invalidations"] == 2
+
+    assert web.remove_session(session.session_id)
+    assert socket_worker.get(session.session_id) is None
+    assert not any(session.session_id in key for key in redis.data)
+
+
+def test_all_sessions_skips_version_counters(tmp_path, caplog):
+    redis = FakeRedis()
+    store = make_worker(redis)
+    session = make_session(tmp_path)
+    store.add(session)
+    store.add(session)  # version 2
+    redis.data[f"session:{session.session_id}:version"] = "1"  # left over from before the rename
+
+    sessions = store.get_all_sessions()
+    assert list(sessions) == [session.session_id]
+    assert sessions[session.session_id].current_question == "Tell me about yourself."
+    assert not [r for r in caplog.records if r.levelno >= logging.ERROR]
@@ -0,0 +1,96 @@
+# tests/utils/smtp.py
+import socketserver
+import threading
+import pytest
+
+class SmtpStandIn:
+    """
+    Just enough SMTP for smtplib: counts connections and accepted messages.
+    reject_data makes every DATA fail; drop_after closes the connection after
+    that many messages on it.
+    """
+
+    def __init__(self, reject_data=False, drop_after=None):
+        self.reject_data = reject_data
+        self.drop_after = drop_after
+        self.connections = 0
+        self.messages = []
+        stand_in = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def reply(self, line):
+                self.wfile.write(line.encode() + b"\r\n")
+                self.wfile.flush()
+
+            def handle(self):
+                stand_in.connections += 1
+                on_this_connection = 0
+                self.reply("220 standin ESMTP")
+                while True:
+                    line = self.rfile.readline()
+                    if not line:
+                        return
+                    cmd = line.decode(errors="replace").strip().split(" ", 1)[0].upper()
+                    if cmd in ("EHLO", "HELO"):
+                        self.reply("250 standin")
+                    elif cmd in ("MAIL", "RCPT", "RSET", "NOOP"):
+                        self.reply("250 OK")
+                    elif cmd == "DATA":
+                        if stand_in.reject_data:
+                            self.reply("554 Transaction failed")
+                            continue
+                        self.reply("354 End data with <CR><LF>.<CR><LF>")
+                        body = []
+                        for data_line in self.rfile:
+                            if data_line in (b".\r\n", b".\n"):
+                                break
+                            body.append(data_line)
+                        stand_in.messages.append(b"".join(body))
+                        on_this_connection += 1
+                        self.reply("250 queued")
+                        if stand_in.drop_after and on_this_connection >= stand_in.drop_after:
+                            return
+                    elif cmd == "QUIT":
+                        self.reply("221 Bye")
+                        return
+                    else:
+                        self.reply("502 Command not implemented")
+
+        self.server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.port = self.server.server_address[1]
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def smtp(app, tmp_path):
+    """Point Flask-Mail and the PDF storage at the stand-in and a temp dir."""
+    state = app.extensions["mail"]
+    saved = (state.server, state.port, state.suppress)
+    saved_config = {k: app.config.get(k) for k in ("OFFER_LETTER_DIR", "OFFER_OUTBOX_MAX_ATTEMPTS", "OFFER_RENDER_PROCESSES")}
+    app.config["OFFER_LETTER_DIR"] = str(tmp_path)
+
+    def start(**kwargs):
+        server = SmtpStandIn(**kwargs).__enter__()
+        state.server, state.port, state.suppress = "127.0.0.1", server.port, False
+        servers.append(server)
+        return server
+
+    servers = []
+    yield start
+    for server in servers:
+        server.__exit__(None, None, None)
+    state.server, state.port, state.suppress = saved
+    for key, value in saved_config.items():
+        if value is None:
+            app.config.pop(key, None)
+        else:
+            app.config[key] = value